@@ -0,0 +1,91 @@
+
+import hashlib
+
+import numpy as np
+
+#Attributes which dont affect what gets plotted; e.g. cached views of other attributes or temporary working space
+_IGNORED_ATTR_PREFIXES = ("_cached", "_scratchSpace")
+
+
+def getFingerprint(inpObj):
+	""" Returns a hash of the content of inpObj (generally a plotter); objects which would produce the same plot should give the same fingerprint
+
+	Args:
+		inpObj (Any): Generally a PlotterInter instance. Option values, commands and the bytes of any numpy arrays are all used for the fingerprint
+
+	Returns
+		outStr (str): Hex digest of the hash. Stable between processes/sessions
+
+	Notes:
+		a) This walks the attributes of inpObj directly, which is much faster than going through toJSON (particularly for large arrays)
+		b) Objects are fingerprinted using their class and their attributes (via __dict__). Anything else falls back to repr
+		c) Attributes starting with "_cached" or "_scratchSpace" are ignored
+
+	"""
+	hasher = hashlib.sha256()
+	_updateHasher(hasher, inpObj, set())
+	return hasher.hexdigest()
+
+
+def _updateHasher(hasher, inpObj, activeIds):
+	#Order matters; e.g. bool is a subclass of int, and numpy scalars need their dtype recorded
+	if inpObj is None or isinstance(inpObj, (bool, int, float, complex, str)):
+		_updateWithTag(hasher, type(inpObj).__name__, repr(inpObj))
+
+	elif isinstance(inpObj, bytes):
+		_updateWithTag(hasher, "bytes", str(len(inpObj)))
+		hasher.update(inpObj)
+
+	elif isinstance(inpObj, (np.ndarray, np.generic)):
+		_updateHasherWithNumpy(hasher, inpObj, activeIds)
+
+	else:
+		#Guard against infinite recursion from self-referencing objects
+		if id(inpObj) in activeIds:
+			_updateWithTag(hasher, "cycle", type(inpObj).__name__)
+			return None
+		activeIds.add(id(inpObj))
+
+		if isinstance(inpObj, (list, tuple)):
+			_updateWithTag(hasher, type(inpObj).__name__, str(len(inpObj)))
+			for val in inpObj:
+				_updateHasher(hasher, val, activeIds)
+
+		elif isinstance(inpObj, dict):
+			_updateHasherWithDict(hasher, "dict", inpObj, activeIds)
+
+		elif isinstance(inpObj, (set, frozenset)):
+			_updateWithTag(hasher, "set", str(len(inpObj)))
+			for val in sorted(inpObj, key=repr):
+				_updateHasher(hasher, val, activeIds)
+
+		elif hasattr(inpObj, "__dict__"):
+			useDict = {k:v for k,v in vars(inpObj).items() if not k.startswith(_IGNORED_ATTR_PREFIXES)}
+			_updateHasherWithDict(hasher, str(inpObj.__class__), useDict, activeIds)
+
+		else:
+			_updateWithTag(hasher, type(inpObj).__name__, repr(inpObj))
+
+		activeIds.remove(id(inpObj))
+
+
+def _updateHasherWithDict(hasher, tag, inpDict, activeIds):
+	_updateWithTag(hasher, tag, str(len(inpDict)))
+	for key in sorted(inpDict.keys(), key=repr):
+		_updateHasher(hasher, key, activeIds)
+		_updateHasher(hasher, inpDict[key], activeIds)
+
+
+def _updateHasherWithNumpy(hasher, inpArray, activeIds):
+	inpArray = np.asarray(inpArray)
+	_updateWithTag(hasher, "ndarray", "{}{}".format(inpArray.dtype.str, inpArray.shape))
+	if inpArray.dtype.hasobject:
+		for val in inpArray.ravel():
+			_updateHasher(hasher, val, activeIds)
+	else:
+		hasher.update( np.ascontiguousarray(inpArray).reshape(-1).view(np.uint8) ) #No copy if already contiguous
+
+
+def _updateWithTag(hasher, tag, valStr):
+	hasher.update( "<{}:{}>".format(tag, valStr).encode("utf-8") )
+
@@ -0,0 +1,185 @@
+
+import json
+import os
+import threading
+import time
+import types
+
+import numpy as np
+
+_THREAD_STATE = threading.local()
+
+
+class CommandProfiler():
+	""" Records the time taken by each plot command while active. Opt-in; plotting has no extra overhead when no profiler is active
+
+	Example:
+		profiler = CommandProfiler()
+		with profiler:
+			plotter.createPlot()
+		profiler.getTotals() #Time etc. per command class; slowest first
+		profiler.writeChromeTrace("trace.json") #Load in chrome://tracing or https://ui.perfetto.dev
+
+	Notes:
+		a) Only commands executed in the thread which entered the profiler are recorded
+		b) Profilers can be nested; each active profiler records every command
+
+	"""
+
+	def __init__(self, callback=None):
+		""" Initializer
+
+		Args:
+			callback (callable): Optional; called with each record (see "records") as soon as its command finishes
+
+		"""
+		self.callback = callback
+		self.records = list()
+
+	def __enter__(self):
+		_getActiveProfilers().append(self)
+		return self
+
+	def __exit__(self, excType, excVal, excTraceback):
+		_getActiveProfilers().remove(self)
+
+	def addRecord(self, record):
+		""" Stores a record and passes it to the callback (if present). Called automatically for each command executed while the profiler is active
+
+		Args:
+			record (SimpleNamespace): Has attributes plotterClass, commandClass, commandName, depth (>0 for plotters called by other plotters), startTime (time.perf_counter() value), wallTime, cpuTime (both in seconds), nArtistsAdded (net change in artists on the figure; None if theres no figure) and bytesTouched (size of any numpy data in the options listed in command.optionDeps; None if these are unknown)
+
+		"""
+		self.records.append(record)
+		if self.callback is not None:
+			self.callback(record)
+
+	def clear(self):
+		""" Removes all records """
+		self.records = list()
+
+	def getTotals(self):
+		""" Returns totals for each type of command; ordered by wall time, largest first
+
+		Returns
+			outDict (dict): Keys are command class names. Values are SimpleNamespace with attributes nCalls, wallTime, cpuTime, nArtistsAdded and bytesTouched
+
+		"""
+		outDict = dict()
+		for record in self.records:
+			currTotals = outDict.setdefault(record.commandClass, types.SimpleNamespace(nCalls=0, wallTime=0.0, cpuTime=0.0, nArtistsAdded=0, bytesTouched=0))
+			currTotals.nCalls += 1
+			currTotals.wallTime += record.wallTime
+			currTotals.cpuTime += record.cpuTime
+			currTotals.nArtistsAdded += 0 if record.nArtistsAdded is None else record.nArtistsAdded
+			currTotals.bytesTouched += 0 if record.bytesTouched is None else record.bytesTouched
+
+		return dict( sorted(outDict.items(), key=lambda x:x[1].wallTime, reverse=True) )
+
+	def getChromeTrace(self):
+		""" Returns records in the Chrome trace-event format (as a dict; use json.dump to save it). Commands from nested plotters appear nested
+
+		Returns
+			outDict (dict): Contains the "traceEvents" list, with one complete ("X") event per record
+
+		"""
+		outEvents = list()
+		for record in self.records:
+			currArgs = {"plotterClass":record.plotterClass, "commandName":record.commandName, "cpuTimeUs":record.cpuTime*1e6,
+			            "nArtistsAdded":record.nArtistsAdded, "bytesTouched":record.bytesTouched}
+			currEvent = {"name":record.commandClass, "cat":"plotCommand", "ph":"X", "ts":record.startTime*1e6, "dur":record.wallTime*1e6,
+			             "pid":os.getpid(), "tid":record.threadId, "args":currArgs}
+			outEvents.append(currEvent)
+		return {"traceEvents":outEvents, "displayTimeUnit":"ms"}
+
+	def writeChromeTrace(self, outPath):
+		""" Writes the output of getChromeTrace to outPath as json """
+		with open(outPath, "w") as f:
+			json.dump(self.getChromeTrace(), f)
+
+
+def executeCommands(commands, plotterInstance):
+	""" Executes each command in turn on plotterInstance. Plotters should use this rather than looping over commands directly, so that any active CommandProfiler records them
+
+	Args:
+		commands (iter of PlotCommand): Commands to execute in order
+		plotterInstance (PlotterInter): Passed to command.execute
+
+	"""
+	activeProfilers = _getActiveProfilers()
+	if len(activeProfilers) == 0:
+		for command in commands:
+			command.execute(plotterInstance)
+		return None
+
+	_THREAD_STATE.depth = getattr(_THREAD_STATE, "depth", -1) + 1
+	try:
+		for command in commands:
+			_executeAndRecord(command, plotterInstance, activeProfilers)
+	finally:
+		_THREAD_STATE.depth -= 1
+
+
+def _executeAndRecord(command, plotterInstance, activeProfilers):
+	startArtists = _getNumbArtists(plotterInstance)
+	startTime, startCpuTime = time.perf_counter(), time.thread_time()
+	command.execute(plotterInstance)
+	wallTime, cpuTime = time.perf_counter() - startTime, time.thread_time() - startCpuTime
+	endArtists = _getNumbArtists(plotterInstance)
+
+	nArtistsAdded = None if endArtists is None else endArtists - (0 if startArtists is None else startArtists)
+	record = types.SimpleNamespace(plotterClass=type(plotterInstance).__name__, commandClass=type(command).__name__,
+	                               commandName=command.name, depth=_THREAD_STATE.depth, threadId=threading.get_ident(),
+	                               startTime=startTime, wallTime=wallTime, cpuTime=cpuTime, nArtistsAdded=nArtistsAdded,
+	                               bytesTouched=_getBytesTouched(command, plotterInstance))
+	for profiler in list(activeProfilers):
+		profiler.addRecord(record)
+
+
+def _getActiveProfilers():
+	try:
+		return _THREAD_STATE.activeProfilers
+	except AttributeError:
+		_THREAD_STATE.activeProfilers = list()
+		return _THREAD_STATE.activeProfilers
+
+
+def _getNumbArtists(plotterInstance):
+	figHandle = _getFigure(plotterInstance)
+	if figHandle is None:
+		return None
+	return len(figHandle.get_children()) + sum([len(ax.get_children()) for ax in figHandle.axes])
+
+
+def _getFigure(plotterInstance):
+	scratchSpace = getattr(plotterInstance, "_scratchSpace", dict())
+	if scratchSpace.get("figHandle", None) is not None:
+		return scratchSpace["figHandle"]
+	if scratchSpace.get("axHandle", None) is not None:
+		return scratchSpace["axHandle"].figure
+	return None
+
+
+def _getBytesTouched(command, plotterInstance):
+	getOptionDeps = getattr(command, "getOptionDeps", None)
+	optionDeps = None if getOptionDeps is None else getOptionDeps(plotterInstance)
+	if optionDeps is None:
+		return None
+
+	outVal = 0
+	for optName in optionDeps:
+		try:
+			optVal = getattr(plotterInstance.opts, optName).value
+		except AttributeError:
+			continue
+		outVal += _getNumbBytesInArrays(optVal)
+	return outVal
+
+
+def _getNumbBytesInArrays(inpVal):
+	if isinstance(inpVal, np.ndarray):
+		return inpVal.nbytes
+	if isinstance(inpVal, (list, tuple)):
+		return sum([_getNumbBytesInArrays(x) for x in inpVal])
+	return 0
+
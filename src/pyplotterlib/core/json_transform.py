@@ -1,24 +1,51 @@
 
+import json
+
 class JSONTransformInterface():
+	""" Interface for objects which can be serialized. Subclasses implement toDict/fromDict; toJSON/fromJSON are built on those
+
+	Notes:
+		a) toDict should return a JSON-compatible dict of the form {"class":str(self.__class__), "payload":payload}. Any embedded serializable objects should be included as dicts too (see json_io.getDictFromInstance), so the whole tree gets encoded in a single pass
+		b) Older classes which only implement toJSON/fromJSON still work; json_io handles them separately
+
+	"""
 
 	def toJSON(self):
 		""" Function to generate a JSON string representation of this instance. Used for serialization.
-		
+
 		"""
-		raise NotImplementedError("")
+		return json.dumps(self.toDict())
 
 	@classmethod
 	def fromJSON(cls, inpJSON):
 		""" Construct a new instance from the JSON (dictionary-like) representation. Used for de-serialization (e.g. reading objects from a file)
-		
+
 		Args:
-			inpJSON (str): JSON (dictionary-like) representation generated by cls.toJSON() 
-				 
+			inpJSON (str): JSON (dictionary-like) representation generated by cls.toJSON()
+
 		Returns
 			outObj (cls): Instance of this class
-	 
+
+		"""
+		return cls.fromDict(json.loads(inpJSON))
+
+	def toDict(self):
+		""" Function to generate a dictionary representation (containing only JSON-compatible values) of this instance. Used for serialization.
+
 		"""
 		raise NotImplementedError("")
 
+	@classmethod
+	def fromDict(cls, inpDict):
+		""" Construct a new instance from the dictionary representation. Used for de-serialization
+
+		Args:
+			inpDict (dict): Representation generated by cls.toDict(). Note that embedded objects may be JSON strings rather than dicts if this was read from a file written by an older version
+
+		Returns
+			outObj (cls): Instance of this class
+
+		"""
+		raise NotImplementedError("")
 
 
@@ -0,0 +1,184 @@
+
+""" References to numpy arrays stored in files; so huge arrays can be used as plot data without reading them into memory until (and only where) theyre needed """
+
+import mmap
+import os
+
+import numpy as np
+
+from . import json_transform as jsonTransHelp
+from .serialization import register as regHelp
+
+
+@regHelp.registerForSerialization()
+class LazyArrayRef(jsonTransHelp.JSONTransformInterface):
+	""" Reference to a numpy array stored in a file. Values are only read from disk when the reference is indexed (e.g. lazyArray[100:200,50:60]), and then only the requested region. Converting to a normal array (e.g. np.asarray(lazyArray)) reads the whole array
+
+	Can be used in place of a numpy array for image/matrix plot data (e.g. plotDataImage), and is serialized as the reference rather than the values.
+
+	Notes:
+		a) Plotter fingerprints (and hence render caching) use the reference; not the contents of the file
+		b) Relative paths are relative to the working directory when the values are read
+
+	"""
+
+	def __init__(self, path, dtype, shape, offset=0, order="C"):
+		""" Initializer
+
+		Args:
+			path (str): Path to the file containing the raw array data
+			dtype (np.dtype or str): Data type of the array
+			shape (iter of int): Shape of the array
+			offset (int): Number of bytes before the array data starts in the file
+			order (str): "C" or "F"; the memory layout of the array in the file
+
+		"""
+		self.path = os.fspath(path)
+		self.dtype = np.dtype(dtype)
+		self.shape = tuple(int(x) for x in shape)
+		self.offset = int(offset)
+		self.order = order
+
+	@classmethod
+	def fromNpyFile(cls, path):
+		""" Creates a reference to the array in a .npy file (e.g. written by np.save); reads only the file header
+
+		Args:
+			path (str): Path to the .npy file
+
+		Returns
+			outRef (LazyArrayRef):
+
+		"""
+		shape, isFortranOrder, dtype, offset = _readNpyFileHeader(path)
+		return cls(path, dtype, shape, offset=offset, order="F" if isFortranOrder else "C")
+
+	@classmethod
+	def fromMemmap(cls, inpMemmap):
+		""" Creates a reference to the file region mapped by inpMemmap
+
+		Args:
+			inpMemmap (np.memmap): Needs to map a whole array from its file (e.g. from np.memmap(...) or np.load(path, mmap_mode="r")); rather than being a view/slice of one
+
+		Returns
+			outRef (LazyArrayRef):
+
+		Raises:
+			ValueError: If inpMemmap isnt a memory-mapped array of a whole array in a file
+
+		"""
+		if not isWholeFileMemmap(inpMemmap):
+			raise ValueError("Can only create references from memory-mapped arrays covering a whole array in a file (not views/slices of them)")
+		order = "C" if inpMemmap.flags.c_contiguous else "F"
+		return cls(inpMemmap.filename, inpMemmap.dtype, inpMemmap.shape, offset=inpMemmap.offset, order=order)
+
+	@property
+	def ndim(self):
+		return len(self.shape)
+
+	@property
+	def size(self):
+		return int(np.prod(self.shape, dtype=np.int64))
+
+	@property
+	def nbytes(self):
+		return self.size*self.dtype.itemsize
+
+	def __len__(self):
+		return self.shape[0]
+
+	def getMemmap(self):
+		""" Returns a read-only memory-mapped array of the referenced data. Slicing it doesnt read anything from disk; data is only read when values are used
+
+		"""
+		#np.memmap doesnt allow empty arrays
+		if self.size == 0:
+			return np.zeros(self.shape, dtype=self.dtype)
+		return np.memmap(self.path, dtype=self.dtype, mode="r", shape=self.shape, order=self.order, offset=self.offset)
+
+	def __getitem__(self, key):
+		return np.array(self.getMemmap()[key])
+
+	def __array__(self, dtype=None, copy=None):
+		outArray = np.array(self.getMemmap())
+		return outArray if dtype is None else outArray.astype(dtype, copy=False)
+
+	def __eq__(self, other):
+		if not isinstance(other, LazyArrayRef):
+			return False
+		selfVals = [self.path, self.dtype, self.shape, self.offset, self.order]
+		otherVals = [other.path, other.dtype, other.shape, other.offset, other.order]
+		return selfVals == otherVals
+
+	def __repr__(self):
+		return "LazyArrayRef(path={!r}, dtype={}, shape={}, offset={}, order={!r})".format(self.path, self.dtype, self.shape, self.offset, self.order)
+
+	def toDict(self):
+		payload = {"path":self.path, "dtype":np.lib.format.dtype_to_descr(self.dtype), "shape":list(self.shape),
+		           "offset":self.offset, "order":self.order}
+		return {"class":str(self.__class__), "payload":payload}
+
+	@classmethod
+	def fromDict(cls, inpDict):
+		payload = inpDict["payload"]
+		dtype = np.lib.format.descr_to_dtype( _getDescrFromJSON(payload["dtype"]) )
+		return cls(payload["path"], dtype, payload["shape"], offset=payload["offset"], order=payload["order"])
+
+
+def isFileBacked(inpArray):
+	""" Returns True if inpArray is a LazyArrayRef or memory-mapped array; i.e. its values are read from disk when used """
+	return isinstance(inpArray, (LazyArrayRef, np.memmap))
+
+
+def isReadOnlyMemmap(inpArray):
+	""" Returns True if inpArray is a memory-mapped array (or view of one) which cant be modified; these can safely be shared rather than copied """
+	return isinstance(inpArray, np.memmap) and (not inpArray.flags.writeable)
+
+
+def isWholeFileMemmap(inpArray):
+	""" Returns True if inpArray is a memory-mapped array covering a whole (contiguous) array in a file; rather than a view of one """
+	if not isinstance(inpArray, np.memmap):
+		return False
+	isContiguous = inpArray.flags.c_contiguous or inpArray.flags.f_contiguous
+	return isinstance(inpArray.base, mmap.mmap) and (inpArray.filename is not None) and isContiguous
+
+
+def isNpyFileMemmap(inpArray):
+	""" Returns True if inpArray is a memory-mapped array covering the array in a standalone .npy file (e.g. from np.load(path, mmap_mode="r")); rather than e.g. one stored inside a zip archive """
+	if not isWholeFileMemmap(inpArray):
+		return False
+	try:
+		offset = _readNpyFileHeader(inpArray.filename)[-1]
+	except (OSError, ValueError):
+		return False
+	return offset == inpArray.offset
+
+
+def getUnloadedArray(inpArray):
+	""" Returns an array for inpArray without reading any data from disk; LazyArrayRef instances are returned as (read-only) memory-mapped arrays. Useful for getting shapes/slices of plot data that may be a LazyArrayRef """
+	if isinstance(inpArray, LazyArrayRef):
+		return inpArray.getMemmap()
+	return np.asarray(inpArray)
+
+
+def _readNpyFileHeader(path):
+	#Returns (shape, isFortranOrder, dtype, offset); raises ValueError if path isnt a .npy file
+	with open(path, "rb") as f:
+		version = np.lib.format.read_magic(f)
+		readHeaderFunct = np.lib.format.read_array_header_1_0 if version==(1,0) else np.lib.format.read_array_header_2_0
+		shape, isFortranOrder, dtype = readHeaderFunct(f)
+		offset = f.tell()
+	return shape, isFortranOrder, dtype, offset
+
+#Structured dtype descriptions are lists of (name, dtype, [shape]) tuples; which become lists of lists in JSON
+def _getDescrFromJSON(inpDescr):
+	if isinstance(inpDescr, str):
+		return inpDescr
+
+	outDescr = list()
+	for field in inpDescr:
+		name, subDescr, *shape = field
+		name = tuple(name) if isinstance(name, list) else name
+		outDescr.append( (name, _getDescrFromJSON(subDescr)) + tuple(tuple(x) for x in shape) )
+	return outDescr
+
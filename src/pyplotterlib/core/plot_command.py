@@ -1,5 +1,4 @@
 
-import json
 
 from . import json_transform as jsonTransHelp
 
@@ -9,6 +8,9 @@ class PlotCommand(jsonTransHelp.JSONTransformInterface):
 	Attributes:
 		name (str): Descriptive Name of the command
 		description (str): Description of what the command does
+		optionDeps (list of str or None): Names of options which, if changed, mean this command needs running again. None means unknown (i.e. it may depend on any option)
+		reExecutable (bool): True if running this command again on an already-drawn plot gives the same result as drawing from scratch (assuming the relevant option values are not None)
+		mutatesPlotData (bool): True if this command modifies scratchSpace["usePlotData"] in place; commands copying plot data to the scratch space only make a (writeable) copy if a later command has this set
 
 	"""
 
@@ -20,28 +22,70 @@ class PlotCommand(jsonTransHelp.JSONTransformInterface):
 	def description(self):
 		return self._description
 
+	#These are used by SingleGraphPlotter.updatePlot to figure out which commands need running again
+	#Options which only reach this command through values set by non-re-executable commands dont need listing in optionDeps,
+	#since changing them means the whole plot gets redrawn anyway
+	@property
+	def optionDeps(self):
+		return getattr(self, "_optionDeps", None)
+
+	@property
+	def reExecutable(self):
+		return getattr(self, "_reExecutable", False)
+
+	@property
+	def mutatesPlotData(self):
+		return getattr(self, "_mutatesPlotData", False)
+
+	def getOptionDeps(self, plotterInstance):
+		""" Returns the option dependencies for the current option values on plotterInstance. Overwrite this if the dependencies change with option values (e.g. extra options only matter when some mode is switched on)
+		
+		Args:
+			plotterInstance (PlotterInter):
+
+		Returns
+			optionDeps (list of str or None): See optionDeps. Default is to return self.optionDeps
+
+		"""
+		return self.optionDeps
+
+	def canReExecute(self, plotterInstance):
+		""" Returns True if running this command again on the plot already drawn by plotterInstance gives the same result as drawing from scratch. Overwrite this if it depends on the plot thats already drawn (e.g. existing artists can only be updated in place if there are the right number of them)
+		
+		Args:
+			plotterInstance (PlotterInter): Options on this have already been updated to the new values
+
+		Returns
+			reExecutable (bool): Default is to return self.reExecutable
+
+		"""
+		return self.reExecutable
+
 	def execute(self, plotterInstance):
 		""" Executes the command on the current plot, likely using options/data stored in plotterInstance
 		
 		Args:
 			plotterInstance (PlotterInter):
+
+		Notes:
+			Option values on plotterInstance may be shared with other plotters (see PlotterInter.createCopyOnWriteFactory); so they should not be modified in place
 				 
 		"""
 		raise NotImplementedError("")
 
 	#name/description will generally be hard-coded into the initializer;
-	def toJSON(self):
+	def toDict(self):
 		outDict = {"class": str(self.__class__), "payload": {} }
-		return json.dumps(outDict)
+		return outDict
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
+	def fromDict(cls, inpDict):
 		return cls() #Should almost ALWAYS be called without any values passed
 
 
 	def __eq__(self, other):
 
-		if self.toJSON() != other.toJSON():
+		if self.toDict() != other.toDict():
 			return False
 
 		return True
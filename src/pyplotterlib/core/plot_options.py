@@ -1,12 +1,14 @@
 
+import copy
 import itertools as it
-import json
 import types
 
 import numpy as np
 
 from . import json_transform as jsonTransHelp
+from . import lazy_array as lazyArrayHelp
 from .serialization import register as regHelp
+from .serialization import binary_io as binaryIoHelp
 from .serialization import json_io as jsonIoHelp
 
 @regHelp.registerForSerialization()
@@ -25,7 +27,8 @@ class OptionsCollection(jsonTransHelp.JSONTransformInterface):
 			options (iter of SinglePlotOptionInter):
 				 
 		"""
-		self._options = list()
+		self._options = dict() #Maps option name to the option
+		self._clearCachedViews()
 		if options is not None:
 			for opt in options:
 				self.addOption(opt)
@@ -37,48 +40,65 @@ class OptionsCollection(jsonTransHelp.JSONTransformInterface):
 		Args:
 			inpOption (SinglePlotOptionInter):
 		
-		Raises:
-			ValueError: If adding an SinglePlotOptionInter object with .name which is already present
+		Notes:
+			If an option with the same .name is already present, inpOption is ignored
  
 		"""
 		inpName = inpOption.name
-		if inpName not in self.names:
-			self._options.append(inpOption)
+		if inpName not in self._options:
+			self._options[inpName] = inpOption
+			self._clearCachedViews()
 
-	def toJSON(self):
+	def createCopyOnWrite(self):
+		""" Creates a new OptionsCollection which shares option values with this one, but not the option objects themselves
+		
+		Returns
+			outObj (OptionsCollection): Setting .value on any of its options will NOT affect this object. Values are not copied, so modifying them in place still affects both
+	 
+		"""
+		return self.__class__( options=[copy.copy(x) for x in self._options.values()] )
+
+	def toDict(self):
 		outDict = {"class": str(self.__class__)}
-		optsJSON = [x.toJSON() for x in self._options]
-		outDict["payload"] = {"options":optsJSON}
-		return json.dumps(outDict)
+		optsDicts = [jsonIoHelp.getDictFromInstance(x) for x in self._options.values()]
+		outDict["payload"] = {"options":optsDicts}
+		return outDict
 
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		optsDict = useDict["payload"]
-		optionsObjs = [ jsonIoHelp.createInstanceFromJSON(x) for x in optsDict["options"] ]
+	def fromDict(cls, inpDict):
+		optsDict = inpDict["payload"]
+		optionsObjs = [ jsonIoHelp.createInstanceFromDict(x) for x in optsDict["options"] ]
 		return cls(options=optionsObjs)
 
+	#Both .names and .opts are cached, since they get accessed A LOT when creating plots (e.g. by every command)
+	def _clearCachedViews(self):
+		self._cachedNames = None
+		self._cachedOptsNamespace = None
+
 	@property
 	def names(self):
-		return sorted([x.name for x in self._options])
+		if self._cachedNames is None:
+			self._cachedNames = sorted(self._options.keys())
+		return list(self._cachedNames)
 
 	@property
 	def opts(self):
-		sortedNames = sorted(self.names)
-		sortedOpts = sorted(self._options, key=lambda x:x.name)
-		return types.SimpleNamespace(**{name:obj for name,obj in it.zip_longest(sortedNames, sortedOpts)})
+		if self._cachedOptsNamespace is None:
+			self._cachedOptsNamespace = types.SimpleNamespace(**self._options)
+		return self._cachedOptsNamespace
 
 	def __eq__(self, other):
-		if len(self.names) != len(other.names):
+		if len(self._options) != len(other._options):
 			return False
 
-		optsA = sorted(self._options, key=lambda x:x.name)
-		optsB = sorted(other._options, key=lambda x:x.name)
-
-		if optsA != optsB:
+		if self._options.keys() != other._options.keys():
 			return False
 
+		for name, opt in self._options.items():
+			if opt != other._options[name]:
+				return False
+
 		return True
 
 
@@ -96,13 +116,12 @@ class SinglePlotOptionInter(jsonTransHelp.JSONTransformInterface):
 		self.name = str(name)
 		self.value = value
 
-	def toJSON(self):
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":self.value}})
+	def toDict(self):
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":self.value}}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		return cls( useDict["payload"]["name"], useDict["payload"]["value"] )
+	def fromDict(cls, inpDict):
+		return cls( inpDict["payload"]["name"], inpDict["payload"]["value"] )
 
 	def __eq__(self, other):
 		if self.name != other.name:
@@ -149,21 +168,20 @@ class IntOrIntIterPlotOption(SinglePlotOptionInter):
 @regHelp.registerForSerialization()
 class JsonTransObjPlotOption(SinglePlotOptionInter):
 
-	def toJSON(self):
+	def toDict(self):
 		if self.value is None:
 			embeddedVal = None
 		else:
-			embeddedVal = self.value.toJSON()
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":embeddedVal}})
+			embeddedVal = jsonIoHelp.getDictFromInstance(self.value)
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":embeddedVal}}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		if useDict["payload"]["value"] is None:
+	def fromDict(cls, inpDict):
+		if inpDict["payload"]["value"] is None:
 			value = None
 		else:
-			value = jsonIoHelp.createInstanceFromJSON( useDict["payload"]["value"] )
-		return cls( useDict["payload"]["name"], value)
+			value = jsonIoHelp.createInstanceFromDict( inpDict["payload"]["value"] )
+		return cls( inpDict["payload"]["name"], value)
 
 
 
@@ -274,34 +292,33 @@ def _isIter(inpObj):
 @regHelp.registerForSerialization()
 class ObjectIterPlotOption(SinglePlotOptionInter):
 
-	def toJSON(self):
+	def toDict(self):
 		if self.value is None:
 			outPayloads = None
 		else:
-			outPayloads = [ x.toJSON() for x in self.value ]
+			outPayloads = [ jsonIoHelp.getDictFromInstance(x) for x in self.value ]
 
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":outPayloads}})
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":outPayloads}}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		if useDict["payload"]["value"] is None:
+	def fromDict(cls, inpDict):
+		if inpDict["payload"]["value"] is None:
 			objs = None
 		else:
-			objs = [ jsonIoHelp.createInstanceFromJSON(x) for x in useDict["payload"]["value"] ]
-		return cls( useDict["payload"]["name"], objs )
+			objs = [ jsonIoHelp.createInstanceFromDict(x) for x in inpDict["payload"]["value"] ]
+		return cls( inpDict["payload"]["name"], objs )
 
 
 @regHelp.registerForSerialization()
 class ObjectTwoDimIterPlotOption(SinglePlotOptionInter):
 
-	def toJSON(self):
+	def toDict(self):
 		if self.value is None:
 			outVal = None
 		else:
 			outVal = self._generateOutPayloadIfValNotNone()
 
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":outVal}})
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":outVal}}
 
 
 	def _generateOutPayloadIfValNotNone(self):
@@ -309,32 +326,44 @@ class ObjectTwoDimIterPlotOption(SinglePlotOptionInter):
 		for rowIdx, unused in enumerate(self.value):
 			currList = list()
 			for colIdx, unused in enumerate(self.value[rowIdx]):
-				 currList.append( self.value[rowIdx][colIdx].toJSON() )
+				 currList.append( jsonIoHelp.getDictFromInstance(self.value[rowIdx][colIdx]) )
 			outVal.append(currList)
 		return outVal
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		if useDict["payload"]["value"] is None:
+	def fromDict(cls, inpDict):
+		if inpDict["payload"]["value"] is None:
 			objs = None
 		else:
-			objs = cls._generateInpPayloadIfNotNone(inpJSON)
+			objs = cls._generateInpPayloadIfNotNone(inpDict)
 
-		return cls( useDict["payload"]["name"], objs )
+		return cls( inpDict["payload"]["name"], objs )
 
 	@classmethod
-	def _generateInpPayloadIfNotNone(self, inpJSON):
-		useDict = json.loads(inpJSON)
+	def _generateInpPayloadIfNotNone(self, inpDict):
 		objs = list()
-		for rowIdx, currRow in enumerate(useDict["payload"]["value"]):
-			currList = [ jsonIoHelp.createInstanceFromJSON(x) for x in currRow ]
+		for rowIdx, currRow in enumerate(inpDict["payload"]["value"]):
+			currList = [ jsonIoHelp.createInstanceFromDict(x) for x in currRow ]
 			objs.append(currList)
 
 		return objs	
 
 
 class NumpyArrayPlotOption(SinglePlotOptionInter):
+	""" Option holding a single numpy array. Values can also be read-only memory-mapped arrays (e.g. np.load(path, mmap_mode="r")) or LazyArrayRef instances; these are shared (rather than copied) by copy.deepcopy. LazyArrayRef instances and memory-mapped .npy files are serialized as references to their file rather than as values; except when writing a binary file to that same path
+
+	"""
+
+	#Read-only arrays on disk cant be modified in place; so sharing them keeps copies independent, without reading them into memory
+	def __deepcopy__(self, memo):
+		outObj = copy.copy(self)
+		memo[id(self)] = outObj
+		for key, val in vars(self).items():
+			if lazyArrayHelp.isReadOnlyMemmap(val) or isinstance(val, lazyArrayHelp.LazyArrayRef):
+				setattr(outObj, key, val)
+			else:
+				setattr(outObj, key, copy.deepcopy(val, memo))
+		return outObj
 
 	def __eq__(self, other):
 
@@ -350,6 +379,9 @@ class NumpyArrayPlotOption(SinglePlotOptionInter):
 				return False
 
 		#
+		if isinstance(self.value, lazyArrayHelp.LazyArrayRef) or isinstance(other.value, lazyArrayHelp.LazyArrayRef):
+			return self.value == other.value
+
 		if self.value.shape != other.value.shape:
 			return False
 
@@ -358,24 +390,38 @@ class NumpyArrayPlotOption(SinglePlotOptionInter):
 
 		return True
 
-	def toJSON(self):
-		#Note np arrays arent JSON-compatible; hence need to work with them as lists
+	def toDict(self):
+		#Note np arrays arent JSON-compatible; hence need to work with them as lists (or as references when writing binary files)
+		outArray, outRef = None, _getArrayRefToWrite(self.value)
 		if self.value is None:
 			outVal = None
+		elif outRef is not None:
+			outVal = jsonIoHelp.getDictFromInstance(outRef)
 		else:
-			outVal = self.value.tolist()
+			outArray = np.asarray(self.value)
+			outVal = binaryIoHelp.getArrayPayload(outArray)
+
+		outDict = {"class":str(self.__class__), "payload":{"name":self.name, "value":outVal}}
 
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":outVal}})
+		#Values in JSON lists lose their dtype (e.g. uint8 images would come back as int64); so its stored separately
+		outDtype = _getSimpleDtypeStr(outArray)
+		if (outDtype is not None) and (not isinstance(outVal, dict)):
+			outDict["payload"]["dtype"] = outDtype
+
+		return outDict
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		if useDict["payload"]["value"] is None:
+	def fromDict(cls, inpDict):
+		#Older files dont record the dtype. Arrays from binary files already have the right dtype (and may be memory-mapped)
+		inpVal, inpDtype = inpDict["payload"]["value"], inpDict["payload"].get("dtype", None)
+		if inpVal is None:
 			outVal = None
+		elif isinstance(inpVal, dict) and ("class" in inpVal):
+			outVal = jsonIoHelp.createInstanceFromDict(inpVal)
 		else:
-			outVal = np.array(useDict["payload"]["value"])
+			outVal = binaryIoHelp.getArrayFromPayload(inpVal, dtype=inpDtype)
 
-		return cls( useDict["payload"]["name"], outVal )
+		return cls( inpDict["payload"]["name"], outVal )
 
 
 class IterOfNumpyIterPlotOption(SinglePlotOptionInter):
@@ -401,30 +447,53 @@ class IterOfNumpyIterPlotOption(SinglePlotOptionInter):
 
 		return True
 
-	def toJSON(self):
+	def toDict(self):
 		if self.value is None:
 			outArrays = None
 		else:
 			outArrays = list()
 			for arrIter in self.value:
-				currVals = [ np.array(x).tolist() for x in arrIter ]
+				currVals = [ binaryIoHelp.getArrayPayload(np.asarray(x)) for x in arrIter ]
 				outArrays.append(currVals)
 
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":outArrays}})
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":outArrays}}
 
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		if useDict["payload"]["value"] is None:
-			outVal = useDict["payload"]["value"]
+	def fromDict(cls, inpDict):
+		if inpDict["payload"]["value"] is None:
+			outVal = inpDict["payload"]["value"]
 		else:
 			outVal = list()
-			for arrIter in useDict["payload"]["value"]:
-				currVals = [np.array(x) for x in arrIter]
+			for arrIter in inpDict["payload"]["value"]:
+				currVals = [binaryIoHelp.getArrayFromPayload(x) for x in arrIter]
 				outVal.append(currVals)
 
-		return cls( useDict["payload"]["name"], outVal )
+		return cls( inpDict["payload"]["name"], outVal )
+
+
+#Only for dtypes which np.array(inpVal.tolist(), dtype=dtypeStr) recreates exactly; e.g. not structured or object dtypes
+#Only references the user chose (LazyArrayRef or a memory-mapped .npy file) are written as references. Arrays memory-mapped from
+#a binary plotter file are written as values; that file may be overwritten or deleted, and a reference into it would then be invalid
+def _getArrayRefToWrite(inpVal):
+	if isinstance(inpVal, lazyArrayHelp.LazyArrayRef):
+		outRef = inpVal
+	elif lazyArrayHelp.isReadOnlyMemmap(inpVal) and lazyArrayHelp.isNpyFileMemmap(inpVal):
+		outRef = lazyArrayHelp.LazyArrayRef.fromMemmap(inpVal)
+	else:
+		return None
+
+	#The file being written cant hold the values for a reference to itself
+	if binaryIoHelp.isBinaryOutputPath(outRef.path):
+		return None
+	return outRef
+
+def _getSimpleDtypeStr(inpVal):
+	if not isinstance(inpVal, np.ndarray):
+		return None
+	if inpVal.dtype.hasobject or (inpVal.dtype.fields is not None) or (inpVal.dtype.subdtype is not None):
+		return None
+	return inpVal.dtype.str
 
 
 def _areNumpyIterValsEqual(iterA, iterB):
@@ -455,35 +524,33 @@ class NumpyIterPlotOption(SinglePlotOptionInter):
 
 		return _areNumpyIterValsEqual(self.value, other.value)
 
-	def toJSON(self):
-		#Note np arrays arent JSON-compatible; hence need to work with them as lists
+	def toDict(self):
+		#Note np arrays arent JSON-compatible; hence need to work with them as lists (or as references when writing binary files)
 		if self.value is None:
 			outArrays = None
 		else:
-			outArrays = [ np.array(x).tolist() for x in self.value ]
+			outArrays = [ binaryIoHelp.getArrayPayload(np.asarray(x)) for x in self.value ]
 
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":outArrays}})
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":outArrays}}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		if useDict["payload"]["value"] is None:
-			outVal = useDict["payload"]["value"]
+	def fromDict(cls, inpDict):
+		if inpDict["payload"]["value"] is None:
+			outVal = inpDict["payload"]["value"]
 		else:
-			outVal = [np.array(x) for x in useDict["payload"]["value"]]
+			outVal = [binaryIoHelp.getArrayFromPayload(x) for x in inpDict["payload"]["value"]]
 
-		return cls( useDict["payload"]["name"], outVal )
+		return cls( inpDict["payload"]["name"], outVal )
 
 @regHelp.registerForSerialization()
 class BoolNamespaceOption(SinglePlotOptionInter):
 
-	def toJSON(self):
-		outDict = self.value.__dict__
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":outDict}})
+	def toDict(self):
+		outDict = dict(self.value.__dict__)
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":outDict}}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		return cls( useDict["payload"]["name"], types.SimpleNamespace(**useDict["payload"]["value"]) )
+	def fromDict(cls, inpDict):
+		return cls( inpDict["payload"]["name"], types.SimpleNamespace(**inpDict["payload"]["value"]) )
 
 
@@ -1,9 +1,11 @@
 
 import copy
-import json
+import itertools as it
 
 import matplotlib.pyplot as plt
 
+from . import fingerprint as fingerprintHelp
+from . import instrumentation as instrumentHelp
 from . import json_transform as jsonTransHelp
 from .serialization import json_io as jsonIoHelp
 
@@ -17,14 +19,65 @@ class PlotterInter(jsonTransHelp.JSONTransformInterface):
 		self._scratchSpace = dict()
 
 	def createPlot(self, **kwargs):
-		useFactory = self.createFactory(**kwargs)
+		useFactory = self.createCopyOnWriteFactory(**kwargs)
 		useFactory._scratchSpace["outDict"] = dict()
 
-		for command in self.commands:
-			command.execute(useFactory)
+		instrumentHelp.executeCommands(self.commands, useFactory)
 
 		return useFactory._scratchSpace["outDict"]
 
+	def createPlots(self, iterOfKwargs, outPaths, fmt=None, savefigKwargs=None):
+		""" Creates (and saves) one plot per set of kwargs. Faster than calling createPlot in a loop, since the figure (and for single-graph plotters the axis and unchanged artists) is re-used where possible
+		
+		Args:
+			iterOfKwargs (iter of dicts): Each is the kwargs for a single createPlot call
+			outPaths (iter of str): Paths to save each figure to; same length as iterOfKwargs
+			fmt (str): The format to save figures in (e.g. "png"). Default of None means matplotlib infers it from the path
+			savefigKwargs (dict): Any extra keyword arguments to pass to figure.savefig (e.g. dpi)
+				 
+		Returns
+			outDicts (list of dicts): The return value of createPlot for each set of kwargs
+	 
+		Raises:
+			ValueError: If iterOfKwargs and outPaths have different lengths
+
+		Notes:
+			a) Single-graph plotters draw each plot by calling updatePlot on the previous one; so only commands affected by the options that differ between plots are run again. In this case every outDict is a (shallow) copy taken when its plot was saved, and the "plotter" entry is shared between them
+			b) The saved figures are the same as those from calling createPlot in a loop
+
+		"""
+		savefigKwargs = dict() if savefigKwargs is None else savefigKwargs
+		outDicts, figHandle, prevKwargs, prevOutDict = list(), None, None, None
+		try:
+			for kwargs, outPath in it.zip_longest(iterOfKwargs, outPaths, fillvalue=None):
+				if (kwargs is None) or (outPath is None):
+					raise ValueError("iterOfKwargs and outPaths must be the same length")
+				figHandle, prevOutDict = self._createPlotForBatch(figHandle, kwargs, prevKwargs=prevKwargs, prevOutDict=prevOutDict)
+				prevKwargs = kwargs
+				figHandle.savefig(outPath, format=fmt, **savefigKwargs)
+				outDicts.append( dict(prevOutDict) ) #prevOutDict may be modified in place to create the next plot
+		finally:
+			if figHandle is not None:
+				plt.close(figHandle)
+
+		return outDicts
+
+	def _createPlotForBatch(self, figHandle, kwargs, prevKwargs=None, prevOutDict=None):
+		""" Creates a single plot for createPlots; returns (figHandle, outDict). figHandle, prevKwargs and prevOutDict are from the previous call (None on the first call) """
+		if figHandle is not None:
+			plt.close(figHandle)
+		outDict = self.createPlot(**kwargs)
+		return plt.gcf(), outDict
+
+	def _getOptionValForBatch(self, kwargs, optName):
+		#The value createPlot(**kwargs) would use; None if we dont have the option
+		if kwargs.get(optName, None) is not None:
+			return kwargs[optName]
+		try:
+			return getattr(self.opts, optName).value
+		except AttributeError:
+			return None
+
 	def createFactory(self, **kwargs):
 		""" Returns a copy of self, with all options in **kwargs updated on the copy. Essentially a shorthand for newObj=copy.deepcopy(x); newObj.setOptionVals(kwargs)
 		
@@ -39,6 +92,35 @@ class PlotterInter(jsonTransHelp.JSONTransformInterface):
 		outPlotter.setOptionVals(copy.deepcopy(kwargs)) #Don't want list kwargs to be modified in place; hence second copy
 		return outPlotter
 
+	def createCopyOnWriteFactory(self, **kwargs):
+		""" Like createFactory, except option values are shared with self rather than copied. This is what createPlot uses; it avoids copying (potentially large) plotData arrays on every call.
+		
+		Args:
+			kwargs: Keys correspond to those in self.opts (i.e. in the options object)
+				 
+		Returns
+			outPlotter (PlotterInter): A copy of this object, with any requested option values updated. Setting option values on this (including via kwargs) will NOT affect self; modifying values in place WILL
+
+		Notes:
+			a) list/dict kwargs are shallow-copied, so the containers passed in are never modified. Anything inside them (e.g. numpy arrays) is shared with the caller; and shouldnt be modified while the plot is being created
+
+		"""
+		outPlotter = copy.copy(self)
+		outPlotter._options = self._options.createCopyOnWrite()
+		outPlotter._commands = list(self._commands)
+		outPlotter._scratchSpace = copy.deepcopy(self._scratchSpace) #Small; and commands DO modify this in place
+		outPlotter.setOptionVals( {key:_getShallowCopyIfContainer(val) for key,val in kwargs.items()} )
+		return outPlotter
+
+
+	def getFingerprint(self):
+		""" Returns a hash of this plotters options and commands (including the bytes of any arrays). Plotters with the same fingerprint should create identical plots
+		
+		Returns
+			outStr (str): Hex digest; stable between processes/sessions
+
+		"""
+		return fingerprintHelp.getFingerprint(self)
 
 	def addOptionsObjs(self, optionsObjs):
 		""" Add options to the plotter._options object. This is what generally holds things such as plotData and xLabel for example
@@ -81,6 +163,8 @@ class PlotterInter(jsonTransHelp.JSONTransformInterface):
 			if len(currAttrKeys)==1:
 				setattr(currObj, "value", optVals[key])
 			else:
+				#Copy the namespace first; it may be shared with another plotter (e.g. the one that created this factory)
+				currObj.value = copy.copy(currObj.value)
 				currObj = getattr(currObj, "value")
 				for idx,attrSubKey in enumerate(currAttrKeys[1:],start=1):
 					if idx==len(currAttrKeys)-1:
@@ -101,20 +185,19 @@ class PlotterInter(jsonTransHelp.JSONTransformInterface):
 	def commands(self):
 		return self._commands
 
-	def toJSON(self):
-		commsJSON = [x.toJSON() for x in self._commands]
-		optsJSON = self._options.toJSON()
+	def toDict(self):
+		commsDicts = [jsonIoHelp.getDictFromInstance(x) for x in self._commands]
+		optsDict = jsonIoHelp.getDictFromInstance(self._options)
 
 		outDict = {"class": str(self.__class__),
-		           "payload":{"options":optsJSON,
-		                      "commands":commsJSON}}
-		return json.dumps(outDict)
+		           "payload":{"options":optsDict,
+		                      "commands":commsDicts}}
+		return outDict
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		optionsObj = jsonIoHelp.createInstanceFromJSON(useDict["payload"]["options"])
-		commandObjs = [ jsonIoHelp.createInstanceFromJSON(x) for x in useDict["payload"]["commands"] ]
+	def fromDict(cls, inpDict):
+		optionsObj = jsonIoHelp.createInstanceFromDict(inpDict["payload"]["options"])
+		commandObjs = [ jsonIoHelp.createInstanceFromDict(x) for x in inpDict["payload"]["commands"] ]
 
 		return cls(optionsObj, commandObjs)
 
@@ -142,41 +225,176 @@ class SingleGraphPlotter(PlotterInter):
 				 
 		Returns
 			outDict (dict): Contents depend on the specific plotter used
+
+		Notes:
+			a) If axHandle belongs to a figure created directly (e.g. fig=matplotlib.figure.Figure(); axHandle=fig.add_subplot()) rather than through pyplot, then pyplot global state is never touched. This allows different plots to be created concurrently from multiple threads
 	 
 		"""
-		useFactory = self.createFactory(**kwargs)
+		useFactory = self.createCopyOnWriteFactory(**kwargs)
 		useFactory._scratchSpace["outDict"] = dict()
 		if axHandle is not None:
 			useFactory._scratchSpace["axHandle"] = axHandle
-			plt.sca(axHandle)
+			if _isPyplotFigure(axHandle.figure):
+				plt.sca(axHandle)
 
-		for command in self.commands:
-			command.execute(useFactory)
+		instrumentHelp.executeCommands(self.commands, useFactory)
 
 		return useFactory._scratchSpace["outDict"]
 
 
+	def _createPlotForBatch(self, figHandle, kwargs, prevKwargs=None, prevOutDict=None):
+		#Re-use the same figure and axis; updatePlot means we only re-run commands for options that differ from the previous plot
+		if figHandle is None:
+			figHandle = plt.figure()
+		figSize = self._getOptionValForBatch(kwargs, "figSizeOnCreation")
+		figHandle.set_size_inches( plt.rcParams["figure.figsize"] if figSize is None else figSize )
+
+		if (prevOutDict is None) or (prevOutDict.get("plotter", None) is None):
+			figHandle.clear()
+			outDict = self.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+			return figHandle, outDict
+
+		#Options set for the previous plot but not this one need resetting to our values; this must happen before
+		#setting any dot-notation keys (e.g. "showBorder.top") for the same options
+		resetNames = [key.split(".")[0] for key in prevKwargs if key not in kwargs]
+		updateKwargs = {name:getattr(self.opts, name).value for name in resetNames}
+		updateKwargs.update(kwargs)
+
+		outDict = self.updatePlot(prevOutDict, **updateKwargs)
+		return figHandle, outDict
+
+	def updatePlot(self, outDict, **kwargs):
+		""" Updates a plot made by createPlot to use new option values. Where possible only the commands affected by the changed options are run again on the existing artists; e.g. changing the title or axis limits doesnt involve redrawing the data
+		
+		Args:
+			outDict (dict): The output of self.createPlot (or of a previous updatePlot call)
+			kwargs: Names are those in self.opts, values are the new values. These are applied on top of the options used to create the plot
+
+		Returns
+			outDict (dict): The same dict that was passed in
+	 
+		Raises:
+			ValueError: If outDict doesnt contain the plotter used to create it (i.e. the plotter lacks the AddPlotterToOutput command)
+
+		Notes:
+			a) Commands declare the options they depend on (PlotCommand.getOptionDeps) and whether its safe to run them again on an existing plot (PlotCommand.canReExecute). If any affected command cant be run again, or any option is set to None, then the axis is replaced by a new one in the same place (outDict["axHandle"]) and the whole plot is redrawn on that
+			b) The result should look the same as calling createPlot with all the options; except that figure-level options (e.g. figSizeOnCreation) are ignored
+			c) Options on self are not modified; the new values are only stored on the plotter in outDict["plotter"]
+
+		"""
+		factory = outDict.get("plotter", None)
+		if factory is None:
+			raise ValueError("outDict has no \"plotter\" key; updatePlot needs the plotter instance used to create the plot")
+
+		factory.setOptionVals(kwargs)
+		changedNames = {key.split(".")[0] for key in kwargs}
+		affectedCommands = [command for command in factory.commands if _isCommandAffected(command, changedNames, factory)]
+
+		canUpdateInPlace = all([command.canReExecute(factory) for command in affectedCommands])
+		canUpdateInPlace = canUpdateInPlace and all([val is not None for val in kwargs.values()])
+
+		if canUpdateInPlace:
+			instrumentHelp.executeCommands(affectedCommands, factory)
+		else:
+			self._redrawPlotFromScratch(factory)
+
+		return outDict
+
+	def _redrawPlotFromScratch(self, factory):
+		#Swap the axis for a new one in the same place, rather than clearing it; clearing keeps some state (e.g. tick params, space taken by a removed colorbar)
+		#Then run everything again; with the scratch space reset to what createPlot would start with
+		outDict = factory._scratchSpace["outDict"]
+		cbar = factory._scratchSpace.get("cbar", None)
+		if cbar is not None:
+			cbar.remove()
+		axHandle = _replaceAxis(factory._scratchSpace["axHandle"], axLayout=factory._scratchSpace.get("axHandleLayout", None))
+
+		outDict.clear()
+		factory._scratchSpace = copy.deepcopy(self._scratchSpace)
+		factory._scratchSpace["outDict"], factory._scratchSpace["axHandle"] = outDict, axHandle
+
+		instrumentHelp.executeCommands(factory.commands, factory)
+
+
 class MultiGraphPlotter(PlotterInter):
 
-	def createPlot(self, axHandles=None, **kwargs):
+	def createPlot(self, axHandles=None, figHandle=None, **kwargs):
 		""" Combines multiple SingleGraphPlotter instances to create a grid of graphs
 		
 		Args:
-			axHandle (iter of matplotlib axis handle): If handles are provided then plots are made on these axes; useful if you want to build the plotting grid with an external library (e.g. directly in matplotlib).
+			axHandles (iter of matplotlib axis handle): If handles are provided then plots are made on these axes; useful if you want to build the plotting grid with an external library (e.g. directly in matplotlib).
+			figHandle (matplotlib figure): If provided, the grid of axes is created on this (empty) figure rather than a new pyplot figure. Passing a figure created directly (matplotlib.figure.Figure()) means pyplot global state is never touched
 			kwargs: Names are those in self.opts, values are the values you want to set (they override current values for this function call)
 				 
 		Returns
 			outDict (dict): Contents depend on the specific plotter used
 	 
 		"""
-		useFactory = self.createFactory(**kwargs)
+		useFactory = self.createCopyOnWriteFactory(**kwargs)
 		useFactory._scratchSpace["outDict"] = dict()
 		if axHandles is not None:
-			useFactory._scratchSpace["axHandles"] = axHandles
-			plt.sca(axHandle)
+			useFactory._scratchSpace["ax_handles"] = axHandles
+			figHandle = axHandles[0].figure if figHandle is None else figHandle
+		if figHandle is not None:
+			useFactory._scratchSpace["figHandle"] = figHandle
 
-		for command in self.commands:
-			command.execute(useFactory)
+		instrumentHelp.executeCommands(self.commands, useFactory)
 
 		return useFactory._scratchSpace["outDict"]
 
+
+def _isCommandAffected(command, changedNames, plotterInstance):
+	#None means the command doesnt declare its dependencies; so any change might affect it
+	optionDeps = command.getOptionDeps(plotterInstance)
+	if optionDeps is None:
+		return True
+	return len(changedNames.intersection(optionDeps)) > 0
+
+def _getAxisLayout(axHandle):
+	#Enough to create a new axis in the same place as axHandle (see _replaceAxis)
+	return {"subplotSpec":axHandle.get_subplotspec(), "position":axHandle.get_position(original=True).frozen(), "projection":axHandle.name}
+
+def _replaceAxis(oldAxHandle, axLayout=None):
+	""" Removes oldAxHandle from its figure and returns a new (empty) axis in the same place
+	
+	Args:
+		oldAxHandle (matplotlib axis handle): The axis to replace
+		axLayout (dict): Output of _getAxisLayout, taken before anything (e.g. a colorbar) moved the axis. Default of None means use the current layout of oldAxHandle
+
+	Returns
+		newAxHandle (matplotlib axis handle): Shares x/y with the same axes as oldAxHandle did (if any); and is the current axis of the figure if oldAxHandle was
+
+	"""
+	axLayout = _getAxisLayout(oldAxHandle) if axLayout is None else axLayout
+	figHandle = oldAxHandle.figure
+	wasCurrentAxis = figHandle.gca() is oldAxHandle
+	shareX, shareY = [ _getSharedAxisOnFigure(oldAxHandle, grouper) for grouper in (oldAxHandle.get_shared_x_axes(), oldAxHandle.get_shared_y_axes()) ]
+	oldAxHandle.remove()
+
+	axKwargs = {"projection":axLayout["projection"], "sharex":shareX, "sharey":shareY}
+	if axLayout["subplotSpec"] is None:
+		newAxHandle = figHandle.add_axes(axLayout["position"], **axKwargs)
+	else:
+		newAxHandle = figHandle.add_subplot(axLayout["subplotSpec"], **axKwargs)
+
+	if wasCurrentAxis:
+		figHandle.sca(newAxHandle)
+
+	return newAxHandle
+
+def _getSharedAxisOnFigure(axHandle, grouper):
+	#Axes removed from the figure (e.g. twins created by a previous draw) may still be in the grouper
+	return next( (x for x in grouper.get_siblings(axHandle) if (x is not axHandle) and (x in axHandle.figure.axes)), None )
+
+def _isPyplotFigure(figHandle):
+	#Figures created directly (i.e. matplotlib.figure.Figure()) have no manager
+	return getattr(figHandle.canvas, "manager", None) is not None
+
+
+#Cheap (unlike copy.deepcopy), but stops callers lists/dicts being modified in place
+def _getShallowCopyIfContainer(inpVal):
+	if isinstance(inpVal, list):
+		return list(inpVal)
+	if isinstance(inpVal, dict):
+		return dict(inpVal)
+	return inpVal
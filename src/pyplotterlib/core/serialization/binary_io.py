@@ -0,0 +1,189 @@
+
+import json
+import os
+import struct
+import threading
+import zipfile
+
+import numpy as np
+
+from . import json_io as jsonIoHelp
+
+_THREAD_STATE = threading.local()
+
+_FORMAT_VERSION = 1
+_METADATA_MEMBER = "metadata.json"
+_ARRAY_MEMBER_FMT = "arrays/{}.npy"
+_ARRAY_REF_KEY = "__pplArrayRef__"
+_PADDING_EXTRA_ID = 0x7070 #Header ID for the zip "extra" field we use to align array data
+_LOCAL_HEADER_STRUCT = struct.Struct("<4s5H3L2H")
+
+
+def writeInstanceToBinaryFile(inpInstance, outPath):
+	""" Writes an instance (generally a plotter) to a binary file; similar to writing inpInstance.toJSON() except numpy arrays are stored as raw typed buffers
+
+	Args:
+		inpInstance (JSONTransformInterface): Any instance with toDict/fromDict (or toJSON/fromJSON) methods
+		outPath (str): Path to write to. The file is a zip archive (loadable with np.load) containing the JSON metadata and one .npy file per array
+
+	Notes:
+		a) Arrays are stored uncompressed, with their data aligned to 64 bytes; this is what allows them to be memory-mapped on reading
+		b) The file is written to a temporary path then moved to outPath. This means arrays memory-mapped from outPath (e.g. if inpInstance was read from it) are still valid while writing
+
+	"""
+	outPath = os.fspath(outPath)
+	arrayStore = list()
+	with _ArrayStoreActive(arrayStore, outPath=outPath):
+		outDict = jsonIoHelp.getDictFromInstance(inpInstance)
+
+	metadata = {"formatVersion":_FORMAT_VERSION, "nArrays":len(arrayStore), "instance":outDict}
+	tempPath = "{}.{}-{}.tmp".format(outPath, os.getpid(), threading.get_ident())
+	try:
+		with zipfile.ZipFile(tempPath, "w", compression=zipfile.ZIP_STORED) as zipHandle:
+			zipHandle.writestr(_METADATA_MEMBER, json.dumps(metadata))
+			for idx, currArray in enumerate(arrayStore):
+				_writeArrayMember(zipHandle, _ARRAY_MEMBER_FMT.format(idx), currArray)
+		os.replace(tempPath, outPath)
+	except BaseException:
+		if os.path.exists(tempPath):
+			os.remove(tempPath)
+		raise
+
+
+def readInstanceFromBinaryFile(inpPath, memoryMap=False):
+	""" Reads an instance from a file written by writeInstanceToBinaryFile
+
+	Args:
+		inpPath (str): Path to the file
+		memoryMap (bool): If True, arrays are memory-mapped (read-only) rather than read into memory; so they are only loaded from disk when used. Being read-only means copies of the instance (e.g. copy.deepcopy) share them rather than reading them in
+
+	Returns
+		outInstance (JSONTransformInterface): The instance stored in the file
+
+	"""
+	with zipfile.ZipFile(inpPath, "r") as zipHandle:
+		metadata = json.loads( zipHandle.read(_METADATA_MEMBER).decode("utf-8") )
+		if metadata["formatVersion"] > _FORMAT_VERSION:
+			raise ValueError("File format version {} is newer than the latest supported ({})".format(metadata["formatVersion"], _FORMAT_VERSION))
+
+		arrayStore = list()
+		for idx in range(metadata["nArrays"]):
+			zipInfo = zipHandle.getinfo(_ARRAY_MEMBER_FMT.format(idx))
+			if memoryMap and (zipInfo.compress_type == zipfile.ZIP_STORED):
+				arrayStore.append( _getMemoryMappedArray(inpPath, zipHandle, zipInfo) )
+			else:
+				with zipHandle.open(zipInfo) as f:
+					arrayStore.append( np.lib.format.read_array(f, allow_pickle=False) )
+
+	with _ArrayStoreActive(arrayStore):
+		outInstance = jsonIoHelp.createInstanceFromDict(metadata["instance"])
+
+	return outInstance
+
+
+def getArrayPayload(inpArray):
+	""" Returns a JSON-compatible representation of inpArray; for use in toDict methods
+
+	Args:
+		inpArray (np.ndarray):
+
+	Returns
+		outPayload (list or dict): Generally inpArray.tolist(). When writing a binary file, a reference to the array (which gets stored separately) is returned instead
+
+	"""
+	arrayStore = getattr(_THREAD_STATE, "arrayStore", None)
+	if (arrayStore is None) or inpArray.dtype.hasobject:
+		return inpArray.tolist()
+
+	arrayStore.append(inpArray)
+	return {_ARRAY_REF_KEY: len(arrayStore)-1}
+
+
+def getArrayFromPayload(inpPayload, dtype=None):
+	""" Inverse of getArrayPayload; for use in fromDict methods
+
+	Args:
+		inpPayload (list or dict): Output from getArrayPayload
+		dtype (np.dtype or str): The dtype to create arrays from (list) payloads with; so they dont need creating at the default dtype then converting (e.g. uint8 data would otherwise go through int64). Default of None means let numpy pick. Arrays from binary files always keep their stored dtype
+
+	Returns
+		outArray (np.ndarray):
+
+	"""
+	if not( isinstance(inpPayload, dict) and (_ARRAY_REF_KEY in inpPayload) ):
+		return np.array(inpPayload, dtype=dtype)
+
+	arrayStore = getattr(_THREAD_STATE, "arrayStore", None)
+	if arrayStore is None:
+		raise ValueError("Array references can only be read from binary files (see readInstanceFromBinaryFile)")
+	return arrayStore[ inpPayload[_ARRAY_REF_KEY] ]
+
+
+def isBinaryOutputPath(inpPath):
+	""" Returns True if inpPath is the file being written by writeInstanceToBinaryFile (on this thread); for use in toDict methods, since references to arrays in this file would be invalid once its overwritten
+
+	Args:
+		inpPath (str):
+
+	Returns
+		isOutPath (bool):
+
+	"""
+	outPath = getattr(_THREAD_STATE, "outPath", None)
+	if outPath is None:
+		return False
+	try:
+		return os.path.samefile(inpPath, outPath)
+	except OSError: #Generally because one doesnt exist yet
+		return os.path.realpath(inpPath) == os.path.realpath(outPath)
+
+
+class _ArrayStoreActive():
+
+	def __init__(self, arrayStore, outPath=None):
+		self.arrayStore = arrayStore
+		self.outPath = outPath
+
+	def __enter__(self):
+		self.prevStore, self.prevOutPath = getattr(_THREAD_STATE, "arrayStore", None), getattr(_THREAD_STATE, "outPath", None)
+		_THREAD_STATE.arrayStore, _THREAD_STATE.outPath = self.arrayStore, self.outPath
+
+	def __exit__(self, excType, excVal, excTraceback):
+		_THREAD_STATE.arrayStore, _THREAD_STATE.outPath = self.prevStore, self.prevOutPath
+
+
+def _writeArrayMember(zipHandle, memberName, inpArray):
+	useZip64 = inpArray.nbytes > zipfile.ZIP64_LIMIT
+	zipInfo = zipfile.ZipInfo(memberName, date_time=(1980,1,1,0,0,0))
+	zipInfo.compress_type = zipfile.ZIP_STORED
+
+	#Pad the extra field so the .npy member starts on a 64 byte boundary; its header is a multiple of 64 bytes
+	#so the array data then ends up aligned too
+	headerLen = _LOCAL_HEADER_STRUCT.size + len(memberName.encode("utf-8")) + 4 + (20 if useZip64 else 0)
+	padLen = (-(zipHandle.fp.tell() + headerLen)) % np.lib.format.ARRAY_ALIGN
+	zipInfo.extra = struct.pack("<HH", _PADDING_EXTRA_ID, padLen) + bytes(padLen)
+
+	with zipHandle.open(zipInfo, "w", force_zip64=useZip64) as f:
+		np.lib.format.write_array(f, inpArray, allow_pickle=False)
+
+
+def _getMemoryMappedArray(inpPath, zipHandle, zipInfo):
+	#Find where the .npy data starts from the local file header (its extra field can differ from the central directory)
+	with open(inpPath, "rb") as f:
+		f.seek(zipInfo.header_offset)
+		localHeader = _LOCAL_HEADER_STRUCT.unpack( f.read(_LOCAL_HEADER_STRUCT.size) )
+		nameLen, extraLen = localHeader[-2], localHeader[-1]
+		f.seek(zipInfo.header_offset + _LOCAL_HEADER_STRUCT.size + nameLen + extraLen)
+
+		version = np.lib.format.read_magic(f)
+		readHeaderFunct = np.lib.format.read_array_header_1_0 if version==(1,0) else np.lib.format.read_array_header_2_0
+		shape, isFortranOrder, dtype = readHeaderFunct(f)
+		dataOffset = f.tell()
+
+	#np.memmap doesnt allow empty arrays
+	if np.prod(shape, dtype=np.int64) == 0:
+		return np.zeros(shape, dtype=dtype)
+
+	order = "F" if isFortranOrder else "C"
+	return np.memmap(inpPath, dtype=dtype, mode="r", shape=shape, order=order, offset=dataOffset)
+
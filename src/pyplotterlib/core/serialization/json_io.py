@@ -2,20 +2,58 @@
 import json
 
 from . import register as regHelp
+from .. import json_transform as jsonTransHelp
 
 def createInstanceFromJSON(inpJSON):
 	""" Creates an instance from a json string input
-	
+
 	Args:
 		inpJSON (str): JSON format, which will have been generated from a .toJSON() instance method. "class" key will map to the required class
-			 
+
+	Returns
+		outInstance (JSONTransformInterface): Instance of the class in "class" key
+
+	"""
+	return createInstanceFromDict( json.loads(inpJSON) )
+
+
+def createInstanceFromDict(inpDict):
+	""" Creates an instance from its dictionary representation
+
+	Args:
+		inpDict (dict or str): Generally generated using getDictFromInstance. A JSON string is also accepted; older versions embedded objects this way, so this allows reading their files
+
 	Returns
 		outInstance (JSONTransformInterface): Instance of the class in "class" key
- 
+
 	"""
-	useDict = json.loads(inpJSON)
-	useCls = regHelp._SERIALIZATION_REGISTER[ useDict["class"] ]
-	return useCls.fromJSON(inpJSON)
+	if isinstance(inpDict, str):
+		inpDict = json.loads(inpDict)
+
+	useCls = regHelp._SERIALIZATION_REGISTER[ inpDict["class"] ]
+	if _hasDictInterface(useCls):
+		return useCls.fromDict(inpDict)
+	return useCls.fromJSON( json.dumps(inpDict) )
+
+
+def getDictFromInstance(inpInstance):
+	""" Gets the dictionary representation of an instance; for embedding in the representation of its parent
+
+	Args:
+		inpInstance (JSONTransformInterface): Any instance with toDict/fromDict (or toJSON/fromJSON) methods
+
+	Returns
+		outDict (dict): Contains only JSON-compatible values. Can be passed to createInstanceFromDict
+
+	"""
+	if _hasDictInterface(type(inpInstance)):
+		return inpInstance.toDict()
+	return json.loads( inpInstance.toJSON() )
+
 
+#Classes only implementing toJSON/fromJSON (e.g. those written before toDict/fromDict existed) fall back to using those
+def _hasDictInterface(inpCls):
+	toDictFunct = getattr(inpCls, "toDict", None)
+	return (toDictFunct is not None) and (toDictFunct is not jsonTransHelp.JSONTransformInterface.toDict)
 
 
@@ -2,6 +2,7 @@
 import json
 import unittest
 
+import pyplotterlib.core.json_transform as jsonTransHelp
 import pyplotterlib.core.serialization.register as regHelp
 
 import pyplotterlib.core.serialization.json_io as tCode
@@ -51,6 +52,31 @@ class TwoLevelValidStub():
 		return True
 
 
+@regHelp.registerForSerialization()
+class DictStub(jsonTransHelp.JSONTransformInterface):
+
+	def __init__(self, inpVal, child=None):
+		self.inpVal = inpVal
+		self.child = child
+
+	def toDict(self):
+		childDict = None if self.child is None else tCode.getDictFromInstance(self.child)
+		return {"class": str(self.__class__), "payload":{"inpVal":self.inpVal, "child":childDict}}
+
+	@classmethod
+	def fromDict(cls, inpDict):
+		childDict = inpDict["payload"]["child"]
+		child = None if childDict is None else tCode.createInstanceFromDict(childDict)
+		return cls(inpDict["payload"]["inpVal"], child)
+
+	def __eq__(self, other):
+		if self.inpVal != other.inpVal:
+			return False
+		if self.child != other.child:
+			return False
+		return True
+
+
 class TestCreateInstanceFromJSON(unittest.TestCase):
 
 	def setUp(self):
@@ -73,3 +99,37 @@ class TestCreateInstanceFromJSON(unittest.TestCase):
 		expObj = self.twoLevelA
 		actObj = tCode.createInstanceFromJSON( self.twoLevelA.toJSON() )
 		self.assertEqual(expObj, actObj)
+
+
+class TestCreateInstanceFromDict(unittest.TestCase):
+
+	def setUp(self):
+		self.singleLevel = SingleLevelValidStub(4)
+		self.nestedDictStub = DictStub(5, child=DictStub(6, child=self.singleLevel))
+
+	def testRoundTripViaJSON(self):
+		expObj = self.nestedDictStub
+		actObj = tCode.createInstanceFromJSON( self.nestedDictStub.toJSON() )
+		self.assertEqual(expObj, actObj)
+
+	def testNestedObjectsNotEmbeddedAsStrings(self):
+		outDict = json.loads( self.nestedDictStub.toJSON() )
+		self.assertTrue( isinstance(outDict["payload"]["child"], dict) )
+		self.assertTrue( isinstance(outDict["payload"]["child"]["payload"]["child"], dict) )
+
+	def testReadsNestedJSONStrings(self):
+		""" Older versions embedded children as JSON strings; these need to remain readable """
+		legacyChild = json.dumps( DictStub(6).toDict() )
+		legacyJSON = json.dumps( {"class":str(DictStub), "payload":{"inpVal":5, "child":legacyChild}} )
+		expObj = DictStub(5, child=DictStub(6))
+		actObj = tCode.createInstanceFromJSON(legacyJSON)
+		self.assertEqual(expObj, actObj)
+
+	def testGetDictFromInstanceForJSONOnlyClass(self):
+		expDict = json.loads( self.singleLevel.toJSON() )
+		actDict = tCode.getDictFromInstance(self.singleLevel)
+		self.assertEqual(expDict, actDict)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,78 @@
+
+import types
+import unittest
+
+import numpy as np
+
+import pyplotterlib.core.fingerprint as tCode
+import pyplotterlib.standard.plotters as ptrs
+
+
+class TestGetFingerprint(unittest.TestCase):
+
+	def setUp(self):
+		self.dataA = np.array( [ [1,2], [3,4], [5,6] ], dtype="float64" )
+		self.kwargsA = {"plotData":[self.dataA], "titleStr":"title", "showTicksAndLabelsOnSides.top":True}
+		self.createTestObjs()
+
+	def createTestObjs(self):
+		self.plotterA = ptrs.LinePlotter(**self.kwargsA)
+		self.plotterB = ptrs.LinePlotter(**self.kwargsA)
+
+	def testEqualPlottersGiveSameFingerprint(self):
+		self.assertEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testCopiedArrayGivesSameFingerprint(self):
+		self.plotterB.opts.plotData.value = [np.array(self.dataA, copy=True)]
+		self.assertEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testNonContiguousArrayGivesSameFingerprintAsContiguous(self):
+		self.plotterB.opts.plotData.value = [np.asfortranarray(self.dataA)]
+		self.assertEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testDiffOptionValueGivesDiffFingerprint(self):
+		self.plotterB.opts.titleStr.value = "title_b"
+		self.assertNotEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testDiffArrayValueGivesDiffFingerprint(self):
+		dataB = np.array(self.dataA)
+		dataB[1][1] = 5
+		self.plotterB.opts.plotData.value = [dataB]
+		self.assertNotEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testDiffArrayDtypeGivesDiffFingerprint(self):
+		self.plotterB.opts.plotData.value = [self.dataA.astype("float32")]
+		self.assertNotEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testDiffNamespaceValGivesDiffFingerprint(self):
+		self.plotterB.setOptionVals({"showTicksAndLabelsOnSides.top":False})
+		self.assertNotEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testDiffCommandsGivesDiffFingerprint(self):
+		self.plotterB._commands = self.plotterB._commands[:-1]
+		self.assertNotEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testCachedViewsAndScratchSpaceIgnored(self):
+		self.plotterA.opts #Populates the cached opts namespace
+		self.plotterA._scratchSpace["unused"] = 4
+		self.assertEqual( self.plotterA.getFingerprint(), self.plotterB.getFingerprint() )
+
+	def testNestedPlotters(self):
+		multiA = ptrs.RectMultiPlotter(plotters=[self.plotterA])
+		multiB = ptrs.RectMultiPlotter(plotters=[self.plotterB])
+		self.assertEqual( multiA.getFingerprint(), multiB.getFingerprint() )
+		self.plotterB.opts.titleStr.value = "title_b"
+		self.assertNotEqual( multiA.getFingerprint(), multiB.getFingerprint() )
+
+	def testIntAndFloatDiffer(self):
+		self.assertNotEqual( tCode.getFingerprint([1]), tCode.getFingerprint([1.0]) )
+
+	def testSelfReferencingObjectDoesntRecurseForever(self):
+		testObj = types.SimpleNamespace(val=2)
+		testObj.selfRef = testObj
+		tCode.getFingerprint(testObj)
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,103 @@
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.core.instrumentation as tCode
+import pyplotterlib.standard.plotters as ptrs
+
+
+class TestCommandProfiler(unittest.TestCase):
+
+	def setUp(self):
+		self.plotData = [ np.array([[1,2],[3,4],[5,6]], dtype="float64") ]
+		self.plotter = ptrs.LinePlotter(plotData=self.plotData, titleStr="title", showLegend=True, dataLabels=["a"])
+		self.figHandle = matplotlib.figure.Figure()
+
+	def _runTestFunct(self, profiler):
+		with profiler:
+			self.plotter.createPlot(axHandle=self.figHandle.add_subplot(111))
+
+	def testOneRecordPerCommand(self):
+		profiler = tCode.CommandProfiler()
+		self._runTestFunct(profiler)
+		expVals = [type(x).__name__ for x in self.plotter.commands]
+		actVals = [x.commandClass for x in profiler.records]
+		self.assertEqual(expVals, actVals)
+
+	def testCallbackCalledForEachRecord(self):
+		actRecords = list()
+		profiler = tCode.CommandProfiler(callback=actRecords.append)
+		self._runTestFunct(profiler)
+		self.assertEqual(profiler.records, actRecords)
+
+	def testArtistsCountedForDataLines(self):
+		profiler = tCode.CommandProfiler()
+		self._runTestFunct(profiler)
+		actRecord = [x for x in profiler.records if x.commandClass=="PlotDataAsLines"][0]
+		self.assertEqual(1, actRecord.nArtistsAdded)
+
+	def testBytesTouchedForDataLines(self):
+		profiler = tCode.CommandProfiler()
+		self._runTestFunct(profiler)
+		actRecord = [x for x in profiler.records if x.commandClass=="PlotDataAsLines"][0]
+		self.assertEqual(self.plotData[0].nbytes, actRecord.bytesTouched)
+
+	def testNothingRecordedOutsideContext(self):
+		profiler = tCode.CommandProfiler()
+		self._runTestFunct(profiler)
+		expNumb = len(profiler.records)
+		self.plotter.createPlot(axHandle=self.figHandle.add_subplot(111))
+		self.assertEqual(expNumb, len(profiler.records))
+
+	def testOtherThreadsNotRecorded(self):
+		profiler = tCode.CommandProfiler()
+		def _createPlotOnOtherThread():
+			self.plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111))
+		with profiler:
+			currThread = threading.Thread(target=_createPlotOnOtherThread)
+			currThread.start()
+			currThread.join()
+		self.assertEqual(0, len(profiler.records))
+
+	def testNestedPlottersHaveGreaterDepth(self):
+		profiler = tCode.CommandProfiler()
+		multiPlotter = ptrs.RectMultiPlotter(plotters=[self.plotter])
+		with profiler:
+			multiPlotter.createPlot(figHandle=self.figHandle)
+		expVals = {"RectMultiPlotter":0, "LinePlotter":1}
+		actVals = {x.plotterClass:x.depth for x in profiler.records}
+		self.assertEqual(expVals, actVals)
+
+	def testTotalsSumRecords(self):
+		profiler = tCode.CommandProfiler()
+		self._runTestFunct(profiler)
+		self._runTestFunct(profiler)
+		actTotals = profiler.getTotals()["SetTitleStr"]
+		expTime = sum([x.wallTime for x in profiler.records if x.commandClass=="SetTitleStr"])
+		self.assertEqual(2, actTotals.nCalls)
+		self.assertAlmostEqual(expTime, actTotals.wallTime)
+
+	def testWriteChromeTrace(self):
+		profiler = tCode.CommandProfiler()
+		self._runTestFunct(profiler)
+		with tempfile.TemporaryDirectory() as tempDir:
+			outPath = os.path.join(tempDir, "trace.json")
+			profiler.writeChromeTrace(outPath)
+			with open(outPath) as f:
+				actVals = json.load(f)
+
+		actEvents = actVals["traceEvents"]
+		self.assertEqual(len(profiler.records), len(actEvents))
+		self.assertEqual("X", actEvents[0]["ph"])
+		self.assertEqual(profiler.records[0].commandClass, actEvents[0]["name"])
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,76 @@
+
+import copy
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import pyplotterlib.core.lazy_array as tCode
+import pyplotterlib.core.plot_options as plotOptHelp
+
+
+class TestLazyArrayRef(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.filePath = os.path.join(self.tempDir.name, "test_array.npy")
+		self.value = np.arange(24, dtype=np.float32).reshape(4,6)
+		np.save(self.filePath, self.value)
+		self.testObj = tCode.LazyArrayRef.fromNpyFile(self.filePath)
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+
+	def testValuesMatchFile(self):
+		self.assertEqual( (4,6), self.testObj.shape )
+		self.assertTrue( np.array_equal(self.value, np.asarray(self.testObj)) )
+		self.assertTrue( np.array_equal(self.value[1:3,2:], self.testObj[1:3,2:]) )
+
+	def testFromMemmapMatchesFromNpyFile(self):
+		actObj = tCode.LazyArrayRef.fromMemmap( np.load(self.filePath, mmap_mode="r") )
+		self.assertEqual(self.testObj, actObj)
+
+	def testFromMemmapRaisesForViews(self):
+		with self.assertRaises(ValueError):
+			tCode.LazyArrayRef.fromMemmap( np.load(self.filePath, mmap_mode="r")[1:] )
+
+	def testToAndFromJSONEqual(self):
+		actObj = tCode.LazyArrayRef.fromJSON(self.testObj.toJSON())
+		self.assertEqual(self.testObj, actObj)
+
+
+class TestNumpyArrayOptionFileBacked(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.filePath = os.path.join(self.tempDir.name, "test_array.npy")
+		self.value = np.arange(24, dtype=float).reshape(4,6)
+		np.save(self.filePath, self.value)
+		self.memmap = np.load(self.filePath, mmap_mode="r")
+
+	def tearDown(self):
+		del self.memmap
+		self.tempDir.cleanup()
+
+	def testDeepCopySharesReadOnlyMemmap(self):
+		testObj = plotOptHelp.NumpyArrayPlotOption("test-name", self.memmap)
+		self.assertIs(self.memmap, copy.deepcopy(testObj).value)
+
+	def testDeepCopyCopiesWriteableArray(self):
+		testObj = plotOptHelp.NumpyArrayPlotOption("test-name", self.value)
+		self.assertIsNot(self.value, copy.deepcopy(testObj).value)
+
+	def testMemmapSerializedAsReference(self):
+		testObj = plotOptHelp.NumpyArrayPlotOption("test-name", self.memmap)
+		outJSON = testObj.toJSON()
+		actObj = plotOptHelp.NumpyArrayPlotOption.fromJSON(outJSON)
+		self.assertIsInstance(json.loads(outJSON)["payload"]["value"], dict)
+		self.assertIsInstance(actObj.value, tCode.LazyArrayRef)
+		self.assertTrue( np.array_equal(self.value, np.asarray(actObj.value)) )
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -1,5 +1,6 @@
 
 import copy
+import tracemalloc
 import types
 import unittest
 
@@ -45,6 +46,25 @@ class TestOptionsCol(unittest.TestCase):
 		objB = tCode.OptionsCollection.fromJSON( objA.toJSON() )
 		self.assertEqual(objA, objB)
 
+	def testNamesSorted(self):
+		""" .names should be sorted regardless of the order options were added in """
+		expNames = sorted([self.nameA, self.nameB])
+		self.assertEqual(expNames, self.testObjB.names)
+
+	def testOptsUpdatedOnAddOption(self):
+		""" .opts should include options added after it was first accessed """
+		self.testObjA.opts #Make sure any cached values are populated
+		newOpt = tCode.BooleanPlotOption("nameC", True)
+		self.testObjA.addOption(newOpt)
+		self.assertIs(newOpt, self.testObjA.opts.nameC)
+		self.assertIn("nameC", self.testObjA.names)
+
+	def testAddOptionIgnoresDuplicateName(self):
+		""" addOption should leave the original option in place if one with the same name is added """
+		origOpt = getattr(self.testObjA.opts, self.nameA)
+		self.testObjA.addOption( tCode.BooleanPlotOption(self.nameA, not self.valA) )
+		self.assertIs(origOpt, getattr(self.testObjA.opts, self.nameA))
+
 
 class TestBoolean(unittest.TestCase):
 
@@ -217,6 +237,34 @@ class TestNumpyArray(unittest.TestCase):
 		self.testObjB = tCode.NumpyArrayPlotOption.fromJSON(self.testObjA.toJSON())
 		self.assertEqual(self.testObjA, self.testObjB)
 
+	def testToAndFromJSONKeepsDtype(self):
+		""" Checking .toJSON and .fromJSON keep compact dtypes (e.g. uint16 images) for NumpyArrayPlotOption """
+		self.testObjA.value = np.array([[0,1000],[65535,7]], dtype=np.uint16)
+		self.testObjB = tCode.NumpyArrayPlotOption.fromJSON(self.testObjA.toJSON())
+		self.assertEqual(np.uint16, self.testObjB.value.dtype)
+		self.assertEqual(self.testObjA, self.testObjB)
+
+	def testFromDictBuildsArrayAtRecordedDtype(self):
+		""" NumpyArrayPlotOption.fromDict should build arrays at the recorded dtype, rather than via a (larger) default-dtype array """
+		nVals = 200000
+		self.testObjA.value = np.ones(nVals, dtype=np.uint8)
+		inpDict = self.testObjA.toDict()
+		tracemalloc.start()
+		try:
+			self.testObjB = tCode.NumpyArrayPlotOption.fromDict(inpDict)
+			peakBytes = tracemalloc.get_traced_memory()[1]
+		finally:
+			tracemalloc.stop()
+		self.assertEqual(np.uint8, self.testObjB.value.dtype)
+		self.assertLess(peakBytes, 4*nVals)
+
+	def testFromJSONWithoutDtype(self):
+		""" NumpyArrayPlotOption JSON written before dtypes were recorded should still be readable """
+		inpDict = self.testObjA.toDict()
+		inpDict["payload"].pop("dtype")
+		self.testObjB = tCode.NumpyArrayPlotOption.fromDict(inpDict)
+		self.assertEqual(self.testObjA, self.testObjB)
+
 
 class TestBoolNamespaceOption(unittest.TestCase):
 
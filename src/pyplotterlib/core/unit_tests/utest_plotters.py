@@ -106,6 +106,30 @@ class TestPlotterInterface(unittest.TestCase):
 		self.plotter.setOptionVals({"testStrName":"new-str-here"})
 		self.assertEqual( newObj._options, self.plotter._options )
 
+	def testCreateCopyOnWriteFactory_valuesNotCopied(self):
+		""" createCopyOnWriteFactory should share (rather than copy) option values with the original """
+		newObj = self.plotter.createCopyOnWriteFactory()
+		self.assertIs(newObj.opts.testStub.value, self.plotter.opts.testStub.value)
+
+	def testCreateCopyOnWriteFactory_setValDoesntModifyOrig(self):
+		""" Setting an option value on the output of createCopyOnWriteFactory should not affect the original plotter """
+		newObj = self.plotter.createCopyOnWriteFactory()
+		newObj.opts.testStrName.value = "new-str-here"
+		self.assertEqual(self.optsCopy, self.plotter._options)
+
+	def testCreateCopyOnWriteFactory_namespaceKwargDoesntModifyOrig(self):
+		""" createCopyOnWriteFactory with a namespace kwarg (dot-notation) should not modify the original plotter """
+		newObj = self.plotter.createCopyOnWriteFactory( **{"testStub.embeddedVal":_EMBED_VAL+2} )
+		self.assertEqual(newObj.opts.testStub.value.embeddedVal, _EMBED_VAL+2)
+		self.assertEqual(self.optsCopy, self.plotter._options)
+
+	def testCreateCopyOnWriteFactory_listKwargCopied(self):
+		""" createCopyOnWriteFactory should shallow-copy list kwargs; so modifying the option value in place doesnt change the callers list """
+		inpList = [1,2]
+		newObj = self.plotter.createCopyOnWriteFactory(testStrName=inpList)
+		newObj.opts.testStrName.value.append(3)
+		self.assertEqual([1,2], inpList)
+
 	def testCreatePlot_expectedOutput(self):
 		""" createPlot should output a dictionary which can be modified by any command object """
 		targCommand = SetValInOutDictCommand()
@@ -0,0 +1,40 @@
+import argparse
+import time
+
+
+def parseStdCommandLineArgs():
+	""" Used to parse the standard expected command line arguments for benchmark scripts. Call a relevant script with --help to see their description
+
+	"""
+	parser = argparse.ArgumentParser(description="Run a benchmark and print the timings")
+	parser.add_argument("--nRepeats", default="3", help="Number of times to repeat each timing; the fastest is reported")
+	outArgs = parser.parse_args()
+	outArgs.nRepeats = int(outArgs.nRepeats)
+	return outArgs
+
+
+def getBestTimeForFunct(inpFunct, nRepeats=3):
+	""" Returns the fastest wall-clock time (in seconds) for calling inpFunct() from nRepeats attempts
+
+	"""
+	outTimes = list()
+	for idx in range(nRepeats):
+		startTime = time.perf_counter()
+		inpFunct()
+		outTimes.append( time.perf_counter() - startTime )
+	return min(outTimes)
+
+
+def printThroughput(label, nItems, timeTaken, unitStr="plots"):
+	""" Prints the number of items processed per second in a consistent format
+
+	"""
+	print("{:<40} {:>10.1f} {}/s  ({:.3f} s for {})".format(label, nItems/timeTaken, unitStr, timeTaken, nItems))
+
+
+
+def printSpeedup(label, baseTime, newTime):
+	""" Prints how many times faster newTime is than baseTime in a consistent format
+
+	"""
+	print("{:<40} {:>10.2f}x".format(label, baseTime/newTime))
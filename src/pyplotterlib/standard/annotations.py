@@ -29,13 +29,12 @@ class BarLabelAnnotation(jsonTransHelp.JSONTransformInterface):
 		outDict = {kwarg:getattr(self,kwarg) for kwarg in kwargs}
 		return outDict
 	
-	def toJSON(self):
-		return json.dumps({"class":str(self.__class__), "payload":self._getPayloadDict()})
+	def toDict(self):
+		return {"class":str(self.__class__), "payload":self._getPayloadDict()}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		return cls( **useDict["payload"] )
+	def fromDict(cls, inpDict):
+		return cls( **inpDict["payload"] )
 
 
 
@@ -63,13 +62,12 @@ class ShadedSliceAnnotation(jsonTransHelp.JSONTransformInterface):
 		outDict = {kwarg:getattr(self,kwarg) for kwarg in kwargs}
 		return outDict
 	
-	def toJSON(self):
-		return json.dumps({"class":str(self.__class__), "payload":self._getPayloadDict()})
+	def toDict(self):
+		return {"class":str(self.__class__), "payload":self._getPayloadDict()}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		return cls( **useDict["payload"] )
+	def fromDict(cls, inpDict):
+		return cls( **inpDict["payload"] )
 
 
 
@@ -124,11 +122,10 @@ class TextAnnotation(jsonTransHelp.JSONTransformInterface):
 		           "fontSize":self.fontSize}
 		return outDict
 	
-	def toJSON(self):
-		return json.dumps({"class":str(self.__class__), "payload":self._getPayloadDict()})
+	def toDict(self):
+		return {"class":str(self.__class__), "payload":self._getPayloadDict()}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		return cls( **useDict["payload"] )
+	def fromDict(cls, inpDict):
+		return cls( **inpDict["payload"] )
 
@@ -0,0 +1,81 @@
+
+import concurrent.futures
+import time
+import traceback
+import types
+
+import matplotlib.pyplot as plt
+
+from ..core.serialization import json_io as jsonIO
+
+from . import plotters as _plotters #Makes sure all standard plotters are registered for serialization in worker processes
+
+
+def renderPlottersInParallel(inpPlotters, outPaths, fmt=None, savefigKwargs=None, maxWorkers=None, mpContext=None):
+	""" Renders a group of plotters to file, spreading the work across a pool of processes (each using the Agg backend)
+
+	Args:
+		inpPlotters (iter of PlotterInter or str): Plotters to render. Strings are interpreted as the output of plotter.toJSON()
+		outPaths (iter of str): Paths to save each figure to; same length as inpPlotters
+		fmt (str): The format to save figures in (e.g. "png"). Default of None means matplotlib infers it from the path
+		savefigKwargs (dict): Any extra keyword arguments to pass to figure.savefig (e.g. dpi)
+		maxWorkers (int): Maximum number of processes to use. Default of None means use the number of processors on the machine
+		mpContext (multiprocessing context): Passed to ProcessPoolExecutor; use to control how worker processes are started
+
+	Returns
+		outResults (list of SimpleNamespace): One per plotter, in the same order as inpPlotters. Each has attributes "outPath", "success" (bool), "errorStr" (None on success), "loadTime" (time to recreate the plotter from JSON), "renderTime" (time to create and save the plot) and "totalTime" (wall time from submission to completion)
+
+	Raises:
+		ValueError: If inpPlotters and outPaths have different lengths
+
+	Notes:
+		a) A failed job does not stop the others; check the "success" attribute on each result
+		b) Plotters (rather than JSON strings) must be picklable; JSON strings are generally the safer option
+
+	"""
+	inpPlotters, outPaths = list(inpPlotters), list(outPaths)
+	if len(inpPlotters) != len(outPaths):
+		raise ValueError("inpPlotters and outPaths must be the same length; got {} and {}".format(len(inpPlotters), len(outPaths)))
+
+	outResults = [None for x in outPaths]
+	with concurrent.futures.ProcessPoolExecutor(max_workers=maxWorkers, mp_context=mpContext, initializer=_initWorker) as executor:
+		futureToIdx, startTimes = dict(), list()
+		for idx, (plotter, outPath) in enumerate(zip(inpPlotters, outPaths)):
+			startTimes.append( time.perf_counter() )
+			currFuture = executor.submit(_renderSingleJob, plotter, outPath, fmt, savefigKwargs)
+			futureToIdx[currFuture] = idx
+
+		for currFuture in concurrent.futures.as_completed(futureToIdx):
+			idx = futureToIdx[currFuture]
+			try:
+				outResults[idx] = currFuture.result()
+			except Exception: #e.g. failing to pickle the plotter
+				outResults[idx] = _getJobResult(outPaths[idx], errorStr=traceback.format_exc())
+			outResults[idx].totalTime = time.perf_counter() - startTimes[idx]
+
+	return outResults
+
+
+def _initWorker():
+	plt.switch_backend("Agg")
+
+
+def _renderSingleJob(inpPlotter, outPath, fmt, savefigKwargs):
+	try:
+		startTime = time.perf_counter()
+		plotter = jsonIO.createInstanceFromJSON(inpPlotter) if isinstance(inpPlotter, str) else inpPlotter
+		loadTime = time.perf_counter() - startTime
+
+		startTime = time.perf_counter()
+		plotter.createPlots([dict()], [outPath], fmt=fmt, savefigKwargs=savefigKwargs)
+		renderTime = time.perf_counter() - startTime
+	except Exception:
+		return _getJobResult(outPath, errorStr=traceback.format_exc())
+
+	return _getJobResult(outPath, loadTime=loadTime, renderTime=renderTime)
+
+
+def _getJobResult(outPath, errorStr=None, loadTime=None, renderTime=None):
+	return types.SimpleNamespace(outPath=outPath, success=errorStr is None, errorStr=errorStr,
+	                             loadTime=loadTime, renderTime=renderTime, totalTime=None)
+
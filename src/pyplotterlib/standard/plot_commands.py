@@ -1,15 +1,21 @@
 
 import itertools as it
-import json
 import matplotlib.ticker
 import matplotlib.pyplot as plt
 
 
 import numpy as np
 
+from ..core import lazy_array as lazyArrayHelp
 from ..core import plot_command as plotCommCoreHelp
+from ..core import plotters as plotterCoreHelp
 from ..core.serialization import register as serializationReg
 
+from .private import batched_lines as batchedLinesHelp
+from .private import block_downsample as blockDownsampleHelp
+from .private import density_raster as densityRasterHelp
+from .private import line_decimation as decimationHelp
+
 
 #Generic commands should work for all
 @serializationReg.registerForSerialization()
@@ -20,6 +26,8 @@ class AddPlotterToOutput(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-plotter-instance-to-output"
 		self._description = "Adds the plotter instance used to create a plot to the output generated"
+		self._optionDeps = []
+		self._reExecutable = True
 
 	def execute(self, plotterInstance):
 		plotterInstance._scratchSpace["outDict"]["plotter"] = plotterInstance
@@ -33,6 +41,7 @@ class AddColorBar(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-color-bar"
 		self._description = "Adds a color bar to the plot"
+		self._optionDeps = ["colorBarShow", "colorBarLabel", "colorBarLocation", "colorBarLabelRotation"]
 		self._showAttr = "colorBarShow"
 
 	def execute(self, plotterInstance):
@@ -42,7 +51,11 @@ class AddColorBar(plotCommCoreHelp.PlotCommand):
 		labelRotation = _getValueFromOptName(plotterInstance, "colorBarLabelRotation")
 
 		if toShow is True:
-			cbar = plt.colorbar(label=label,location=location)
+			axHandle = _getAxHandle(plotterInstance)
+			mappable = plotterInstance._scratchSpace.get("imageHandle", None)
+			if mappable is None: #e.g. a LinePlotter not drawing a density raster
+				return None
+			cbar = axHandle.figure.colorbar(mappable, ax=axHandle, label=label, location=location)
 			plotterInstance._scratchSpace["cbar"] = cbar			
 
 			if labelRotation is not None:
@@ -63,23 +76,36 @@ class CopyNumpyArrayPlotDataToScratchSpace(plotCommCoreHelp.PlotCommand):
 		self._name = "copy-plot-data-to-scratch-space"
 		self._description = "Copies the basic plot data to the scratch space; this can be useful if data-processing is being carried out before plotting the data"
 		self.plotDataName = plotDataName
+		self._optionDeps = [plotDataName, "plotDataDowncastFloat32"]
 
 	#Need to overwrite these classes to include the attr name for plotData
-	def toJSON(self):
+	def toDict(self):
 		outDict = {"class": str(self.__class__), "payload": {"plotDataName":self.plotDataName} }
-		return json.dumps(outDict)
+		return outDict
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		return cls( plotDataName=useDict["payload"]["plotDataName"] ) #Should almost ALWAYS be called without any values passed
+	def fromDict(cls, inpDict):
+		return cls( plotDataName=inpDict["payload"]["plotDataName"] ) #Should almost ALWAYS be called without any values passed
 
+	#Plot data may be shared with the plotter that created the factory (see createCopyOnWriteFactory); so its only
+	#copied if a later command modifies it in place, else a read-only view is used
 	def execute(self, plotterInstance):
 		plotData = _getValueFromOptName(plotterInstance, self.plotDataName)
 		if plotData is None:
 			plotterInstance._scratchSpace["usePlotData"] = None
+		elif self._laterCommandsMutatePlotData(plotterInstance):
+			inpVals = np.asarray(plotData)
+			outVals = _getPlotDataDowncastIfRequested(plotterInstance, inpVals)
+			plotterInstance._scratchSpace["usePlotData"] = np.array(outVals,copy=True) if outVals is inpVals else outVals
 		else:
-			plotterInstance._scratchSpace["usePlotData"] = np.array(plotData,copy=True)
+			outView = np.asarray(lazyArrayHelp.getUnloadedArray(plotData)).view()
+			outView.flags.writeable = False
+			plotterInstance._scratchSpace["usePlotData"] = _getPlotDataDowncastIfRequested(plotterInstance, outView)
+
+	def _laterCommandsMutatePlotData(self, plotterInstance):
+		commands = list( getattr(plotterInstance, "commands", list()) )
+		startIdx = next( (idx+1 for idx,command in enumerate(commands) if command is self), 0 )
+		return any( getattr(command, "mutatesPlotData", False) for command in commands[startIdx:] )
 
 
 @serializationReg.registerForSerialization()
@@ -88,6 +114,7 @@ class CreateFigureIfNoAxHandle(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "create-figure"
 		self._description = "If no ax-handle is present, create a figure"
+		self._optionDeps = ["figSizeOnCreation"]
 		self._axHandleKey = "axHandle"
 
 	def execute(self, plotterInstance):
@@ -96,6 +123,11 @@ class CreateFigureIfNoAxHandle(plotCommCoreHelp.PlotCommand):
 		except KeyError:
 			self._createFigure(plotterInstance)
 
+		#Record where the axis started out; so updatePlot can replace it with an identical (empty) one
+		currAxHandle = plotterInstance._scratchSpace["axHandle"]
+		plotterInstance._scratchSpace["axHandleLayout"] = plotterCoreHelp._getAxisLayout(currAxHandle)
+		plotterInstance._scratchSpace["outDict"]["axHandle"] = currAxHandle
+
 	def _createFigure(self, plotterInstance):
 		try:
 			figSize = getattr(plotterInstance.opts,"figSizeOnCreation").value
@@ -103,8 +135,7 @@ class CreateFigureIfNoAxHandle(plotCommCoreHelp.PlotCommand):
 			figSize = None
 
 		currFigHandle = plt.figure(figsize=figSize)
-		currFigHandle.add_subplot(111)
-		plotterInstance._scratchSpace["axHandle"] = plt.gca()
+		plotterInstance._scratchSpace["axHandle"] = currFigHandle.add_subplot(111)
 
 @serializationReg.registerForSerialization()
 class DrawShadedAnnotationsGeneric(plotCommCoreHelp.PlotCommand):
@@ -112,6 +143,7 @@ class DrawShadedAnnotationsGeneric(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "drawGenericShadedAnnotations"
 		self._description = "Adds shaded area annotations to the plot"
+		self._optionDeps = ["annotationsShadedGeneric"]
 		self._optName = "annotationsShadedGeneric"
 
 	def execute(self, plotterInstance):
@@ -125,7 +157,7 @@ class DrawShadedAnnotationsGeneric(plotCommCoreHelp.PlotCommand):
 
 	def _addSingleAnnotation(self, plotterInstance, annotation):
 		#Figure out the command to use
-		useComm = self._getUseComm(annotation)		
+		useComm = self._getUseComm(plotterInstance, annotation)
 
 		#Figure out the keyword arguments
 		kwargDict = {"alpha":annotation.opacity}
@@ -140,11 +172,11 @@ class DrawShadedAnnotationsGeneric(plotCommCoreHelp.PlotCommand):
 
 
 
-	def _getUseComm(self, annotation):
+	def _getUseComm(self, plotterInstance, annotation):
 		if annotation.direction.lower() == "vertical":
-			return plt.axvspan
+			return _getAxHandle(plotterInstance).axvspan
 		elif annotation.direction.lower() == "horizontal":
-			return plt.axhspan
+			return _getAxHandle(plotterInstance).axhspan
 		else:
 			raise ValueError("{} is an invalid value for annotation.direction".format(annotation.direction))
 
@@ -155,6 +187,7 @@ class DrawTextAnnotationsGeneric(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "drawGenericAnnotations"
 		self._description = "Adds Text annotations to the plot"
+		self._optionDeps = ["annotationsTextGeneric", "fontSizeDefault"]
 		self._optName = "annotationsTextGeneric"
 
 	def execute(self, plotterInstance):
@@ -191,7 +224,7 @@ class DrawTextAnnotationsGeneric(plotCommCoreHelp.PlotCommand):
 			useDict.update({"textcoords":annotation.textCoordSys})
 
 		#Actually add the annotation
-		plt.annotate(*posArgs, **useDict)
+		_getAxHandle(plotterInstance).annotate(*posArgs, **useDict)
 
 
 @serializationReg.registerForSerialization()
@@ -200,6 +233,8 @@ class GridLinesCreate(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "create-grid-lines"
 		self._description = "Creates grid lines if required" 
+		self._optionDeps = ["gridLinesShow", "gridLinesShowX", "gridLinesShowY", "gridLinesStyle", "gridLinesWidth"]
+		self._reExecutable = True
 		self._settingsComms = [_GridLinesSetVisibilityOption(),
 		                       _GridLinesSetLineStyles(),
 		                       _GridLinesSetLineWidths()]
@@ -236,17 +271,17 @@ class GridLinesCreate(plotCommCoreHelp.PlotCommand):
 
 		#Apply any options to grid lines (including turning on/off)
 #		self._applyGeneralGridLineOpts(genDict)
-		self._applyAxisGridLineOpts(genDict, axis="both")
-		self._applyAxisGridLineOpts(xDict, axis="x")
-		self._applyAxisGridLineOpts(yDict, axis="y")
+		self._applyAxisGridLineOpts(plotterInstance, genDict, axis="both")
+		self._applyAxisGridLineOpts(plotterInstance, xDict, axis="x")
+		self._applyAxisGridLineOpts(plotterInstance, yDict, axis="y")
 
 #		raise ValueError("TODO: Want to set linewidth/color on GENERAL only")
 
-	def _applyAxisGridLineOpts(self, genDict, axis="both"):
+	def _applyAxisGridLineOpts(self, plotterInstance, genDict, axis="both"):
 		if genDict is None:
 			return None
 
-		plt.gca().grid(**genDict, axis=axis)
+		_getAxHandle(plotterInstance).grid(**genDict, axis=axis)
 
 
 @serializationReg.registerForSerialization()
@@ -320,43 +355,97 @@ class PlotDataAsLines(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "plot-line-data"
 		self._description = "Plots available data using standard line-plot mode (matplotlibs plot)"
+		self._optionDeps = ["plotData", "plotDataColumnsY", "plotDataSharedX", "errorBarDataX", "errorBarDataY",
+		                    "errorBarLineMplHooks", "errorBarCapsize", "lineDecimation", "lineDecimationNumbPixels",
+		                    "lineDensityRaster", "lineDrawAsCollection"]
 		self._optName = "plotData"
 
+	#The points kept by decimation (and the density raster grid) depend on the visible range, which only matters when theyre switched on
+	def getOptionDeps(self, plotterInstance):
+		outDeps = list(self.optionDeps)
+		if _getValueFromOptName(plotterInstance, "lineDecimation") is not None:
+			outDeps += ["xLimit", "axisScaleX"]
+		if _getValueFromOptName(plotterInstance, "lineDensityRaster") is not None:
+			outDeps += ["xLimit", "yLimit"]
+		return outDeps
+
+	#Lines can only be updated in place if theres one plain line per series; anything else (error bars, collections, density rasters) is redrawn from scratch
+	def canReExecute(self, plotterInstance):
+		lineHandles = plotterInstance._scratchSpace.get("plotLineHandles", dict()).get("value", list())
+		axHandle = _getAxHandle(plotterInstance)
+		if (len(lineHandles)==0) or any([lineHandle.axes is not axHandle for lineHandle in lineHandles]):
+			return False
+
+		#relim ignores collections; so any on the axis could change the data limits
+		if ("errorBars" in plotterInstance._scratchSpace) or (len(axHandle.collections) > 0):
+			return False
+
+		for optName in ["errorBarDataX", "errorBarDataY"]:
+			if any([val is not None for val in _getValueFromOptName(plotterInstance, optName, retIfNone=list())]):
+				return False
+
+		if (_getValueFromOptName(plotterInstance, "lineDensityRaster") is not None) or _getValueFromOptName(plotterInstance, "lineDrawAsCollection", False):
+			return False
+
+		return len(self._getSeriesXYData(plotterInstance)) == len(lineHandles)
+
 	def execute(self, plotterInstance):
 		#Get the data; exit if none present
-		targVal = getattr(plotterInstance.opts, self._optName).value
-		if targVal is None:
+		allSeriesData = self._getSeriesXYData(plotterInstance)
+		if len(allSeriesData)==0:
 			return None
-		elif len(targVal)==0:
+
+		#Only the case if updatePlot decided we can re-execute (a fresh plot has no line handles yet)
+		if len(plotterInstance._scratchSpace.get("plotLineHandles", dict()).get("value", list())) > 0:
+			self._updateLinesInPlace(plotterInstance, allSeriesData)
+			return None
+
+		rasterMethod = _getValueFromOptName(plotterInstance, "lineDensityRaster")
+		if rasterMethod is not None:
+			self._drawDensityRaster(plotterInstance, allSeriesData, rasterMethod)
 			return None
 
 		#Look for any error bars present
-		_errorBarDefVal = [None for x in targVal]
+		_errorBarDefVal = [None for x in allSeriesData]
 		errorBarsY = _getValueFromOptName(plotterInstance, "errorBarDataY", _errorBarDefVal)
 		errorBarsX = _getValueFromOptName(plotterInstance, "errorBarDataX", _errorBarDefVal)
 		errorBarMplHooks = _getValueFromOptName(plotterInstance, "errorBarLineMplHooks", _errorBarDefVal)
 
-		errorBarMplHooks = [hooks for hooks,unused in zip( it.cycle(errorBarMplHooks), targVal)]
+		errorBarMplHooks = [hooks for hooks,unused in zip( it.cycle(errorBarMplHooks), allSeriesData)]
 
 		#Plot the data; may want to return handles to scratch space later
 		lineHandles = list()
 		errorLineHandles, errorCapHandles = list(), list()
-		capsizeVals = self._getCapsizeVals(plotterInstance)
-		for idx,(currData, xErrBars, yErrBars, hooks) in enumerate(it.zip_longest(targVal,errorBarsX,errorBarsY, errorBarMplHooks)):
-			xData, yData = np.array(currData)[:,0], np.array(currData)[:,1]
+		capsizeVals = self._getCapsizeVals(plotterInstance, len(allSeriesData))
+		decimationKwargs = self._getDecimationKwargs(plotterInstance)
+		drawAsCollection = _getValueFromOptName(plotterInstance, "lineDrawAsCollection", False)
+		batchedData = list() #(idx, xData, yData) for series drawn as part of a collection
+		defColors = plt.rcParams["axes.prop_cycle"].by_key().get("color", ["k"])
+		for idx,(currData, xErrBars, yErrBars, hooks) in enumerate(it.zip_longest(allSeriesData,errorBarsX,errorBarsY, errorBarMplHooks)):
+			xData, yData = currData
+			if (decimationKwargs is not None) and (xErrBars is None) and (yErrBars is None):
+				xData, yData = decimationHelp.getDecimatedLine(xData, yData, **decimationKwargs)
 			if (xErrBars is not None) or (yErrBars is not None):
 				_xBars, _yBars = [self._reshapeErrorBarData(bars) for bars in [xErrBars,yErrBars]]
-				hooks = dict() if hooks is None else hooks
+				hooks = dict() if hooks is None else dict(hooks) #Copy; hooks are shared with the parent plotter
 				if capsizeVals[idx] is not None:
 					hooks["capsize"] = capsizeVals[idx]
-				_allLines = plt.errorbar( xData, yData, yerr=_yBars, xerr=_xBars, **hooks ).lines
+				if drawAsCollection and ("color" not in hooks): #Series in the collection dont use the axis color cycle
+					hooks["color"] = defColors[idx % len(defColors)]
+				_allLines = _getAxHandle(plotterInstance).errorbar( xData, yData, yerr=_yBars, xerr=_xBars, **hooks ).lines
 				currLines = _allLines[0]
 				errorCapHandles.append(_allLines[1])
 				errorLineHandles.append(_allLines[2])
+			elif drawAsCollection:
+				batchedData.append( (idx, xData, yData) )
+				currLines = None #Filled in once the collection is created
 			else:
-				currLines = plt.plot( xData, yData )[0]
+				currLines = _getAxHandle(plotterInstance).plot( xData, yData )[0]
 			lineHandles.append(currLines)
 
+		if len(batchedData) > 0:
+			self._drawBatchedLines(plotterInstance, batchedData, lineHandles, defColors)
+
 		#Add plotted lines to scratch space
 		_setScratchSpaceDictKey(plotterInstance, "plotLineHandles", "value", lineHandles)
 		if len(errorLineHandles) > 0:
@@ -365,28 +454,103 @@ class PlotDataAsLines(plotCommCoreHelp.PlotCommand):
 
 		return
 
+	#Keeping the same lines means anything set on them (colors, labels, legend entries etc.) carries over to the new data
+	def _updateLinesInPlace(self, plotterInstance, allSeriesData):
+		decimationKwargs = self._getDecimationKwargs(plotterInstance)
+		lineHandles = plotterInstance._scratchSpace["plotLineHandles"]["value"]
+		for lineHandle, (xData, yData) in zip(lineHandles, allSeriesData):
+			if decimationKwargs is not None:
+				xData, yData = decimationHelp.getDecimatedLine(xData, yData, **decimationKwargs)
+			lineHandle.set_data(xData, yData)
+
+		axHandle = _getAxHandle(plotterInstance)
+		axHandle.relim()
+		axHandle.autoscale_view()
+
+		#Buffers from LinePlotter.appendData hold the old data
+		plotterInstance._scratchSpace.pop("streamLineBuffers", None)
+		plotterInstance._scratchSpace.pop("streamFixedLineLimits", None)
+
+	#Style lines act as the line handles for batched series; so commands setting colors/labels etc. work the same in both modes
+	def _drawBatchedLines(self, plotterInstance, batchedData, lineHandles, defColors):
+		allIdxs, allXData, allYData = zip(*batchedData)
+		colors = [defColors[idx % len(defColors)] for idx in allIdxs]
+		styleLines = batchedLinesHelp.createStyleLines(allXData, allYData, colors=colors)
+		for idx, styleLine in zip(allIdxs, styleLines):
+			lineHandles[idx] = styleLine
+
+		axHandle = _getAxHandle(plotterInstance)
+		lineCollection = batchedLinesHelp.BatchedLineCollection(styleLines)
+		axHandle.add_collection(lineCollection, autolim=True)
+		axHandle.autoscale_view()
+		_setScratchSpaceDictKey(plotterInstance, "plotLineCollection", "value", lineCollection)
+
+	#Any colormap/colorbar commands treat the raster the same as an image from ImagePlotter
+	def _drawDensityRaster(self, plotterInstance, allSeriesData, method):
+		axHandle = _getAxHandle(plotterInstance)
+		axExtent = axHandle.get_window_extent()
+		shape = ( max(int(np.ceil(axExtent.height)),1), max(int(np.ceil(axExtent.width)),1) )
+
+		allXData, allYData = zip(*allSeriesData)
+		xLimit, yLimit = [_getValueFromOptName(plotterInstance, optName) for optName in ["xLimit", "yLimit"]]
+		counts, xRange, yRange = densityRasterHelp.getDensityGrid(allXData, allYData, method, shape, xRange=xLimit, yRange=yLimit)
+
+		plotKwargs = {"origin":"lower", "extent":(*xRange, *yRange), "aspect":"auto", "interpolation":"nearest"}
+		plotKwargs.update( plotterInstance._scratchSpace.get("plotKwargs", dict()) )
+		plotterInstance._scratchSpace["imageHandle"] = axHandle.imshow( np.ma.masked_equal(counts, 0), **plotKwargs )
+		_setScratchSpaceDictKey(plotterInstance, "plotLineHandles", "value", list())
+
+	def _getDecimationKwargs(self, plotterInstance):
+		method = _getValueFromOptName(plotterInstance, "lineDecimation")
+		if method is None:
+			return None
+
+		nPixels = _getValueFromOptName(plotterInstance, "lineDecimationNumbPixels")
+		if nPixels is None:
+			nPixels = int( np.ceil(_getAxHandle(plotterInstance).get_window_extent().width) )
+
+		outKwargs = {"method":method, "nPixels":nPixels,
+		             "xRange":_getValueFromOptName(plotterInstance, "xLimit"),
+		             "xScale":_getValueFromOptName(plotterInstance, "axisScaleX")}
+		return outKwargs
+
+	#Returns (xData,yData) for each series; these are views of the option values where possible, so large inputs dont get copied
+	def _getSeriesXYData(self, plotterInstance):
+		outData = list()
+		plotData = _getValueFromOptName(plotterInstance, self._optName, retIfNone=list())
+		for currData in plotData:
+			useData = np.asarray(currData)
+			outData.append( (useData[:,0], useData[:,1]) )
+
+		columnsY = _getValueFromOptName(plotterInstance, "plotDataColumnsY")
+		if columnsY is not None:
+			columnsY = np.asarray(columnsY)
+			columnsY = columnsY.reshape(-1,1) if columnsY.ndim==1 else columnsY
+			sharedX = _getValueFromOptName(plotterInstance, "plotDataSharedX")
+			sharedX = np.arange(columnsY.shape[0]) if sharedX is None else np.asarray(sharedX)
+			outData.extend( [(sharedX, columnsY[:,idx]) for idx in range(columnsY.shape[1])] )
+
+		return outData
+
 	def _reshapeErrorBarData(self, errorBarData):
 		if errorBarData is None:
 			return None
 
-		useData = np.array(errorBarData)
+		useData = np.asarray(errorBarData)
 
 		if useData.shape[-1] == 2:
 			return useData.transpose()
 		else:
 			return useData
 
-	def _getCapsizeVals(self, plotterInstance):
-		#Figure out how many vals we need to know
-		plotData = _getValueFromOptName(plotterInstance, self._optName, retIfNone=list())
-
+	def _getCapsizeVals(self, plotterInstance, nSeries):
 		#Figure out what capsizes to use
 		errorCapsizes = _getValueFromOptName(plotterInstance, "errorBarCapsize", retIfNone=None)
 		if errorCapsizes is None:
-			return [None for x in plotData]
+			return [None for x in range(nSeries)]
 
 		useCapsizes = it.cycle(errorCapsizes)
-		outVals = [capsize for data,capsize in zip(plotData, useCapsizes)]
+		outVals = [capsize for unused,capsize in zip(range(nSeries), useCapsizes)]
 
 		return outVals
 
@@ -397,6 +561,7 @@ class PlotHozAndVertLines(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "plot-hoz-and-vert-lines"
 		self._description = "Plots horizontal and vertical lines; generally should be AFTER the main plotting (and x/y limit setting)"
+		self._optionDeps = ["plotHozLinePositions", "plotHozLineColorStrs", "plotHozLineStyleStrs", "plotVertLinePositions", "plotVertLineColorStrs", "plotVertLineStyleStrs"]
 
 	def execute(self, plotterInstance):
 		self._plotHozLines(plotterInstance)
@@ -411,7 +576,7 @@ class PlotHozAndVertLines(plotCommCoreHelp.PlotCommand):
 		kwargDicts = self._getKwargDictsForHozLines(plotterInstance, len(linePositions))
 
 		for currPos,kwargDict in it.zip_longest(linePositions, kwargDicts):
-			plt.gca().axhline(y=currPos, **kwargDict)
+			_getAxHandle(plotterInstance).axhline(y=currPos, **kwargDict)
 
 
 	def _plotVertLines(self, plotterInstance):
@@ -423,7 +588,7 @@ class PlotHozAndVertLines(plotCommCoreHelp.PlotCommand):
 		kwargDicts = self._getKwargDictsForVertLines(plotterInstance, len(linePositions))
 
 		for currPos,kwargDict in it.zip_longest(linePositions,kwargDicts):
-			plt.gca().axvline(x=currPos,**kwargDict)
+			_getAxHandle(plotterInstance).axvline(x=currPos,**kwargDict)
 
 
 	def _getKwargDictsForHozLines(self, plotterInstance, nLines):
@@ -490,6 +655,7 @@ class SetAspectStr(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-aspect-str"
 		self._description = "Sets the aspect string for the axis"
+		self._optionDeps = ["aspectStr"]
 		self._optName = "aspectStr"
 
 	def execute(self, plotterInstance):
@@ -506,6 +672,7 @@ class SetAxisBorderInvisible(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetAxisBorderVisibility"
 		self._description = "Sets the border visibility for various axes (top/bottom/left/right)"
+		self._optionDeps = ["axisBorderMakeInvisible"]
 		self._optName = "axisBorderMakeInvisible"
 
 	def execute(self, plotterInstance):
@@ -520,17 +687,17 @@ class SetAxisBorderInvisible(plotCommCoreHelp.PlotCommand):
 
 		for attrKey, attrVal in it.zip_longest(attrKeys, attrVals):
 			if attrVal is True:
-				plt.gca().spines[attrKey].set_visible(False)
+				_getAxHandle(plotterInstance).spines[attrKey].set_visible(False)
 				if attrKey == "left":
 #					plt.gca().get_yaxis().set_ticks([])
-					plt.gca().tick_params(which="both", left=False, labelleft=False)
+					_getAxHandle(plotterInstance).tick_params(which="both", left=False, labelleft=False)
 				if attrKey == "bottom":
 #					plt.gca().get_xaxis().set_ticks([])
-					plt.gca().tick_params(which="both", bottom=False, labelbottom=False)
+					_getAxHandle(plotterInstance).tick_params(which="both", bottom=False, labelbottom=False)
 				if attrKey == "right":
-					plt.gca().tick_params(which="both", right=False, labelright=False)
+					_getAxHandle(plotterInstance).tick_params(which="both", right=False, labelright=False)
 				if attrKey == "top":
-					plt.gca().tick_params(which="both", top=False, labeltop=False)
+					_getAxHandle(plotterInstance).tick_params(which="both", top=False, labeltop=False)
 
 #				if attrKey == "right":
 
@@ -549,6 +716,7 @@ class SetAxisColorX(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetAxisColorX"
 		self._description = "Sets the base color for the x-axis"
+		self._optionDeps = ["axisColorX", "axisColorX_exclSpines"]
 		self._optName = "axisColorX"
 		self._inclSpinesOptName = "axisColorX_exclSpines"
 
@@ -558,7 +726,7 @@ class SetAxisColorX(plotCommCoreHelp.PlotCommand):
 			return None
 
 		#Set options
-		currAx = plt.gca()
+		currAx = _getAxHandle(plotterInstance)
 		currAx.xaxis.label.set_color(targVal)
 		currAx.tick_params(axis='x', colors=targVal)
 
@@ -573,6 +741,7 @@ class SetAxisColorY(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetAxisColorY"
 		self._description = "Sets the base color for the y-axis"
+		self._optionDeps = ["axisColorY", "axisColorY_exclSpines"]
 		self._optName = "axisColorY"
 		self._inclSpinesOptName = "axisColorY_exclSpines"
 
@@ -582,7 +751,7 @@ class SetAxisColorY(plotCommCoreHelp.PlotCommand):
 			return None
 
 		#Set options
-		currAx = plt.gca()
+		currAx = _getAxHandle(plotterInstance)
 		currAx.yaxis.label.set_color(targVal)
 		currAx.tick_params(axis='y', colors=targVal)
 
@@ -597,13 +766,14 @@ class SetAxisScaleX(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-axis-scale-x"
 		self._description = "Sets the type of scale for the x-axis; uses matplotlib set_xscale"
+		self._optionDeps = ["axisScaleX"]
 
 	def execute(self, plotterInstance):
 		scaleVal = _getValueFromOptName(plotterInstance, "axisScaleX")
 		if scaleVal is None:
 			return None
 
-		plt.gca().set_xscale(scaleVal)
+		_getAxHandle(plotterInstance).set_xscale(scaleVal)
 
 
 @serializationReg.registerForSerialization()
@@ -612,13 +782,14 @@ class SetAxisScaleY(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-axis-scale-y"
 		self._description = "Sets the type of scale for the y-axis; uses matplotlib set_yscale"
+		self._optionDeps = ["axisScaleY"]
 
 	def execute(self, plotterInstance):
 		scaleVal = _getValueFromOptName(plotterInstance, "axisScaleY")
 		if scaleVal is None:
 			return None
 
-		plt.gca().set_yscale(scaleVal)
+		_getAxHandle(plotterInstance).set_yscale(scaleVal)
 
 
 @serializationReg.registerForSerialization()
@@ -627,6 +798,7 @@ class SetAxisTickAndLabelVisibilitiesEachSide(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetAxisTickAndLabelVisiblityEachSide"
 		self._description = "Sets which sides of the plot to show/hide tick markers and labels"
+		self._optionDeps = ["showTicksAndLabelsOnSides"]
 		self._optName = "showTicksAndLabelsOnSides"
 
 	def execute(self, plotterInstance):
@@ -648,8 +820,8 @@ class SetAxisTickAndLabelVisibilitiesEachSide(plotCommCoreHelp.PlotCommand):
 			else:
 				pass #To catch None. Though will also catch other values
 
-		plt.gca().tick_params(**useDict)
-		plt.gca().tick_params(which="minor",**useDict)
+		_getAxHandle(plotterInstance).tick_params(**useDict)
+		_getAxHandle(plotterInstance).tick_params(which="minor",**useDict)
 
 @serializationReg.registerForSerialization()
 class SetBarDataLabels(plotCommCoreHelp.PlotCommand):
@@ -657,6 +829,7 @@ class SetBarDataLabels(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-data-labels-for-bars"
 		self._description = "Sets the data labels (to use in a legend) for a bar chart; this is different to the line plotter version since theres no safe equivalent to ax.get_lines()"
+		self._optionDeps = ["dataLabels"]
 		self._optName = "dataLabels"
 
 	def execute(self, plotterInstance):
@@ -683,6 +856,8 @@ class SetBarColors(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-colors-for-bars"
 		self._description = "Sets the colors for series of bars"
+		self._optionDeps = ["barColors"]
+		self._reExecutable = True
 		self._optName = "barColors"
 
 	def execute(self, plotterInstance):
@@ -706,6 +881,8 @@ class SetBarOpacities(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-opacities-for-bars"
 		self._description = "Sets the opacities for a series of bars"
+		self._optionDeps = ["barOpacities"]
+		self._reExecutable = True
 		self._optName = "barOpacities"
 
 	def execute(self, plotterInstance):
@@ -728,6 +905,8 @@ class SetColorbarFontSizes(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-color-bar-fonts"
 		self._description = "Sets the font sizes on the color bar (if its present)"
+		self._optionDeps = ["fontSizeDefault", "colorBarFontSize", "colorBarLabelFontSize", "colorBarTickLabelFontSize"]
+		self._reExecutable = True
 		self._dictKey = "cbar"
 
 	def execute(self, plotterInstance):
@@ -761,6 +940,7 @@ class SetColormapInPlotKwargs(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-color-map"
 		self._description = "Sets the color map to use (just sets in a scratch-space dict though)"
+		self._optionDeps = ["colorMapStr"]
 		self._optName = "colorMapStr"
 
 	def execute(self, plotterInstance):
@@ -776,6 +956,7 @@ class SetColormapMaxValInPlotKwargs(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-max-colormap-val"
 		self._description = "Sets the maximum value to use when mapping data to colors (sets a value in a scratchSpace dict)"
+		self._optionDeps = ["colorMapMaxVal"]
 		self._optName = "colorMapMaxVal"
 
 	def execute(self, plotterInstance):
@@ -791,6 +972,7 @@ class SetColormapMinValInPlotKwargs(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-min-colormap-val"
 		self._description = "Sets the minimum value to use when mapping data to colors (sets a value in a scratchSpace dict)"
+		self._optionDeps = ["colorMapMinVal"]
 		self._optName = "colorMapMinVal"
 
 	def execute(self, plotterInstance):
@@ -807,6 +989,7 @@ class SetDataLabels(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetDataLabels"
 		self._description = "Sets the data labels for lines currently plotted; this is needed to show a legend"
+		self._optionDeps = ["dataLabels"]
 		self._optName = "dataLabels"
 
 	def execute(self, plotterInstance):
@@ -828,6 +1011,8 @@ class SetLineErrorBarColors(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLineErrorBarColors"
 		self._description = "Sets the color of the error bars"
+		self._optionDeps = ["errorBarColors", "errorBarColorsMatchLinesByDefault", "lineColors"]
+		self._reExecutable = True
 
 	def execute(self, plotterInstance):
 		#Get error bar handles (exit if not present)
@@ -836,9 +1021,19 @@ class SetLineErrorBarColors(plotCommCoreHelp.PlotCommand):
 		if errorHandles is None:
 			return None
 
-		#Figure out what colors to use; if empty then exit without doing anything
+		#Keep the original colors; this means running again (e.g. from updatePlot) can undo any earlier changes
+		origColors = _getScratchSpaceValueIfPresent(plotterInstance, "errorBars", "origColors")
+		if origColors is None:
+			origColors = [ ([handle.get_color() for handle in barHandles], [handle.get_color() for handle in capHandles])
+			               for capHandles,barHandles in zip(errorCapHandles,errorHandles) ]
+			_setScratchSpaceDictKey(plotterInstance, "errorBars", "origColors", origColors)
+
+		#Figure out what colors to use; if empty then use the original colors
 		colorCycle = self._getColorCycle(plotterInstance)
 		if colorCycle is None:
+			for capHandles,barHandles,(barColors,capColors) in zip(errorCapHandles,errorHandles,origColors):
+				[handle.set_color(color) for handle,color in zip(barHandles,barColors)]
+				[handle.set_color(color) for handle,color in zip(capHandles,capColors)]
 			return None
 
 		useColors = it.cycle(colorCycle)
@@ -870,6 +1065,8 @@ class SetLegendFontSize(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLegendFontSize"
 		self._description = "Sets the font size to use in the legend"
+		self._optionDeps = ["fontSizeDefault"]
+		self._reExecutable = True
 
 	def execute(self, plotterInstance):
 		defFont = _getDefaultFontSizeFromPlotter(plotterInstance)
@@ -886,6 +1083,8 @@ class SetLegendNumberColumns(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLegendNumbColumns"
 		self._description = "Sets the number of columns to use in the legend"
+		self._optionDeps = ["legendNumbCols"]
+		self._reExecutable = True
 		self._optName = "legendNumbCols"
 
 	def execute(self, plotterInstance):
@@ -902,6 +1101,8 @@ class SetLegendLocStr(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLegendLocStr"
 		self._description = "Sets the 'loc' option for matplotlibs legend() function; as far as i understand, this either tells mpl where to draw the legend or where to START drawing from"
+		self._optionDeps = ["legendLocStr"]
+		self._reExecutable = True
 		self._optName = "legendLocStr"
 
 	def execute(self, plotterInstance):
@@ -922,6 +1123,8 @@ class SetLegendFractPosStart(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLegendFractPosStart"
 		self._description = "Sets either the 'loc' or 'bbox_to_anchor' values in mpl. Regardless, this tells it where to start drawing the legend"
+		self._optionDeps = ["legendFractPosStart", "legendLocStr"]
+		self._reExecutable = True
 		self._optName = "legendFractPosStart"
 
 	def execute(self, plotterInstance):
@@ -943,6 +1146,8 @@ class SetLegendHandlesToPlottedLinesDefault(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLegendHandlesToPlottedLines"
 		self._description = "If they are present in the scratch space, the legend handles are set to plotLineHandles; this is to avoid errorbars interfering with the legend"
+		self._optionDeps = []
+		self._reExecutable = True
 
 	def execute(self, plotterInstance):
 		lineHandles = _getScratchSpaceValueIfPresent(plotterInstance, "plotLineHandles", "value")
@@ -957,6 +1162,8 @@ class SetLineAlpha(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLineThickness"
 		self._description = "Sets the line thicknesses for lines currently plotted"
+		self._optionDeps = ["lineAlpha"]
+		self._reExecutable = True
 		self._optName = "lineAlpha"
 
 	def execute(self, plotterInstance):
@@ -986,6 +1193,8 @@ class SetLineColors(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLineColors"
 		self._description = "Sets the line colors for lines currently plotted"
+		self._optionDeps = ["lineColors"]
+		self._reExecutable = True
 		self._optName = "lineColors"
 
 	def execute(self, plotterInstance):
@@ -1007,6 +1216,8 @@ class SetLineMarkerSizes(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLineMarkerSizes"
 		self._description = "Sets the sizes for line markers"
+		self._optionDeps = ["lineMarkerSizes"]
+		self._reExecutable = True
 		self._optName = "lineMarkerSizes"
 
 	def execute(self, plotterInstance):
@@ -1032,6 +1243,8 @@ class SetLineMarkerStyles(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLineMarkerStyles"
 		self._description = "Sets the line markers for lines currently plotted"
+		self._optionDeps = ["lineMarkerStyles"]
+		self._reExecutable = True
 		self._optName = "lineMarkerStyles"
 
 	def execute(self, plotterInstance):
@@ -1050,6 +1263,8 @@ class SetLineStyles(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLineStyles"
 		self._description = "Sets the line styles for lines currently plotted"
+		self._optionDeps = ["lineStyles"]
+		self._reExecutable = True
 		self._optName = "lineStyles"
 
 	def execute(self, plotterInstance):
@@ -1073,6 +1288,8 @@ class SetLineThickness(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setLineThickness"
 		self._description = "Sets the line thicknesses for lines currently plotted"
+		self._optionDeps = ["lineThickness"]
+		self._reExecutable = True
 		self._optName = "lineThickness"
 
 	def execute(self, plotterInstance):
@@ -1102,6 +1319,8 @@ class SetTickLabelFontSize(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setTickLabelFontSize"
 		self._description = "Sets the size of the font for axis tick labels"
+		self._optionDeps = ["fontSizeDefault"]
+		self._reExecutable = True
 		self._optName = "setTickLabelFontSize"
 
 	def execute(self, plotterInstance):
@@ -1109,8 +1328,8 @@ class SetTickLabelFontSize(plotCommCoreHelp.PlotCommand):
 		if defVal is None:
 			return None
 
-		plt.gca().xaxis.set_tick_params(labelsize=defVal)
-		plt.gca().yaxis.set_tick_params(labelsize=defVal)
+		_getAxHandle(plotterInstance).xaxis.set_tick_params(labelsize=defVal)
+		_getAxHandle(plotterInstance).yaxis.set_tick_params(labelsize=defVal)
 
 
 @serializationReg.registerForSerialization()
@@ -1119,6 +1338,8 @@ class SetTickLabelValues(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetTickLabelValues"
 		self._description = "Sets the values for the tick labels on x/y axes"
+		self._optionDeps = ["tickMarkerLabelsX", "tickMarkerLabelsY"]
+		self._reExecutable = True
 		self._optNameX = "tickMarkerLabelsX"
 		self._optNameY = "tickMarkerLabelsY"
 
@@ -1127,10 +1348,10 @@ class SetTickLabelValues(plotCommCoreHelp.PlotCommand):
 		yLabelVals = _getValueFromOptName(plotterInstance, self._optNameY)
 
 		if xLabelVals is not None:
-			plt.gca().set_xticklabels(xLabelVals)
+			_getAxHandle(plotterInstance).set_xticklabels(xLabelVals)
 			
 		if yLabelVals is not None:
-			plt.gca().set_yticklabels(yLabelVals)
+			_getAxHandle(plotterInstance).set_yticklabels(yLabelVals)
 
 @serializationReg.registerForSerialization()
 class SetTickMarkerValues(plotCommCoreHelp.PlotCommand):
@@ -1138,6 +1359,7 @@ class SetTickMarkerValues(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setTickMarkerValues"
 		self._description = "Sets the values for the (major) tick marker positions on x/y axes"
+		self._optionDeps = ["tickMarkerValsX", "tickMarkerValsY"]
 		self._optNameX = "tickMarkerValsX"
 		self._optNameY = "tickMarkerValsY"
 
@@ -1146,10 +1368,10 @@ class SetTickMarkerValues(plotCommCoreHelp.PlotCommand):
 		yTickVals = _getValueFromOptName(plotterInstance, self._optNameY)
 
 		if xTickVals is not None:
-			plt.gca().set_xticks(xTickVals)
+			_getAxHandle(plotterInstance).set_xticks(xTickVals)
 
 		if yTickVals is not None:
-			plt.gca().set_yticks(yTickVals)
+			_getAxHandle(plotterInstance).set_yticks(yTickVals)
 
 @serializationReg.registerForSerialization()
 class SetTickMinorMarkersOn(plotCommCoreHelp.PlotCommand):
@@ -1157,6 +1379,7 @@ class SetTickMinorMarkersOn(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setTickMinorMarkersOn"
 		self._description = "Optionally turns the minor tick markers on/off"
+		self._optionDeps = ["showMinorTickMarkersX", "showMinorTickMarkersY"]
 		self._optNameX = "showMinorTickMarkersX"
 		self._optNameY = "showMinorTickMarkersY"
 
@@ -1166,15 +1389,15 @@ class SetTickMinorMarkersOn(plotCommCoreHelp.PlotCommand):
 
 		if showMinorTicksX is not None:
 			if showMinorTicksX is False:
-				plt.gca().xaxis.set_minor_locator( matplotlib.ticker.AutoMinorLocator(n=1) )
+				_getAxHandle(plotterInstance).xaxis.set_minor_locator( matplotlib.ticker.AutoMinorLocator(n=1) )
 			elif showMinorTicksX is True:
-				plt.gca().xaxis.set_minor_locator( matplotlib.ticker.AutoMinorLocator()   )
+				_getAxHandle(plotterInstance).xaxis.set_minor_locator( matplotlib.ticker.AutoMinorLocator()   )
 
 		if showMinorTicksY is not None:
 			if showMinorTicksY is False:
-				plt.gca().yaxis.grid(visible=False, which="minor")
+				_getAxHandle(plotterInstance).yaxis.grid(visible=False, which="minor")
 			elif showMinorTicksY is True:
-				plt.gca().yaxis.set_minor_locator( matplotlib.ticker.AutoMinorLocator()   )
+				_getAxHandle(plotterInstance).yaxis.set_minor_locator( matplotlib.ticker.AutoMinorLocator()   )
 
 
 @serializationReg.registerForSerialization()
@@ -1183,6 +1406,7 @@ class SetGroupTickValsToPosKey(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-tick-vals-to-values-in-scratchspace"
 		self._description = "Sets the tick markers to groups of values found in the scratchspace. More general than setting to group Centres (original goal was to allow labels to be on left/right of bars)"
+		self._optionDeps = ["plotHorizontally", "groupLabelTickPosKey", "groupLabelTicksEveryN"]
 		self.defaultKey = "groupCentres"
 		self.groupLabelPosKey = "groupLabelTickPosKey"
 
@@ -1200,9 +1424,9 @@ class SetGroupTickValsToPosKey(plotCommCoreHelp.PlotCommand):
 		useCentres = [x for idx,x in enumerate(useVals) if idx%everyN==0]
 
 		if plotHoz:
-			plt.gca().set_yticks(useCentres)
+			_getAxHandle(plotterInstance).set_yticks(useCentres)
 		else:
-			plt.gca().set_xticks(useCentres)
+			_getAxHandle(plotterInstance).set_xticks(useCentres)
 
 
 @serializationReg.registerForSerialization()
@@ -1211,6 +1435,7 @@ class SetTickValsToGroupCentres(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-tick-val-to-group-centres"
 		self._description = "Sets the tick markers to the centre of each group of bars"
+		self._optionDeps = ["plotHorizontally", "groupLabelTicksEveryN"]
 		
 	def execute(self, plotterInstance):
 		#Check if we have any data; exit if not
@@ -1227,9 +1452,9 @@ class SetTickValsToGroupCentres(plotCommCoreHelp.PlotCommand):
 		useCentres = [x for idx,x in enumerate(groupCentres) if idx%everyN==0]
 
 		if plotHoz:
-			plt.gca().set_yticks(useCentres)
+			_getAxHandle(plotterInstance).set_yticks(useCentres)
 		else:
-			plt.gca().set_xticks(useCentres)
+			_getAxHandle(plotterInstance).set_xticks(useCentres)
 
 @serializationReg.registerForSerialization()
 class SetTickLabelsToGroupLabels(plotCommCoreHelp.PlotCommand):
@@ -1237,6 +1462,7 @@ class SetTickLabelsToGroupLabels(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-tick-labels-to-group-names"
 		self._description = "Sets the axis tick labels to group names"
+		self._optionDeps = ["plotHorizontally", "groupLabels", "groupLabelTicksEveryN", "groupLabelRotation", "tickLabelRotationX", "tickLabelRotationY"]
 
 	def execute(self, plotterInstance):
 
@@ -1265,9 +1491,9 @@ class SetTickLabelsToGroupLabels(plotCommCoreHelp.PlotCommand):
 		#
 		plotHoz = plotterInstance.opts.plotHorizontally.value
 		if plotHoz:
-			plt.gca().set_yticklabels(useLabels, rotation=rotation)
+			_getAxHandle(plotterInstance).set_yticklabels(useLabels, rotation=rotation)
 		else:
-			plt.gca().set_xticklabels(useLabels, rotation=rotation)
+			_getAxHandle(plotterInstance).set_xticklabels(useLabels, rotation=rotation)
 
 
 @serializationReg.registerForSerialization()
@@ -1276,16 +1502,18 @@ class SetTickLabelRotations(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-tick-label-rotation"
 		self._description = "Sets the rotation angle (in degrees) for labels on the x/y axis"
+		self._optionDeps = ["tickLabelRotationX", "tickLabelRotationY"]
+		self._reExecutable = True
 
 	def execute(self, plotterInstance):
 		rotationX = _getValueFromOptName(plotterInstance, "tickLabelRotationX")
 		rotationY = _getValueFromOptName(plotterInstance, "tickLabelRotationY")
 
 		if rotationX is not None:
-			plt.gca().xaxis.set_tick_params(rotation=rotationX)
+			_getAxHandle(plotterInstance).xaxis.set_tick_params(rotation=rotationX)
 
 		if rotationY is not None:
-			plt.gca().yaxis.set_tick_params(rotation=rotationY)
+			_getAxHandle(plotterInstance).yaxis.set_tick_params(rotation=rotationY)
 
 
 @serializationReg.registerForSerialization()
@@ -1294,6 +1522,8 @@ class SetTitleStr(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "setTitleString"
 		self._description = "Sets the axis title string"
+		self._optionDeps = ["titleStr", "titleFractPosX", "titleFractPosY", "fontSizeDefault"]
+		self._reExecutable = True
 		self._optName = "titleStr"
 
 	def execute(self, plotterInstance):
@@ -1307,7 +1537,7 @@ class SetTitleStr(plotCommCoreHelp.PlotCommand):
 
 		kwargDict = {"fontsize":defFontSize, "x":xPosVal, "y":yPosVal}
 		kwargDict = {k:v for k,v in kwargDict.items() if v is not None}
-		plt.title(targVal, **kwargDict)
+		_getAxHandle(plotterInstance).set_title(targVal, **kwargDict)
 
 @serializationReg.registerForSerialization()
 class SetXLabelStr(plotCommCoreHelp.PlotCommand):
@@ -1315,6 +1545,8 @@ class SetXLabelStr(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetXLabelStr"
 		self._description = "Set the string value for the x-label" 
+		self._optionDeps = ["xLabelStr", "fontSizeDefault"]
+		self._reExecutable = True
 		self._optName = "xLabelStr"
 
 	def execute(self, plotterInstance):
@@ -1323,7 +1555,7 @@ class SetXLabelStr(plotCommCoreHelp.PlotCommand):
 			return None
 
 		defFontSize = _getDefaultFontSizeFromPlotter(plotterInstance)
-		plt.xlabel(targVal, fontsize=defFontSize)
+		_getAxHandle(plotterInstance).set_xlabel(targVal, fontsize=defFontSize)
 
 @serializationReg.registerForSerialization()
 class SetXLabelFractPos(plotCommCoreHelp.PlotCommand):
@@ -1331,13 +1563,15 @@ class SetXLabelFractPos(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetXLabelFractPos"
 		self._description = "Set the fractional position for the x-label"
+		self._optionDeps = ["xLabelFractPos", "xLabelStr", "fontSizeDefault"]
+		self._reExecutable = True
 		self._optName = "xLabelFractPos"
 
 	def execute(self, plotterInstance):
 		targVal = getattr(plotterInstance.opts, self._optName).value
 		if targVal is None:
 			return None
-		plt.gca().xaxis.set_label_coords(targVal[0], targVal[1])
+		_getAxHandle(plotterInstance).xaxis.set_label_coords(targVal[0], targVal[1])
 
 
 @serializationReg.registerForSerialization()
@@ -1346,13 +1580,15 @@ class SetXLimit(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetXLimit"
 		self._description = "Set the x-axis limits"
+		self._optionDeps = ["xLimit"]
+		self._reExecutable = True
 		self._optName = "xLimit"
 
 	def execute(self, plotterInstance):
 		targVal = getattr(plotterInstance.opts, self._optName).value
 		if targVal is None:
 			return None
-		plt.xlim(targVal)
+		_getAxHandle(plotterInstance).set_xlim(targVal)
 
 @serializationReg.registerForSerialization()
 class SetYLimit(plotCommCoreHelp.PlotCommand):
@@ -1360,13 +1596,15 @@ class SetYLimit(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetYLimit"
 		self._description = "Set the y-axis limits"
+		self._optionDeps = ["yLimit"]
+		self._reExecutable = True
 		self._optName = "yLimit"
 
 	def execute(self, plotterInstance):
 		targVal = getattr(plotterInstance.opts, self._optName).value
 		if targVal is None:
 			return None
-		plt.ylim(targVal)
+		_getAxHandle(plotterInstance).set_ylim(targVal)
 
 
 @serializationReg.registerForSerialization()
@@ -1375,6 +1613,8 @@ class SetYLabelStr(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetYLabelStr"
 		self._description = "Set the string value for the y-label"
+		self._optionDeps = ["yLabelStr", "fontSizeDefault"]
+		self._reExecutable = True
 		self._optName = "yLabelStr"
 
 	def execute(self, plotterInstance):
@@ -1383,7 +1623,7 @@ class SetYLabelStr(plotCommCoreHelp.PlotCommand):
 			return None
 
 		defFontSize = _getDefaultFontSizeFromPlotter(plotterInstance)
-		plt.ylabel(targVal, fontsize=defFontSize)
+		_getAxHandle(plotterInstance).set_ylabel(targVal, fontsize=defFontSize)
 
 
 @serializationReg.registerForSerialization()
@@ -1392,13 +1632,15 @@ class SetYLabelFractPos(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "SetYLabelFractPos"
 		self._description = "Set the fractional position for the y-label"
+		self._optionDeps = ["yLabelFractPos", "yLabelStr", "fontSizeDefault"]
+		self._reExecutable = True
 		self._optName = "yLabelFractPos"
 
 	def execute(self, plotterInstance):
 		targVal = getattr(plotterInstance.opts, self._optName).value
 		if targVal is None:
 			return None
-		plt.gca().yaxis.set_label_coords(targVal[0], targVal[1])
+		_getAxHandle(plotterInstance).yaxis.set_label_coords(targVal[0], targVal[1])
 
 @serializationReg.registerForSerialization()
 class TurnLegendOnIfRequested(plotCommCoreHelp.PlotCommand):
@@ -1406,6 +1648,8 @@ class TurnLegendOnIfRequested(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "TurnLegendOnIfRequested"
 		self._description = "Turn the legend on if requested"
+		self._optionDeps = None #Legend entries copy the appearance of plotted artists; so almost any option can affect it
+		self._reExecutable = True
 		self._optName = "showLegend"
 
 	def execute(self, plotterInstance):
@@ -1413,6 +1657,11 @@ class TurnLegendOnIfRequested(plotCommCoreHelp.PlotCommand):
 		if targVal is None:
 			return None
 
+		#Remove any legend we added previously (only relevant when running again from updatePlot)
+		prevLegend = plotterInstance._scratchSpace.pop("legendHandle", None)
+		if (prevLegend is not None) and (targVal is not True):
+			prevLegend.remove()
+
 		legendKwargDict = plotterInstance._scratchSpace["legendKwargDict"]
 
 		#Need to pass data line handles explicitly if present, otherwise error bars can interfere
@@ -1424,11 +1673,39 @@ class TurnLegendOnIfRequested(plotCommCoreHelp.PlotCommand):
 #			if dataLines is not None:
 #				plt.legend(dataLines,**legendKwargDict)
 #			else:
-			plt.legend(**legendKwargDict)
+			plotterInstance._scratchSpace["legendHandle"] = _getAxHandle(plotterInstance).legend(**legendKwargDict)
 
 
 
 #Some shared helper functions
+def _getAxHandle(plotterInstance):
+	""" Returns the axis handle commands should draw on. Use this rather than plt.gca(), so that plotting works on figures unknown to pyplot (and hence from multiple threads) """
+	return plotterInstance._scratchSpace["axHandle"]
+
+def _getBlockDownsamplingShape(plotterInstance, dataShape):
+	""" Returns the (nRows, nCols) blocks to aggregate array data into (see blockDownsampling option); None if the data shouldnt be downsampled """
+	if _getValueFromOptName(plotterInstance, "blockDownsampling") is None:
+		return None
+
+	blockShape = blockDownsampleHelp.getBlockShape(dataShape, _getBlockDownsamplingNumbPixels(plotterInstance))
+	return None if blockShape==(1,1) else blockShape
+
+def _getBlockDownsamplingNumbPixels(plotterInstance):
+	""" Returns the (nRows, nCols) pixel grid that array data is drawn on; the blockDownsamplingNumbPixels option if set, else the size of the axis in pixels """
+	nPixels = _getValueFromOptName(plotterInstance, "blockDownsamplingNumbPixels")
+	if nPixels is None:
+		axExtent = _getAxHandle(plotterInstance).get_window_extent()
+		nPixels = ( int(np.ceil(axExtent.height)), int(np.ceil(axExtent.width)) )
+	return nPixels
+
+def _getPlotDataDowncastIfRequested(plotterInstance, data):
+	""" Returns data as float32 if the plotDataDowncastFloat32 option is True and data has a larger float dtype; else returns data unchanged """
+	if not _getValueFromOptName(plotterInstance, "plotDataDowncastFloat32"):
+		return data
+	if (not np.issubdtype(data.dtype, np.floating)) or (data.dtype.itemsize <= 4):
+		return data
+	return data.astype(np.float32)
+
 def _getDefaultFontSizeFromPlotter(plotterInstance):
 	try:
 		outVal = getattr(plotterInstance.opts, "fontSizeDefault").value
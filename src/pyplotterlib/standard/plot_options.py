@@ -126,6 +126,17 @@ class BarColors(plotOptCore.StringIterPlotOption):
 		self.name = "barColors"
 		self.value = value
 
+@serializationReg.registerForSerialization()
+class BarDrawAsCollection(plotOptCore.BooleanPlotOption):
+	""" If True, draw all bars in each data series as a single matplotlib artist; rather than one Rectangle patch per bar. This is much faster when plotting many thousands of bars
+
+	Bar colors, opacities, stacking, data labels (for legends) and bar labels work the same either way. For histograms with no space between bars, each series is drawn as one filled step patch (i.e. ax.stairs); otherwise a PolyCollection is used. Note that legend placement with legendLocStr="best" (the default) ignores bars drawn this way
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "barDrawAsCollection"
+		self.value = value
+
 @serializationReg.registerForSerialization()
 class BarOpacities(plotOptCore.FloatIterPlotOption):
 	""" The opacities to use for each bar. Values should be between 0 (invisible) and 1 (fully opaque). Corresponds to the alpha keyword in matplotlib.
@@ -137,6 +148,33 @@ class BarOpacities(plotOptCore.FloatIterPlotOption):
 		self.name = "barOpacities" if name is None else name
 		self.value = value
 
+@serializationReg.registerForSerialization()
+class BlockDownsampling(plotOptCore.StringPlotOption):
+	""" Method used to shrink very large arrays (images/matrices) before drawing them; each block of values which would share a screen pixel is replaced by one aggregated value. Options are:
+
+	None: Draw the full array (default)
+	"mean", "max", "min": Aggregate each block by its mean/max/min. Any NaN in a block gives NaN
+	"nanmean", "nanmax", "nanmin": As above, but NaN values are ignored; so only blocks with all values NaN give NaN
+
+	Notes:
+		a) The array is processed in chunks of rows and never copied in full; so memory-mapped arrays too large to fit in memory can be plotted
+		b) Axis co-ordinates still match the original array indices; so ticks, tick labels and axis limits work the same as when plotting the full array. Any value annotations are drawn at the centre of each block. If tick marks are placed on every row/column (e.g. DiscreteHeatMapPlotter) then fewer are used, though group labels still match the row/column each tick is on
+		c) Default colormap limits (colorMapMinVal/colorMapMaxVal) come from the aggregated values; so "mean" will usually give a narrower range than the original data
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "blockDownsampling"
+		self.value = value
+
+@serializationReg.registerForSerialization()
+class BlockDownsamplingNumbPixels(plotOptCore.IntIterPlotOption):
+	""" The (nRows, nCols) pixel grid to shrink arrays to when using blockDownsampling. The array is only shrunk along dimensions where its larger than this. Default of None means use the size of the axis in pixels, at the figure dpi. Should generally be set if saving a figure with a higher dpi than it was created with
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "blockDownsamplingNumbPixels"
+		self.value = value
+
 @serializationReg.registerForSerialization()
 class ColorBarFontSize(plotOptCore.IntPlotOption):
 	""" The font size to use for the colorbar
@@ -493,6 +531,60 @@ class LineColors(plotOptCore.StringIterPlotOption):
 		self.name = "lineColors"
 		self.value = value
 
+@serializationReg.registerForSerialization()
+class LineDecimation(plotOptCore.StringPlotOption):
+	""" Method used to reduce the number of points in each line before drawing it; useful for series with millions of points. Options are:
+
+	None: Draw every point (default)
+	"minMax": Split the x-axis into narrow columns (4 per pixel) and keep the first, last, minimum and maximum point in each. The line should look the same as drawing every point (at the target resolution) and all peaks are kept
+	"lttb": Use the Largest-Triangle-Three-Buckets algorithm with 2 points per pixel column. Fewer points than "minMax", but the line may look slightly different (e.g. narrow spikes can be missed)
+
+	Note: Decimation is skipped for data series with error bars or non-finite values, or where x-values arent sorted. Markers (if used) are only drawn for the retained points
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "lineDecimation"
+		self.value = value
+
+@serializationReg.registerForSerialization()
+class LineDecimationNumbPixels(plotOptCore.IntPlotOption):
+	""" The number of pixel columns to decimate lines to (see lineDecimation). Default of None means use the width of the axis in pixels, at the figure dpi. Should generally be set if saving a figure with a higher dpi than it was created with
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "lineDecimationNumbPixels"
+		self.value = value
+
+@serializationReg.registerForSerialization()
+class LineDensityRaster(plotOptCore.StringPlotOption):
+	""" If set, data is drawn as an image showing how many points/lines pass through each pixel; rather than as individual lines. Useful when theres far too many points to draw as vector lines. Options are:
+
+	None: Draw lines as normal (default)
+	"lines": Count the line segments passing through each pixel
+	"points": Count the data points in each pixel
+
+	The image uses the colormap options (e.g. colorMapStr, colorMapMaxVal) and can have a colorbar (colorBarShow). Pixels with a count of zero are left transparent
+
+	Notes:
+		a) The grid matches the size of the axis in pixels (at the figure dpi) when the plot is created, and covers xLimit/yLimit (or the full data range if theyre not set)
+		b) Line style options, error bars and data labels dont apply in this mode. Linear axis scales are assumed
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "lineDensityRaster"
+		self.value = value
+
+@serializationReg.registerForSerialization()
+class LineDrawAsCollection(plotOptCore.BooleanPlotOption):
+	""" If True, draw all data series (except those with error bars) as a single matplotlib LineCollection; rather than one Line2D per series. This is much faster when plotting thousands of series
+
+	Line style options (colors, thicknesses, alphas, styles, markers) and data labels work the same either way. Note that markers are drawn on top of all lines in this mode, as are dashed lines when mixed with solid ones
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "lineDrawAsCollection"
+		self.value = value
+
 @serializationReg.registerForSerialization()
 class LineMarkerSizes(plotOptCore.FloatIterOrSingleFloatOption):
 	""" The sizes of line marker sizes. Valid values are either a single number or a list of numbers.
@@ -556,11 +648,50 @@ class PlotData2D(plotOptCore.NumpyIterPlotOption):
 	b) An iterable of nx2 numpy arrays, with columns being [x,y]
 	c) An iterable that transforms to b) when np.array() is called on each element
 
+	Notes:
+		a) Numpy arrays are used as-is (the x/y columns are taken as views), so large float arrays arent copied before being passed to matplotlib. A single mxnx2 array also works (for m series of n points each)
+		b) For many series sharing the same x-values, plotDataColumnsY (with plotDataSharedX) avoids storing the x-values for each series
+
 	"""
 	def __init__(self, name=None, value=None):
 		self.name = "plotData" if name is None else name
 		self.value = value
 
+@serializationReg.registerForSerialization()
+class PlotDataColumnsY(plotOptCore.NumpyArrayPlotOption):
+	""" Columnar plot data; an nxm numpy array with each of the m columns holding the y-values for one data series. x-values come from plotDataSharedX
+
+	Notes:
+		a) These series are plotted after any in plotData; so options set per-series (e.g. lineColors) apply to plotData series first
+		b) Each column is passed to matplotlib as a view, so no copies are made by pyplotterlib. A 1-dim array is treated as a single series
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "plotDataColumnsY" if name is None else name
+		self.value = value
+
+@serializationReg.registerForSerialization()
+class PlotDataSharedX(plotOptCore.NumpyArrayPlotOption):
+	""" A 1-dim numpy array with the x-values for every series in plotDataColumnsY. Default of None means use 0,1,2,...
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "plotDataSharedX" if name is None else name
+		self.value = value
+
+@serializationReg.registerForSerialization()
+class PlotDataDowncastFloat32(plotOptCore.BooleanPlotOption):
+	""" If True, float plot data with more than 32 bits (e.g. float64) is converted to float32 before drawing; halving the memory used by the copies made for drawing (including matplotlibs own). Default of None means keep the original dtype. Integer data (e.g. uint8/uint16 images) always keeps its dtype
+
+	Notes:
+		a) The stored option value (and hence serialized data) is never converted
+		b) float32 has ~7 significant figures; so this can merge colors for data with a tiny range relative to its magnitude
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "plotDataDowncastFloat32"
+		self.value = value
+
 @serializationReg.registerForSerialization()
 class PlotData1D(plotOptCore.NumpyIterPlotOption):
 	""" Option for 1-dimensional plot data. Expected formats are:
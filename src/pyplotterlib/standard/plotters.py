@@ -15,6 +15,8 @@ from .serialization import writePlotterToFile, readPlotterFromFile
 
 #Other objects
 from . import annotations
+from .private.histogram_plotter import getHistoDataFromChunks
+from ..core.lazy_array import LazyArrayRef
 
 
 #Define them like this to keep the file easier to read + plotters easy as possible to access
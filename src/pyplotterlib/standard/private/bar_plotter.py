@@ -2,10 +2,11 @@
 import itertools as it
 import types
 
-import matplotlib.ticker
 import matplotlib.pyplot as plt
+import matplotlib.ticker
 import numpy as np
 
+from . import batched_bars as batchedBarsHelp
 from . import shared
 
 from ...core import plotters as plotterCoreHelp
@@ -95,6 +96,7 @@ def _createOptionsList():
 	plotOptStdHelp.AxisColorY(),
 	plotOptStdHelp.AxisColorY_exclSpines(),
 	plotOptStdHelp.BarColors(),
+	plotOptStdHelp.BarDrawAsCollection(),
 	plotOptStdHelp.BarOpacities(),
 	plotOptStdHelp.DataLabels(),
 	plotOptStdHelp.ErrorBarCapsize(),
@@ -279,6 +281,7 @@ class AddBarLabels(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-labels-to-bars"
 		self._description = "Adds labels to bars; generally showing the value for each"
+		self._optionDeps = ["addBarLabelsByDefault", "barLabels", "plotData1D", "fontSizeDefault"]
 
 	def execute(self, plotterInstance):
 		#Get relevant values
@@ -319,7 +322,7 @@ class AddBarLabels(plotCommCoreHelp.PlotCommand):
 		if annotation.mplBarLabelHooks is not None:
 			kwargs.update(annotation.mplBarLabelHooks)
 
-		plt.bar_label(inpBar, **kwargs)
+		plotCmdStdHelp._getAxHandle(plotterInstance).bar_label(inpBar, **kwargs)
 
 
 class _CalcValsMixin():
@@ -343,6 +346,7 @@ class CalculateBottomVals(plotCommCoreHelp.PlotCommand, _CalcValsMixin):
 	def __init__(self):
 		self._name = "calculate-bar-bottom-vals"
 		self._description = "Calculates the bottom value of each bar (i.e. where to draw from) and saves to the scratch space"
+		self._optionDeps = ["plotData1D", "stackBars", "reverseIntraBarOrdering"]
 
 	def execute(self, plotterInstance):
 		#Get the data, exit if none present
@@ -361,42 +365,25 @@ class CalculateBottomVals(plotCommCoreHelp.PlotCommand, _CalcValsMixin):
 
 
 def _getBarBottomVals(inpPlotData, skipVals, reverseIntraOrdering=False):
+	""" Gets the bottom value of each bar; this is non-zero for stacked bars
 
+	Returns
+		outVals (nSeries x nGroups np array): Bottom value for each bar. Missing (e.g. None) values are treated as zero height when stacking
 
-	#Initialize output
+	"""
 	nSeries = len(inpPlotData)
-	nGroups = max( [len(x) for x in inpPlotData] )
-	outVals = [ list() for x in range(nSeries) ]
-
-	#
 	if skipVals is None:
 		skipVals = [False for x in range(nSeries)]
 
 	#Best to NOT reverse stack order i think.
-	if reverseIntraOrdering:
-#		skipVals = [val for val in reversed(skipVals)]
-		plotData = list()
-		for currSeries in reversed(inpPlotData):
-			plotData.append(currSeries)
-	else:
-		plotData = inpPlotData 
-
-
-	defStartPos = 0.0
+	plotData = list(reversed(inpPlotData)) if reverseIntraOrdering else inpPlotData
+	dataVals = shared._getBarLikeDataAsMaskedArray(plotData).filled(0)
 
-	#Set the first series to zero for each group
-	outVals[0] = [defStartPos for x in range(nGroups)]
-
-	#Now we apply the relevant shift to each series
+	#Each stacked series starts where the previous one ended; others start at zero
+	outVals = np.zeros(dataVals.shape)
 	for skipShift,sIdx in zip(skipVals,range(1,nSeries)):
-		for gIdx in range(nGroups):
-			if skipShift is True:
-				prevBottom = outVals[sIdx-1][gIdx]
-				prevVal = plotData[sIdx-1][gIdx]
-				outVals[sIdx].append( prevBottom + prevVal )
-			else:
-				outVals[sIdx].append(defStartPos)
-
+		if skipShift is True:
+			outVals[sIdx] = outVals[sIdx-1] + dataVals[sIdx-1]
 
 	return outVals
 
@@ -406,6 +393,7 @@ class CalculateCentreVals(plotCommCoreHelp.PlotCommand, _CalcValsMixin):
 	def __init__(self):
 		self._name = "calculate-bar-centre-vals"
 		self._description = "Calculates the central position of each bar in the bar plot and saves to the scratch space"
+		self._optionDeps = ["plotData1D", "stackBars", "widthBars", "widthInterSpacing", "widthIntraSpacing"]
 
 	def execute(self, plotterInstance):
 		#Get the data, exit if none present
@@ -445,6 +433,7 @@ class CalculateGroupEdgesFromCentreVals(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "calculate-group-edges-vals"
 		self._description = "Calculates the left/right edges of each group; using central positions of each bar (calculated by another function)"
+		self._optionDeps = ["widthBars"]
 
 	
 	def execute(self, plotterInstance):
@@ -456,18 +445,10 @@ class CalculateGroupEdgesFromCentreVals(plotCommCoreHelp.PlotCommand):
 		widthBars = plotterInstance.opts.widthBars.value
 		widthBars = 1 if widthBars is None else widthBars
 
-		#barCentres is a list for each series; so we have 1 group per entry in each list
-		nGroups = len(barCentres[0])
-		groupEdges = list()
-		for n in range(nGroups):
-			groupVals = [x[n] for x in barCentres]
-			minCentre, maxCentre = min(groupVals), max(groupVals)
-			edges = [minCentre - 0.5*widthBars, maxCentre+0.5*widthBars]
-			groupEdges.append(edges)
-
-		#
-		plotterInstance._scratchSpace["groupLeftEdges"] = [x[0] for x in groupEdges]
-		plotterInstance._scratchSpace["groupRightEdges"] = [x[1] for x in groupEdges]
+		#barCentres has one row per series and one column per group
+		barCentres = np.asarray(barCentres)
+		plotterInstance._scratchSpace["groupLeftEdges"] = np.min(barCentres, axis=0) - 0.5*widthBars
+		plotterInstance._scratchSpace["groupRightEdges"] = np.max(barCentres, axis=0) + 0.5*widthBars
 
 #This will get A LOT more complicated later (when dealing with widths etc)
 @serializationReg.registerForSerialization()
@@ -476,6 +457,8 @@ class PlotOneDimDataAsBars(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "plot-bar-data"
 		self._description = "Plots available data using bar chart plotter"
+		self._optionDeps = ["plotData1D", "plotHorizontally", "widthBars", "reverseIntraBarOrdering", "errorBarData", "errorBarColors", "errorBarCapsize",
+		                    "barDrawAsCollection"]
 		self._optName = "plotData1D"
 
 	def execute(self, plotterInstance):
@@ -503,7 +486,10 @@ class PlotOneDimDataAsBars(plotCommCoreHelp.PlotCommand):
 
 		#Plot the data; may want to return handles to scratch space later
 		outBars = list()
-		for idx,currData in enumerate(targVal):
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		drawAsCollection = plotCmdStdHelp._getValueFromOptName(plotterInstance, "barDrawAsCollection", retIfNone=False)
+		dataVals = shared._getBarLikeDataAsMaskedArray(targVal)
+		for idx in range(len(targVal)):
 			#We need centres for idx from the other end is all
 			if reverseIntraOrdering:
 				centres = allCentres[len(targVal)-1-idx]
@@ -512,15 +498,21 @@ class PlotOneDimDataAsBars(plotCommCoreHelp.PlotCommand):
 				centres = allCentres[idx]
 				bottoms = allBottoms[idx]
 
-			useCentres = [centre for centre,val in zip(centres,currData) if val is not None]
-			useBottoms = [bottom for bottom,val in zip(bottoms,currData) if val is not None]
-			useData = [val for val in currData if val is not None]
+			#Missing (e.g. None) values are skipped
+			useIdxs = ~np.ma.getmaskarray(dataVals[idx])
+			useCentres = np.asarray(centres)[useIdxs]
+			useBottoms = np.asarray(bottoms)[useIdxs]
+			useData = dataVals[idx].data[useIdxs]
 			useErrorBarOpts = allErrorBars[idx]
 
-			if plotHoz:
-				currBars = plt.barh( np.array(useCentres), np.array(useData), height=barWidth, left=np.array(useBottoms), **useErrorBarOpts )
+			if drawAsCollection:
+				orientation = "horizontal" if plotHoz else "vertical"
+				currBars = batchedBarsHelp.drawBarsAsCollection(axHandle, useCentres, useData, barWidth, useBottoms, orientation=orientation,
+				                                                color=batchedBarsHelp.getDefaultColor(idx), **useErrorBarOpts)
+			elif plotHoz:
+				currBars = axHandle.barh( useCentres, useData, height=barWidth, left=useBottoms, **useErrorBarOpts )
 			else:
-				currBars = plt.bar( np.array(useCentres), np.array(useData), width=barWidth, bottom=np.array(useBottoms), **useErrorBarOpts )
+				currBars = axHandle.bar( useCentres, useData, width=barWidth, bottom=useBottoms, **useErrorBarOpts )
 
 			outBars.append(currBars)
 
@@ -578,13 +570,15 @@ class SetTickMinorValsOnOrOff(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-tick-minor-vals-on-or-off"
 		self._description = "Sets the minor tick values on/off. The axis to apply to is that which should be showing numerical data (where the height of bars matters)"
+		self._optionDeps = ["showMinorTickMarkers", "plotHorizontally"]
 		self._optName = "showMinorTickMarkers"
 
 	def execute(self, plotterInstance):
 		minorTicksOn = getattr(plotterInstance.opts, self._optName).value
 		plotHoz = getattr(plotterInstance.opts, "plotHorizontally").value
 
-		useAx = plt.gca().xaxis if plotHoz else plt.gca().yaxis
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		useAx = axHandle.xaxis if plotHoz else axHandle.yaxis
 		self._applyToAxis(useAx, minorTicksOn)
 
 	def _applyToAxis(self, inpAxis, minorTickOn):
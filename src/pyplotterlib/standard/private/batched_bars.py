@@ -0,0 +1,164 @@
+
+""" Drawing each series of bars as a single matplotlib artist, rather than one Rectangle patch per bar """
+
+import matplotlib.collections
+import matplotlib.container
+import matplotlib.patches
+import matplotlib.pyplot as plt
+import numpy as np
+
+
+class BatchedBarContainer(matplotlib.container.Container):
+	""" Holds one artist that draws every bar in a data series. Used as a stand-in for matplotlibs BarContainer, so code which styles bars/adds legends/adds bar labels works the same in both cases
+
+	Notes:
+		a) get_children() returns only the single artist; so setting color/alpha on each child (as done for BarContainer) styles every bar at once
+		b) set_label() is passed on to the artist; so it appears in legends like a single bar would
+		c) patches (one Rectangle per bar) are only created when first accessed; which is generally only needed for ax.bar_label()
+
+	"""
+
+	def __new__(cls, artist, *args, **kwargs):
+		return tuple.__new__(cls, [artist])
+
+	def __init__(self, artist, rectBounds, datavalues=None, orientation="vertical", errorbar=None, label=None):
+		""" Initializer
+
+		Args:
+			artist (matplotlib Artist): The artist that draws all the bars (e.g. a PolyCollection). Should already be added to an axis
+			rectBounds (nx4 np array): (left, bottom, width, height) for each bar; in data co-ordinates
+			datavalues (1-dim np array): Value for each bar. Default of None means use the bar heights (widths for horizontal)
+			orientation (str): "vertical" or "horizontal"
+			errorbar (ErrorbarContainer): Error bars drawn for these bars; None if there are none
+			label (str): Label to use in any legend
+
+		"""
+		super().__init__([artist], label=None)
+		self.artist = artist
+		self.orientation = orientation
+		self.errorbar = errorbar
+		self._rectBounds = np.asarray(rectBounds)
+		self._patches = None
+		sizeIdx = 3 if orientation == "vertical" else 2
+		self.datavalues = self._rectBounds[:,sizeIdx] if datavalues is None else datavalues
+		if label is not None:
+			self.set_label(label)
+
+	@property
+	def patches(self):
+		if self._patches is None:
+			self._patches = [self._createPatch(bounds) for bounds in self._rectBounds]
+		return self._patches
+
+	def set_label(self, s):
+		matplotlib.container.Container.set_label(self, s)
+		self.artist.set_label(s)
+
+	#Not added to an axis; but they need transforms/clipping set for ax.bar_label(label_type="center")
+	def _createPatch(self, bounds):
+		left, bottom, width, height = bounds
+		outPatch = matplotlib.patches.Rectangle((left,bottom), width, height, transform=self.artist.get_transform(), label="_nolegend_")
+		if self.artist.axes is not None:
+			outPatch.set_clip_path(self.artist.axes.patch)
+		return outPatch
+
+
+def drawBarsAsCollection(axHandle, positions, sizes, barWidths, bottoms, orientation="vertical", color=None, **kwargs):
+	""" Draws bars as a single PolyCollection. Arguments broadly match ax.bar(), though only some keyword arguments are supported
+
+	Args:
+		axHandle (matplotlib Axes): The axis to draw on
+		positions (1-dim np array): Centre of each bar along the axis that bars are placed on (x-axis for vertical bars)
+		sizes (1-dim np array): Height of each bar (or length, for horizontal bars)
+		barWidths (float or 1-dim np array): Width of each bar (or thickness, for horizontal bars)
+		bottoms (float or 1-dim np array): Where each bar starts from (left-most value, for horizontal bars)
+		orientation (str): "vertical" or "horizontal"
+		color: Color for all the bars. Default of None means the first color in the matplotlib color cycle
+		kwargs: Error bar kwargs only; xerr, yerr, ecolor, capsize
+
+	Returns
+		outContainer (BatchedBarContainer):
+
+	"""
+	positions, sizes = np.asarray(positions, dtype=float), np.asarray(sizes, dtype=float)
+	barWidths, bottoms = np.broadcast_to(barWidths, positions.shape), np.broadcast_to(bottoms, positions.shape)
+
+	if orientation == "vertical":
+		rectBounds = np.column_stack([positions - 0.5*barWidths, bottoms, barWidths, sizes])
+	else:
+		rectBounds = np.column_stack([bottoms, positions - 0.5*barWidths, sizes, barWidths])
+
+	collection = _createCollection(rectBounds, getDefaultColor() if color is None else color)
+	stickyEdges = collection.sticky_edges.y if orientation == "vertical" else collection.sticky_edges.x
+	stickyEdges.extend( np.unique(bottoms).tolist() )
+	axHandle.add_collection(collection, autolim=True)
+	axHandle.autoscale_view()
+
+	errorbar = _addErrorBars(axHandle, rectBounds, orientation, **kwargs)
+	return BatchedBarContainer(collection, rectBounds, datavalues=sizes, orientation=orientation, errorbar=errorbar)
+
+
+def drawContiguousBarsAsStairs(axHandle, edges, sizes, color=None):
+	""" Draws vertical bars which share edges (e.g. a histogram with no spaces between bars) as a single filled step patch. Unlike separate bars, there are no edges drawn between neighbouring bars (only visible if bars are partly transparent)
+
+	Args:
+		axHandle (matplotlib Axes): The axis to draw on
+		edges (1-dim np array): Edges of the bars; len(sizes)+1 values
+		sizes (1-dim np array): Height of each bar
+		color: Color for all the bars. Default of None means the first color in the matplotlib color cycle
+
+	Returns
+		outContainer (BatchedBarContainer):
+
+	"""
+	edges, sizes = np.asarray(edges, dtype=float), np.asarray(sizes, dtype=float)
+	useColor = getDefaultColor() if color is None else color
+	stepPatch = axHandle.stairs(sizes, edges, fill=True, color=useColor, linewidth=plt.rcParams["patch.linewidth"])
+
+	lowEdges, highEdges = np.minimum(edges[:-1], edges[1:]), np.maximum(edges[:-1], edges[1:])
+	rectBounds = np.column_stack([lowEdges, np.zeros(len(sizes)), highEdges-lowEdges, sizes])
+	return BatchedBarContainer(stepPatch, rectBounds, datavalues=sizes, orientation="vertical")
+
+
+def getDefaultColor(seriesIdx=0):
+	""" Gets the default color for a data series drawn by drawBarsAsCollection/drawContiguousBarsAsStairs; the same way LinePlotter does for collections (i.e. indexing the matplotlib color cycle by series)
+
+	Args:
+		seriesIdx (int): Index of the data series
+
+	Returns
+		color (str):
+
+	"""
+	defColors = plt.rcParams["axes.prop_cycle"].by_key().get("color", ["k"])
+	return defColors[seriesIdx % len(defColors)]
+
+
+def _createCollection(rectBounds, color):
+	left, bottom, width, height = rectBounds.T
+	right, top = left + width, bottom + height
+
+	#Same vertex order as a Rectangle patch
+	verts = np.empty( (len(rectBounds),4,2) )
+	verts[:,:,0] = np.column_stack([left, right, right, left])
+	verts[:,:,1] = np.column_stack([bottom, bottom, top, top])
+
+	outCollection = matplotlib.collections.PolyCollection(verts, closed=True, facecolors=color, edgecolors="none",
+	                                                      linewidths=plt.rcParams["patch.linewidth"],
+	                                                      zorder=matplotlib.patches.Patch.zorder)
+	return outCollection
+
+
+#Same positioning/defaults that ax.bar() uses for error bars
+def _addErrorBars(axHandle, rectBounds, orientation, xerr=None, yerr=None, ecolor="k", capsize=None):
+	if (xerr is None) and (yerr is None):
+		return None
+
+	left, bottom, width, height = rectBounds.T
+	if orientation == "vertical":
+		errX, errY = left + 0.5*width, bottom + height
+	else:
+		errX, errY = left + width, bottom + 0.5*height
+
+	capsize = plt.rcParams["errorbar.capsize"] if capsize is None else capsize
+	return axHandle.errorbar(errX, errY, xerr=xerr, yerr=yerr, fmt="none", ecolor=ecolor, capsize=capsize, label="_nolegend_")
@@ -0,0 +1,110 @@
+
+""" Drawing many line series as a single matplotlib artist """
+
+import itertools as it
+
+import matplotlib.collections
+import matplotlib.colors
+import matplotlib.lines
+import matplotlib.pyplot as plt
+
+_NO_LINE_STYLES = ["None", "none", " ", ""]
+_NO_MARKER_STYLES = [None, "None", "none", " ", ""]
+
+
+def createStyleLines(allXData, allYData, colors=None):
+	""" Creates one Line2D per data series, for use with BatchedLineCollection. These are never added to an axis; they just hold the style (and data) for each series, and can be used as legend handles
+
+	Args:
+		allXData (iter of 1-dim np array): x-values for each series
+		allYData (iter of 1-dim np array): y-values for each series
+		colors (iter): Initial color for each series. Default of None means follow the default matplotlib color cycle
+
+	Returns
+		outLines (list of Line2D): Properties other than color use the current rcParams
+
+	"""
+	useColors = it.cycle( plt.rcParams["axes.prop_cycle"].by_key().get("color", ["k"]) ) if colors is None else colors
+	outLines = list()
+	for idx, (xData, yData, color) in enumerate(zip(allXData, allYData, useColors)):
+		#Label matches the one matplotlib gives lines added with ax.plot; so legends look the same in both drawing modes
+		outLines.append( matplotlib.lines.Line2D(xData, yData, color=color, label="_child{}".format(idx)) )
+	return outLines
+
+
+class BatchedLineCollection(matplotlib.collections.LineCollection):
+	""" LineCollection which draws one line per Line2D in styleLines. Styles are read from those lines each time this is drawn, so anything that styles a Line2D (e.g. set_color, set_linewidth, set_alpha, set_linestyle, set_marker) also works for the matching series here
+
+	Notes:
+		a) Drawing N series with this is much faster than drawing N Line2D artists
+		b) Markers are drawn after all the lines, so they always appear on top of lines from other series. Similarly, when solid and dashed series are mixed, the dashed ones are drawn after all the solid ones
+
+	"""
+
+	def __init__(self, styleLines, **kwargs):
+		""" Initializer
+
+		Args:
+			styleLines (iter of Line2D): One per series; generally created with createStyleLines. These should NOT be added to an axis
+			kwargs: Passed to the LineCollection initializer
+
+		"""
+		self.styleLines = list(styleLines)
+		useKwargs = {"zorder":matplotlib.lines.Line2D.zorder}
+		useKwargs.update(kwargs)
+		super().__init__([line.get_xydata() for line in self.styleLines], **useKwargs)
+
+	def draw(self, renderer):
+		colors, isDashed = self._updateStylesFromLines()
+
+		#Line2D uses different cap/join styles for solid and dashed lines, but a collection only has one of each. So
+		#mixed styles need drawing in two passes; each with the other type made transparent
+		if not any(isDashed):
+			self._drawWithCapStyle(renderer, "solid")
+		elif all(isDashed):
+			self._drawWithCapStyle(renderer, "dash")
+		else:
+			transparent = (0,0,0,0)
+			self.set_color([transparent if dashed else color for color, dashed in zip(colors,isDashed)])
+			self._drawWithCapStyle(renderer, "solid")
+			self.set_color([color if dashed else transparent for color, dashed in zip(colors,isDashed)])
+			self._drawWithCapStyle(renderer, "dash")
+			self.set_color(colors)
+
+		self._drawMarkers(renderer)
+
+	def _drawWithCapStyle(self, renderer, styleType):
+		self.set_capstyle( plt.rcParams["lines.{}_capstyle".format(styleType)] )
+		self.set_joinstyle( plt.rcParams["lines.{}_joinstyle".format(styleType)] )
+		super().draw(renderer)
+
+	def _updateStylesFromLines(self):
+		colors, lineStyles, isDashed = list(), list(), list()
+		for line in self.styleLines:
+			currStyle = line.get_linestyle()
+			currAlpha = 0 if currStyle in _NO_LINE_STYLES else line.get_alpha()
+			colors.append( matplotlib.colors.to_rgba(line.get_color(), currAlpha) )
+			lineStyles.append( "-" if currStyle in _NO_LINE_STYLES else currStyle )
+			isDashed.append( line.is_dashed() )
+
+		self.set_color(colors)
+		self.set_linestyle(lineStyles)
+		self.set_linewidth([line.get_linewidth() for line in self.styleLines])
+		return colors, isDashed
+
+	def _drawMarkers(self, renderer):
+		for line in self.styleLines:
+			if line.get_marker() in _NO_MARKER_STYLES:
+				continue
+
+			if line.axes is None:
+				line.axes = self.axes
+				line.set_transform(self.get_transform())
+				line.set_clip_path(self.axes.patch)
+
+			#Only want the markers; the line itself is part of the collection
+			origStyle = line.get_linestyle()
+			line.set_linestyle("None")
+			line.draw(renderer)
+			line.set_linestyle(origStyle)
+
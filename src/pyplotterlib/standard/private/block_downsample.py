@@ -0,0 +1,205 @@
+
+""" Functions for reducing huge 2-dim arrays (e.g. images or matrices) to roughly the number of pixels they will be drawn with; by aggregating values in rectangular blocks """
+
+import warnings
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+BLOCK_AGGREGATION_METHODS = ["mean", "max", "min", "nanmean", "nanmax", "nanmin"]
+
+_AGGREGATION_FUNCTS = {"mean":np.mean, "max":np.max, "min":np.min,
+                       "nanmean":np.nanmean, "nanmax":np.nanmax, "nanmin":np.nanmin}
+
+#Limits temporary memory; only this many input elements are read (and converted to the output dtype) at once
+_DEF_CHUNK_SIZE = 2**22
+
+
+def getBlockShape(dataShape, outShape):
+	""" Gets the (nRows, nCols) block size needed to reduce an array with dataShape to (at most) outShape
+
+	Args:
+		dataShape ((int,int)): (nRows, nCols) of the input array
+		outShape ((int,int)): (nRows, nCols) of the target grid; generally the size of the plotted region in pixels
+
+	Returns
+		blockShape ((int,int)): Number of input (rows, cols) aggregated into each output value. (1,1) means no downsampling needed
+
+	"""
+	return tuple( max(int(np.ceil(nData/max(nOut,1))),1) for nData,nOut in zip(dataShape[:2], outShape) )
+
+
+def getBlockDownsampledArray(data, blockShape, method, chunkSize=_DEF_CHUNK_SIZE, processChunkFunct=None):
+	""" Aggregates values in each (non-overlapping) block of data, where the first block starts at data[0,0]. Blocks on the last row/column are smaller if the data shape isnt a multiple of the block shape
+
+	Args:
+		data (np array): NxM or NxMxK (e.g. RGB images) array; can be memory-mapped (e.g. np.load(mmap_mode="r"))
+		blockShape ((int,int)): Number of (rows, cols) in each block. See getBlockShape
+		method (str): How to aggregate each block; "mean", "max", "min" or the nan-aware versions "nanmean", "nanmax", "nanmin" (which ignore NaN values)
+		chunkSize (int): Approximate max number of input elements processed at once; this bounds the temporary memory used. At least one row of blocks is always processed at once
+		processChunkFunct (function): Optional; f(chunk, rowOffset) called on a (writeable) copy of each chunk of rows before its aggregated; e.g. to set some values to NaN. rowOffset is the index of the chunks first row in data
+
+	Returns
+		outArray (np array): Aggregated values; one per block. 3-dim inputs keep their dtype (so integer RGB values stay in the same range), else mean methods return floats (float32 for 8/16 bit integer inputs)
+
+	Raises:
+		ValueError: If method is not recognised
+
+	Notes:
+		a) For non nan-aware methods, any NaN in a block makes the output NaN; for nan-aware methods only all-NaN blocks give NaN
+		b) Only one chunk of rows is read from data at a time, so memory-mapped inputs never need loading fully into memory
+
+	"""
+	if method not in BLOCK_AGGREGATION_METHODS:
+		raise ValueError("{} is not a valid block aggregation method; options are {}".format(method, BLOCK_AGGREGATION_METHODS))
+
+	nRows, nCols = data.shape[:2]
+	blockRows, blockCols = blockShape
+	outShape = ( int(np.ceil(nRows/blockRows)), int(np.ceil(nCols/blockCols)) ) + data.shape[2:]
+	workDtype = _getWorkingDtype(data.dtype, method, processChunkFunct)
+	outArray = np.empty(outShape, dtype=data.dtype if len(data.shape)==3 else workDtype)
+
+	rowSize = max( int(np.prod(data.shape[1:])), 1 )
+	blockRowsPerChunk = max( chunkSize // (rowSize*blockRows), 1 )
+	aggFunct = _AGGREGATION_FUNCTS[method]
+
+	for outStartRow in range(0, outShape[0], blockRowsPerChunk):
+		startRow, endRow = outStartRow*blockRows, min( (outStartRow+blockRowsPerChunk)*blockRows, nRows )
+		chunk = np.array(data[startRow:endRow], dtype=workDtype)
+		if processChunkFunct is not None:
+			processChunkFunct(chunk, startRow)
+		outVals = _aggregateChunk(chunk, blockShape, aggFunct)
+		if np.issubdtype(outArray.dtype, np.integer) and not np.issubdtype(outVals.dtype, np.integer):
+			outVals = np.rint(outVals)
+		outArray[outStartRow:outStartRow+len(outVals)] = outVals
+
+	return outArray
+
+
+def getBlockImageExtent(dataShape, blockShape, origin="upper", startIdxs=(0,0)):
+	""" Gets the imshow extent which places a block-downsampled array over the indices of the original data; so ticks/labels line up the same as when plotting the full array
+
+	Args:
+		dataShape ((int,int)): (nRows, nCols) of the original array
+		blockShape ((int,int)): (nRows, nCols) in each block
+		origin (str): The imshow origin; "upper" or "lower"
+		startIdxs ((int,int)): The (row, col) index of data[0,0]; for when data is a region of a larger array
+
+	Returns
+		extent ((float,float,float,float)): (left, right, bottom, top) for imshow. Covers whole blocks; so the last row/column of blocks can extend past the original data (see getDataLimits)
+
+	"""
+	nRows, nCols = dataShape[:2]
+	blockRows, blockCols = blockShape
+	startRow, startCol = startIdxs
+	left, near = startCol - 0.5, startRow - 0.5
+	right = left + int(np.ceil(nCols/blockCols))*blockCols
+	far = near + int(np.ceil(nRows/blockRows))*blockRows
+	if origin == "lower":
+		return (left, right, near, far)
+	return (left, right, far, near)
+
+
+def getDataLimits(dataShape, origin="upper", startIdxs=(0,0)):
+	""" Gets the axis limits matplotlib uses when plotting an array with imshow (default extent)
+
+	Args:
+		dataShape ((int,int)): (nRows, nCols) of the original array
+		origin (str): The imshow origin; "upper" or "lower"
+		startIdxs ((int,int)): The (row, col) index of data[0,0]; for when data is a region of a larger array
+
+	Returns
+		xLimit ((float,float)):
+		yLimit ((float,float)):
+
+	"""
+	nRows, nCols = dataShape[:2]
+	startRow, startCol = startIdxs
+	yLimit = (startRow-0.5, startRow+nRows-0.5)
+	yLimit = yLimit if origin == "lower" else yLimit[::-1]
+	return (startCol-0.5, startCol+nCols-0.5), yLimit
+
+
+def getBlockCentres(nVals, blockSize):
+	""" Gets the centre of each block along one dimension, in terms of the original indices. The last block can be smaller than the rest
+
+	Args:
+		nVals (int): Length of the original data along this dimension
+		blockSize (int): Number of values in each block
+
+	Returns
+		centres (1-dim np array): One value per block
+
+	"""
+	starts = np.arange(0, nVals, blockSize)
+	ends = np.minimum(starts+blockSize, nVals)
+	return 0.5*(starts + ends - 1)
+
+
+def imshowBlockDownsampled(axHandle, data, dataShape, blockShape, startIdxs=(0,0), **kwargs):
+	""" Draws a block-downsampled array with imshow, so axis co-ordinates match indices of the original array
+
+	Args:
+		axHandle (matplotlib Axes): The axis to draw on
+		data (np array): Output of getBlockDownsampledArray
+		dataShape ((int,int)): (nRows, nCols) of the original array
+		blockShape ((int,int)): The blockShape passed to getBlockDownsampledArray
+		startIdxs ((int,int)): The (row, col) index of the first value of the original array; for when its a region of a larger array
+		kwargs: Passed to imshow. Shouldnt include extent
+
+	Returns
+		imageHandle (AxesImage): Output of imshow
+
+	"""
+	origin = kwargs.get("origin", plt.rcParams["image.origin"])
+	imageHandle = axHandle.imshow(data, extent=getBlockImageExtent(dataShape, blockShape, origin=origin, startIdxs=startIdxs), **kwargs)
+	xLimit, yLimit = getDataLimits(dataShape, origin=origin, startIdxs=startIdxs)
+	axHandle.set_xlim(xLimit)
+	axHandle.set_ylim(yLimit)
+	return imageHandle
+
+
+def _getWorkingDtype(inpDtype, method, processChunkFunct):
+	#Setting values to NaN (e.g. in processChunkFunct) needs floats; as does taking the mean
+	if np.issubdtype(inpDtype, np.floating):
+		return inpDtype
+	if (processChunkFunct is not None) or method.startswith("nan") or method=="mean":
+		#float32 holds every 8/16 bit integer exactly (e.g. uint8/uint16 images), in half the memory of float64
+		return np.dtype(np.float32) if inpDtype.itemsize <= 2 else np.dtype(float)
+	return inpDtype
+
+
+#chunk has a whole number of block-rows, except possibly the last rows of the data. The same is true for columns
+def _aggregateChunk(chunk, blockShape, aggFunct):
+	blockRows, blockCols = blockShape
+	nRows, nCols = chunk.shape[:2]
+	trailShape = chunk.shape[2:]
+	nFullRows, nFullCols = nRows//blockRows, nCols//blockCols
+	fullRowEnd, fullColEnd = nFullRows*blockRows, nFullCols*blockCols
+
+	outShape = ( int(np.ceil(nRows/blockRows)), int(np.ceil(nCols/blockCols)) ) + trailShape
+	outVals = None
+
+	#All-NaN blocks are expected (e.g. masked out triangles of a matrix) and just give NaN
+	with warnings.catch_warnings():
+		warnings.simplefilter("ignore", category=RuntimeWarning)
+		pieces = list()
+		if (nFullRows > 0) and (nFullCols > 0):
+			blocks = chunk[:fullRowEnd,:fullColEnd].reshape( (nFullRows,blockRows,nFullCols,blockCols)+trailShape )
+			pieces.append( (slice(0,nFullRows), slice(0,nFullCols), aggFunct(blocks, axis=(1,3))) )
+		if (nFullRows > 0) and (fullColEnd < nCols):
+			blocks = chunk[:fullRowEnd,fullColEnd:].reshape( (nFullRows,blockRows,nCols-fullColEnd)+trailShape )
+			pieces.append( (slice(0,nFullRows), nFullCols, aggFunct(blocks, axis=(1,2))) )
+		if (fullRowEnd < nRows) and (nFullCols > 0):
+			blocks = chunk[fullRowEnd:,:fullColEnd].reshape( (nRows-fullRowEnd,nFullCols,blockCols)+trailShape )
+			pieces.append( (nFullRows, slice(0,nFullCols), aggFunct(blocks, axis=(0,2))) )
+		if (fullRowEnd < nRows) and (fullColEnd < nCols):
+			pieces.append( (nFullRows, nFullCols, aggFunct(chunk[fullRowEnd:,fullColEnd:], axis=(0,1))) )
+
+	for rowIdx, colIdx, vals in pieces:
+		if outVals is None:
+			outVals = np.empty(outShape, dtype=np.asarray(vals).dtype)
+		outVals[rowIdx, colIdx] = vals
+
+	return outVals
+
@@ -3,7 +3,6 @@
 import copy
 import itertools as it
 import types
-import matplotlib.pyplot as plt
 
 import numpy as np
 
@@ -268,6 +267,7 @@ class AddDataToScratch(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-data-to-plot"
 		self._description = "Adds the to-plot data to the scratch space; this allows multiple options for input formats (this command will translate to the native form)"
+		self._optionDeps = ["plotDataSingleSeries", "plotDataMultiSeries"]
 
 	#Will be 
 	def execute(self, plotterInstance):
@@ -298,6 +298,7 @@ class AddBoxColorToScratch(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-box-color-to-scratch-space"
 		self._description = "Adds information on the box-colors to use to the scratch space"
+		self._optionDeps = ["boxColorsOn", "boxColorStrsInterSeries"]
 
 	def execute(self, plotterInstance):
 		def _setPatchArtistToTrue():
@@ -328,6 +329,7 @@ class AddBoxPositionsToScratch(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-box-positions-to-scratch-space"
 		self._description = "Adds the positions of each box to the scratch space"
+		self._optionDeps = ["widthBoxes", "widthInterSpacing", "widthIntraSpacing"]
 
 	def execute(self, plotterInstance):
 		plotData = plotterInstance._scratchSpace.get("plotData",None)
@@ -361,6 +363,7 @@ class AddHozPlotOptionToScratch(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-hoz-plot-option-to-scratch"
 		self._description = "Modifies boxPlotKwargsGlobal to include an option on whether to plot horizontally or not"
+		self._optionDeps = ["plotHorizontally"]
 
 	def execute(self, plotterInstance):
 		plotHozOpt = plotCmdStdHelp._getValueFromOptName(plotterInstance, "plotHorizontally")
@@ -373,6 +376,7 @@ class AddOutlierOptsToScratch(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-outlier-opts-to-scratch"
 		self._description = "Modifies boxPlotKwargsGlobal to include options related to how to plot outliers (if at all)"
+		self._optionDeps = ["outliersShow"]
 
 	def execute(self, plotterInstance):
 		onOpt = plotCmdStdHelp._getValueFromOptName(plotterInstance, "outliersShow")
@@ -385,6 +389,7 @@ class AddNotchesOnOrOffToScratch(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-notches-on-or-off"
 		self._description = "Modifies boxPlotKwargsGlobal to set notches on the boxes on or off"
+		self._optionDeps = ["boxNotchOn"]
 
 	def execute(self, plotterInstance):
 		notchesOn = plotCmdStdHelp._getValueFromOptName(plotterInstance, "boxNotchOn")
@@ -397,6 +402,7 @@ class AddWhiskerOnOrOffToScratch(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-whiskers-on-or-off"
 		self._description = "Modifies boxPlotKwargsGlobal to turn whiskers on or off"
+		self._optionDeps = ["whiskersShow"]
 
 	def execute(self, plotterInstance):
 		showWhiskers = plotCmdStdHelp._getValueFromOptName(plotterInstance, "whiskersShow")
@@ -409,6 +415,7 @@ class PlotBoxData(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "plot-box-data"
 		self._description = "Plots boxplot data"
+		self._optionDeps = []
 
 	def execute(self, plotterInstance):
 		plotData = plotterInstance._scratchSpace.get("plotData",None)
@@ -418,6 +425,7 @@ class PlotBoxData(plotCmdCoreHelp.PlotCommand):
 		#Will be A LOT more complicated later
 		plotKwargsGlobal = plotterInstance._scratchSpace.get("boxPlotKwargsGlobal", dict() )
 		seriesHandleDicts = list()
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
 		for pIdx,pData in enumerate(plotData):
 			currKwargs = copy.deepcopy( plotKwargsGlobal )
 			currKwargs.update( plotterInstance._scratchSpace["boxPlotKwargsLocal"][pIdx] )
@@ -427,7 +435,7 @@ class PlotBoxData(plotCmdCoreHelp.PlotCommand):
 			except AttributeError:
 				useData = pData
 
-			currDict = plt.boxplot( useData, **currKwargs)
+			currDict = axHandle.boxplot( useData, **currKwargs)
 			seriesHandleDicts.append(currDict)
 
 		plotterInstance._scratchSpace["boxHandles"] = seriesHandleDicts
@@ -438,6 +446,8 @@ class SetLegendDataHandlesAndLabels(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-legend-handles-and-labels"
 		self._description = "Sets the handles/labels to use in the legend"
+		self._optionDeps = ["dataLabels"]
+		self._reExecutable = True
 
 	def execute(self, plotterInstance):
 		handleDicts = plotterInstance._scratchSpace.get("boxHandles",None)
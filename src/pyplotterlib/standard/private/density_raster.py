@@ -0,0 +1,186 @@
+
+""" Functions for aggregating (potentially huge numbers of) points or line segments into a 2-dim grid of counts; which can then be drawn as an image """
+
+import numpy as np
+
+DENSITY_RASTER_METHODS = ["lines", "points"]
+
+#Limits temporary memory; each chunk needs a few arrays of this many elements. Small enough for these to stay in cache
+_DEF_CHUNK_SIZE = 2**16
+
+
+def getDensityGrid(allXData, allYData, method, shape, xRange=None, yRange=None, chunkSize=_DEF_CHUNK_SIZE):
+	""" Gets the number of points (or line segments) falling in each cell of a regular 2-dim grid
+
+	Args:
+		allXData (iter of 1-dim np array): x-values for each data series
+		allYData (iter of 1-dim np array): y-values for each data series
+		method (str): "points" means count the points in each cell. "lines" means count the line segments (between consecutive points in each series) passing through each cell
+		shape ((int,int)): The number of grid cells (nY, nX); generally the size of the plotted region in pixels
+		xRange ((float,float)): The range of x-values the grid covers. Default of None means the full range of the data
+		yRange ((float,float)): The range of y-values the grid covers. Default of None means the full range of the data
+		chunkSize (int): Max number of points (or segment pieces; see _addColumnRunsToRunCounts) processed at once; this bounds the temporary memory used
+
+	Returns
+		outGrid (nYxnX np array): Counts for each cell. Row 0 is at the bottom of the grid (i.e. imshow origin="lower")
+		xRange ((float,float)): The x-range covered by the grid
+		yRange ((float,float)): The y-range covered by the grid
+
+	Raises:
+		ValueError: If method is not recognised
+
+	Notes:
+		a) Non-finite values are ignored; for "lines" this leaves a gap, as in matplotlib line plots
+		b) In "lines" mode, each segment adds 1 to every cell it passes through. Cells are half-open (i.e. [i,i+1) ), so a segment passing exactly through a cell corner only counts for one of the cells
+
+	"""
+	if method not in DENSITY_RASTER_METHODS:
+		raise ValueError("{} is not a valid density raster method; options are {}".format(method, DENSITY_RASTER_METHODS))
+
+	allXData, allYData = list(allXData), list(allYData)
+	xRange = _getDataRange(allXData) if xRange is None else (min(xRange), max(xRange))
+	yRange = _getDataRange(allYData) if yRange is None else (min(yRange), max(yRange))
+
+	nY, nX = shape
+	pointCounts = np.zeros(nY*nX, dtype=np.int64)
+	runCounts = np.zeros(nX*(nY+1), dtype=np.int64) #Only used for "lines"; see _addColumnRunsToRunCounts
+	for xData, yData in zip(allXData, allYData):
+		if method == "points":
+			_addPointsToCounts(pointCounts, xData, yData, shape, xRange, yRange, chunkSize)
+		else:
+			_addSegmentsToRunCounts(runCounts, pointCounts, xData, yData, shape, xRange, yRange, chunkSize)
+
+	outGrid = pointCounts.reshape(shape)
+	if method == "lines":
+		outGrid += np.cumsum(runCounts.reshape(nX,nY+1), axis=1)[:,:nY].T
+
+	return outGrid, xRange, yRange
+
+
+def _getDataRange(allVals):
+	minVals = [np.nanmin(vals) for vals in allVals if np.any(np.isfinite(vals))]
+	maxVals = [np.nanmax(vals) for vals in allVals if np.any(np.isfinite(vals))]
+	if len(minVals) == 0:
+		return (0.0, 1.0)
+
+	minVal, maxVal = float(min(minVals)), float(max(maxVals))
+	if minVal == maxVal:
+		return (minVal-0.5, maxVal+0.5)
+	return (minVal, maxVal)
+
+
+#Converts to grid co-ordinates; i.e. cell (i,j) spans [i,i+1) and [j,j+1)
+def _getGridCoords(xVals, yVals, shape, xRange, yRange):
+	nY, nX = shape
+	gridX = (np.asarray(xVals, dtype=np.float64) - xRange[0]) * (nX / (xRange[1]-xRange[0]))
+	gridY = (np.asarray(yVals, dtype=np.float64) - yRange[0]) * (nY / (yRange[1]-yRange[0]))
+	return gridX, gridY
+
+
+def _addGridCoordsToCounts(flatCounts, gridX, gridY, shape):
+	nY, nX = shape
+	with np.errstate(invalid="ignore"):
+		idxX, idxY = np.floor(gridX), np.floor(gridY)
+		#Points exactly on the top/right edge of the range go in the last cell
+		idxX[gridX==nX] = nX-1
+		idxY[gridY==nY] = nY-1
+		useVals = (idxX >= 0) & (idxX < nX) & (idxY >= 0) & (idxY < nY)
+
+	flatIdxs = idxY[useVals].astype(np.int64)*nX + idxX[useVals].astype(np.int64)
+	flatCounts += np.bincount(flatIdxs, minlength=len(flatCounts))
+
+
+def _addPointsToCounts(flatCounts, xData, yData, shape, xRange, yRange, chunkSize):
+	for startIdx in range(0, len(xData), chunkSize):
+		endIdx = startIdx + chunkSize
+		gridX, gridY = _getGridCoords(xData[startIdx:endIdx], yData[startIdx:endIdx], shape, xRange, yRange)
+		_addGridCoordsToCounts(flatCounts, gridX, gridY, shape)
+
+
+def _addSegmentsToRunCounts(runCounts, pointCounts, xData, yData, shape, xRange, yRange, chunkSize):
+	#Chunks overlap by one point, so the segment joining two chunks is included
+	for startIdx in range(0, max(len(xData)-1, 0), chunkSize):
+		endIdx = startIdx + chunkSize + 1
+		gridX, gridY = _getGridCoords(xData[startIdx:endIdx], yData[startIdx:endIdx], shape, xRange, yRange)
+		segArgs = gridX[:-1], gridY[:-1], gridX[1:], gridY[1:]
+		startX, startY, endX, endY = segArgs if _areAllInsideGrid(gridX, gridY, shape) else _getClippedSegments(*segArgs, shape)
+		_addColumnRunsToRunCounts(runCounts, startX, startY, endX, endY, shape, chunkSize)
+
+	#A lone point has no segments, but should still show up
+	if len(xData) == 1:
+		gridX, gridY = _getGridCoords(xData, yData, shape, xRange, yRange)
+		_addGridCoordsToCounts(pointCounts, gridX, gridY, shape)
+
+#False for any NaN values too
+def _areAllInsideGrid(gridX, gridY, shape):
+	nY, nX = shape
+	return bool( (gridX.min() >= 0) and (gridX.max() <= nX) and (gridY.min() >= 0) and (gridY.max() <= nY) )
+
+
+#Liang-Barsky clipping to the grid; segments with non-finite values or entirely outside the grid are removed
+def _getClippedSegments(startX, startY, endX, endY, shape):
+	nY, nX = shape
+	deltaX, deltaY = endX-startX, endY-startY
+	minT, maxT = np.zeros(len(startX)), np.ones(len(startX))
+	with np.errstate(divide="ignore", invalid="ignore"):
+		for delta, start, lowEdge, highEdge in [(deltaX, startX, 0, nX), (deltaY, startY, 0, nY)]:
+			tLow, tHigh = (lowEdge-start)/delta, (highEdge-start)/delta
+			tEnter, tExit = np.minimum(tLow, tHigh), np.maximum(tLow, tHigh)
+			#Segments parallel to an edge are either fully inside or fully outside that pair of edges
+			isParallel = delta == 0
+			isInside = (start >= lowEdge) & (start <= highEdge)
+			tEnter[isParallel] = np.where(isInside[isParallel], 0, np.inf)
+			tExit[isParallel] = np.where(isInside[isParallel], 1, -np.inf)
+			minT, maxT = np.maximum(minT, tEnter), np.minimum(maxT, tExit)
+
+		useSegs = (minT <= maxT) & np.isfinite(startX) & np.isfinite(startY) & np.isfinite(endX) & np.isfinite(endY)
+
+	minT, maxT, startX, startY = minT[useSegs], maxT[useSegs], startX[useSegs], startY[useSegs]
+	deltaX, deltaY = deltaX[useSegs], deltaY[useSegs]
+	return startX + minT*deltaX, startY + minT*deltaY, startX + maxT*deltaX, startY + maxT*deltaY
+
+
+#Each segment is split at pixel-column edges; each piece then covers a vertical run of cells within one column. Runs are stored as
+#+1 at their start and -1 after their end (in column-major order), so a cumulative sum down each column gives the counts. Thus
+#the cost scales with the number of columns each segment crosses; rather than the number of cells
+def _addColumnRunsToRunCounts(runCounts, startX, startY, endX, endY, shape, chunkSize):
+	nY, nX = shape
+	lowX, highX = np.minimum(startX, endX), np.maximum(startX, endX)
+	lowCols = _getLowCellIdxs(lowX, nX)
+	nPieces = _getHighCellIdxs(highX, lowCols, nX) - lowCols + 1
+	with np.errstate(divide="ignore", invalid="ignore"):
+		slopes = (endY-startY) / (endX-startX)
+
+	#Groups of segments are picked to keep the number of pieces near chunkSize
+	pieceEnds = np.cumsum(nPieces)
+	groupEdges = np.searchsorted(pieceEnds, np.arange(chunkSize, pieceEnds[-1] if len(pieceEnds) > 0 else 0, chunkSize), side="right")
+	groupEdges = np.unique( np.concatenate([[0], groupEdges, [len(nPieces)]]) )
+
+	for startSeg, endSeg in zip(groupEdges[:-1], groupEdges[1:]):
+		currNumbPieces = nPieces[startSeg:endSeg]
+		segIdxs = np.repeat(np.arange(startSeg, endSeg), currNumbPieces)
+		pieceOffsets = np.cumsum(currNumbPieces) - currNumbPieces
+		cols = lowCols[segIdxs] + np.arange(len(segIdxs)) - np.repeat(pieceOffsets, currNumbPieces)
+
+		#y-values where each piece enters/leaves its column; vertical segments just use their end-points
+		pieceLowX, pieceHighX = np.maximum(lowX[segIdxs], cols), np.minimum(highX[segIdxs], cols+1)
+		pieceStartX, pieceStartY, pieceSlopes = startX[segIdxs], startY[segIdxs], slopes[segIdxs]
+		isVertical = ~np.isfinite(pieceSlopes)
+		pieceSlopes[isVertical] = 0
+		yAtLowX = np.where(isVertical, pieceStartY, pieceStartY + (pieceLowX-pieceStartX)*pieceSlopes)
+		yAtHighX = np.where(isVertical, endY[segIdxs], pieceStartY + (pieceHighX-pieceStartX)*pieceSlopes)
+
+		lowRows = _getLowCellIdxs(np.minimum(yAtLowX, yAtHighX), nY)
+		highRows = _getHighCellIdxs(np.maximum(yAtLowX, yAtHighX), lowRows, nY)
+		runStartIdxs = cols*(nY+1) + lowRows
+		runCounts += np.bincount(runStartIdxs, minlength=len(runCounts))
+		runCounts -= np.bincount(runStartIdxs + (highRows-lowRows+1), minlength=len(runCounts))
+
+
+#Cells are half-open, so a piece ending exactly on a cell edge doesnt touch the next cell
+def _getLowCellIdxs(lowVals, nCells):
+	return np.clip(np.floor(lowVals), 0, nCells-1).astype(np.int64)
+
+def _getHighCellIdxs(highVals, lowIdxs, nCells):
+	return np.clip( np.maximum(np.ceil(highVals).astype(np.int64)-1, lowIdxs), 0, nCells-1 )
+
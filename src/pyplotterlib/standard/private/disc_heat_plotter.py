@@ -1,16 +1,16 @@
 
-import itertools as it
-
 import matplotlib.colors
-import matplotlib.pyplot as plt
+import matplotlib.ticker
 
 import numpy as np
 
+from . import block_downsample as blockDownsampleHelp
 from . import shared
 
 from .. import plot_options as plotOptStdHelp
 from .. import plot_commands as plotCmdStdHelp
 
+from ...core import lazy_array as lazyArrayHelp
 from ...core import plotters as plotterCoreHelp
 from ...core import plot_command as plotCmdCoreHelp
 from ...core import plot_options as plotOptCoreHelp
@@ -49,7 +49,7 @@ def _createCommandsList():
 	plotCmdStdHelp.CreateFigureIfNoAxHandle(),
 	plotCmdStdHelp.SetAspectStr(),
 	plotCmdStdHelp.AddPlotterToOutput(),
-	plotCmdStdHelp.CopyNumpyArrayPlotDataToScratchSpace(),
+	CopyPlotDataToScratchSpace(),
 	RemoveUnwantedPlotData(),
 	plotCmdStdHelp.SetColormapInPlotKwargs(),
 	plotCmdStdHelp.SetColormapMaxValInPlotKwargs(),
@@ -78,6 +78,8 @@ def _createOptionsList():
 	AnnotateValsTextColor(),
 	plotOptStdHelp.AnnotationsTextGeneric(),
 	plotOptStdHelp.AspectString(value="auto"),
+	plotOptStdHelp.BlockDownsampling(),
+	plotOptStdHelp.BlockDownsamplingNumbPixels(),
 	plotOptStdHelp.ColorBarFontSize(),
 	plotOptStdHelp.ColorBarLabelFontSize(),
 	plotOptStdHelp.ColorBarTickLabelFontSize(),
@@ -100,6 +102,7 @@ def _createOptionsList():
 	GroupLabelsRows(),
 	GroupLabelsRowsRotation(),
 	PlotDataDiscHeat(),
+	plotOptStdHelp.PlotDataDowncastFloat32(),
 	PlotDiag(value=True),
 	PlotLowerTri(value=True),
 	PlotUpperTri(value=True),
@@ -199,7 +202,11 @@ class GroupLabelsRowsRotation(plotOptCoreHelp.FloatPlotOption):
 
 @serializationReg.registerForSerialization()
 class PlotDataDiscHeat(plotOptCoreHelp.NumpyArrayPlotOption):
-	""" Data to plot; should be a SINGLE two-dimensional numpy array (e.g. np.array( [ [1.0,0.3], [0.3,1.0] ]) """
+	""" Data to plot; should be a SINGLE two-dimensional numpy array (e.g. np.array( [ [1.0,0.3], [0.3,1.0] ])
+
+	Huge matrices can be given as a read-only memory-mapped array (e.g. np.load(path, mmap_mode="r")) or a LazyArrayRef. These are only read when drawing; and with blockDownsampling set, only a chunk of rows at a time
+
+	"""
 
 	def __init__(self, name=None, value=None):
 		self.name = "plotData"
@@ -238,7 +245,8 @@ class AddDataToPlot(plotCmdCoreHelp.PlotCommand):
 
 	def __init__(self):
 		self._name = "add-data-to-plot"
-		self._description = "Adds data to the plot using plt.imshow(data)"
+		self._description = "Adds data to the plot using ax.imshow(data)"
+		self._optionDeps = []
 		self._plotDataAttr = "plotData"
 
 	def execute(self, plotterInstance):
@@ -247,7 +255,13 @@ class AddDataToPlot(plotCmdCoreHelp.PlotCommand):
 			return None
 		else:
 			plotKwargs = plotterInstance._scratchSpace.get("plotKwargs", dict())
-			plt.imshow(data, **plotKwargs)
+			axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+			blockShape = plotterInstance._scratchSpace.get("plotDataBlockShape", None)
+			if blockShape is None:
+				plotterInstance._scratchSpace["imageHandle"] = axHandle.imshow(data, **plotKwargs)
+			else:
+				dataShape = plotterInstance._scratchSpace["plotDataShape"]
+				plotterInstance._scratchSpace["imageHandle"] = blockDownsampleHelp.imshowBlockDownsampled(axHandle, data, dataShape, blockShape, **plotKwargs)
 
 @serializationReg.registerForSerialization()
 class AddDataAnnotations(plotCmdCoreHelp.PlotCommand):
@@ -255,6 +269,7 @@ class AddDataAnnotations(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-data-annotations"
 		self._description = "Adds float-annotations to each plotted data point"
+		self._optionDeps = ["annotateVals", "annotateValsStrFmt", "annotateValsTextColor", "annotateValsRotation", "annotateValsFontSize", "fontSizeDefault", "colorMapMinVal", "colorMapMaxVal"]
 	
 	def execute(self, plotterInstance):
 		annotate = plotCmdStdHelp._getValueFromOptName(plotterInstance, "annotateVals")
@@ -265,11 +280,10 @@ class AddDataAnnotations(plotCmdCoreHelp.PlotCommand):
 		data = plotterInstance._scratchSpace["usePlotData"]
 		if data is None:
 			return None
-		data = np.array(data)
+		data = _getArrayWithMaskedAsNan(data)
 
 		#Add the text annotations
 		fmtStr = plotCmdStdHelp._getValueFromOptName(plotterInstance,"annotateValsStrFmt", retIfNone="{}")
-		nRows, nCols = data.shape
 		annotateColor = plotCmdStdHelp._getValueFromOptName(plotterInstance, "annotateValsTextColor")
 		annotateRotation = plotCmdStdHelp._getValueFromOptName(plotterInstance, "annotateValsRotation")
 
@@ -277,18 +291,24 @@ class AddDataAnnotations(plotCmdCoreHelp.PlotCommand):
 		useFontSize = plotCmdStdHelp._getValueFromOptName(plotterInstance, "annotateValsFontSize", retIfNone=useFontSize)
 
 		colorArray = self._getColorArray(plotterInstance, data)
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		posY, posX = self._getCellCentres(plotterInstance, data)
 
-		for rIdx in range(nRows):
-			for cIdx in range(nCols):
-				currVal = data[rIdx,cIdx]
-				if not np.isnan(currVal):
-					plt.gca().text(cIdx, rIdx, fmtStr.format(currVal),
-					               ha="center", va="center", color=colorArray[rIdx][cIdx], fontsize=useFontSize, rotation=annotateRotation)
+		for rIdx, cIdx in zip( *np.nonzero(~np.isnan(data)) ):
+			currVal = data[rIdx,cIdx]
+			axHandle.text(posX[cIdx], posY[rIdx], fmtStr.format(currVal),
+			               ha="center", va="center", color=colorArray[rIdx,cIdx], fontsize=useFontSize, rotation=annotateRotation)
 
 
+	#Cells of downsampled data cover blocks of the original data; so annotations go in the block centres
+	def _getCellCentres(self, plotterInstance, data):
+		blockShape = plotterInstance._scratchSpace.get("plotDataBlockShape", None)
+		if blockShape is None:
+			return np.arange(data.shape[0]), np.arange(data.shape[1])
+		dataShape = plotterInstance._scratchSpace["plotDataShape"]
+		return [blockDownsampleHelp.getBlockCentres(nVals, blockSize) for nVals, blockSize in zip(dataShape, blockShape)]
+
 	def _getColorArray(self, plotterInstance, inpData):
-		outArray = np.empty( inpData.shape, dtype= object )
-		nRows, nCols = inpData.shape
 		colors = self._getListOfColorsToUse(plotterInstance)
 
 		#Normalizer the data
@@ -296,7 +316,7 @@ class AddDataAnnotations(plotCmdCoreHelp.PlotCommand):
 		lowerBound = plotCmdStdHelp._getValueFromOptName(plotterInstance, "colorMapMinVal", retIfNone=lowerBound)
 		upperBound = plotCmdStdHelp._getValueFromOptName(plotterInstance, "colorMapMaxVal", retIfNone=upperBound)
 		_normalizer = matplotlib.colors.Normalize(vmin=lowerBound, vmax=upperBound)
-		useData = _normalizer(inpData)
+		useData = np.ma.getdata( _normalizer(inpData) )
 
 		#Figure out the colormapping
 		minVal, maxVal, rangeCurr = 0.0, 1.0, 1.0 #Properties of normalisation
@@ -312,23 +332,16 @@ class AddDataAnnotations(plotCmdCoreHelp.PlotCommand):
 				currVal = thresHolds[idx-1] + stepVal
 			thresHolds.append(currVal)
 
+		#Each value gets the color for the first threshold its <= to; values above all thresholds (or NaN) get the last color
+		colorIndices = np.digitize(useData, thresHolds, right=True)
+		colorIndices[colorIndices==nColors] = nColors-1
 
-		#Function to get a color from a data value
-		def _getColor(inpVal):
-			useIdx = -1
-			for idx,thres in enumerate(thresHolds):
-				if inpVal <= thres:
-					useIdx = idx
-					break
-			outColor = colors[useIdx]
-			return outColor
-
-		#
-		for rIdx in range(nRows):
-			for cIdx in range(nCols):
-				outArray[rIdx][cIdx] = _getColor(useData[rIdx][cIdx])
+		#Filled one at a time so that color tuples (e.g. RGB) arent split into extra dimensions
+		colorsArray = np.empty(nColors, dtype=object)
+		for idx,color in enumerate(colors):
+			colorsArray[idx] = color
 
-		return outArray	
+		return colorsArray[colorIndices]
 
 	def _getListOfColorsToUse(self, plotterInstance):
 		rawColors = plotCmdStdHelp._getValueFromOptName(plotterInstance, "annotateValsTextColor")
@@ -344,50 +357,108 @@ class AddDataAnnotations(plotCmdCoreHelp.PlotCommand):
 
 
 
+@serializationReg.registerForSerialization()
+class CopyPlotDataToScratchSpace(plotCmdStdHelp.CopyNumpyArrayPlotDataToScratchSpace):
+	""" Copies plot data to the scratch space; or a block-downsampled version of it if the blockDownsampling option is set. In the latter case the full array is never copied, and unwanted values (see RemoveUnwantedPlotData) are removed from each chunk before aggregating it
+
+	"""
+	def __init__(self, plotDataName="plotData"):
+		super().__init__(plotDataName=plotDataName)
+		self._optionDeps = [plotDataName, "blockDownsampling", "blockDownsamplingNumbPixels", "plotDataDowncastFloat32", "plotLowerTri", "plotDiag", "plotUpperTri"]
+
+	def execute(self, plotterInstance):
+		plotterInstance._scratchSpace["plotDataBlockShape"] = None
+		plotData = plotCmdStdHelp._getValueFromOptName(plotterInstance, self.plotDataName)
+		if plotData is None:
+			return super().execute(plotterInstance)
+
+		plotData = lazyArrayHelp.getUnloadedArray(plotData)
+		blockShape = plotCmdStdHelp._getBlockDownsamplingShape(plotterInstance, plotData.shape)
+		if blockShape is None:
+			return super().execute(plotterInstance)
+
+		method = plotCmdStdHelp._getValueFromOptName(plotterInstance, "blockDownsampling")
+		removeCommand = RemoveUnwantedPlotData()
+		def _processChunk(chunk, rowOffset):
+			removeCommand.setUnwantedValsToNan(plotterInstance, chunk, rowOffset=rowOffset)
+
+		outData = blockDownsampleHelp.getBlockDownsampledArray(plotData, blockShape, method, processChunkFunct=_processChunk)
+		plotterInstance._scratchSpace["usePlotData"] = plotCmdStdHelp._getPlotDataDowncastIfRequested(plotterInstance, outData)
+		plotterInstance._scratchSpace["plotDataShape"] = plotData.shape
+		plotterInstance._scratchSpace["plotDataBlockShape"] = blockShape
+
+
 @serializationReg.registerForSerialization()
 class RemoveUnwantedPlotData(plotCmdCoreHelp.PlotCommand):
+	""" Masks out plot-data values as requested (e.g. if you dont want to plot the diagonal elements). The plot data is wrapped in a masked array rather than modified; so it doesnt need copying first
 
+	"""
 	def __init__(self):
 		self._name = "remove-unwanted-plot-data"
-		self._description = "Sets certain plot-data values to np.nan as requested (e.g. if you dont want to plot the diagonal elements)"
+		self._description = "Masks certain plot-data values as requested (e.g. if you dont want to plot the diagonal elements)"
+		self._optionDeps = ["plotLowerTri", "plotDiag", "plotUpperTri"]
 
 
 	def execute(self, plotterInstance):
+		#Downsampled data had unwanted values removed before aggregating
+		if plotterInstance._scratchSpace.get("plotDataBlockShape", None) is not None:
+			return None
+
 		data = plotterInstance._scratchSpace["usePlotData"]
+		if data is None:
+			return None
+
+		unwantedMask = self.getUnwantedMask(plotterInstance, np.shape(data))
+		if unwantedMask is not None:
+			plotterInstance._scratchSpace["usePlotData"] = np.ma.masked_array(data, mask=unwantedMask, copy=False)
+
+	def getUnwantedMask(self, plotterInstance, dataShape, rowOffset=0):
+		""" Gets a mask of values to remove based on the plotLowerTri/plotDiag/plotUpperTri options of plotterInstance
+
+		Args:
+			plotterInstance: The plotter to get options from
+			dataShape ((int,int)): Shape of the data; either the full plot data or a chunk of its rows
+			rowOffset (int): Index of the first row of data in the full plot data
+
+		Returns
+			unwantedMask (2-dim bool np array or None): True for values to remove. None if nothing needs removing
+
+		"""
 		lowerTri = plotCmdStdHelp._getValueFromOptName(plotterInstance, "plotLowerTri")
 		diagTri  = plotCmdStdHelp._getValueFromOptName(plotterInstance, "plotDiag")
 		upperTri = plotCmdStdHelp._getValueFromOptName(plotterInstance, "plotUpperTri")
+		if lowerTri and diagTri and upperTri:
+			return None
+
+		#Broadcasting row indices against column indices means no full-size index arrays are needed
+		nRows, nCols = dataShape
+		rowIdxs = np.arange(rowOffset, rowOffset+nRows)[:,np.newaxis]
+		colIdxs = np.arange(nCols)[np.newaxis,:]
+		unwantedMask = np.zeros( (nRows,nCols), dtype=bool )
 
-		#TODO: Merging all would be nice more efficient
 		if not lowerTri:
-			self._setLowerTriToNan(data)
+			unwantedMask |= rowIdxs > colIdxs
 
 		if not upperTri:
-			self._setUpperTriToNan(data)
+			unwantedMask |= rowIdxs < colIdxs
 
 		if not diagTri:
-			self._setDiagTriToNan(data)
-
-	def _setLowerTriToNan(self,data):
-		nRows, nCols = data.shape
-		for rIdx in range(nRows):
-			for cIdx in range(nCols):
-				if rIdx > cIdx:
-					data[rIdx][cIdx] = np.nan
-
-	def _setDiagTriToNan(self, data):
-		nRows, nCols = data.shape
-		for rIdx in range(nRows):
-			for cIdx in range(nCols):
-				if rIdx == cIdx:
-					data[rIdx][cIdx] = np.nan
-
-	def _setUpperTriToNan(self,data):
-		nRows, nCols = data.shape
-		for rIdx in range(nRows):
-			for cIdx in range(nCols):
-				if rIdx < cIdx:
-					data[rIdx][cIdx] = np.nan
+			unwantedMask |= rowIdxs == colIdxs
+
+		return unwantedMask
+
+	def setUnwantedValsToNan(self, plotterInstance, data, rowOffset=0):
+		""" Sets values in data to NaN based on the plotLowerTri/plotDiag/plotUpperTri options of plotterInstance
+
+		Args:
+			plotterInstance: The plotter to get options from
+			data (2-dim np array): Data to modify in place; either the full plot data or a chunk of its rows
+			rowOffset (int): Index of the first row of data in the full plot data
+
+		"""
+		unwantedMask = self.getUnwantedMask(plotterInstance, data.shape, rowOffset=rowOffset)
+		if unwantedMask is not None:
+			data[unwantedMask] = np.nan
 
 #Similar in bar plotter; but this is actually a bit different since we set both x/y as standard
 @serializationReg.registerForSerialization()
@@ -396,6 +467,7 @@ class SetTickLabelsToGroupLabels(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-tick-labels-to-group-names"
 		self._description = "Sets the axis tick labels to group names"
+		self._optionDeps = ["plotData", "groupLabels", "groupLabelsCols", "groupLabelsRows", "groupLabelsColsRotation", "groupLabelsRowsRotation"]
 		self._plotDataAttr = "plotData"
 		self._groupLabelAttr = "groupLabels"
 
@@ -421,21 +493,24 @@ class SetTickLabelsToGroupLabels(plotCmdCoreHelp.PlotCommand):
 		rotationY = plotCmdStdHelp._getValueFromOptName(plotterInstance, "groupLabelsRowsRotation")
 
 		#Figure out the labels to use
-		ticksX, ticksY = plt.gca().get_xticks(), plt.gca().get_yticks()
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		ticksX, ticksY = axHandle.get_xticks(), axHandle.get_yticks()
+		#Ticks are at data indices; though not every index has a tick if the data is downsampled
 		def _getUseLabels(inpTicks, inpLabels):
 			if inpLabels is None:
 				return None
-			outLabels = [label if label is not None else tickVal for label,tickVal in it.zip_longest(inpLabels, inpTicks)]
-			return outLabels[:len(inpTicks)]
+			labelIdxs = [int(round(tickVal)) for tickVal in inpTicks]
+			outLabels = [inpLabels[idx] if 0 <= idx < len(inpLabels) else None for idx in labelIdxs]
+			return [label if label is not None else tickVal for label,tickVal in zip(outLabels, inpTicks)]
 
 		useLabelsX = _getUseLabels(ticksX, groupLabelsX)
 		useLabelsY = _getUseLabels(ticksY, groupLabelsY)
 
 		#
 		if useLabelsX is not None:
-			plt.gca().set_xticklabels(useLabelsX, rotation=rotationX)
+			axHandle.set_xticklabels(useLabelsX, rotation=rotationX)
 		if useLabelsY is not None:
-			plt.gca().set_yticklabels(useLabelsY, rotation=rotationY)
+			axHandle.set_yticklabels(useLabelsY, rotation=rotationY)
 		
 
 
@@ -445,6 +520,7 @@ class SetTicksToDataCentres(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "set-ticks-to-data-centres"
 		self._description = "Sets the x/y tick marker positions to match up with centres of data points"
+		self._optionDeps = ["plotData"]
 		self._plotDataAttr = "plotData"
 
 	def execute(self, plotterInstance):
@@ -452,11 +528,28 @@ class SetTicksToDataCentres(plotCmdCoreHelp.PlotCommand):
 		if data is None:
 			return None
 
-		data = np.array(data, copy=False)
-		assert len(data.shape)==2
-		nY, nX = np.array(data).shape
+		dataShape = np.shape(data)
+		assert len(dataShape)==2
+		nY, nX = dataShape
 		
-		plt.gca().set_xticks( list(range(nX)) )
-		plt.gca().set_yticks( list(range(nY)) ) 
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		blockShape = plotterInstance._scratchSpace.get("plotDataBlockShape", None)
+		if blockShape is None:
+			axHandle.set_xticks( list(range(nX)) )
+			axHandle.set_yticks( list(range(nY)) ) 
+		else:
+			axHandle.set_xticks( self._getSubsetOfTicks(nX) )
+			axHandle.set_yticks( self._getSubsetOfTicks(nY) )
+
+	#Theres far too many rows/cols for a tick on each when data is downsampled; so use a normal number of (integer) ticks
+	def _getSubsetOfTicks(self, nVals):
+		tickVals = matplotlib.ticker.MaxNLocator(integer=True).tick_values(0, nVals-1)
+		return [int(x) for x in tickVals if 0 <= x <= nVals-1]
 
 
+#Annotations are only added for (relatively) small arrays; so copying here is fine
+def _getArrayWithMaskedAsNan(inpData):
+	if not np.ma.isMaskedArray(inpData):
+		return np.array(inpData)
+	useDtype = inpData.dtype if np.issubdtype(inpData.dtype, np.inexact) else float
+	return np.ma.filled(inpData.astype(useDtype), np.nan)
@@ -1,11 +1,12 @@
 
-import json
+import concurrent.futures
+import os
 import types
 
-import numpy as np
-
 import matplotlib.pyplot as plt
+import numpy as np
 
+from . import batched_bars as batchedBarsHelp
 from . import shared
 
 from ...core import plotters as plotterCoreHelp
@@ -88,6 +89,7 @@ def _createOptionsList():
 	plotOptStdHelp.AxisColorY(),
 	plotOptStdHelp.AxisColorY_exclSpines(),
 	plotOptStdHelp.BarColors(),
+	plotOptStdHelp.BarDrawAsCollection(),
 	plotOptStdHelp.BarOpacities(),
 	plotOptStdHelp.DataLabels(),
 	plotOptStdHelp.FontSizeDefault(),
@@ -185,15 +187,15 @@ class PlotDataHisto(plotOptCoreHelp.SinglePlotOptionInter):
 
 		return True
 
-	#fromJSON just inherited; this means fromJSON will use lists rather than np arrays
-	def toJSON(self):
+	#fromDict just inherited; this means fromDict will use lists rather than np arrays
+	def toDict(self):
 		#Note np arrays arent JSON-compatible; hence need to work with them as lists
 		if self.value is None:
 			outVal = None
 		else:
 			outVal = self._getValsAsList()
 
-		return json.dumps({"class":str(self.__class__), "payload":{"name":self.name, "value":outVal}})
+		return {"class":str(self.__class__), "payload":{"name":self.name, "value":outVal}}
 
 	def _getValsAsList(self):
 		outVals = list()
@@ -228,6 +230,7 @@ class PlotHistoData(plotCommCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "plot-histogram-data"
 		self._description = "Plots histogram data"
+		self._optionDeps = ["plotDataHisto", "interBarFractSpace", "plotInRevOrder", "barDrawAsCollection"]
 		self._revOrderOpt = "plotInRevOrder"
 
 	def execute(self, plotterInstance):
@@ -244,17 +247,26 @@ class PlotHistoData(plotCommCoreHelp.PlotCommand):
 			centresAndWidths.append(_currVals)
 
 		counts = [x[0] for x in data]
+		allEdges = [x[1] for x in data]
 
 		#Reverse order on request
 		plotInRevOrder = plotCmdStdHelp._getValueFromOptName(plotterInstance, self._revOrderOpt)
 		if plotInRevOrder:
 			centresAndWidths = reversed(centresAndWidths)
 			counts = list(reversed(counts))
+			allEdges = list(reversed(allEdges))
 
 		#Plot the bars
 		outBars = list()
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		drawAsCollection = plotCmdStdHelp._getValueFromOptName(plotterInstance, "barDrawAsCollection", retIfNone=False)
 		for idx,(centres,widths) in enumerate(centresAndWidths):
-			currBars = plt.bar( np.array(centres), np.array(counts[idx]), width=widths)
+			if drawAsCollection and (_fractSpace == 0):
+				currBars = batchedBarsHelp.drawContiguousBarsAsStairs(axHandle, allEdges[idx], counts[idx], color=batchedBarsHelp.getDefaultColor(idx))
+			elif drawAsCollection:
+				currBars = batchedBarsHelp.drawBarsAsCollection(axHandle, centres, counts[idx], widths, 0, color=batchedBarsHelp.getDefaultColor(idx))
+			else:
+				currBars = axHandle.bar( centres, np.asarray(counts[idx]), width=widths)
 			outBars.append(currBars)
 
 		#Reverse order on request
@@ -265,17 +277,185 @@ class PlotHistoData(plotCommCoreHelp.PlotCommand):
 
 
 def _getBarCentresAndWidthsFromEdges(edges, fractSpace=0.0):
-	outCentres, outWidths = list(), list()
+	edges = np.asarray(edges, dtype=float)
+	fullWidths = np.abs( np.diff(edges) )
+	outCentres = np.minimum(edges[:-1], edges[1:]) + 0.5*fullWidths
+	outWidths = fullWidths - (fractSpace*fullWidths)
+	return outCentres, outWidths
 
-	for idx,_unused in enumerate(edges[:-1]):
-		_edgePair = edges[idx], edges[idx+1]
-		_currWidth = abs(_edgePair[0] - _edgePair[1])
-		_currCentre = min(_edgePair) + 0.5*_currWidth
-		_useWidth = _currWidth - (fractSpace*_currWidth)
-		outCentres.append(_currCentre)
-		outWidths.append(_useWidth)
 
-	return outCentres, outWidths
+#Max number of values read from a memory-mapped file at once
+_DEF_PIECE_SIZE = 2**20
 
 
+def getHistoDataFromChunks(chunks, bins=10, binRange=None, rangePass=False, nWorkers=None, mpContext=None):
+	""" Builds histogram data from values supplied in chunks; so the full data never needs to be in memory at once
 
+	Args:
+		chunks (iter): Each element is an np array or a path to a .npy file. Files are memory-mapped and read in pieces. Arrays of any shape are flattened. Can be a one-use iterator unless rangePass=True
+		bins (int or 1-dim np array): Number of bins, or the bin edges; same as for np.histogram
+		binRange ((float,float)): The (min,max) values covered by the bins. Ignored if bins are edges. Default of None means work this out from the data (see Notes)
+		rangePass (bool): If True, find the data range with a separate pass over chunks before counting. Only used if the range is needed
+		nWorkers (int): Number of processes to spread chunks across. Default of None means process all chunks in this process
+		mpContext (multiprocessing context): Passed to ProcessPoolExecutor; use to control how worker processes are started
+
+	Returns
+		outData ([counts, edges]): Same format as one element of the plotDataHisto option (e.g. HistogramPlotter(plotDataHisto=[outData]) )
+
+	Raises:
+		ValueError: If nWorkers is set, but the bin edges arent known in advance (i.e. bins is an int, binRange=None and rangePass=False)
+
+	Notes:
+		a) If the bin edges are known in advance (or rangePass=True), counts are the same as from np.histogram on all the data at once
+		b) Otherwise, counting starts with bins covering the range of the first chunk. Pairs of bins are merged (doubling the range covered) whenever values fall outside this range. Bin widths are powers of 2 (e.g. 0.25, 1, 4); and empty bins at either end are removed at the end, so the final number of bins may be fewer than requested
+		c) Non-finite values (NaN/inf) are ignored
+		d) With nWorkers set, chunks which are arrays get copied to worker processes; passing file paths avoids this
+
+	"""
+	usingEdges = np.ndim(bins) > 0
+	if (not usingEdges) and (binRange is None) and rangePass:
+		chunkRanges = [x for x in _mapOverChunks(_getFiniteRangeForChunk, chunks, nWorkers, mpContext) if x is not None]
+		if len(chunkRanges) > 0:
+			binRange = ( min([x[0] for x in chunkRanges]), max([x[1] for x in chunkRanges]) )
+
+	#Edges unknown; so need to use the single pass (auto-range) method
+	if (not usingEdges) and (binRange is None):
+		if nWorkers is not None:
+			raise ValueError("Bin edges must be known in advance when using nWorkers; set bins to edges, set binRange or use rangePass=True")
+		autoHisto = _AutoRangeHistogram(bins)
+		for chunk in chunks:
+			for vals in _iterValsInChunk(chunk):
+				autoHisto.addVals(vals)
+		return autoHisto.getCountsAndEdges()
+
+	histoKwargs = {"bins":np.asarray(bins, dtype=float)} if usingEdges else {"bins":bins, "range":binRange}
+	edges = np.histogram_bin_edges(np.array([]), **histoKwargs)
+	counts = np.zeros(len(edges)-1, dtype=np.int64)
+	for chunkCounts in _mapOverChunks(_getCountsForChunk, chunks, nWorkers, mpContext, histoKwargs):
+		counts += chunkCounts
+
+	return [counts, edges]
+
+
+#Keeps at most 2*nWorkers chunks queued at once; so data read from an iterator isnt all held in memory
+def _mapOverChunks(funct, chunks, nWorkers, mpContext, *args):
+	if nWorkers is None:
+		for chunk in chunks:
+			yield funct(chunk, *args)
+		return
+
+	with concurrent.futures.ProcessPoolExecutor(max_workers=nWorkers, mp_context=mpContext) as executor:
+		pending = set()
+		for chunk in chunks:
+			if len(pending) >= 2*nWorkers:
+				done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+				for currFuture in done:
+					yield currFuture.result()
+			pending.add( executor.submit(funct, chunk, *args) )
+
+		for currFuture in concurrent.futures.as_completed(pending):
+			yield currFuture.result()
+
+
+def _iterValsInChunk(chunk, pieceSize=_DEF_PIECE_SIZE):
+	if isinstance(chunk, (str, os.PathLike)):
+		vals = np.ravel( np.load(chunk, mmap_mode="r"), order="K" )
+		for startIdx in range(0, len(vals), pieceSize):
+			yield np.asarray(vals[startIdx:startIdx+pieceSize])
+	else:
+		yield np.ravel( np.asarray(chunk) )
+
+
+def _getCountsForChunk(chunk, histoKwargs):
+	counts = np.zeros(len(np.histogram_bin_edges(np.array([]), **histoKwargs))-1, dtype=np.int64)
+	for vals in _iterValsInChunk(chunk):
+		counts += np.histogram(vals, **histoKwargs)[0]
+	return counts
+
+
+def _getFiniteRangeForChunk(chunk):
+	minVals, maxVals = list(), list()
+	for vals in _iterValsInChunk(chunk):
+		vals = vals[np.isfinite(vals)]
+		if len(vals) > 0:
+			minVals.append(vals.min())
+			maxVals.append(vals.max())
+
+	if len(minVals) == 0:
+		return None
+	return float(min(minVals)), float(max(maxVals))
+
+
+class _AutoRangeHistogram():
+	""" Accumulates counts into equal-width bins; the range covered is doubled (by merging pairs of bins) whenever values fall outside it
+
+	"""
+
+	def __init__(self, nBins):
+		self.nBins = nBins + (nBins%2) #Needs to be even so bins can be merged in pairs
+		self.counts = np.zeros(self.nBins, dtype=np.int64)
+		self.low, self.binWidth = None, None
+		self.nAtHigh = 0 #Values exactly on the top edge; these go in the last bin at the end (as in np.histogram)
+
+	@property
+	def high(self):
+		return self.low + self.nBins*self.binWidth
+
+	@property
+	def edges(self):
+		return self.low + np.arange(self.nBins+1)*self.binWidth
+
+	def addVals(self, vals):
+		vals = vals[np.isfinite(vals)]
+		if len(vals) == 0:
+			return None
+
+		minVal, maxVal = float(vals.min()), float(vals.max())
+		if self.low is None:
+			self._setInitialRange(minVal, maxVal)
+
+		while minVal < self.low:
+			self._doubleRange(extendLow=True)
+		while maxVal > self.high:
+			self._doubleRange(extendLow=False)
+
+		isAtHigh = vals == self.high
+		self.nAtHigh += int(isAtHigh.sum())
+		vals = vals[~isAtHigh]
+		self.counts += np.bincount(self._getBinIdxs(vals), minlength=self.nBins)
+
+	def getCountsAndEdges(self):
+		if self.low is None:
+			return [np.zeros(self.nBins, dtype=np.int64), np.histogram_bin_edges(np.array([]), bins=self.nBins)]
+
+		counts, edges = self.counts.copy(), self.edges
+		counts[-1] += self.nAtHigh
+		usedIdxs = np.flatnonzero(counts)
+		startIdx, endIdx = usedIdxs[0], usedIdxs[-1]+1
+		return [counts[startIdx:endIdx], edges[startIdx:endIdx+1]]
+
+	#Bin width is a power of 2 and edges are multiples of it. So edges are exact, and dont move when bins are merged
+	def _setInitialRange(self, minVal, maxVal):
+		valRange = 1.0 if minVal == maxVal else maxVal-minVal
+		self.binWidth = 2.0**np.ceil( np.log2(valRange/self.nBins) )
+		self.low = np.floor(minVal/self.binWidth)*self.binWidth
+
+	def _doubleRange(self, extendLow):
+		mergedCounts = self.counts.reshape(-1,2).sum(axis=1)
+		self.counts[:] = 0
+		if extendLow:
+			self.counts[self.nBins//2:] = mergedCounts
+			self.low -= self.nBins*self.binWidth
+		else:
+			self.counts[:self.nBins//2] = mergedCounts
+			self.counts[self.nBins//2] += self.nAtHigh
+			self.nAtHigh = 0
+		self.binWidth *= 2
+
+	#Same approach as np.histogram; indices from the bin width are then corrected using the edges (to avoid floating point issues)
+	def _getBinIdxs(self, vals):
+		edges = self.edges
+		binIdxs = np.clip( ((vals-self.low)/self.binWidth).astype(np.int64), 0, self.nBins-1 )
+		binIdxs[vals < edges[binIdxs]] -= 1
+		binIdxs[(vals >= edges[binIdxs+1]) & (binIdxs != self.nBins-1)] += 1
+		return np.clip(binIdxs, 0, self.nBins-1)
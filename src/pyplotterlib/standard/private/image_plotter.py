@@ -1,13 +1,16 @@
 
 import types
 
-import matplotlib.pyplot as plt
+import numpy as np
 
+from . import block_downsample as blockDownsampleHelp
+from . import image_pyramid as imagePyramidHelp
 from . import shared
 
 from .. import plot_options as plotOptStdHelp
 from .. import plot_commands as plotCmdStdHelp
 
+from ...core import lazy_array as lazyArrayHelp
 from ...core import plotters as plotterCoreHelp
 from ...core import plot_command as plotCmdCoreHelp
 from ...core import plot_options as plotOptCoreHelp
@@ -41,6 +44,7 @@ class ImagePlotter(shared.FromJsonMixin, shared.FromPlotterMixin, plotterCoreHel
 def _createCommandsList():
 	outList = [
 	plotCmdStdHelp.CreateFigureIfNoAxHandle(),
+	plotCmdStdHelp.AddPlotterToOutput(),
 	SetAspectStr(),
 	SetColormap(),
 	plotCmdStdHelp.SetColormapMaxValInPlotKwargs(),
@@ -74,6 +78,8 @@ def _createOptionsList():
 	plotOptStdHelp.AxisColorX_exclSpines(),
 	plotOptStdHelp.AxisColorY(),
 	plotOptStdHelp.AxisColorY_exclSpines(),
+	plotOptStdHelp.BlockDownsampling(),
+	plotOptStdHelp.BlockDownsamplingNumbPixels(),
 	plotOptStdHelp.ColorBarFontSize(),
 	plotOptStdHelp.ColorBarLabelFontSize(),
 	ColorBarShow(),
@@ -90,7 +96,9 @@ def _createOptionsList():
 	plotOptStdHelp.GridLinesShowY(),
 	plotOptStdHelp.GridLinesStyle(),
 	plotOptStdHelp.GridLinesWidth(),
+	ImagePyramidDir(),
 	PlotDataImage(),
+	plotOptStdHelp.PlotDataDowncastFloat32(),
 	plotOptStdHelp.SetFigsizeOnCreation(),
 	plotOptStdHelp.ShowTicksAndLabelsOnSides( value=types.SimpleNamespace(top=None,bottom=None,left=None, right=None) ),
 	plotOptStdHelp.TitleStr(),
@@ -114,6 +122,22 @@ class AspectString(plotOptStdHelp.AspectString):
 class ColormapStr(plotOptStdHelp.ColormapStr):
 	pass
 
+@serializationReg.registerForSerialization()
+class ImagePyramidDir(plotOptCoreHelp.StringPlotOption):
+	""" Directory to store a multi-resolution tile pyramid of plotDataImage in; useful for very large images which are rendered many times (e.g. zooming in with xLimit/yLimit). Default of None means dont use a pyramid
+
+	The pyramid is built (once) the first time its needed, and found again on later renders; including from other plotters or processes using the same directory. Each render then only reads the tiles overlapping xLimit/yLimit, at the lowest resolution which still has at least one value per pixel
+
+	Notes:
+		a) Each level is made by aggregating 2x2 blocks of the level below using the blockDownsampling method; or "mean" if thats not set. blockDownsamplingNumbPixels sets the resolution needed (default is the axis size in pixels)
+		b) For memory-mapped or LazyArrayRef data, pyramids are found using the file path, size and modification time. For other arrays every value is hashed on each render
+		c) Pyramids are never deleted automatically
+
+	"""
+	def __init__(self, name=None, value=None):
+		self.name = "imagePyramidDir"
+		self.value = value
+
 @serializationReg.registerForSerialization()
 class PlotDataImage(plotOptCoreHelp.NumpyArrayPlotOption):
 	""" Numpy representation of an image. The allowed formats are those allowed by matplotlibs plt.imshow
@@ -122,6 +146,10 @@ class PlotDataImage(plotOptCoreHelp.NumpyArrayPlotOption):
 
 	For color images this will be an NxMx3 (RGB) or NxMx4 (RGBA) matrix. N/M represnt pixel indices, whilst the vector represents RGB or RGBA values for that pixel
 
+	Huge images can be given as a read-only memory-mapped array (e.g. np.load(path, mmap_mode="r")) or a LazyArrayRef. These are only read when drawing, and then only the region inside xLimit/yLimit (if set)
+
+	The dtype is kept when storing, copying, serializing and drawing; so uint8/uint16 images should be passed as such (rather than converted to float) to keep memory use down. See plotDataDowncastFloat32 for float images
+
 	"""
 	def __init__(self, name=None, value=None):
 		self.name = "plotDataImage"
@@ -138,14 +166,86 @@ class AddImageToPlot(plotCmdCoreHelp.PlotCommand):
 	def __init__(self):
 		self._name = "add-image-to-plot"
 		self._description = "Adds the image to the current axis"
+		self._optionDeps = ["plotDataImage", "blockDownsampling", "blockDownsamplingNumbPixels", "imagePyramidDir", "plotDataDowncastFloat32"]
 		self._plotDataAttr = "plotDataImage"
 
+	#Only the region inside the axis limits is read for data on disk (or from an image pyramid)
+	def getOptionDeps(self, plotterInstance):
+		outDeps = list(self.optionDeps)
+		isFileBacked = lazyArrayHelp.isFileBacked( plotCmdStdHelp._getValueFromOptName(plotterInstance, self._plotDataAttr) )
+		if isFileBacked or (plotCmdStdHelp._getValueFromOptName(plotterInstance, "imagePyramidDir") is not None):
+			outDeps += ["xLimit", "yLimit"]
+		return outDeps
+
 	def execute(self, plotterInstance):
 		data = plotCmdStdHelp._getValueFromOptName(plotterInstance, self._plotDataAttr)
 		if data is None:
 			return None
+
+		if plotCmdStdHelp._getValueFromOptName(plotterInstance, "imagePyramidDir") is not None:
+			self._addImageFromPyramid(plotterInstance, data)
+			return None
+
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		plotKwargs = plotterInstance._scratchSpace["plotKwargs"]
+		startIdxs = (0,0)
+		if lazyArrayHelp.isFileBacked(data):
+			data = lazyArrayHelp.getUnloadedArray(data)
+			rowSlice, colSlice = self._getRegionInLimits(plotterInstance, data.shape)
+			data, startIdxs = data[rowSlice, colSlice], (rowSlice.start, colSlice.start)
+
+		blockShape = plotCmdStdHelp._getBlockDownsamplingShape(plotterInstance, np.shape(data))
+		if (blockShape is None) and (startIdxs == (0,0)):
+			useData = plotCmdStdHelp._getPlotDataDowncastIfRequested(plotterInstance, np.asarray(data))
+			plotterInstance._scratchSpace["imageHandle"] = axHandle.imshow(useData, **plotKwargs)
+			return None
+
+		if blockShape is None:
+			useData, blockShape = data, (1,1)
 		else:
-			plt.imshow(data, **plotterInstance._scratchSpace["plotKwargs"])
+			method = plotCmdStdHelp._getValueFromOptName(plotterInstance, "blockDownsampling")
+			useData = blockDownsampleHelp.getBlockDownsampledArray(data, blockShape, method)
+
+		useData = plotCmdStdHelp._getPlotDataDowncastIfRequested(plotterInstance, np.asarray(useData))
+		outHandle = blockDownsampleHelp.imshowBlockDownsampled(axHandle, useData, data.shape, blockShape, startIdxs=startIdxs, **plotKwargs)
+		plotterInstance._scratchSpace["imageHandle"] = outHandle
+
+	#Reads the tiles visible with the current xLimit/yLimit options, from the lowest resolution level with enough values for the axis
+	def _addImageFromPyramid(self, plotterInstance, data):
+		cacheDir = plotCmdStdHelp._getValueFromOptName(plotterInstance, "imagePyramidDir")
+		method = plotCmdStdHelp._getValueFromOptName(plotterInstance, "blockDownsampling", retIfNone="mean")
+		pyramid = imagePyramidHelp.getImagePyramid(cacheDir, data, method=method)
+
+		rowSlice, colSlice = self._getRegionInLimits(plotterInstance, pyramid.shape)
+		regionShape = (rowSlice.stop-rowSlice.start, colSlice.stop-colSlice.start)
+		blockShape = blockDownsampleHelp.getBlockShape(regionShape, plotCmdStdHelp._getBlockDownsamplingNumbPixels(plotterInstance))
+		level = pyramid.getLevelForBlockShape(blockShape)
+		scaleFactor = 2**level
+
+		#Whole values of the chosen level; these can extend slightly past the requested region
+		levelRanges = [ (currSlice.start//scaleFactor, int(np.ceil(currSlice.stop/scaleFactor))) for currSlice in [rowSlice, colSlice] ]
+		useData = plotCmdStdHelp._getPlotDataDowncastIfRequested(plotterInstance, pyramid.readRegion(level, *levelRanges))
+		startIdxs = tuple( start*scaleFactor for start,unused in levelRanges )
+		levelRegionShape = tuple( min(end*scaleFactor, nVals) - startIdx for (unused,end), nVals, startIdx in zip(levelRanges, pyramid.shape, startIdxs) )
+
+		axHandle = plotCmdStdHelp._getAxHandle(plotterInstance)
+		plotKwargs = plotterInstance._scratchSpace["plotKwargs"]
+		outHandle = blockDownsampleHelp.imshowBlockDownsampled(axHandle, useData, levelRegionShape, (scaleFactor,scaleFactor), startIdxs=startIdxs, **plotKwargs)
+		plotterInstance._scratchSpace["imageHandle"] = outHandle
+
+	#Returns (rowSlice, colSlice) for the part of the data visible with the current xLimit/yLimit options
+	def _getRegionInLimits(self, plotterInstance, dataShape):
+		limits = [plotCmdStdHelp._getValueFromOptName(plotterInstance, optName) for optName in ["yLimit", "xLimit"]]
+		outSlices = list()
+		for nVals, limit in zip(dataShape[:2], limits):
+			if limit is None:
+				startIdx, endIdx = 0, nVals
+			else:
+				#Value i covers [i-0.5, i+0.5] on the axis
+				startIdx = min( max(int(np.floor(min(limit)+0.5)), 0), max(nVals-1,0) )
+				endIdx = max( min(int(np.ceil(max(limit)+0.5)), nVals), startIdx+1 )
+			outSlices.append( slice(startIdx, endIdx) )
+		return tuple(outSlices)
 
 @serializationReg.registerForSerialization()
 class AddColorBar(plotCmdStdHelp.AddColorBar):
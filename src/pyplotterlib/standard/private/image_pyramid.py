@@ -0,0 +1,188 @@
+
+""" Multi-resolution tile pyramids for huge images; stored on disk, so repeated (e.g. zoomed-in) renders only read the tiles they need at the resolution they need """
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from . import block_downsample as blockDownsampleHelp
+
+from ...core import fingerprint as fingerprintHelp
+from ...core import lazy_array as lazyArrayHelp
+
+_FORMAT_VERSION = 1
+_METADATA_FILE = "pyramid.json"
+_LEVEL_FILE_FMT = "level_{}.npy"
+_DEF_TILE_SIZE = 256
+
+
+def getImagePyramid(cacheDir, data, method="mean", tileSize=_DEF_TILE_SIZE):
+	""" Returns the ImagePyramid for data stored in cacheDir; building (and storing) it first if its not already there
+
+	Args:
+		cacheDir (str): Directory to store pyramids in; created if needed. Each pyramid is stored in its own sub-directory, so one cacheDir can hold pyramids for many images
+		data (np array or LazyArrayRef): NxM or NxMxK (e.g. RGB) image data; generally memory-mapped or a LazyArrayRef
+		method (str): How to aggregate each 2x2 block of one level into a value in the next; same options as blockDownsampling (e.g. "mean", "nanmax")
+		tileSize (int): Number of rows/columns in each (square) tile
+
+	Returns
+		outPyramid (ImagePyramid):
+
+	Notes:
+		a) Pyramids are found using a key made from the data and arguments. For LazyArrayRef or memory-mapped data this uses the file path, size and modification time (so its cheap); for other arrays all values are hashed
+		b) Pyramids are built in a temporary directory and then moved into place; so an interrupted build never leaves a partial pyramid in cacheDir
+
+	"""
+	if method not in blockDownsampleHelp.BLOCK_AGGREGATION_METHODS:
+		raise ValueError("{} is not a valid block aggregation method; options are {}".format(method, blockDownsampleHelp.BLOCK_AGGREGATION_METHODS))
+
+	pyramidDir = os.path.join(cacheDir, _getPyramidKey(data, method, tileSize))
+	if not os.path.exists(os.path.join(pyramidDir, _METADATA_FILE)):
+		os.makedirs(cacheDir, exist_ok=True)
+		tempDir = tempfile.mkdtemp(dir=cacheDir, suffix=".tmp")
+		try:
+			_buildPyramid(tempDir, lazyArrayHelp.getUnloadedArray(data), method, tileSize)
+			os.replace(tempDir, pyramidDir)
+		except OSError:
+			#Another process finished building the same pyramid first
+			if not os.path.exists(os.path.join(pyramidDir, _METADATA_FILE)):
+				raise
+		finally:
+			if os.path.exists(tempDir):
+				shutil.rmtree(tempDir)
+
+	return ImagePyramid(pyramidDir)
+
+
+class ImagePyramid():
+	""" Multi-resolution version of an image stored on disk. Level 0 is the original image, and each level after that has half the rows/columns of the one before (each value aggregating a 2x2 block). Each level is split into square tiles, which are stored contiguously; so reading a region only touches the tiles it overlaps
+
+	"""
+
+	def __init__(self, pyramidDir):
+		""" Initializer
+
+		Args:
+			pyramidDir (str): Directory containing the pyramid; generally use getImagePyramid rather than calling this directly
+
+		"""
+		self.pyramidDir = pyramidDir
+		with open(os.path.join(pyramidDir, _METADATA_FILE), "r") as f:
+			metadata = json.load(f)
+		self.tileSize = metadata["tileSize"]
+		self.method = metadata["method"]
+		self.levelShapes = [tuple(shape) for shape in metadata["levelShapes"]]
+
+	@property
+	def nLevels(self):
+		return len(self.levelShapes)
+
+	@property
+	def shape(self):
+		return self.levelShapes[0]
+
+	def getLevelForBlockShape(self, blockShape):
+		""" Gets the lowest resolution level which still has at least as many values as needed; i.e. each of its values covers no more than blockShape values of the original image
+
+		Args:
+			blockShape ((int,int)): Number of original (rows, cols) per output pixel; see block_downsample.getBlockShape
+
+		Returns
+			level (int): Each value in this level covers (2**level, 2**level) original values
+
+		"""
+		maxFactor = max(min(blockShape), 1)
+		return min( int(np.floor(np.log2(maxFactor))), self.nLevels-1 )
+
+	def readRegion(self, level, rowRange, colRange):
+		""" Reads a region of one level; only the tiles overlapping the region are read from disk
+
+		Args:
+			level (int): The level to read from
+			rowRange ((int,int)): (start, end) row indices (in this level); end is exclusive
+			colRange ((int,int)): (start, end) column indices (in this level); end is exclusive
+
+		Returns
+			outArray (np array): The values in the region
+
+		"""
+		return _readTiledRegion(self._getLevelTiles(level), self.levelShapes[level], rowRange, colRange, self.tileSize)
+
+	def _getLevelTiles(self, level):
+		return np.load(os.path.join(self.pyramidDir, _LEVEL_FILE_FMT.format(level)), mmap_mode="r")
+
+
+def _getPyramidKey(data, method, tileSize):
+	keyVals = [_FORMAT_VERSION, method, tileSize]
+	if isinstance(data, lazyArrayHelp.LazyArrayRef) or lazyArrayHelp.isWholeFileMemmap(data):
+		useRef = data if isinstance(data, lazyArrayHelp.LazyArrayRef) else lazyArrayHelp.LazyArrayRef.fromMemmap(data)
+		fileStats = os.stat(useRef.path)
+		keyVals += [useRef.toDict()["payload"], fileStats.st_size, fileStats.st_mtime_ns]
+	else:
+		keyVals.append( np.asarray(data) )
+	return fingerprintHelp.getFingerprint(keyVals)[:32]
+
+
+#Each level is stored as an array of shape (nTileRows, nTileCols, tileSize, tileSize, ...); so each tile is contiguous on disk.
+#Tiles at the bottom/right edges are padded; values in the padding are never read
+def _buildPyramid(outDir, data, method, tileSize):
+	levelShapes = [tuple(data.shape)]
+	levelTiles = _createTiledLevel(outDir, 0, data.shape, data.dtype, tileSize)
+	for (rowStart, rowEnd), (colStart, colEnd) in _iterTileRanges(data.shape, tileSize):
+		levelTiles[rowStart//tileSize, colStart//tileSize, :rowEnd-rowStart, :colEnd-colStart] = data[rowStart:rowEnd, colStart:colEnd]
+	levelTiles.flush()
+
+	while max(levelShapes[-1][:2]) > tileSize:
+		prevShape, prevTiles = levelShapes[-1], levelTiles
+		currShape = ( int(np.ceil(prevShape[0]/2)), int(np.ceil(prevShape[1]/2)) ) + tuple(prevShape[2:])
+		currDtype = _getDownsampledDtype(prevTiles.dtype, prevShape, method)
+		levelTiles = _createTiledLevel(outDir, len(levelShapes), currShape, currDtype, tileSize)
+		for (rowStart, rowEnd), (colStart, colEnd) in _iterTileRanges(currShape, tileSize):
+			prevVals = _readTiledRegion(prevTiles, prevShape, (2*rowStart, min(2*rowEnd, prevShape[0])), (2*colStart, min(2*colEnd, prevShape[1])), tileSize)
+			outVals = blockDownsampleHelp.getBlockDownsampledArray(prevVals, (2,2), method)
+			levelTiles[rowStart//tileSize, colStart//tileSize, :rowEnd-rowStart, :colEnd-colStart] = outVals
+		levelTiles.flush()
+		levelShapes.append(currShape)
+
+	metadata = {"formatVersion":_FORMAT_VERSION, "tileSize":tileSize, "method":method,
+	            "levelShapes":[list(shape) for shape in levelShapes]}
+	with open(os.path.join(outDir, _METADATA_FILE), "w") as f:
+		json.dump(metadata, f)
+
+
+def _createTiledLevel(outDir, level, shape, dtype, tileSize):
+	nTileRows, nTileCols = [ int(np.ceil(nVals/tileSize)) for nVals in shape[:2] ]
+	tiledShape = (nTileRows, nTileCols, tileSize, tileSize) + tuple(shape[2:])
+	outPath = os.path.join(outDir, _LEVEL_FILE_FMT.format(level))
+	return np.lib.format.open_memmap(outPath, mode="w+", dtype=dtype, shape=tiledShape)
+
+
+def _getDownsampledDtype(inpDtype, inpShape, method):
+	testShape = (2,2) + tuple(inpShape[2:])
+	return blockDownsampleHelp.getBlockDownsampledArray(np.zeros(testShape, dtype=inpDtype), (2,2), method).dtype
+
+
+def _iterTileRanges(shape, tileSize):
+	nRows, nCols = shape[:2]
+	for rowStart in range(0, nRows, tileSize):
+		for colStart in range(0, nCols, tileSize):
+			yield (rowStart, min(rowStart+tileSize, nRows)), (colStart, min(colStart+tileSize, nCols))
+
+
+def _readTiledRegion(levelTiles, levelShape, rowRange, colRange, tileSize):
+	(rowStart, rowEnd), (colStart, colEnd) = rowRange, colRange
+	outArray = np.empty( (rowEnd-rowStart, colEnd-colStart) + tuple(levelShape[2:]), dtype=levelTiles.dtype )
+	for tileRow in range(rowStart//tileSize, int(np.ceil(rowEnd/tileSize))):
+		tileRowStart = tileRow*tileSize
+		inRowStart, inRowEnd = max(rowStart-tileRowStart, 0), min(rowEnd-tileRowStart, tileSize)
+		for tileCol in range(colStart//tileSize, int(np.ceil(colEnd/tileSize))):
+			tileColStart = tileCol*tileSize
+			inColStart, inColEnd = max(colStart-tileColStart, 0), min(colEnd-tileColStart, tileSize)
+			outRows = slice(tileRowStart+inRowStart-rowStart, tileRowStart+inRowEnd-rowStart)
+			outCols = slice(tileColStart+inColStart-colStart, tileColStart+inColEnd-colStart)
+			outArray[outRows, outCols] = levelTiles[tileRow, tileCol, inRowStart:inRowEnd, inColStart:inColEnd]
+	return outArray
+
@@ -0,0 +1,145 @@
+
+""" Functions for reducing the number of points in a line before drawing it; without changing how it looks at a given resolution """
+
+import numpy as np
+
+DECIMATION_METHODS = ["minMax", "lttb"]
+
+#Using several columns per pixel for "minMax" means column edges dont need aligning with pixel edges; the result is then
+#practically identical to drawing every point
+_MIN_MAX_COLUMNS_PER_PIXEL = 4
+_LTTB_POINTS_PER_PIXEL = 2
+
+
+def getDecimatedLine(xVals, yVals, method, nPixels, xRange=None, xScale=None):
+	""" Returns a reduced set of points for a line, for drawing at a resolution of nPixels along the x-axis
+
+	Args:
+		xVals (1-dim np array): x-values; need to be sorted (ascending) for any decimation to happen
+		yVals (1-dim np array): y-values
+		method (str): "minMax" or "lttb". See getMinMaxDecimatedIndices and getLTTBDecimatedIndices
+		nPixels (int): The width of the plotted region in pixels
+		xRange ((float,float)): The range of x-values visible on the plot. Default of None means the full range of xVals
+		xScale (str): The x-axis scale (e.g. "log"). Only "log" changes the behaviour
+
+	Returns
+		outX (1-dim np array): x-values to plot
+		outY (1-dim np array): y-values to plot
+
+	Raises:
+		ValueError: If method is not recognised
+
+	Notes:
+		a) The input values are returned unchanged if they cant be decimated safely; i.e. if xVals arent sorted, if any value is non-finite (NaN values create gaps in lines) or if theres too few points for decimation to help
+
+	"""
+	if method not in DECIMATION_METHODS:
+		raise ValueError("{} is not a valid decimation method; options are {}".format(method, DECIMATION_METHODS))
+
+	if not _canDecimate(xVals, yVals, nPixels):
+		return xVals, yVals
+
+	if method == "minMax":
+		binVals, binRange = xVals, xRange
+		if (xScale == "log") and (xVals[0] > 0):
+			binVals = np.log10(xVals)
+			binRange = None if (xRange is None) or (min(xRange) <= 0) else np.log10(xRange)
+		useIndices = getMinMaxDecimatedIndices(binVals, yVals, _MIN_MAX_COLUMNS_PER_PIXEL*nPixels, xRange=binRange)
+	else:
+		useIndices = getLTTBDecimatedIndices(xVals, yVals, _LTTB_POINTS_PER_PIXEL*nPixels)
+
+	return xVals[useIndices], yVals[useIndices]
+
+
+def getMinMaxDecimatedIndices(xVals, yVals, nBins, xRange=None):
+	""" Gets indices of points to keep when splitting the x-range into nBins equal-width columns, and keeping the first, last, minimum and maximum point in each
+
+	Args:
+		xVals (1-dim np array): Sorted x-values
+		yVals (1-dim np array): y-values
+		nBins (int): Number of columns; should be at least the number of pixels
+		xRange ((float,float)): The range to split into columns. Points outside this range are put in two extra columns (one each side). Default of None means the full range of xVals
+
+	Returns
+		outIndices (1-dim np array): Sorted indices of points to keep
+
+	Notes:
+		a) Since the end-points of each column are kept, the segments connecting adjacent columns are drawn exactly; and every peak/trough appears with its full height. Thus, at a resolution of nBins, the line should look the same as if all points were drawn
+
+	"""
+	nPoints = len(xVals)
+	xMin, xMax = (xVals[0], xVals[-1]) if xRange is None else (min(xRange), max(xRange))
+	if (nPoints == 0) or (xMax <= xMin):
+		return np.arange(nPoints)
+
+	#xVals are sorted, so each column is a contiguous run of points; found by binary search rather than binning every point.
+	#The first/last runs hold any points outside xRange
+	innerEdges = xMin + (xMax-xMin)*(np.arange(nBins)/nBins)
+	boundaries = np.concatenate( [[0], np.searchsorted(xVals, innerEdges, side="left"),
+	                              [np.searchsorted(xVals, xMax, side="right"), nPoints]] )
+	startIdxs, endIdxs = boundaries[:-1], boundaries[1:]
+	isNonEmpty = endIdxs > startIdxs
+	startIdxs, endIdxs = startIdxs[isNonEmpty], endIdxs[isNonEmpty]
+
+	minIdxs = np.empty(len(startIdxs), dtype=np.int64)
+	maxIdxs = np.empty(len(startIdxs), dtype=np.int64)
+	for idx, (startIdx, endIdx) in enumerate(zip(startIdxs.tolist(), endIdxs.tolist())):
+		currVals = yVals[startIdx:endIdx]
+		minIdxs[idx] = startIdx + currVals.argmin()
+		maxIdxs[idx] = startIdx + currVals.argmax()
+
+	return np.unique( np.concatenate([startIdxs, endIdxs-1, minIdxs, maxIdxs]) )
+
+
+def getLTTBDecimatedIndices(xVals, yVals, nOut):
+	""" Gets indices of points to keep using the Largest-Triangle-Three-Buckets algorithm
+
+	Args:
+		xVals (1-dim np array): Sorted x-values
+		yVals (1-dim np array): y-values
+		nOut (int): Number of points to keep
+
+	Returns
+		outIndices (1-dim np array): Sorted indices of points to keep
+
+	Notes:
+		a) LTTB keeps the overall shape of a line well with fewer points than the "minMax" method, but isnt guaranteed to keep every peak
+
+	"""
+	nPoints = len(xVals)
+	if (nOut >= nPoints) or (nOut < 3):
+		return np.arange(nPoints)
+
+	#First and last points are always kept; the rest are split into (nOut-2) buckets with one point picked from each
+	bucketEdges = np.linspace(1, nPoints-1, nOut-1).astype(np.int64)
+	outIndices = np.empty(nOut, dtype=np.int64)
+	outIndices[0], outIndices[-1] = 0, nPoints-1
+
+	prevIdx = 0
+	for bIdx in range(nOut-2):
+		startIdx, endIdx = bucketEdges[bIdx], bucketEdges[bIdx+1]
+		nextEndIdx = bucketEdges[bIdx+2] if bIdx+2 < len(bucketEdges) else nPoints
+		avgX, avgY = xVals[endIdx:nextEndIdx].mean(), yVals[endIdx:nextEndIdx].mean()
+
+		#Pick the point making the largest triangle with the previous pick and the average of the next bucket
+		prevX, prevY = xVals[prevIdx], yVals[prevIdx]
+		areas = np.abs( (prevX-avgX)*(yVals[startIdx:endIdx]-prevY) - (prevX-xVals[startIdx:endIdx])*(avgY-prevY) )
+		prevIdx = startIdx + int(np.argmax(areas))
+		outIndices[bIdx+1] = prevIdx
+
+	return outIndices
+
+
+def _canDecimate(xVals, yVals, nPixels):
+	if (nPixels is None) or (nPixels < 1):
+		return False
+
+	#"minMax" keeps up to 4 points per column (first/last/min/max), so fewer points than that means nothing to gain
+	if len(xVals) <= 4*_MIN_MAX_COLUMNS_PER_PIXEL*nPixels:
+		return False
+
+	if not ( np.all(np.isfinite(xVals)) and np.all(np.isfinite(yVals)) ):
+		return False
+
+	return bool( np.all(xVals[1:] >= xVals[:-1]) )
+
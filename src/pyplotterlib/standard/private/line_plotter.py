@@ -2,6 +2,9 @@
 
 import types
 
+import numpy as np
+
+from . import line_streaming as streamingHelp
 from . import shared
 
 from ...core import plotters as plotterCoreHelp
@@ -24,9 +27,75 @@ class LinePlotter(shared.FromJsonMixin, shared.FromPlotterMixin, plotterCoreHelp
 		"""
 		self._createCommands()
 		self._createOptions()
-		self._scratchSpace = {"legendKwargDict":{}}
+		self._scratchSpace = {"legendKwargDict":{}, "plotKwargs":{}}
 		self.setOptionVals(kwargs)
 
+	def appendData(self, outDict, seriesIdx, newPoints, maxWindow=None):
+		""" Appends points to one line on a plot made by createPlot; without redrawing anything else. Useful for live-updating plots
+
+		Args:
+			outDict (dict): The output of self.createPlot (or of a previous updatePlot/appendData call)
+			seriesIdx (int): Index of the data series to add points to
+			newPoints (nx2 np array): New [x,y] values to add to the end of the line
+			maxWindow (int): If set, only the latest maxWindow points of this series are kept. Only the value passed in the first call (for each series) is used
+
+		Returns
+			outDict (dict): The same dict that was passed in
+
+		Raises:
+			ValueError: If outDict doesnt contain the plotter used to create it, or if the plot wasnt drawn as individual lines (e.g. lineDrawAsCollection or lineDensityRaster were set)
+
+		Notes:
+			a) Time taken scales with the number of new points, rather than the total number of points; the line references the buffered data rather than a copy of it. Matplotlib still has to convert and draw every point when the figure is next drawn. For matplotlib versions outside line_streaming._DIRECT_LINE_DATA_MPL_VERSIONS the line data is copied on every call instead
+			b) Axis limits are expanded to fit the new points (unless xLimit/yLimit are set). If maxWindow drops points, the limits are recalculated from all the data lines instead; other artists (e.g. annotations) are then ignored
+			c) The new points arent added to the plotData option; so calling updatePlot in a way that redraws the data (e.g. changing plotData) discards them. Error bars, decimation and legends are not updated
+
+		"""
+		factory = outDict.get("plotter", None)
+		if factory is None:
+			raise ValueError("outDict has no \"plotter\" key; appendData needs the plotter instance used to create the plot")
+
+		for optName in ["lineDrawAsCollection", "lineDensityRaster"]:
+			if getattr(factory.opts, optName).value:
+				raise ValueError("appendData cant be used when {} is set".format(optName))
+
+		lineHandle = factory._scratchSpace["plotLineHandles"]["value"][seriesIdx]
+		streamBuffers = factory._scratchSpace.setdefault("streamLineBuffers", dict())
+		if lineHandle not in streamBuffers:
+			streamBuffers[lineHandle] = streamingHelp.StreamingLineData(lineHandle.get_xdata(), lineHandle.get_ydata(), maxWindow=maxWindow)
+
+		lineBuffer = streamBuffers[lineHandle]
+		newPoints = np.asarray(newPoints)
+		nDropped = lineBuffer.append(newPoints[:,0], newPoints[:,1])
+		streamingHelp.setLineDataFromBuffer(lineHandle, lineBuffer)
+
+		axHandle = factory._scratchSpace["axHandle"]
+		if nDropped > 0:
+			self._resetDataLimsToPlottedLines(factory, streamBuffers)
+		else:
+			axHandle.update_datalim(newPoints)
+		axHandle.autoscale_view()
+
+		return outDict
+
+	#Limits can shrink when points are dropped, so need setting from all the data lines. Lines without buffers dont change, so their limits are cached
+	def _resetDataLimsToPlottedLines(self, factory, streamBuffers):
+		cachedLimits = factory._scratchSpace.setdefault("streamFixedLineLimits", dict())
+		allLimits = list()
+		for lineHandle in factory._scratchSpace["plotLineHandles"]["value"]:
+			if lineHandle in streamBuffers:
+				allLimits.append( streamBuffers[lineHandle].getDataLimits() )
+			else:
+				if lineHandle not in cachedLimits:
+					cachedLimits[lineHandle] = streamingHelp.StreamingLineData(lineHandle.get_xdata(), lineHandle.get_ydata()).getDataLimits()
+				allLimits.append( cachedLimits[lineHandle] )
+
+		axHandle = factory._scratchSpace["axHandle"]
+		axHandle.ignore_existing_data_limits = True
+		for limits in allLimits:
+			if np.all(np.isfinite(limits)):
+				axHandle.update_datalim(limits)
+
 	def _createCommands(self):
 		self._commands = _createCommandsList()
 
@@ -41,7 +110,12 @@ def _createCommandsList():
 	outList = [
 	plotCmdStdHelp.CreateFigureIfNoAxHandle(),
 	plotCmdStdHelp.AddPlotterToOutput(),
+	plotCmdStdHelp.SetColormapInPlotKwargs(),
+	plotCmdStdHelp.SetColormapMaxValInPlotKwargs(),
+	plotCmdStdHelp.SetColormapMinValInPlotKwargs(),
 	plotCmdStdHelp.PlotDataAsLines(),
+	plotCmdStdHelp.AddColorBar(),
+	plotCmdStdHelp.SetColorbarFontSizes(),
 	plotCmdStdHelp.GridLinesCreate(),
 	plotCmdStdHelp.SetDataLabels(),
 	plotCmdStdHelp.SetLineAlpha(),
@@ -94,6 +168,16 @@ def _createOptionsList():
 	plotOptStdHelp.AxisColorY_exclSpines(),
 	plotOptStdHelp.AxisScaleX(),
 	plotOptStdHelp.AxisScaleY(),
+	plotOptStdHelp.ColorBarFontSize(),
+	plotOptStdHelp.ColorBarLabelFontSize(),
+	plotOptStdHelp.ColorBarTickLabelFontSize(),
+	plotOptStdHelp.ColorBarLabel(),
+	plotOptStdHelp.ColorBarLocation(),
+	plotOptStdHelp.ColorBarShow(),
+	plotOptStdHelp.ColorBarLabelRotation(),
+	plotOptStdHelp.ColormapMaxVal(),
+	plotOptStdHelp.ColormapMinVal(),
+	plotOptStdHelp.ColormapStr(),
 	plotOptStdHelp.DataLabels(),
 	plotOptStdHelp.ErrorBarCapsize(),
 	plotOptStdHelp.ErrorBarColors(),
@@ -113,11 +197,17 @@ def _createOptionsList():
 	plotOptStdHelp.LegendOn(),
 	plotOptStdHelp.LineAlpha(),
 	plotOptStdHelp.LineColors(),
+	plotOptStdHelp.LineDecimation(),
+	plotOptStdHelp.LineDecimationNumbPixels(),
+	plotOptStdHelp.LineDensityRaster(),
+	plotOptStdHelp.LineDrawAsCollection(),
 	plotOptStdHelp.LineMarkerSizes(),
 	plotOptStdHelp.LineMarkerStyles(),
 	plotOptStdHelp.LineStyles(),
 	plotOptStdHelp.LineThickness(),
 	plotOptStdHelp.PlotData2D(),
+	plotOptStdHelp.PlotDataColumnsY(),
+	plotOptStdHelp.PlotDataSharedX(),
 	plotOptStdHelp.PlotHozLinesColorStrs(),
 	plotOptStdHelp.PlotHozLinesPositions(),
 	plotOptStdHelp.PlotHozLinesStyleStrs(),
@@ -0,0 +1,174 @@
+
+""" Buffers for appending data to already-drawn lines (e.g. for live-updating plots) """
+
+import matplotlib
+import numpy as np
+
+_MIN_CAPACITY = 1024
+_SUMMARY_BLOCK_SIZE = 4096
+
+#Matplotlib versions where Line2D.set_xdata/set_ydata are known to just store the values (in _xorig/_yorig) and set _invalidx/_invalidy; see setLineDataFromBuffer
+_DIRECT_LINE_DATA_MPL_VERSIONS = [(3,5), (3,11)]
+
+
+class StreamingLineData():
+	""" Holds x/y values for one line in pre-allocated arrays; so appending points only costs time proportional to the number of new points (on average)
+
+	Notes:
+		a) Capacity is doubled whenever its exceeded. If maxWindow is set, only the latest maxWindow points are kept; the buffer is then 2*maxWindow long, and retained points are shifted to the start whenever the end is reached (once per maxWindow points appended)
+		b) xVals/yVals are views; they become invalid once more points are appended
+		c) The min/max values of each block of points are stored, so getDataLimits doesnt need to check every point
+
+	"""
+
+	def __init__(self, xVals, yVals, maxWindow=None):
+		""" Initializer
+
+		Args:
+			xVals (1-dim np array): Initial x-values; these are copied into the buffer
+			yVals (1-dim np array): Initial y-values; these are copied into the buffer
+			maxWindow (int): Maximum number of points to keep; the oldest are dropped first. Default of None means keep every point
+
+		"""
+		self.maxWindow = maxWindow
+		xVals, yVals = np.asarray(xVals), np.asarray(yVals)
+		if maxWindow is not None:
+			xVals, yVals = xVals[-maxWindow:], yVals[-maxWindow:]
+
+		capacity = max(2*len(xVals), _MIN_CAPACITY) if maxWindow is None else 2*maxWindow
+		self._xBuffer = np.empty(capacity, dtype=np.result_type(xVals, np.float64))
+		self._yBuffer = np.empty(capacity, dtype=np.result_type(yVals, np.float64))
+		self._xBuffer[:len(xVals)], self._yBuffer[:len(yVals)] = xVals, yVals
+		self._startIdx, self._endIdx = 0, len(xVals)
+		self._resetBlockLimits()
+
+	@property
+	def xVals(self):
+		return self._xBuffer[self._startIdx:self._endIdx]
+
+	@property
+	def yVals(self):
+		return self._yBuffer[self._startIdx:self._endIdx]
+
+	def __len__(self):
+		return self._endIdx - self._startIdx
+
+	def append(self, xVals, yVals):
+		""" Adds points to the end of the line
+
+		Args:
+			xVals (1-dim np array): x-values for the new points
+			yVals (1-dim np array): y-values for the new points
+
+		Returns
+			nDropped (int): The number of old points dropped due to maxWindow
+
+		"""
+		xVals, yVals = np.asarray(xVals), np.asarray(yVals)
+		nBefore = len(self)
+		if self.maxWindow is not None:
+			xVals, yVals = xVals[-self.maxWindow:], yVals[-self.maxWindow:]
+
+		nNew = len(xVals)
+		if self._endIdx + nNew > len(self._xBuffer):
+			self._makeSpace(nNew)
+
+		self._xBuffer[self._endIdx:self._endIdx+nNew] = xVals
+		self._yBuffer[self._endIdx:self._endIdx+nNew] = yVals
+		self._updateBlockLimits(self._endIdx, self._endIdx+nNew)
+		self._endIdx += nNew
+
+		if (self.maxWindow is not None) and (len(self) > self.maxWindow):
+			self._startIdx = self._endIdx - self.maxWindow
+
+		return nBefore + nNew - len(self)
+
+	def _makeSpace(self, nNew):
+		#Points which will still be in the window after the append are moved to the start of the (possibly new) buffers
+		nKeep = len(self) if self.maxWindow is None else min(len(self), self.maxWindow-nNew)
+		capacity = len(self._xBuffer) if self.maxWindow is not None else max(2*(nKeep+nNew), _MIN_CAPACITY)
+		keepSlice = slice(self._endIdx-nKeep, self._endIdx)
+
+		if capacity == len(self._xBuffer):
+			self._xBuffer[:nKeep], self._yBuffer[:nKeep] = self._xBuffer[keepSlice].copy(), self._yBuffer[keepSlice].copy()
+		else:
+			newX, newY = np.empty(capacity, dtype=self._xBuffer.dtype), np.empty(capacity, dtype=self._yBuffer.dtype)
+			newX[:nKeep], newY[:nKeep] = self._xBuffer[keepSlice], self._yBuffer[keepSlice]
+			self._xBuffer, self._yBuffer = newX, newY
+
+		self._startIdx, self._endIdx = 0, nKeep
+		self._resetBlockLimits()
+
+	def getDataLimits(self):
+		""" Gets the range of x/y values currently held; NaN values are ignored
+
+		Returns
+			limits (2x2 np array): [[minX,minY], [maxX,maxY]]. Values are NaN if there arent any (non-NaN) points
+
+		"""
+		#Full blocks use the stored limits; the partial blocks at either end are checked directly
+		firstBlock = -(-self._startIdx // _SUMMARY_BLOCK_SIZE)
+		endBlock = self._endIdx // _SUMMARY_BLOCK_SIZE
+		if endBlock <= firstBlock:
+			return _getLimitsFromVals(self.xVals, self.yVals)
+
+		edgeSlices = [slice(self._startIdx, firstBlock*_SUMMARY_BLOCK_SIZE), slice(endBlock*_SUMMARY_BLOCK_SIZE, self._endIdx)]
+		allLimits = [_getLimitsFromVals(self._xBuffer[currSlice], self._yBuffer[currSlice]) for currSlice in edgeSlices]
+		allLimits.append( np.array([np.fmin.reduce(self._blockMins[firstBlock:endBlock], axis=0),
+		                            np.fmax.reduce(self._blockMaxs[firstBlock:endBlock], axis=0)]) )
+		return np.array([np.fmin.reduce([x[0] for x in allLimits]), np.fmax.reduce([x[1] for x in allLimits])])
+
+	def _resetBlockLimits(self):
+		nBlocks = -(-len(self._xBuffer) // _SUMMARY_BLOCK_SIZE)
+		self._blockMins, self._blockMaxs = np.full((nBlocks,2), np.nan), np.full((nBlocks,2), np.nan)
+		self._updateBlockLimits(0, self._endIdx)
+
+	#Blocks overlapping [startIdx,endIdx) are recalculated from all their points (up to endIdx)
+	def _updateBlockLimits(self, startIdx, endIdx):
+		if endIdx <= startIdx:
+			return None
+		firstBlock, lastBlock = startIdx // _SUMMARY_BLOCK_SIZE, (endIdx-1) // _SUMMARY_BLOCK_SIZE
+		regionStart = firstBlock*_SUMMARY_BLOCK_SIZE
+		offsets = np.arange(lastBlock-firstBlock+1) * _SUMMARY_BLOCK_SIZE
+		for buffer, colIdx in [(self._xBuffer, 0), (self._yBuffer, 1)]:
+			regionVals = buffer[regionStart:endIdx]
+			self._blockMins[firstBlock:lastBlock+1, colIdx] = np.fmin.reduceat(regionVals, offsets)
+			self._blockMaxs[firstBlock:lastBlock+1, colIdx] = np.fmax.reduceat(regionVals, offsets)
+
+
+def setLineDataFromBuffer(lineHandle, lineBuffer):
+	""" Equivalent to lineHandle.set_data(lineBuffer.xVals, lineBuffer.yVals); except the line references the buffer views rather than copies of them
+
+	Args:
+		lineHandle (matplotlib Line2D):
+		lineBuffer (StreamingLineData):
+
+	Notes:
+		a) Line2D.set_data copies the data it's given; which would make every append cost time proportional to the total number of points
+		b) This should be called after every append; since the views become invalid once more points are appended
+		c) This sets private Line2D attributes; so is only done for matplotlib versions where we know what they mean (_DIRECT_LINE_DATA_MPL_VERSIONS). Other versions use set_data; meaning each append copies the whole line
+
+	"""
+	if not _canSetLineDataDirectly():
+		lineHandle.set_data(lineBuffer.xVals, lineBuffer.yVals)
+		return None
+
+	#What set_xdata/set_ydata do, minus the copy; the converted values are then recalculated when the line is next drawn
+	lineHandle._xorig, lineHandle._yorig = lineBuffer.xVals, lineBuffer.yVals
+	lineHandle._invalidx, lineHandle._invalidy = True, True
+	lineHandle.stale = True
+
+
+def _canSetLineDataDirectly():
+	versionInfo = getattr(matplotlib, "__version_info__", None) #Only present from 3.5 onwards
+	if versionInfo is None:
+		return False
+	minVersion, maxVersion = _DIRECT_LINE_DATA_MPL_VERSIONS
+	return minVersion <= (versionInfo.major, versionInfo.minor) <= maxVersion
+
+
+def _getLimitsFromVals(xVals, yVals):
+	if len(xVals) == 0:
+		return np.full((2,2), np.nan)
+	return np.array([[np.fmin.reduce(xVals), np.fmin.reduce(yVals)], [np.fmax.reduce(xVals), np.fmax.reduce(yVals)]])
+
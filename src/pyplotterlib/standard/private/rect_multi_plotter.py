@@ -33,6 +33,18 @@ class RectMultiPlotter(shared.FromJsonMixin,  shared.FromPlotterMixin, plotterCo
 		_optionsList = _createOptionsList()
 		self._options = plotOptCoreHelp.OptionsCollection(options=_optionsList)
 
+	#Re-use the figure (but not the axes) for each plot; unless it needs creating with a different layout engine
+	def _createPlotForBatch(self, figHandle, kwargs, prevKwargs=None, prevOutDict=None):
+		layoutName = "constrainedLayout"
+		if (figHandle is None) or (self._getOptionValForBatch(kwargs, layoutName) != self._getOptionValForBatch(prevKwargs, layoutName)):
+			return super()._createPlotForBatch(figHandle, kwargs, prevKwargs=prevKwargs, prevOutDict=prevOutDict)
+
+		figHandle.clear()
+		figSize = self._getOptionValForBatch(kwargs, "figSizeOnCreation")
+		figHandle.set_size_inches( plt.rcParams["figure.figsize"] if figSize is None else figSize )
+		outDict = self.createPlot(figHandle=figHandle, **kwargs)
+		return figHandle, outDict
+
 
 
 def _createCommandList():
@@ -509,7 +521,7 @@ class FillPlottersToMatchGridCommand(plotCmdCoreHelp.PlotCommand):
 		if nPlotters == 0:
 			outPlotters = list()
 		else:
-			outPlotters = getattr(plotterInstance.opts,"plotters").value
+			outPlotters = list( getattr(plotterInstance.opts,"plotters").value ) #Copy, since we extend it below
 
 		#Add until we fill the grid
 		keepAdding = True
@@ -662,7 +674,7 @@ def _getRelHeightsAndWidthArrays(plotterInstance, _relHeightAttr="relGridHeights
 	_relWidths = getattr(plotterInstance.opts, _relWidthAttr).value
 
 	def _getFinalArrayForHeightOrWidth(inpArray):
-		outArray = list() if inpArray is None else inpArray
+		outArray = list() if inpArray is None else list(inpArray) #Copy; we modify this in place below
 		for idx, val in enumerate(outArray):
 			outArray[idx] = val if val is not None else 1
 
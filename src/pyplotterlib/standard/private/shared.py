@@ -1,16 +1,16 @@
 
-import json
+import numpy as np
+
 from ...core.serialization import json_io as jsonIoHelp
 
 
 class FromJsonMixin():
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
+	def fromDict(cls, inpDict):
 		outObj = cls()
-		optionsObj = jsonIoHelp.createInstanceFromJSON(useDict["payload"]["options"])
-		commandObjs = [ jsonIoHelp.createInstanceFromJSON(x) for x in useDict["payload"]["commands"] ]
+		optionsObj = jsonIoHelp.createInstanceFromDict(inpDict["payload"]["options"])
+		commandObjs = [ jsonIoHelp.createInstanceFromDict(x) for x in inpDict["payload"]["commands"] ]
 
 		outObj._options = optionsObj
 		outObj._commands = commandObjs
@@ -56,37 +56,65 @@ def _getAxisEdges(inpAx):
 	return startX, startY, endX, endY
 
 
+#Colorbars are drawn on their own axes; which arent removed by clearing/removing the axis the sub-plot was drawn on
+def _removeSubPlotColorBars(subOutDicts):
+	for outDict in subOutDicts:
+		subPlotter = outDict.get("plotter", None)
+		cbar = None if subPlotter is None else subPlotter._scratchSpace.get("cbar", None)
+		if cbar is not None:
+			cbar.remove()
+
 
 #Refactored/Extracted from bar_plotter; also usable in boxPlotter (and likely other similar plotters in the future)
 def _getIndividAndGroupCentresBarLikePlot(nGroups, nSeries, widthBar, widthIntraSpacing,
                                           widthInterSpacing, startPos=0, skipSeries=None):
-	outCentres = [ list() for x in range(nSeries) ]
-	currPos = startPos
+	""" Gets the central positions of each bar (or similar) and of each group
 
+	Returns
+		outCentres (nSeries x nGroups np array): Centre of each bar
+		groupCentres (nGroups np array): Mean centre of the bars in each group
+
+	"""
 	if skipSeries is None:
 		skipSeries = [False for x in range(nSeries)]
 
-	#Figure out where to plot the individual bars/similar
-	for gIdx in range(nGroups):
-		for skipShift,sIdx in zip(skipSeries, range(nSeries)):
-			outCentres[sIdx].append(currPos)
-			if skipShift is False:
-				currPos += widthIntraSpacing
-				currPos += widthBar
-
-		#Not 100% sure why this if statement had to be added
-		if any(skipSeries):
-			currPos += widthInterSpacing + widthBar
-		else:
-			currPos += widthInterSpacing
-
-
-	#Figure out the centre of each group
-	groupCentres = list()
-	for idx in range(nGroups):
-		currCentres = [ x[idx] for x in outCentres ]
-		currAverage = sum(currCentres)/len(currCentres)
-		groupCentres.append(currAverage)
-	
+	#Each series is shifted along from the previous one, unless its skipped (e.g. stacked bars)
+	seriesSteps = [widthIntraSpacing+widthBar if skipShift is False else 0 for skipShift,unused in zip(skipSeries, range(nSeries))]
+	seriesOffsets = np.concatenate([ [0], np.cumsum(seriesSteps)[:-1] ])
+
+	#Not 100% sure why this extra widthBar had to be added
+	groupStep = sum(seriesSteps) + widthInterSpacing
+	if any(skipSeries):
+		groupStep += widthBar
+
+	groupStarts = startPos + groupStep*np.arange(nGroups)
+	outCentres = groupStarts[np.newaxis,:] + seriesOffsets[:,np.newaxis]
+	groupCentres = np.mean(outCentres, axis=0)
+
 	return outCentres, groupCentres
 
+
+def _getBarLikeDataAsMaskedArray(plotData):
+	""" Converts 1-dim data for each series into a single (nSeries x nGroups) masked array
+
+	Args:
+		plotData (iter of iter): Values for each series. Series may differ in length, and values may be None
+
+	Returns
+		outArray (nSeries x nGroups masked np array): Float values; masked where plotData is None or the series is too short
+
+	"""
+	nSeries = len(plotData)
+	nGroups = max( [len(x) for x in plotData] )
+	outVals = np.zeros( (nSeries,nGroups) )
+	outMask = np.ones( (nSeries,nGroups), dtype=bool )
+
+	for sIdx, currSeries in enumerate(plotData):
+		#Only object arrays (e.g. lists) can contain None
+		currVals = np.asarray(currSeries)
+		isNone = np.equal(currVals, None) if currVals.dtype == object else np.zeros(len(currVals), dtype=bool)
+		outVals[sIdx,:len(currVals)] = np.where(isNone, np.nan, currVals)
+		outMask[sIdx,:len(currVals)] = isNone
+
+	return np.ma.masked_array(outVals, mask=outMask)
+
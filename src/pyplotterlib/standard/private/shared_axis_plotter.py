@@ -30,11 +30,19 @@ class DoubleAxisPlotter(shared.FromJsonMixin, shared.FromPlotterMixin, plotterCo
 		_optionsList = _createOptionsList()
 		self._options = plotOptCoreHelp.OptionsCollection(options=_optionsList)
 
+	#Sub-plotters draw on twinned axes which are created on every draw; so updatePlot removes them and redraws everything (on a new original axis)
+	def _redrawPlotFromScratch(self, factory):
+		shared._removeSubPlotColorBars( factory._scratchSpace.get("shared_axes_sub_out_dicts", list()) )
+		for axHandle in factory._scratchSpace.get("shared_axes_created_axes", list()):
+			axHandle.remove()
+		super()._redrawPlotFromScratch(factory)
+
 
 
 def _createCommandsList():
 	outList = [
 	CheckMaxThreeAxes(),
+	plotCommStdHelp.AddPlotterToOutput(),
 	plotCommStdHelp.CreateFigureIfNoAxHandle(),
 	GenerateSecondAxisForPlotting(),
 	CheckAxesAndPlottersConsistent(),
@@ -101,6 +109,7 @@ class GenerateSecondAxisForPlotting(plotCommCoreHelp.PlotCommand):
 		secondAxis = startAxis.twiny() if newX else startAxis
 		thirdAxis = secondAxis.twinx() if newY else secondAxis
 		plotterInstance._scratchSpace["shared_axes_second_axis"] = thirdAxis
+		plotterInstance._scratchSpace["shared_axes_created_axes"] = ([secondAxis] if newX else list()) + ([thirdAxis] if newY else list())
 
 
 
@@ -116,9 +125,10 @@ class PopulateAxesWithPlotters(plotCommCoreHelp.PlotCommand):
 		targVal = getattr(plotterInstance.opts, self._plottersKey).value
 		if targVal is None:
 			return None
-		targVal[0].createPlot(axHandle=plotterInstance._scratchSpace["axHandle"])
+		subOutDicts = [ targVal[0].createPlot(axHandle=plotterInstance._scratchSpace["axHandle"]) ]
 		if len(targVal)>1:
-			targVal[1].createPlot(axHandle=plotterInstance._scratchSpace["shared_axes_second_axis"])
+			subOutDicts.append( targVal[1].createPlot(axHandle=plotterInstance._scratchSpace["shared_axes_second_axis"]) )
+		plotterInstance._scratchSpace["shared_axes_sub_out_dicts"] = subOutDicts
 
 
 @serializationReg.registerForSerialization()
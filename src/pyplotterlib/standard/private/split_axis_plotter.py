@@ -1,11 +1,9 @@
 
 import itertools as it
-import json
 import math
 
 import numpy as np
 import matplotlib.lines as lines
-import matplotlib.pyplot as plt
 
 from . import shared
 
@@ -35,6 +33,21 @@ class SplitAxisPlotter(shared.FromJsonMixin, shared.FromPlotterMixin, plotterCor
 		_optionsList = _createOptionsList()
 		self._options = plotOptCoreHelp.OptionsCollection(options=_optionsList)
 
+	#Sub-plotters draw on axes created on every draw (and the original axis is hidden); so updatePlot removes these and redraws everything (on a new original axis)
+	def _redrawPlotFromScratch(self, factory):
+		_removeSubAxesAndSplitLines(factory)
+		super()._redrawPlotFromScratch(factory)
+
+
+def _removeSubAxesAndSplitLines(factory):
+	""" Removes the figure-level artists (axes, colorbars, lines) created when factory (a SplitAxisPlotter) drew a plot. The original axis is left alone; callers should replace it """
+	shared._removeSubPlotColorBars( factory._scratchSpace.get("split_axis_sub_out_dicts", list()) )
+	for axRow in factory._scratchSpace.get("axis_grid", list()):
+		for axHandle in axRow:
+			axHandle.remove()
+	for artist in factory._scratchSpace.get("split_line_artists", list()):
+		artist.remove()
+
 
 def _createCommandList():
 	outList = [
@@ -104,14 +117,13 @@ class DoubleLinesConfig(jsonTransformCoreHelp.JSONTransformInterface):
 		self.length = length
 		self.angle = angle
 
-	def toJSON(self):
+	def toDict(self):
 		payload = {"draw":self.draw, "length":self.length, "angle":self.angle}
-		return json.dumps({"class":str(self.__class__), "payload":payload})
+		return {"class":str(self.__class__), "payload":payload}
 
 	@classmethod
-	def fromJSON(cls, inpJSON):
-		useDict = json.loads(inpJSON)
-		payload = useDict["payload"]
+	def fromDict(cls, inpDict):
+		payload = inpDict["payload"]
 		return cls(**payload)
 
 	def __eq__(self, other):
@@ -201,13 +213,16 @@ class DrawDoubleLinesForAxisSplits(plotCmdCoreHelp.PlotCommand):
 #		_startX, _startY, _endX, _endY = _getAxisEdges(plt.gca())
 		_startX, _startY, _endX, _endY = shared._getAxisEdges( plotterInstance._scratchSpace["original_axis"] )
 		axWidth, axHeight = _endX - _startX, _endY - _startY
+		figHandle = plotterInstance._scratchSpace["original_axis"].figure
 
 		#3) Use all previous info to draw lines around x-splits
-		_drawDoubleLineOnXSplitsIfNeeded(plotterInstance.opts.splitDrawDoubleLinesX.value, xCentroids, axHeight)
-		_drawDoubleLineOnXSplitsIfNeeded(plotterInstance.opts.splitDrawDoubleLinesX.value, xCentroids, axHeight, offsetVal=[0,axHeight])
+		outArtists = list()
+		outArtists += _drawDoubleLineOnXSplitsIfNeeded(figHandle, plotterInstance.opts.splitDrawDoubleLinesX.value, xCentroids, axHeight)
+		outArtists += _drawDoubleLineOnXSplitsIfNeeded(figHandle, plotterInstance.opts.splitDrawDoubleLinesX.value, xCentroids, axHeight, offsetVal=[0,axHeight])
 
-		_drawDoubleLineOnYSplitsIfNeeded(plotterInstance.opts.splitDrawDoubleLinesY.value, yCentroids, axWidth)
-		_drawDoubleLineOnYSplitsIfNeeded(plotterInstance.opts.splitDrawDoubleLinesY.value, yCentroids, axWidth, offsetVal=[axWidth,0])
+		outArtists += _drawDoubleLineOnYSplitsIfNeeded(figHandle, plotterInstance.opts.splitDrawDoubleLinesY.value, yCentroids, axWidth)
+		outArtists += _drawDoubleLineOnYSplitsIfNeeded(figHandle, plotterInstance.opts.splitDrawDoubleLinesY.value, yCentroids, axWidth, offsetVal=[axWidth,0])
+		plotterInstance._scratchSpace["split_line_artists"] = outArtists
 
 	def _getCentroidPositionsX(self, plotterInstance):
 		allPositions = plotterInstance._scratchSpace["new_axis_positions"]
@@ -247,11 +262,12 @@ class DrawDoubleLinesForAxisSplits(plotCmdCoreHelp.PlotCommand):
 		return centroids
 
 
-def _drawDoubleLineOnXSplitsIfNeeded(drawOpts, centroids, axHeight, offsetVal=None):
+def _drawDoubleLineOnXSplitsIfNeeded(figHandle, drawOpts, centroids, axHeight, offsetVal=None):
 	offsetVal = [0,0] if offsetVal is None else offsetVal
 
 	numbSplits = len(centroids)
 	useOpts = it.cycle(drawOpts)
+	outArtists = list()
 
 	for (centroidA, centroidB), currOpts in zip(centroids, useOpts):
 		#Create a vector representing the lines; angle=0 should point along y
@@ -278,15 +294,17 @@ def _drawDoubleLineOnXSplitsIfNeeded(drawOpts, centroids, axHeight, offsetVal=No
 
 		#If requested; add these output lines to the figure
 		if currOpts.draw:
-			currFig = plt.gcf()
-			currFig.add_artist(lines.Line2D(xValsA, yValsA))
-			currFig.add_artist(lines.Line2D(xValsB, yValsB))
+			outArtists.append( figHandle.add_artist(lines.Line2D(xValsA, yValsA)) )
+			outArtists.append( figHandle.add_artist(lines.Line2D(xValsB, yValsB)) )
+
+	return outArtists
 
 #VERY similar to the x-splits
-def _drawDoubleLineOnYSplitsIfNeeded(drawOpts, centroids, axWidth, offsetVal=None):
+def _drawDoubleLineOnYSplitsIfNeeded(figHandle, drawOpts, centroids, axWidth, offsetVal=None):
 	offsetVal = [0,0] if offsetVal is None else offsetVal
 	numbSplits = len(centroids)
 	useOpts = it.cycle(drawOpts)
+	outArtists = list()
 
 	for (centroidA, centroidB), currOpts in zip(centroids, useOpts):
 		widthX = axWidth*currOpts.length
@@ -311,11 +329,11 @@ def _drawDoubleLineOnYSplitsIfNeeded(drawOpts, centroids, axWidth, offsetVal=Non
 
 		#If requested; add these output lines to the figure
 		if currOpts.draw:
-			currFig = plt.gcf()
-			currFig.add_artist(lines.Line2D(xValsA, yValsA))
-			currFig.add_artist(lines.Line2D(xValsB, yValsB))
+			outArtists.append( figHandle.add_artist(lines.Line2D(xValsA, yValsA)) )
+			outArtists.append( figHandle.add_artist(lines.Line2D(xValsB, yValsB)) )
+
+	return outArtists
 
-		
 
 @serializationReg.registerForSerialization()
 class CreateOutputAxes(plotCmdCoreHelp.PlotCommand):
@@ -325,7 +343,7 @@ class CreateOutputAxes(plotCmdCoreHelp.PlotCommand):
 		self._description = "Create the output axes to use for the split axes plot"
 
 	def execute(self, plotterInstance):
-		origAx = plt.gca()
+		origAx = plotterInstance._scratchSpace["axHandle"]
 		plotterInstance._scratchSpace["original_axis"] = origAx
 
 		_attrNames = ["plotterGrid", "fractsX", "fractsY", "spacingX", "spacingY"]
@@ -335,7 +353,7 @@ class CreateOutputAxes(plotCmdCoreHelp.PlotCommand):
 #			currArgs[0], _tempList = list(), list()
 #			currArgs[0].append(_tempList)
  
-		outPositions = _getOutputAxesPositions(*currArgs)
+		outPositions = _getOutputAxesPositions(origAx, *currArgs)
 		plotterInstance._scratchSpace["new_axis_positions"] = outPositions
 
 		outAxesGrid = list()
@@ -350,7 +368,7 @@ class CreateOutputAxes(plotCmdCoreHelp.PlotCommand):
 		plotterInstance._scratchSpace["axis_grid"] = outAxesGrid
 
 
-def _getOutputAxesPositions(plotterGrid, fractsX, fractsY, spacingX, spacingY):
+def _getOutputAxesPositions(origAx, plotterGrid, fractsX, fractsY, spacingX, spacingY):
 	nPlottersX = len(plotterGrid)
 	nPlottersY = len(plotterGrid[0])
 
@@ -361,7 +379,7 @@ def _getOutputAxesPositions(plotterGrid, fractsX, fractsY, spacingX, spacingY):
 	spaceYList = _getListFromFloatOrFloatIter(spacingY, nPlottersY-1)
 
 	#Figure out the original axes bounds; these are fractional with respect to the whole figure so cant go outside them
-	startX, startY, endX, endY = shared._getAxisEdges(plt.gca())
+	startX, startY, endX, endY = shared._getAxisEdges(origAx)
 
 	#Divide the space in the RATIOS determined by spacing and fract values for each
 	xSpace, ySpace = endX - startX, endY - startY
@@ -416,9 +434,12 @@ class AddPlotsToAxisGrid(plotCmdCoreHelp.PlotCommand):
 		axGrid = plotterInstance._scratchSpace["axis_grid"]
 		plotterGrid = getattr(plotterInstance.opts,"plotterGrid").value
 
+		subOutDicts = list()
 		for xIdx, unused in enumerate(axGrid):
 			for yIdx, unused in enumerate(axGrid[xIdx]):
-				plotterGrid[xIdx][yIdx].createPlot(axHandle=axGrid[xIdx][yIdx])
+				subOutDicts.append( plotterGrid[xIdx][yIdx].createPlot(axHandle=axGrid[xIdx][yIdx]) )
+
+		plotterInstance._scratchSpace["split_axis_sub_out_dicts"] = subOutDicts
 
 
 
@@ -3,6 +3,7 @@ import copy
 
 from . import shared
 
+from ...core import instrumentation as instrumentHelp
 from ...core import plotters as plotterCoreHelp
 from ...core import plot_options as plotOptCoreHelp
 from ...core import plot_command as plotCmdCoreHelp
@@ -27,8 +28,49 @@ class SplitAxisPlotterCreator(shared.FromJsonMixin, shared.FromPlotterMixin, plo
 		self.setOptionVals(kwargs)
 
 	def createPlot(self, axHandle=None, **kwargs):
-		plotter = self.createPlotter(**kwargs)
-		return plotter.createPlot(axHandle)
+		creatorFactory = self._createPlotterFactory(**kwargs)
+		outDict = creatorFactory._scratchSpace["outPlotter"].createPlot(axHandle)
+		outDict["plotterCreator"] = creatorFactory
+		return outDict
+
+	def _createPlotForBatch(self, figHandle, kwargs, prevKwargs=None, prevOutDict=None):
+		#Figure size comes from the template plotter, so we let the output plotter create its own figure each time
+		return plotterCoreHelp.PlotterInter._createPlotForBatch(self, figHandle, kwargs, prevKwargs=prevKwargs, prevOutDict=prevOutDict)
+
+	def updatePlot(self, outDict, **kwargs):
+		""" Updates a plot made by createPlot to use new option values. The SplitAxisPlotter is re-created from the new options and the whole plot is redrawn on a new axis in place of the original one
+		
+		Args:
+			outDict (dict): The output of self.createPlot (or of a previous updatePlot call)
+			kwargs: Names are those in self.opts, values are the new values. These are applied on top of the options used to create the plot
+
+		Returns
+			outDict (dict): The same dict that was passed in; now containing the output of the new SplitAxisPlotter
+	 
+		Raises:
+			ValueError: If outDict doesnt contain the creator used to make it (i.e. it wasnt made by SplitAxisPlotterCreator.createPlot)
+
+		"""
+		creatorFactory = outDict.get("plotterCreator", None)
+		if creatorFactory is None:
+			raise ValueError("outDict has no \"plotterCreator\" key; updatePlot needs the plotter creator used to create the plot")
+
+		#Every option can change the axis grid; so we always create a new SplitAxisPlotter
+		creatorFactory.setOptionVals(kwargs)
+		creatorFactory._scratchSpace = copy.deepcopy(self._scratchSpace)
+		creatorFactory._scratchSpace["outDict"] = dict()
+		instrumentHelp.executeCommands(creatorFactory.commands, creatorFactory)
+
+		#Remove everything the old plotter drew, then draw the new one on a new axis in the same place
+		oldPlotter = outDict["plotter"]
+		splitAxisPlotterHelp._removeSubAxesAndSplitLines(oldPlotter)
+		axHandle = plotterCoreHelp._replaceAxis(oldPlotter._scratchSpace["original_axis"], axLayout=oldPlotter._scratchSpace.get("axHandleLayout", None))
+
+		newOutDict = creatorFactory._scratchSpace["outPlotter"].createPlot(axHandle)
+		outDict.clear()
+		outDict.update(newOutDict)
+		outDict["plotterCreator"] = creatorFactory
+		return outDict
 
 	def createPlotter(self, **kwargs):
 		""" Creates a SplitAxisPlotter based on current options
@@ -40,13 +82,15 @@ class SplitAxisPlotterCreator(shared.FromJsonMixin, shared.FromPlotterMixin, plo
 			plotter (SplitAxisPlotter):
 		
 		"""
-		useFactory = self.createFactory(**kwargs)
+		return self._createPlotterFactory(**kwargs)._scratchSpace["outPlotter"]
+
+	def _createPlotterFactory(self, **kwargs):
+		useFactory = self.createCopyOnWriteFactory(**kwargs)
 		useFactory._scratchSpace["outDict"] = dict()
 
-		for command in self.commands:
-			command.execute(useFactory)
+		instrumentHelp.executeCommands(self.commands, useFactory)
 
-		return useFactory._scratchSpace["outPlotter"]
+		return useFactory
 
 
 	def _createCommands(self):
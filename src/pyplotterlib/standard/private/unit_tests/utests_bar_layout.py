@@ -0,0 +1,91 @@
+
+import unittest
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.bar_plotter as tCode
+import pyplotterlib.standard.private.shared as sharedHelp
+
+
+class TestGetIndividAndGroupCentres(unittest.TestCase):
+
+	def setUp(self):
+		self.nGroups, self.nSeries = 3, 2
+		self.widthBar, self.widthIntra, self.widthInter = 1, 0.5, 2
+		self.startPos = 0
+		self.skipSeries = None
+
+	def _runTestFunct(self):
+		args = [self.nGroups, self.nSeries, self.widthBar, self.widthIntra, self.widthInter]
+		return sharedHelp._getIndividAndGroupCentresBarLikePlot(*args, startPos=self.startPos, skipSeries=self.skipSeries)
+
+	def testExpectedCentres(self):
+		expCentres = [ [0,5,10], [1.5,6.5,11.5] ]
+		expGroupCentres = [0.75, 5.75, 10.75]
+		actCentres, actGroupCentres = self._runTestFunct()
+		self.assertTrue( np.allclose(expCentres, actCentres) )
+		self.assertTrue( np.allclose(expGroupCentres, actGroupCentres) )
+
+	def testExpectedCentres_stackedAndStartPos(self):
+		self.startPos, self.skipSeries = 1, [True, False]
+		expCentres = [ [1,5.5,10], [1,5.5,10] ]
+		actCentres = self._runTestFunct()[0]
+		self.assertTrue( np.allclose(expCentres, actCentres) )
+
+
+class TestGetBarLikeDataAsMaskedArray(unittest.TestCase):
+
+	def testNoneAndMissingValuesMasked(self):
+		plotData = [ [1,None,3], np.array([4,5]) ]
+		expVals, expMask = [ [1,0,3], [4,5,0] ], [ [False,True,False], [False,False,True] ]
+		actArray = sharedHelp._getBarLikeDataAsMaskedArray(plotData)
+		self.assertTrue( np.array_equal(expMask, np.ma.getmaskarray(actArray)) )
+		self.assertTrue( np.allclose(expVals, actArray.filled(0)) )
+
+
+class TestGetBarBottomVals(unittest.TestCase):
+
+	def setUp(self):
+		self.plotData = [ [1,2,3], [4,5,6], [7,8,9] ]
+		self.skipVals = [True, False]
+		self.reverseIntraOrdering = False
+
+	def _runTestFunct(self):
+		return tCode._getBarBottomVals(self.plotData, self.skipVals, reverseIntraOrdering=self.reverseIntraOrdering)
+
+	def testStackedSeries(self):
+		expVals = [ [0,0,0], [1,2,3], [0,0,0] ]
+		actVals = self._runTestFunct()
+		self.assertTrue( np.allclose(expVals, actVals) )
+
+	def testStackedSeries_reversed(self):
+		self.reverseIntraOrdering = True
+		expVals = [ [0,0,0], [7,8,9], [0,0,0] ]
+		actVals = self._runTestFunct()
+		self.assertTrue( np.allclose(expVals, actVals) )
+
+	def testStackedOnMissingValues(self):
+		self.plotData = [ [1,None], [4,5,6], [7,8,9] ]
+		self.skipVals = [True, True]
+		expVals = [ [0,0,0], [1,0,0], [5,5,6] ]
+		actVals = self._runTestFunct()
+		self.assertTrue( np.allclose(expVals, actVals) )
+
+
+class TestBarPlotterMissingValues(unittest.TestCase):
+
+	def testNoneValuesNotDrawn(self):
+		plotData = [ [1,None,3], [4,5] ]
+		plotter = ptrs.BarPlotter(plotData1D=plotData)
+		outDict = plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111))
+		barHandles = outDict["plotter"]._scratchSpace["barHandles"]
+		expHeights = [ [1,3], [4,5] ]
+		actHeights = [ [bar.get_height() for bar in handle] for handle in barHandles]
+		self.assertEqual(expHeights, actHeights)
+
+
+if __name__ == '__main__':
+	unittest.main()
+
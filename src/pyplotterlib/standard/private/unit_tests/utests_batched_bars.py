@@ -0,0 +1,112 @@
+
+import unittest
+
+import matplotlib.collections
+import matplotlib.colors
+import matplotlib.figure
+import matplotlib.patches
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.batched_bars as tCode
+
+
+class TestBarPlotterDrawAsCollection(unittest.TestCase):
+
+	def setUp(self):
+		self.plotData = [ [1,2,3], [4,5,6] ]
+		self.plotter = ptrs.BarPlotter(plotData1D=self.plotData, barDrawAsCollection=True)
+
+	def _createPlot(self, **kwargs):
+		figHandle = matplotlib.figure.Figure()
+		outDict = self.plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+		return outDict["plotter"]._scratchSpace
+
+	def testOneArtistPerSeries(self):
+		scratchSpace = self._createPlot()
+		axHandle = scratchSpace["axHandle"]
+		self.assertEqual(0, len(axHandle.patches))
+		self.assertEqual(2, len(axHandle.collections))
+
+	def testColorsAndOpacitiesApplied(self):
+		scratchSpace = self._createPlot(barColors=["red","blue"], barOpacities=[0.5])
+		expColors = [ matplotlib.colors.to_rgba("red", 0.5), matplotlib.colors.to_rgba("blue", 0.5) ]
+		actColors = [ tuple(handle.artist.get_facecolor()[0]) for handle in scratchSpace["barHandles"] ]
+		self.assertTrue( np.allclose(expColors, actColors) )
+
+	def testStackedBarsMatchPatchMode(self):
+		kwargs = {"stackBars":True, "plotHorizontally":True}
+		expBounds = [ [patch.get_bbox().bounds for patch in handle.patches]
+		              for handle in self._createPlot(barDrawAsCollection=False, **kwargs)["barHandles"] ]
+		actBounds = [ [patch.get_bbox().bounds for patch in handle.patches]
+		              for handle in self._createPlot(**kwargs)["barHandles"] ]
+		self.assertTrue( np.allclose(expBounds, actBounds) )
+
+	def testDataLabelsUsedInLegend(self):
+		scratchSpace = self._createPlot(dataLabels=["a","b"], showLegend=True)
+		expLabels = ["a", "b"]
+		actLabels = [x.get_text() for x in scratchSpace["axHandle"].get_legend().get_texts()]
+		self.assertEqual(expLabels, actLabels)
+
+	def testBarLabelsAdded(self):
+		scratchSpace = self._createPlot(addBarLabelsByDefault=True)
+		expLabels = ["1.00", "2.00", "3.00", "4.00", "5.00", "6.00"]
+		actLabels = [x.get_text() for x in scratchSpace["axHandle"].texts]
+		self.assertEqual(expLabels, actLabels)
+
+
+class TestDrawAsCollectionDefaultColors(unittest.TestCase):
+
+	def setUp(self):
+		self.cycleColors = ["red", "green", "blue"]
+		self.rcParams = {"axes.prop_cycle":matplotlib.cycler(color=self.cycleColors)}
+
+	#Same as LinePlotter in collection mode; series idx gets color idx from the matplotlib color cycle
+	def _getArtistColors(self, plotter, **kwargs):
+		with matplotlib.rc_context(self.rcParams):
+			outDict = plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111), barDrawAsCollection=True, **kwargs)
+		return [ matplotlib.colors.to_rgba_array(handle.artist.get_facecolor())[0][:3] for handle in outDict["plotter"]._scratchSpace["barHandles"] ]
+
+	def _getExpColors(self, nSeries):
+		return [ matplotlib.colors.to_rgb(self.cycleColors[idx % len(self.cycleColors)]) for idx in range(nSeries) ]
+
+	def testBarPlotter(self):
+		actColors = self._getArtistColors( ptrs.BarPlotter(plotData1D=[[1,2] for idx in range(4)]) )
+		self.assertTrue( np.allclose(self._getExpColors(4), actColors) )
+
+	def testHistogramPlotter(self):
+		plotData = [ np.array([3,5,2]), np.array([0,1,2,3]) ]
+		for fractSpace in [0, 0.2]:
+			actColors = self._getArtistColors( ptrs.HistogramPlotter(plotDataHisto=[plotData, plotData]), interBarFractSpace=fractSpace )
+			self.assertTrue( np.allclose(self._getExpColors(2), actColors) )
+
+	def testDrawFunctsUseFirstColorByDefault(self):
+		expColor = matplotlib.colors.to_rgb(self.cycleColors[0])
+		with matplotlib.rc_context(self.rcParams):
+			axHandle = matplotlib.figure.Figure().add_subplot(111)
+			allBars = [ tCode.drawBarsAsCollection(axHandle, [1,2], [3,4], 0.5, 0), tCode.drawContiguousBarsAsStairs(axHandle, [0,1,2], [3,4]) ]
+		for bars in allBars:
+			self.assertTrue( np.allclose(expColor, matplotlib.colors.to_rgba_array(bars.artist.get_facecolor())[0][:3]) )
+
+
+class TestHistogramPlotterDrawAsCollection(unittest.TestCase):
+
+	def setUp(self):
+		self.plotData = [ [np.array([3,5,2]), np.array([0,1,2,3])] ]
+		self.plotter = ptrs.HistogramPlotter(plotDataHisto=self.plotData, barDrawAsCollection=True)
+
+	def _getBarArtist(self, **kwargs):
+		figHandle = matplotlib.figure.Figure()
+		outDict = self.plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+		return outDict["plotter"]._scratchSpace["barHandles"][0].artist
+
+	def testStepPatchUsedWithoutSpacing(self):
+		self.assertIsInstance(self._getBarArtist(), matplotlib.patches.StepPatch)
+
+	def testCollectionUsedWithSpacing(self):
+		self.assertIsInstance(self._getBarArtist(interBarFractSpace=0.2), matplotlib.collections.PolyCollection)
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,88 @@
+
+import unittest
+
+import matplotlib.collections
+import matplotlib.figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.batched_lines as tCode
+
+
+class TestCreateStyleLines(unittest.TestCase):
+
+	def setUp(self):
+		self.allXData = [np.arange(5), np.arange(6), np.arange(7)]
+		self.allYData = [np.arange(5)*2, np.arange(6)*3, np.arange(7)*4]
+
+	def testExpectedDataAndColors(self):
+		expColors = ["r", "g", "b"]
+		actLines = tCode.createStyleLines(self.allXData, self.allYData, colors=expColors)
+		self.assertEqual(expColors, [line.get_color() for line in actLines])
+		for expX, expY, actLine in zip(self.allXData, self.allYData, actLines):
+			self.assertTrue( np.array_equal(expX, actLine.get_xdata()) )
+			self.assertTrue( np.array_equal(expY, actLine.get_ydata()) )
+
+	def testLinesNotAttachedToAxis(self):
+		actLines = tCode.createStyleLines(self.allXData, self.allYData)
+		self.assertTrue( all([line.axes is None for line in actLines]) )
+
+
+class TestLinePlotterDrawAsCollection(unittest.TestCase):
+
+	def setUp(self):
+		rng = np.random.default_rng(0)
+		self.plotData = [np.array([np.arange(50), rng.normal(0, 1, 50).cumsum()]).T for x in range(20)]
+		self.plotter = ptrs.LinePlotter(plotData=self.plotData)
+
+	def _createPlot(self, **kwargs):
+		figHandle = matplotlib.figure.Figure(figsize=(6,4), dpi=100)
+		FigureCanvasAgg(figHandle)
+		outDict = self.plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+		return figHandle, outDict
+
+	def _getRenderedPixels(self, **kwargs):
+		figHandle, unused = self._createPlot(**kwargs)
+		figHandle.canvas.draw()
+		return np.asarray(figHandle.canvas.buffer_rgba()).astype("int32")
+
+	def _checkPixelsMatchDefaultMode(self, **kwargs):
+		expPixels = self._getRenderedPixels(**kwargs)
+		actPixels = self._getRenderedPixels(lineDrawAsCollection=True, **kwargs)
+		self.assertTrue( np.array_equal(expPixels, actPixels) )
+
+	def testSingleArtistUsed(self):
+		figHandle, outDict = self._createPlot(lineDrawAsCollection=True)
+		axHandle = outDict["plotter"]._scratchSpace["axHandle"]
+		self.assertEqual(0, len(axHandle.get_lines()))
+		self.assertEqual(1, len(axHandle.collections))
+		self.assertIsInstance(axHandle.collections[0], matplotlib.collections.LineCollection)
+
+	def testPixelsMatchDefaultMode(self):
+		self._checkPixelsMatchDefaultMode()
+
+	def testPixelsMatchDefaultMode_lineStyleOptions(self):
+		kwargs = {"lineColors":["r","g","b"], "lineThickness":[1,3], "lineAlpha":0.5, "lineStyles":["--",":"]}
+		self._checkPixelsMatchDefaultMode(**kwargs)
+
+	def testPixelsMatchDefaultMode_legend(self):
+		self._checkPixelsMatchDefaultMode(dataLabels=["a","b"], showLegend=True)
+
+	def testPixelsMatchDefaultMode_errorBars(self):
+		errorBarDataY = [np.ones(50)*0.5] + [None for x in range(19)]
+		self._checkPixelsMatchDefaultMode(errorBarDataY=errorBarDataY)
+
+	def testUpdatePlotChangesColorsInPlace(self):
+		figHandle, outDict = self._createPlot(lineDrawAsCollection=True)
+		lineCollection = outDict["plotter"]._scratchSpace["plotLineCollection"]["value"]
+		self.plotter.updatePlot(outDict, lineColors=["r"])
+		figHandle.canvas.draw()
+		axHandle = outDict["plotter"]._scratchSpace["axHandle"]
+		self.assertEqual([lineCollection], list(axHandle.collections))
+		self.assertTrue( np.allclose([1,0,0,1], lineCollection.get_colors()[5]) )
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,166 @@
+
+import os
+import tempfile
+import unittest
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.block_downsample as tCode
+
+
+class TestGetBlockDownsampledArray(unittest.TestCase):
+
+	def setUp(self):
+		self.data = np.arange(20, dtype=float).reshape(4,5)
+		self.blockShape = (2,2)
+		self.method = "mean"
+		self.chunkSize = 1
+
+	def _runTestFunct(self, **kwargs):
+		return tCode.getBlockDownsampledArray(self.data, self.blockShape, self.method, chunkSize=self.chunkSize, **kwargs)
+
+	def testMeanWithPartialBlocks(self):
+		expVals = [ [3,5,6.5], [13,15,16.5] ]
+		actVals = self._runTestFunct()
+		self.assertTrue( np.allclose(expVals, actVals) )
+
+	def testNanAwareMax(self):
+		self.data[0:2,0:2] = np.nan
+		self.data[3,4] = np.nan
+		self.method = "nanmax"
+		expVals = [ [np.nan,8,9], [16,18,14] ]
+		actVals = self._runTestFunct()
+		self.assertTrue( np.allclose(expVals, actVals, equal_nan=True) )
+
+	def testProcessChunkFunctGetsRowOffsets(self):
+		self.method = "max"
+		def _setFirstColToNan(chunk, rowOffset):
+			chunk[:,0] = np.nan if rowOffset==0 else -1
+		expVals = [ [np.nan,8,9], [16,18,19] ]
+		actVals = self._runTestFunct(processChunkFunct=_setFirstColToNan)
+		self.assertTrue( np.allclose(expVals, actVals, equal_nan=True) )
+
+	def testIntegerRGBKeepsDtype(self):
+		self.data = np.array([ [[0,10,255],[2,20,255]] ], dtype=np.uint8)
+		self.blockShape = (1,2)
+		expVals = np.array([ [[1,15,255]] ], dtype=np.uint8)
+		actVals = self._runTestFunct()
+		self.assertEqual(expVals.dtype, actVals.dtype)
+		self.assertTrue( np.array_equal(expVals, actVals) )
+
+	def testMeanOfSmallIntegersUsesFloat32(self):
+		self.data = self.data.astype(np.uint16)
+		expVals = [ [3,5,6.5], [13,15,16.5] ]
+		actVals = self._runTestFunct()
+		self.assertEqual(np.float32, actVals.dtype)
+		self.assertTrue( np.allclose(expVals, actVals) )
+
+	def testRaisesForUnknownMethod(self):
+		self.method = "median"
+		with self.assertRaises(ValueError):
+			self._runTestFunct()
+
+
+class TestBlockDownsampledPlots(unittest.TestCase):
+
+	def setUp(self):
+		self.data = np.arange(60*50, dtype=float).reshape(60,50)
+		self.kwargs = {"blockDownsampling":"mean", "blockDownsamplingNumbPixels":[10,10]}
+
+	def _createPlot(self, plotter):
+		figHandle = matplotlib.figure.Figure()
+		outDict = plotter.createPlot(axHandle=figHandle.add_subplot(111))
+		return outDict["plotter"]._scratchSpace
+
+	def testImageLimitsMatchFullData(self):
+		scratchSpace = self._createPlot( ptrs.ImagePlotter(plotDataImage=self.data, **self.kwargs) )
+		axHandle = scratchSpace["axHandle"]
+		self.assertEqual( (10,10), scratchSpace["imageHandle"].get_array().shape )
+		self.assertTrue( np.allclose([-0.5,49.5], axHandle.get_xlim()) )
+		self.assertTrue( np.allclose([59.5,-0.5], axHandle.get_ylim()) )
+
+	def testDiscHeatGroupLabelsMatchTickIndices(self):
+		groupLabels = ["label_{}".format(idx) for idx in range(50)]
+		plotter = ptrs.DiscreteHeatMapPlotter(plotData=self.data[:50], groupLabels=groupLabels, **self.kwargs)
+		axHandle = self._createPlot(plotter)["axHandle"]
+		expLabels = ["label_{}".format(int(x)) for x in axHandle.get_xticks()]
+		actLabels = [x.get_text() for x in axHandle.get_xticklabels()]
+		self.assertTrue( len(actLabels) < 50 )
+		self.assertEqual(expLabels, actLabels)
+
+	def testDiscHeatTriangleRemovedBeforeAggregating(self):
+		self.kwargs["blockDownsampling"] = "nanmax"
+		plotter = ptrs.DiscreteHeatMapPlotter(plotData=self.data[:50], plotLowerTri=False, **self.kwargs)
+		actVals = self._createPlot(plotter)["usePlotData"]
+		expVals = [ [self.data[5*rIdx:5*(rIdx+1), 5*cIdx:5*(cIdx+1)].max() if rIdx<=cIdx else np.nan for cIdx in range(10)] for rIdx in range(10) ]
+		self.assertTrue( np.allclose(expVals, actVals, equal_nan=True) )
+
+
+class TestImagePlotterFileBackedData(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.filePath = os.path.join(self.tempDir.name, "image.npy")
+		self.data = np.arange(40*30, dtype=float).reshape(40,30)
+		np.save(self.filePath, self.data)
+		self.plotter = ptrs.ImagePlotter(plotDataImage=ptrs.LazyArrayRef.fromNpyFile(self.filePath))
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+
+	def _getImageHandle(self, **kwargs):
+		outDict = self.plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111), **kwargs)
+		return outDict["plotter"]._scratchSpace["imageHandle"]
+
+	def testOnlyRegionInLimitsDrawn(self):
+		imageHandle = self._getImageHandle(xLimit=[4.6,10.2], yLimit=[20,12])
+		self.assertTrue( np.array_equal(self.data[12:21,5:11], imageHandle.get_array()) )
+		self.assertTrue( np.allclose([4.5,10.5,20.5,11.5], imageHandle.get_extent()) )
+
+	def testFullImageDrawnWithoutLimits(self):
+		imageHandle = self._getImageHandle()
+		self.assertTrue( np.array_equal(self.data, imageHandle.get_array()) )
+
+
+class TestPlotDataDtypes(unittest.TestCase):
+
+	def setUp(self):
+		self.data = np.arange(12*10, dtype=np.uint8).reshape(12,10)
+		self.plotter = ptrs.ImagePlotter(plotDataImage=self.data)
+
+	def _getDrawnArray(self, plotter, **kwargs):
+		outDict = plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111), **kwargs)
+		return outDict["plotter"]._scratchSpace["imageHandle"].get_array()
+
+	def testDtypeKeptThroughJSON(self):
+		plotter = ptrs.ImagePlotter.fromJSON( self.plotter.toJSON() )
+		self.assertEqual(np.uint8, plotter.opts.plotDataImage.value.dtype)
+		self.assertEqual(np.uint8, self._getDrawnArray(plotter).dtype)
+
+	def testIntegerDataNotDowncast(self):
+		actVals = self._getDrawnArray(self.plotter, plotDataDowncastFloat32=True)
+		self.assertEqual(np.uint8, actVals.dtype)
+
+	def testFloatImageDowncast(self):
+		self.plotter.opts.plotDataImage.value = self.data.astype(float)
+		actVals = self._getDrawnArray(self.plotter, plotDataDowncastFloat32=True)
+		self.assertEqual(np.float32, actVals.dtype)
+		self.assertTrue( np.array_equal(self.data, actVals) )
+		self.assertEqual(np.float64, self.plotter.opts.plotDataImage.value.dtype)
+
+	def testDownsampledFloatImageDowncast(self):
+		self.plotter.opts.plotDataImage.value = self.data.astype(float)
+		kwargs = {"plotDataDowncastFloat32":True, "blockDownsampling":"mean", "blockDownsamplingNumbPixels":[6,5]}
+		self.assertEqual(np.float32, self._getDrawnArray(self.plotter, **kwargs).dtype)
+
+	def testDiscHeatDowncast(self):
+		plotter = ptrs.DiscreteHeatMapPlotter(plotData=self.data.astype(float), plotDataDowncastFloat32=True, plotUpperTri=False)
+		outDict = plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111))
+		self.assertEqual(np.float32, outDict["plotter"]._scratchSpace["usePlotData"].dtype)
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,111 @@
+
+import unittest
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.density_raster as tCode
+
+
+class TestGetDensityGrid(unittest.TestCase):
+
+	def setUp(self):
+		self.allXData = [np.array([0,10])]
+		self.allYData = [np.array([0,10])]
+		self.method = "lines"
+		self.shape = (10,10)
+		self.xRange, self.yRange = None, None
+		self.chunkSize = 100
+
+	def _runTestFunct(self):
+		args = [self.allXData, self.allYData, self.method, self.shape]
+		kwargs = {"xRange":self.xRange, "yRange":self.yRange, "chunkSize":self.chunkSize}
+		return tCode.getDensityGrid(*args, **kwargs)
+
+	def testDiagonalLine(self):
+		expGrid = np.eye(10)
+		actGrid, actXRange, actYRange = self._runTestFunct()
+		self.assertTrue( np.array_equal(expGrid, actGrid) )
+		self.assertEqual([(0,10),(0,10)], [actXRange, actYRange])
+
+	def testDiagonalLineClippedToRange(self):
+		self.allXData, self.allYData = [np.array([-5,15])], [np.array([-5,15])]
+		self.xRange, self.yRange = [0,10], [0,10]
+		expGrid = np.eye(10)
+		actGrid = self._runTestFunct()[0]
+		self.assertTrue( np.array_equal(expGrid, actGrid) )
+
+	def testHorizontalLineCountsEachCellOnce(self):
+		self.allXData, self.allYData = [np.linspace(0,10,3)], [np.ones(3)*0.5]
+		self.yRange = [0,10]
+		actGrid = self._runTestFunct()[0]
+		self.assertTrue( np.array_equal(np.ones(10), actGrid[0]) )
+		self.assertEqual(10, actGrid.sum())
+
+	def testNonFiniteValuesLeaveGap(self):
+		self.allXData, self.allYData = [np.array([0,5,5,10])], [np.array([0,5,np.nan,10])]
+		actGrid = self._runTestFunct()[0]
+		self.assertEqual(5, actGrid.sum())
+
+	def testPointsCounted(self):
+		self.method = "points"
+		self.allXData = [np.array([0.5,0.5,9.5]), np.array([0.5])]
+		self.allYData = [np.array([0.5,0.5,9.5]), np.array([9.5])]
+		self.xRange, self.yRange = [0,10], [0,10]
+		actGrid = self._runTestFunct()[0]
+		self.assertEqual([2,1,1], [actGrid[0,0], actGrid[9,0], actGrid[9,9]])
+		self.assertEqual(4, actGrid.sum())
+
+	def testChunkSizeDoesntChangeResult(self):
+		rng = np.random.default_rng(0)
+		self.allXData, self.allYData = [rng.normal(size=1000)], [rng.normal(size=1000)]
+		for method in tCode.DENSITY_RASTER_METHODS:
+			self.method = method
+			self.chunkSize = 10
+			expGrid = self._runTestFunct()[0]
+			self.chunkSize = 10000
+			actGrid = self._runTestFunct()[0]
+			self.assertTrue( np.array_equal(expGrid, actGrid) )
+
+	def testRaisesForInvalidMethod(self):
+		self.method = "fake_method"
+		with self.assertRaises(ValueError):
+			self._runTestFunct()
+
+
+class TestLinePlotterDensityRaster(unittest.TestCase):
+
+	def setUp(self):
+		xVals = np.linspace(0, 10, 1000)
+		self.plotData = [np.array([xVals, np.sin(xVals+idx)]).T for idx in range(5)]
+		self.plotter = ptrs.LinePlotter(plotData=self.plotData, lineDensityRaster="lines")
+
+	def _createPlot(self, **kwargs):
+		figHandle = matplotlib.figure.Figure(figsize=(4,3), dpi=100)
+		outDict = self.plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+		return outDict["plotter"]._scratchSpace
+
+	def testImageDrawnInsteadOfLines(self):
+		scratchSpace = self._createPlot()
+		axHandle = scratchSpace["axHandle"]
+		self.assertEqual(0, len(axHandle.get_lines()))
+		self.assertEqual([scratchSpace["imageHandle"]], list(axHandle.get_images()))
+
+	def testColormapOptionsUsed(self):
+		scratchSpace = self._createPlot(colorMapStr="magma", colorMapMaxVal=2, colorBarShow=True)
+		imageHandle = scratchSpace["imageHandle"]
+		self.assertEqual("magma", imageHandle.get_cmap().name)
+		self.assertEqual(2, imageHandle.get_clim()[1])
+		self.assertIs(imageHandle, scratchSpace["cbar"].mappable)
+
+	def testGridCoversAxisLimits(self):
+		expExtent = [2, 4, -0.5, 0.5]
+		scratchSpace = self._createPlot(xLimit=[2,4], yLimit=[-0.5,0.5])
+		actExtent = scratchSpace["imageHandle"].get_extent()
+		self.assertTrue( np.allclose(expExtent, actExtent) )
+
+
+if __name__ == '__main__':
+	unittest.main()
+
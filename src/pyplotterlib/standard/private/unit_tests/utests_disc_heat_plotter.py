@@ -0,0 +1,85 @@
+
+import unittest
+
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.disc_heat_plotter as tCode
+
+
+class TestGetAnnotationColorArray(unittest.TestCase):
+
+	def setUp(self):
+		self.data = np.array([ [0,1,2], [3,np.nan,4] ])
+		self.textColors = ["a","b","c"]
+		self.minVal, self.maxVal = None, None
+
+	def _runTestFunct(self):
+		kwargs = {"annotateValsTextColor":self.textColors, "colorMapMinVal":self.minVal, "colorMapMaxVal":self.maxVal}
+		plotter = ptrs.DiscreteHeatMapPlotter(plotData=self.data, **kwargs)
+		return tCode.AddDataAnnotations()._getColorArray(plotter, self.data)
+
+	def testExpectedColors(self):
+		expColors = [ ["a","a","b"], ["c","c","c"] ]
+		actColors = self._runTestFunct().tolist()
+		self.assertEqual(expColors, actColors)
+
+	def testValuesOutsideColormapRange(self):
+		self.minVal, self.maxVal = 1, 3
+		expColors = [ ["a","a","b"], ["c","c","c"] ]
+		actColors = self._runTestFunct().tolist()
+		self.assertEqual(expColors, actColors)
+
+	def testTupleColorsKeptWhole(self):
+		self.textColors = [(1,0,0), (0,0,1)]
+		expColors = [ [(1,0,0),(1,0,0),(1,0,0)], [(0,0,1),(0,0,1),(0,0,1)] ]
+		actColors = self._runTestFunct().tolist()
+		self.assertEqual(expColors, actColors)
+
+
+class TestRemoveUnwantedPlotData(unittest.TestCase):
+
+	def setUp(self):
+		self.data = np.ones((3,4))
+		self.lowerTri, self.diag, self.upperTri = True, True, True
+
+	def _runTestFunct(self):
+		kwargs = {"plotLowerTri":self.lowerTri, "plotDiag":self.diag, "plotUpperTri":self.upperTri}
+		plotter = ptrs.DiscreteHeatMapPlotter(plotData=self.data, **kwargs)
+		plotter._scratchSpace["usePlotData"] = self.data
+		tCode.RemoveUnwantedPlotData().execute(plotter)
+		return np.ma.getmaskarray(plotter._scratchSpace["usePlotData"])
+
+	def testLowerTriAndDiagRemoved(self):
+		self.lowerTri, self.diag = False, False
+		expMask = [ [True ,False,False,False],
+		            [True ,True ,False,False],
+		            [True ,True ,True ,False] ]
+		self.assertTrue( np.array_equal(expMask, self._runTestFunct()) )
+
+	def testUpperTriRemoved(self):
+		self.upperTri = False
+		expMask = [ [False,True ,True ,True ],
+		            [False,False,True ,True ],
+		            [False,False,False,True ] ]
+		self.assertTrue( np.array_equal(expMask, self._runTestFunct()) )
+
+	def testInputDataNotModified(self):
+		self.lowerTri, self.diag, self.upperTri = False, False, False
+		self.assertTrue( self._runTestFunct().all() )
+		self.assertTrue( np.array_equal(np.ones((3,4)), self.data) )
+
+	def testSetUnwantedValsToNanWithRowOffset(self):
+		self.lowerTri = False
+		kwargs = {"plotLowerTri":self.lowerTri, "plotDiag":self.diag, "plotUpperTri":self.upperTri}
+		plotter = ptrs.DiscreteHeatMapPlotter(plotData=self.data, **kwargs)
+		tCode.RemoveUnwantedPlotData().setUnwantedValsToNan(plotter, self.data[1:], rowOffset=1)
+		expMask = [ [False,False,False,False],
+		            [True ,False,False,False],
+		            [True ,True ,False,False] ]
+		self.assertTrue( np.array_equal(expMask, np.isnan(self.data)) )
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -1,6 +1,8 @@
 
 
 import copy
+import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -63,5 +65,83 @@ class TestPlotDatOption(unittest.TestCase):
 		self.assertEqual(objA, objB)
 
 
+class TestGetHistoDataFromChunks(unittest.TestCase):
 
+	def setUp(self):
+		rng = np.random.default_rng(0)
+		self.chunks = [rng.normal(size=1000), rng.normal(2, 1, size=(50,20)), np.array([np.nan, -np.inf, 1.5])]
+		self.allVals = np.concatenate([x.ravel() for x in self.chunks])
+		self.allVals = self.allVals[np.isfinite(self.allVals)]
+		self.bins = 10
+		self.kwargs = dict()
+
+	def _runTestFunct(self):
+		return tCode.getHistoDataFromChunks(self.chunks, bins=self.bins, **self.kwargs)
+
+	def _checkMatchesNumpy(self, actData, **kwargs):
+		expCounts, expEdges = np.histogram(self.allVals, bins=self.bins, **kwargs)
+		self.assertTrue( np.array_equal(expCounts, actData[0]) )
+		self.assertTrue( np.allclose(expEdges, actData[1]) )
+
+	def testMatchesNumpyForFixedEdges(self):
+		self.bins = np.array([-2, -1, 0.5, 3, 4])
+		self._checkMatchesNumpy( self._runTestFunct() )
+
+	def testMatchesNumpyForBinRange(self):
+		self.kwargs["binRange"] = (-1,2)
+		self._checkMatchesNumpy( self._runTestFunct(), range=(-1,2) )
+
+	def testMatchesNumpyWithRangePass(self):
+		self.kwargs["rangePass"] = True
+		self._checkMatchesNumpy( self._runTestFunct() )
+
+	def testAutoRangeCountsEveryValue(self):
+		self.chunks = iter(self.chunks)
+		actCounts, actEdges = self._runTestFunct()
+		self.assertEqual( len(self.allVals), actCounts.sum() )
+		self.assertTrue( actCounts[0] > 0 and actCounts[-1] > 0 )
+		self.assertTrue( (actEdges[0] <= self.allVals.min()) and (actEdges[-1] >= self.allVals.max()) )
+		self.assertTrue( np.array_equal(np.histogram(self.allVals, bins=actEdges)[0], actCounts) )
+
+	def testReadsNpyFiles(self):
+		self.kwargs["binRange"] = (-3,3)
+		with tempfile.TemporaryDirectory() as tempDir:
+			for idx, chunk in enumerate(self.chunks):
+				np.save(os.path.join(tempDir, "chunk_{}.npy".format(idx)), chunk)
+			self.chunks = [os.path.join(tempDir, "chunk_{}.npy".format(idx)) for idx in range(len(self.chunks))]
+			actData = self._runTestFunct()
+		self._checkMatchesNumpy(actData, range=(-3,3))
+
+	def testWorkersGiveSameResult(self):
+		self.kwargs.update({"rangePass":True, "nWorkers":2})
+		self._checkMatchesNumpy( self._runTestFunct() )
+
+	def testWorkersRaiseIfEdgesUnknown(self):
+		self.kwargs["nWorkers"] = 2
+		with self.assertRaises(ValueError):
+			self._runTestFunct()
+
+
+
+class TestGetBarCentresAndWidthsFromEdges(unittest.TestCase):
 
+	def setUp(self):
+		self.edges = [1, 2, 4, 4.5]
+		self.fractSpace = 0.0
+
+	def _runTestFunct(self):
+		return tCode._getBarCentresAndWidthsFromEdges(self.edges, fractSpace=self.fractSpace)
+
+	def testExpectedVals(self):
+		self.fractSpace = 0.2
+		expCentres, expWidths = [1.5, 3, 4.25], [0.8, 1.6, 0.4]
+		actCentres, actWidths = self._runTestFunct()
+		self.assertTrue( np.allclose(expCentres, actCentres) )
+		self.assertTrue( np.allclose(expWidths, actWidths) )
+
+	def testExpectedVals_descendingEdges(self):
+		self.edges = [4.5, 4, 2, 1]
+		expCentres, expWidths = [4.25, 3, 1.5], [0.5, 2, 1]
+		actCentres, actWidths = self._runTestFunct()
+		self.assertTrue( np.allclose(expCentres, actCentres) )
+		self.assertTrue( np.allclose(expWidths, actWidths) )
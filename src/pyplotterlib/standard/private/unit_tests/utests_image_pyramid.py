@@ -0,0 +1,80 @@
+
+import os
+import tempfile
+import unittest
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.block_downsample as blockDownsampleHelp
+import pyplotterlib.standard.private.image_pyramid as tCode
+
+
+class TestImagePyramid(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.data = np.random.default_rng(0).normal(size=(70,45))
+		self.method, self.tileSize = "max", 8
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+
+	def _getPyramid(self):
+		return tCode.getImagePyramid(self.tempDir.name, self.data, method=self.method, tileSize=self.tileSize)
+
+	def testLevelsMatchBlockDownsampling(self):
+		pyramid = self._getPyramid()
+		self.assertEqual(5, pyramid.nLevels)
+		for level, levelShape in enumerate(pyramid.levelShapes):
+			expVals = blockDownsampleHelp.getBlockDownsampledArray(self.data, (2**level,2**level), self.method)
+			actVals = pyramid.readRegion(level, (0,levelShape[0]), (0,levelShape[1]))
+			self.assertTrue( np.array_equal(expVals, actVals) )
+
+	def testReadRegionAcrossTiles(self):
+		expVals = self.data[5:30, 7:41]
+		actVals = self._getPyramid().readRegion(0, (5,30), (7,41))
+		self.assertTrue( np.array_equal(expVals, actVals) )
+
+	def testPyramidReusedFromCacheDir(self):
+		pyramidDir = self._getPyramid().pyramidDir
+		self.assertEqual(pyramidDir, self._getPyramid().pyramidDir)
+		self.assertEqual(1, len(os.listdir(self.tempDir.name)))
+
+	def testLevelChosenForBlockShape(self):
+		pyramid = self._getPyramid()
+		expLevels = [0, 1, 1, 2, 4]
+		actLevels = [pyramid.getLevelForBlockShape(blockShape) for blockShape in [(1,1), (2,3), (3,3), (4,9), (100,100)]]
+		self.assertEqual(expLevels, actLevels)
+
+
+class TestImagePlotterWithPyramid(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.data = np.arange(600*400, dtype=float).reshape(600,400)
+		self.plotter = ptrs.ImagePlotter(plotDataImage=self.data, imagePyramidDir=self.tempDir.name, blockDownsampling="min")
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+
+	def _getImageHandle(self, **kwargs):
+		outDict = self.plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111), **kwargs)
+		return outDict["plotter"]._scratchSpace["imageHandle"]
+
+	def testZoomedRenderUsesFullResolution(self):
+		imageHandle = self._getImageHandle(xLimit=[10,30], yLimit=[60,40])
+		self.assertTrue( np.array_equal(self.data[40:61,10:31], imageHandle.get_array()) )
+		self.assertTrue( np.allclose([9.5,30.5,60.5,39.5], imageHandle.get_extent()) )
+
+	def testFullRenderUsesLowerResolution(self):
+		imageHandle = self._getImageHandle(blockDownsamplingNumbPixels=[80,80])
+		expVals = self.data[::4, ::4]
+		self.assertTrue( np.array_equal(expVals, imageHandle.get_array()) )
+		self.assertTrue( np.allclose([-0.5,399.5,599.5,-0.5], imageHandle.get_extent()) )
+
+
+if __name__ == '__main__':
+	unittest.main()
+
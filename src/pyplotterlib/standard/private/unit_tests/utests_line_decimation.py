@@ -0,0 +1,139 @@
+
+import unittest
+
+import matplotlib.figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.line_decimation as tCode
+
+
+class TestGetMinMaxDecimatedIndices(unittest.TestCase):
+
+	def setUp(self):
+		self.xVals = np.linspace(0, 10, 10000)
+		self.yVals = np.sin(self.xVals)
+		self.yVals[1234], self.yVals[5678] = 5, -5
+		self.nBins = 50
+
+	def _runTestFunct(self, **kwargs):
+		return tCode.getMinMaxDecimatedIndices(self.xVals, self.yVals, self.nBins, **kwargs)
+
+	def testPeaksAndEndPointsKept(self):
+		actIndices = self._runTestFunct()
+		for expIdx in [0, 1234, 5678, len(self.xVals)-1]:
+			self.assertIn(expIdx, actIndices)
+
+	def testAtMostFourPointsPerBin(self):
+		actIndices = self._runTestFunct()
+		self.assertTrue( len(actIndices) <= 4*self.nBins )
+		self.assertTrue( np.all(np.diff(actIndices) > 0) )
+
+	def testExtremesMatchForEachBin(self):
+		actIndices = self._runTestFunct()
+		binIdxs = np.floor(self.xVals*(self.nBins/10)).clip(0, self.nBins-1)
+		for binIdx in range(self.nBins):
+			expVals = self.yVals[binIdxs==binIdx]
+			actVals = self.yVals[actIndices][binIdxs[actIndices]==binIdx]
+			self.assertAlmostEqual(expVals.min(), actVals.min())
+			self.assertAlmostEqual(expVals.max(), actVals.max())
+
+	def testPointsOutsideRangeReduced(self):
+		actIndices = self._runTestFunct(xRange=[4,6])
+		actOutside = [idx for idx in actIndices if self.xVals[idx] < 4]
+		self.assertTrue( len(actOutside) <= 4 )
+		self.assertIn(1234, actIndices)
+
+
+class TestGetLTTBDecimatedIndices(unittest.TestCase):
+
+	def setUp(self):
+		self.xVals = np.linspace(0, 10, 10000)
+		self.yVals = np.sin(self.xVals)
+		self.yVals[5000] = 5
+
+	def testExpectedNumberOfSortedPoints(self):
+		actIndices = tCode.getLTTBDecimatedIndices(self.xVals, self.yVals, 100)
+		self.assertEqual(100, len(actIndices))
+		self.assertEqual([0, len(self.xVals)-1], [actIndices[0], actIndices[-1]])
+		self.assertTrue( np.all(np.diff(actIndices) > 0) )
+
+	def testLargeSpikeKept(self):
+		actIndices = tCode.getLTTBDecimatedIndices(self.xVals, self.yVals, 100)
+		self.assertIn(5000, actIndices)
+
+	def testAllPointsKeptIfTooFew(self):
+		expIndices = np.arange(len(self.xVals))
+		actIndices = tCode.getLTTBDecimatedIndices(self.xVals, self.yVals, len(self.xVals)+1)
+		self.assertTrue( np.array_equal(expIndices, actIndices) )
+
+
+class TestGetDecimatedLine(unittest.TestCase):
+
+	def setUp(self):
+		self.xVals = np.linspace(0, 10, 100000)
+		self.yVals = np.sin(self.xVals)
+		self.nPixels = 100
+
+	def _runTestFunct(self, method="minMax"):
+		return tCode.getDecimatedLine(self.xVals, self.yVals, method, self.nPixels)
+
+	def _checkUnchanged(self):
+		actX, actY = self._runTestFunct()
+		self.assertEqual(len(self.xVals), len(actX))
+
+	def testPointsReduced(self):
+		for method in tCode.DECIMATION_METHODS:
+			actX, actY = self._runTestFunct(method=method)
+			self.assertTrue( len(actX) < len(self.xVals)/10 )
+
+	def testUnsortedDataUnchanged(self):
+		self.xVals[[10,20]] = self.xVals[[20,10]]
+		self._checkUnchanged()
+
+	def testNaNDataUnchanged(self):
+		self.yVals[100] = np.nan
+		self._checkUnchanged()
+
+	def testFewPointsUnchanged(self):
+		self.nPixels = len(self.xVals)
+		self._checkUnchanged()
+
+	def testRaisesForInvalidMethod(self):
+		with self.assertRaises(ValueError):
+			self._runTestFunct(method="fake_method")
+
+
+class TestLinePlotterDecimation(unittest.TestCase):
+
+	def setUp(self):
+		xVals = np.linspace(0, 100, 500000)
+		yVals = np.sin(xVals) + np.random.default_rng(0).normal(0, 0.3, len(xVals))
+		yVals[123456] = 8
+		self.plotter = ptrs.LinePlotter(plotData=[np.array([xVals,yVals]).T])
+
+	def _getRenderedPixels(self, **kwargs):
+		figHandle = matplotlib.figure.Figure(figsize=(6,4), dpi=100)
+		FigureCanvasAgg(figHandle)
+		outDict = self.plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+		figHandle.canvas.draw()
+		nPoints = len(outDict["plotter"]._scratchSpace["axHandle"].get_lines()[0].get_xdata())
+		return np.asarray(figHandle.canvas.buffer_rgba()).astype("int32"), nPoints
+
+	def testMinMaxVisuallyIndistinguishable(self):
+		expPixels, expPoints = self._getRenderedPixels()
+		actPixels, actPoints = self._getRenderedPixels(lineDecimation="minMax")
+		fractPixelsDiff = np.mean( np.abs(expPixels-actPixels).max(axis=2) > 64 )
+		self.assertTrue( actPoints < expPoints/10 )
+		self.assertTrue( fractPixelsDiff < 1e-3 )
+
+	def testNumbPixelsOptionUsed(self):
+		unused, actPointsA = self._getRenderedPixels(lineDecimation="lttb", lineDecimationNumbPixels=100)
+		unused, actPointsB = self._getRenderedPixels(lineDecimation="lttb", lineDecimationNumbPixels=200)
+		self.assertEqual([200,400], [actPointsA, actPointsB])
+
+
+if __name__ == '__main__':
+	unittest.main()
+
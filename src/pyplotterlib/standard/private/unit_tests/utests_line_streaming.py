@@ -0,0 +1,134 @@
+
+import unittest
+import unittest.mock
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.line_streaming as tCode
+
+
+class TestStreamingLineData(unittest.TestCase):
+
+	def setUp(self):
+		self.xVals, self.yVals = np.arange(5), np.arange(5)*2
+		self.maxWindow = None
+		self.createTestObjs()
+
+	def createTestObjs(self):
+		self.testObj = tCode.StreamingLineData(self.xVals, self.yVals, maxWindow=self.maxWindow)
+
+	def _appendPoints(self, nAppends, nPointsEach):
+		allX, allY = [self.xVals], [self.yVals]
+		for idx in range(nAppends):
+			newX = np.arange(nPointsEach) + 1000*(idx+1)
+			self.testObj.append(newX, newX*2)
+			allX.append(newX)
+			allY.append(newX*2)
+		return np.concatenate(allX), np.concatenate(allY)
+
+	def testAppendKeepsAllPoints(self):
+		expX, expY = self._appendPoints(50, 100)
+		self.assertTrue( np.array_equal(expX, self.testObj.xVals) )
+		self.assertTrue( np.array_equal(expY, self.testObj.yVals) )
+
+	def testAppendKeepsLatestWindow(self):
+		self.maxWindow = 150
+		self.createTestObjs()
+		expX, expY = self._appendPoints(50, 70)
+		self.assertTrue( np.array_equal(expX[-150:], self.testObj.xVals) )
+		self.assertTrue( np.array_equal(expY[-150:], self.testObj.yVals) )
+
+	def testNumberDroppedReturned(self):
+		self.maxWindow = 7
+		self.createTestObjs()
+		actVals = [self.testObj.append([10],[20]), self.testObj.append([11,12,13],[22,24,26])]
+		self.assertEqual([0,2], actVals)
+
+	def testDataLimitsMatchDataKept(self):
+		for maxWindow in [None, 10000]:
+			self.maxWindow = maxWindow
+			self.createTestObjs()
+			self._appendPoints(20, 3000)
+			self.testObj.append([-5], [np.nan])
+			expLimits = [[np.nanmin(self.testObj.xVals), np.nanmin(self.testObj.yVals)],
+			             [np.nanmax(self.testObj.xVals), np.nanmax(self.testObj.yVals)]]
+			actLimits = self.testObj.getDataLimits()
+			self.assertTrue( np.allclose(expLimits, actLimits) )
+
+	def testBufferNotReallocatedForWindow(self):
+		self.maxWindow = 100
+		self.createTestObjs()
+		startBuffer = self.testObj._xBuffer
+		self._appendPoints(100, 30)
+		self.assertIs(startBuffer, self.testObj._xBuffer)
+
+
+class TestLinePlotterAppendData(unittest.TestCase):
+
+	def setUp(self):
+		xVals = np.arange(10, dtype=float)
+		self.plotData = [np.array([xVals, xVals]).T, np.array([xVals, -1*xVals]).T]
+		self.plotter = ptrs.LinePlotter(plotData=self.plotData)
+		self.figHandle = matplotlib.figure.Figure()
+		self.outDict = self.plotter.createPlot(axHandle=self.figHandle.add_subplot(111))
+		self.axHandle = self.outDict["plotter"]._scratchSpace["axHandle"]
+		self.lines = self.outDict["plotter"]._scratchSpace["plotLineHandles"]["value"]
+
+	def testLineDataExtended(self):
+		newPoints = np.array([[10,20], [11,30]])
+		self.plotter.appendData(self.outDict, 0, newPoints)
+		self.plotter.appendData(self.outDict, 0, newPoints+2)
+		expData = np.concatenate([self.plotData[0], newPoints, newPoints+2])
+		self.assertTrue( np.allclose(expData, self.lines[0].get_xydata()) )
+		self.assertTrue( np.allclose(self.plotData[1], self.lines[1].get_xydata()) )
+
+	def testLimitsExpandedToFitNewPoints(self):
+		self.plotter.appendData(self.outDict, 0, np.array([[50,100]]))
+		self.assertTrue( self.axHandle.get_xlim()[1] > 50 )
+		self.assertTrue( self.axHandle.get_ylim()[1] > 100 )
+
+	def testLimitsShrinkWhenPointsLeaveWindow(self):
+		self.plotter.appendData(self.outDict, 0, np.array([[50,100]]), maxWindow=2)
+		self.plotter.appendData(self.outDict, 0, np.array([[51,3], [52,4]]))
+		self.assertTrue( self.axHandle.get_ylim()[1] < 100 )
+		self.assertEqual(2, len(self.lines[0].get_xdata()))
+
+	@unittest.skipUnless(tCode._canSetLineDataDirectly(), "Line data is copied by set_data for this matplotlib version")
+	def testLineReferencesBufferedData(self):
+		self.plotter.appendData(self.outDict, 0, np.array([[50,100]]))
+		lineBuffer = self.outDict["plotter"]._scratchSpace["streamLineBuffers"][self.lines[0]]
+		self.assertTrue( np.shares_memory(lineBuffer.xVals, self.lines[0].get_xdata(orig=True)) )
+		self.assertTrue( np.shares_memory(lineBuffer.yVals, self.lines[0].get_ydata(orig=True)) )
+
+	#i.e. appends within capacity only write the new points; neither the buffer nor the line data is re-created
+	@unittest.skipUnless(tCode._canSetLineDataDirectly(), "Line data is copied by set_data for this matplotlib version")
+	def testAppendsWithinCapacityDontCopyData(self):
+		self.plotter.appendData(self.outDict, 0, np.array([[50,100]])) #First call copies the existing points into the buffer
+		lineBuffer = self.outDict["plotter"]._scratchSpace["streamLineBuffers"][self.lines[0]]
+		startBuffers = lineBuffer._xBuffer, lineBuffer._yBuffer
+		for idx in range(20):
+			self.plotter.appendData(self.outDict, 0, np.array([[51+idx,idx]]))
+			self.assertIs(startBuffers[0], lineBuffer._xBuffer)
+			self.assertIs(startBuffers[1], lineBuffer._yBuffer)
+			self.assertIs(startBuffers[0], self.lines[0].get_xdata(orig=True).base)
+			self.assertIs(startBuffers[1], self.lines[0].get_ydata(orig=True).base)
+
+	def testLineDataExtendedForUncheckedMatplotlibVersion(self):
+		newPoints = np.array([[10,20], [11,30]])
+		with unittest.mock.patch.object(tCode, "_DIRECT_LINE_DATA_MPL_VERSIONS", [(0,0), (0,0)]):
+			self.plotter.appendData(self.outDict, 0, newPoints)
+		lineBuffer = self.outDict["plotter"]._scratchSpace["streamLineBuffers"][self.lines[0]]
+		self.assertFalse( np.shares_memory(lineBuffer.xVals, self.lines[0].get_xdata(orig=True)) )
+		self.assertTrue( np.allclose(np.concatenate([self.plotData[0], newPoints]), self.lines[0].get_xydata()) )
+
+	def testRaisesForCollectionMode(self):
+		outDict = self.plotter.createPlot(axHandle=self.figHandle.add_subplot(111), lineDrawAsCollection=True)
+		with self.assertRaises(ValueError):
+			self.plotter.appendData(outDict, 0, np.array([[50,100]]))
+
+
+if __name__ == '__main__':
+	unittest.main()
+
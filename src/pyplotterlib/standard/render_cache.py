@@ -0,0 +1,156 @@
+
+import collections
+import hashlib
+import os
+import pathlib
+import shutil
+import tempfile
+import types
+
+
+class RenderCache():
+	""" On-disk least-recently-used cache of rendered plots. Files are keyed on (plotter fingerprint, format, dpi), so rendering an identical plotter again costs a file copy rather than a matplotlib render
+
+	Example:
+		cache = RenderCache("/path/to/cache_dir", maxSizeBytes=int(1e9))
+		cache.savePlot(plotter, "out.png") #Renders with matplotlib (a miss)
+		cache.savePlot(plotter, "out_b.png") #Copies the cached file (a hit)
+
+	"""
+
+	def __init__(self, cacheDir, maxSizeBytes=None, maxEntries=None):
+		""" Initializer
+
+		Args:
+			cacheDir (str): Directory to store rendered files in; created if needed. Any files already present from a previous RenderCache are re-used
+			maxSizeBytes (int): Maximum total size of cached files. Least recently used files are deleted to stay below this. None means no limit
+			maxEntries (int): Maximum number of cached files. None means no limit
+
+		"""
+		self.cacheDir = cacheDir
+		self.maxSizeBytes = maxSizeBytes
+		self.maxEntries = maxEntries
+		self._hits, self._misses, self._evictions = 0, 0, 0
+		pathlib.Path(cacheDir).mkdir(parents=True, exist_ok=True)
+		self._entries = self._getEntriesFromDisk() #Maps key to file size; ordered from least to most recently used
+		self._sizeBytes = sum(self._entries.values())
+		self._evictIfNeeded()
+
+	def savePlot(self, inpPlotter, outPath, fmt="png", dpi=None, **kwargs):
+		""" Saves the plot for inpPlotter to outPath; uses the cached version if present, else renders and caches it
+
+		Args:
+			inpPlotter (PlotterInter): The plotter to create the plot with
+			outPath (str): Path to save the figure to
+			fmt (str): The format to save the figure in (e.g. "png")
+			dpi (float): Resolution to save the figure at. Default of None means use the matplotlib default
+			kwargs: Passed to inpPlotter.createPlot (and included in the cache key)
+
+		Returns
+			isHit (bool): True if the plot was taken from the cache (i.e. matplotlib wasnt used)
+
+		"""
+		cachePath, isHit = self._getCachedPathRenderingIfNeeded(inpPlotter, fmt, dpi, kwargs)
+		shutil.copyfile(cachePath, outPath)
+		return isHit
+
+	def getPlotBytes(self, inpPlotter, fmt="png", dpi=None, **kwargs):
+		""" Returns the rendered plot for inpPlotter as bytes; uses the cached version if present, else renders and caches it
+
+		Args:
+			inpPlotter (PlotterInter): The plotter to create the plot with
+			fmt (str): The format to save the figure in (e.g. "png")
+			dpi (float): Resolution to save the figure at. Default of None means use the matplotlib default
+			kwargs: Passed to inpPlotter.createPlot (and included in the cache key)
+
+		Returns
+			outBytes (bytes): The contents of the rendered file
+
+		"""
+		cachePath, unused = self._getCachedPathRenderingIfNeeded(inpPlotter, fmt, dpi, kwargs)
+		with open(cachePath, "rb") as f:
+			outBytes = f.read()
+		return outBytes
+
+	def clear(self):
+		""" Deletes all cached files (the stats are not reset) """
+		for key in list(self._entries.keys()):
+			self._removeEntry(key)
+
+	@property
+	def stats(self):
+		""" SimpleNamespace with attributes hits, misses, evictions, nEntries and sizeBytes """
+		return types.SimpleNamespace(hits=self._hits, misses=self._misses, evictions=self._evictions,
+		                             nEntries=len(self._entries), sizeBytes=self._sizeBytes)
+
+	def _getCachedPathRenderingIfNeeded(self, inpPlotter, fmt, dpi, kwargs):
+		usePlotter = inpPlotter.createCopyOnWriteFactory(**kwargs) if len(kwargs)>0 else inpPlotter
+		key = self._getKey(usePlotter.getFingerprint(), fmt, dpi)
+		cachePath = self._getPathFromKey(key)
+
+		if (key in self._entries) and os.path.exists(cachePath):
+			self._hits += 1
+			self._entries.move_to_end(key)
+			os.utime(cachePath) #So the LRU order survives re-creating the cache from disk
+			return cachePath, True
+
+		self._misses += 1
+		if key in self._entries: #File deleted externally
+			self._sizeBytes -= self._entries.pop(key)
+		self._renderToCache(usePlotter, cachePath, fmt, dpi)
+		self._entries[key] = os.path.getsize(cachePath)
+		self._sizeBytes += self._entries[key]
+		self._evictIfNeeded(keepKey=key)
+		return cachePath, False
+
+	def _renderToCache(self, inpPlotter, cachePath, fmt, dpi):
+		#Write to a temporary file first, so an interrupted render never leaves a partial file in the cache
+		savefigKwargs = dict() if dpi is None else {"dpi":dpi}
+		fileDescriptor, tempPath = tempfile.mkstemp(dir=self.cacheDir, suffix=".tmp")
+		os.close(fileDescriptor)
+		try:
+			inpPlotter.createPlots([dict()], [tempPath], fmt=fmt, savefigKwargs=savefigKwargs)
+			os.replace(tempPath, cachePath)
+		finally:
+			if os.path.exists(tempPath):
+				os.remove(tempPath)
+
+	def _evictIfNeeded(self, keepKey=None):
+		def _overLimits():
+			if (self.maxEntries is not None) and (len(self._entries) > self.maxEntries):
+				return True
+			if (self.maxSizeBytes is not None) and (self._sizeBytes > self.maxSizeBytes):
+				return True
+			return False
+
+		while _overLimits():
+			oldestKey = next(iter(self._entries))
+			if oldestKey == keepKey: #Always keep the most recent render; even if it alone is over the size limit
+				break
+			self._removeEntry(oldestKey)
+			self._evictions += 1
+
+	def _removeEntry(self, key):
+		self._sizeBytes -= self._entries.pop(key)
+		try:
+			os.remove(self._getPathFromKey(key))
+		except FileNotFoundError:
+			pass
+
+	def _getEntriesFromDisk(self):
+		outEntries = collections.OrderedDict()
+		allPaths = [os.path.join(self.cacheDir,x) for x in os.listdir(self.cacheDir) if x.endswith(_CACHE_FILE_EXT)]
+		for currPath in sorted(allPaths, key=os.path.getmtime):
+			key = os.path.basename(currPath)[:-len(_CACHE_FILE_EXT)]
+			outEntries[key] = os.path.getsize(currPath)
+		return outEntries
+
+	def _getKey(self, fingerprint, fmt, dpi):
+		return hashlib.sha256( "{}|{}|{}".format(fingerprint, fmt, dpi).encode("utf-8") ).hexdigest()
+
+	def _getPathFromKey(self, key):
+		return os.path.join(self.cacheDir, key + _CACHE_FILE_EXT)
+
+
+_CACHE_FILE_EXT = ".pplcache"
+
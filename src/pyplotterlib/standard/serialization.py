@@ -2,34 +2,44 @@
 import os
 import pathlib
 
+from ..core.serialization import binary_io as binaryIO
 from ..core.serialization import json_io as jsonIO
 
+#Files with this extension use the binary format; anything else uses JSON
+BINARY_FILE_EXT = ".npz"
+
+
 def writePlotterToFile(inpPlotter, inpPath):
 	""" Writes a plotter instance to a file
 	
 	Args:
 		inpPlotter (PlotterInter): Really any instance with a toJSON and fromJSON method should work
-		inpPath (str): Path to the output file
+		inpPath (str): Path to the output file. If it ends in ".npz" a binary format is used, which stores numpy arrays as raw buffers; this is much smaller and faster for large amounts of data. Otherwise JSON is used
 			 
 	Returns
 		 Nothing; but writes data to inpPath
  
 	"""
-	outJSON = inpPlotter.toJSON()
-
 	#Create directory if needed
 	outDir = os.path.split(inpPath)[0]
 	pathlib.Path(outDir).mkdir(parents=True, exist_ok=True)
+
+	if _isBinaryPath(inpPath):
+		binaryIO.writeInstanceToBinaryFile(inpPlotter, inpPath)
+		return None
+
+	outJSON = inpPlotter.toJSON()
 	with open(inpPath,"wt") as f:
 		f.write(outJSON)
 
 
-def readPlotterFromFile(inpPath, reInitPlotter=False):
-	""" Reads in a plotter instance from a JSON file
+def readPlotterFromFile(inpPath, reInitPlotter=False, memoryMap=False):
+	""" Reads in a plotter instance from a file (JSON or binary, depending on the extension)
 	
 	Args:
 		inpPath (str): Path to the file. This should have been generated with "writePlotterToFile"
 		reInitPlotter (Bool): If True we reinitialize the plotter using its current definition. See notes below for more on the meaning for this. True is likely the most sensible value to use, but False is the default due to backwards-comptability/consistency reasons.
+		memoryMap (Bool): Only used for binary (".npz") files. If True, arrays are memory-mapped (read-only) rather than read into memory. Like other read-only memory-mapped arrays, these are shared by copies of the plotter. Saving the plotter again writes their values (not references to inpPath); so inpPath itself can be overwritten
 
 	Notes (reInitPlotter):
 		This option exists to give flexibility in dealing with plotters written using previous versions. Setting to True will likely be best usually.
@@ -40,13 +50,19 @@ def readPlotterFromFile(inpPath, reInitPlotter=False):
 		outPlotter (PlotterInter): The instance stored in the file. 
  
 	"""
-	with open(inpPath, "rt") as f:
-		inpStr = f.read()
-
-	outPlotter = jsonIO.createInstanceFromJSON(inpStr)
+	if _isBinaryPath(inpPath):
+		outPlotter = binaryIO.readInstanceFromBinaryFile(inpPath, memoryMap=memoryMap)
+	else:
+		with open(inpPath, "rt") as f:
+			inpStr = f.read()
+		outPlotter = jsonIO.createInstanceFromJSON(inpStr)
 
 	if reInitPlotter:
 		outPlotter = outPlotter.fromPlotter(outPlotter)
 
 	return outPlotter
 
+
+def _isBinaryPath(inpPath):
+	return str(inpPath).lower().endswith(BINARY_FILE_EXT)
+
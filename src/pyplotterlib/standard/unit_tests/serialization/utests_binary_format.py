@@ -0,0 +1,124 @@
+import copy
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+import numpy as np
+
+import pyplotterlib.core.lazy_array as lazyArrayHelp
+import pyplotterlib.standard.plotters as ppl
+
+
+class TestBinaryPlotterFiles(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.binaryPath = os.path.join(self.tempDir.name, "plotter.npz")
+		self.plotData = [ np.arange(20, dtype="float32").reshape(10,2), np.arange(30, dtype="int16").reshape(15,2) ]
+		self.linePlotter = ppl.LinePlotter(plotData=self.plotData, titleStr="title", dataLabels=["a","b"],
+		                                   errorBarDataY=[np.ones(10), np.ones(15)])
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+
+	def _getRoundTripPlotter(self, inpPlotter, **kwargs):
+		ppl.writePlotterToFile(inpPlotter, self.binaryPath)
+		return ppl.readPlotterFromFile(self.binaryPath, **kwargs)
+
+	def testReadAndWriteConsistentLinePlotter(self):
+		actPlotter = self._getRoundTripPlotter(self.linePlotter)
+		self.assertEqual(self.linePlotter, actPlotter)
+
+	def testReadAndWriteConsistentOtherPlotters(self):
+		allPlotters = [ ppl.DiscreteHeatMapPlotter(plotData=np.random.rand(4,4)),
+		                ppl.BoxPlotter(plotDataMultiSeries=[ [np.random.rand(10), np.random.rand(12)] ]),
+		                ppl.ImagePlotter(plotDataImage=np.arange(16, dtype="uint8").reshape(4,4)),
+		                ppl.RectMultiPlotter(plotters=[self.linePlotter, self.linePlotter]) ]
+		for expPlotter in allPlotters:
+			actPlotter = self._getRoundTripPlotter(expPlotter)
+			self.assertEqual(expPlotter, actPlotter)
+
+	def testDtypesPreserved(self):
+		actPlotter = self._getRoundTripPlotter(self.linePlotter)
+		expDtypes = [x.dtype for x in self.plotData]
+		actDtypes = [x.dtype for x in actPlotter.opts.plotData.value]
+		self.assertEqual(expDtypes, actDtypes)
+
+	def testArraysMemoryMappedIfRequested(self):
+		actPlotter = self._getRoundTripPlotter(self.linePlotter, memoryMap=True)
+		actArray = actPlotter.opts.plotData.value[0]
+		self.assertTrue( isinstance(actArray, np.memmap) )
+		self.assertTrue( np.allclose(self.plotData[0], actArray) )
+
+	def testMemoryMappedArraysSharedByCopies(self):
+		imagePlotter = ppl.ImagePlotter(plotDataImage=np.arange(10000, dtype="uint8").reshape(100,100))
+		actPlotter = self._getRoundTripPlotter(imagePlotter, memoryMap=True)
+		expArray = actPlotter.opts.plotDataImage.value
+		self.assertTrue( isinstance(expArray, np.memmap) )
+		for copiedPlotter in [copy.deepcopy(actPlotter), actPlotter.createFactory()]:
+			self.assertIs(expArray, copiedPlotter.opts.plotDataImage.value)
+
+	def testMemoryMappedArraysRewrittenToSamePath(self):
+		expPlotter = ppl.ImagePlotter(plotDataImage=np.arange(10000, dtype="uint8").reshape(100,100))
+		loadedPlotter = self._getRoundTripPlotter(expPlotter, memoryMap=True)
+		ppl.writePlotterToFile(loadedPlotter, self.binaryPath)
+		for memoryMap in [True, False]:
+			self.assertEqual(expPlotter, ppl.readPlotterFromFile(self.binaryPath, memoryMap=memoryMap))
+
+	def testMemoryMappedArraysWrittenElsewhereDontNeedSourceFile(self):
+		expPlotter = ppl.ImagePlotter(plotDataImage=np.arange(10000, dtype="uint8").reshape(100,100))
+		loadedPlotter = self._getRoundTripPlotter(expPlotter, memoryMap=True)
+		outPaths = [ os.path.join(self.tempDir.name, fileName) for fileName in ["other.npz", "other.json"] ]
+		for outPath in outPaths:
+			ppl.writePlotterToFile(loadedPlotter, outPath)
+		os.remove(self.binaryPath)
+		for outPath in outPaths:
+			self.assertEqual(expPlotter, ppl.readPlotterFromFile(outPath))
+
+	def testNpyFileMemmapsWrittenAsReferences(self):
+		npyPath = os.path.join(self.tempDir.name, "image.npy")
+		np.save(npyPath, np.arange(16, dtype="uint8").reshape(4,4))
+		imagePlotter = ppl.ImagePlotter(plotDataImage=np.load(npyPath, mmap_mode="r"))
+		actVal = self._getRoundTripPlotter(imagePlotter).opts.plotDataImage.value
+		self.assertIsInstance(actVal, lazyArrayHelp.LazyArrayRef)
+		self.assertEqual(npyPath, actVal.path)
+
+	def testReferenceToOutputPathWrittenAsValues(self):
+		expPlotter = ppl.ImagePlotter(plotDataImage=np.arange(10000, dtype="uint8").reshape(100,100))
+		loadedPlotter = self._getRoundTripPlotter(expPlotter, memoryMap=True)
+		loadedPlotter.opts.plotDataImage.value = lazyArrayHelp.LazyArrayRef.fromMemmap(loadedPlotter.opts.plotDataImage.value)
+		ppl.writePlotterToFile(loadedPlotter, self.binaryPath)
+		actVal = ppl.readPlotterFromFile(self.binaryPath).opts.plotDataImage.value
+		self.assertTrue( np.array_equal(expPlotter.opts.plotDataImage.value, actVal) )
+
+	def testArrayDataAligned(self):
+		ppl.writePlotterToFile(self.linePlotter, self.binaryPath)
+		actPlotter = ppl.readPlotterFromFile(self.binaryPath, memoryMap=True)
+		for currArray in actPlotter.opts.plotData.value:
+			self.assertEqual(0, currArray.offset % 64)
+
+	def testArraysLoadableWithNumpy(self):
+		ppl.writePlotterToFile(self.linePlotter, self.binaryPath)
+		with np.load(self.binaryPath) as npzFile:
+			actArrays = [npzFile[x] for x in npzFile.files if x.startswith("arrays/")]
+		self.assertEqual(4, len(actArrays))
+
+	def testJSONFilesUnchanged(self):
+		jsonPath = os.path.join(self.tempDir.name, "plotter.json")
+		ppl.writePlotterToFile(self.linePlotter, jsonPath)
+		with open(jsonPath, "rt") as f:
+			actStr = f.read()
+		self.assertEqual(self.linePlotter.toJSON(), actStr)
+		self.assertEqual(self.linePlotter, ppl.readPlotterFromFile(jsonPath))
+
+	def testNewerFormatVersionRaises(self):
+		with zipfile.ZipFile(self.binaryPath, "w") as zipHandle:
+			zipHandle.writestr("metadata.json", json.dumps({"formatVersion":1000, "nArrays":0, "instance":None}))
+		with self.assertRaises(ValueError):
+			ppl.readPlotterFromFile(self.binaryPath)
+
+
+if __name__ == '__main__':
+	unittest.main()
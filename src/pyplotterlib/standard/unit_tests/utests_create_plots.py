@@ -0,0 +1,134 @@
+
+import os
+import tempfile
+import unittest
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+
+
+class TestCreatePlots(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.plotter = ptrs.LinePlotter(figSizeOnCreation=(3,2))
+		self.iterOfKwargs = [ {"plotData":[ [[1,2,3],[2,4,idx]] ], "titleStr":"Plot {}".format(idx)} for idx in range(3) ]
+		self.outPaths = [ os.path.join(self.tempDir.name, "plot_{}.png".format(idx)) for idx in range(3) ]
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+		plt.close("all")
+
+	def _runTestFunct(self):
+		return self.plotter.createPlots(self.iterOfKwargs, self.outPaths, fmt="png")
+
+	def testExpectedFilesWritten(self):
+		self._runTestFunct()
+		for outPath in self.outPaths:
+			self.assertTrue( os.path.exists(outPath) )
+
+	def testOutDictPerPlotReturned(self):
+		expLen = len(self.iterOfKwargs)
+		actVals = self._runTestFunct()
+		self.assertEqual(expLen, len(actVals))
+
+	def testImagesMatchCreatePlot(self):
+		expPaths = [ os.path.join(self.tempDir.name, "exp_{}.png".format(idx)) for idx in range(3) ]
+		for kwargs, expPath in zip(self.iterOfKwargs, expPaths):
+			self.plotter.createPlot(**kwargs)
+			plt.gcf().savefig(expPath, format="png")
+			plt.close(plt.gcf())
+
+		self._runTestFunct()
+		for expPath, actPath in zip(expPaths, self.outPaths):
+			expImage, actImage = plt.imread(expPath), plt.imread(actPath)
+			self.assertTrue( np.array_equal(expImage, actImage) )
+
+	def testDoesntLeaveFiguresOpen(self):
+		expNumb = len(plt.get_fignums())
+		self._runTestFunct()
+		self.assertEqual(expNumb, len(plt.get_fignums()))
+
+	def testRaisesIfLengthsDiffer(self):
+		self.outPaths = self.outPaths[:-1]
+		with self.assertRaises(ValueError):
+			self._runTestFunct()
+
+
+class TestCreatePlotsMultiGraph(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		linePlotters = [ ptrs.LinePlotter(plotData=[ [[1,2],[2,idx],[3,4]] ]) for idx in range(2) ]
+		self.plotter = ptrs.RectMultiPlotter(plotters=linePlotters, constrainedLayout=True)
+		self.iterOfKwargs = [ {"nColsGrid":1}, {"nColsGrid":2}, {"nColsGrid":2, "constrainedLayout":False} ]
+		self.outPaths = [ os.path.join(self.tempDir.name, "plot_{}.png".format(idx)) for idx in range(3) ]
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+		plt.close("all")
+
+	def testImagesMatchCreatePlot(self):
+		expPaths = [ os.path.join(self.tempDir.name, "exp_{}.png".format(idx)) for idx in range(3) ]
+		for kwargs, expPath in zip(self.iterOfKwargs, expPaths):
+			self.plotter.createPlot(**kwargs)
+			plt.gcf().savefig(expPath, format="png")
+			plt.close(plt.gcf())
+
+		self.plotter.createPlots(self.iterOfKwargs, self.outPaths, fmt="png")
+		for expPath, actPath in zip(expPaths, self.outPaths):
+			expImage, actImage = plt.imread(expPath), plt.imread(actPath)
+			self.assertTrue( np.array_equal(expImage, actImage) )
+
+
+class TestCreatePlotsOptionResets(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+		plt.close("all")
+
+	def _checkImagesMatchCreatePlot(self, plotter, iterOfKwargs):
+		expPaths = [ os.path.join(self.tempDir.name, "exp_{}.png".format(idx)) for idx,unused in enumerate(iterOfKwargs) ]
+		actPaths = [ os.path.join(self.tempDir.name, "act_{}.png".format(idx)) for idx,unused in enumerate(iterOfKwargs) ]
+		for kwargs, expPath in zip(iterOfKwargs, expPaths):
+			plotter.createPlot(**kwargs)
+			plt.gcf().savefig(expPath, format="png")
+			plt.close(plt.gcf())
+
+		plotter.createPlots(iterOfKwargs, actPaths, fmt="png")
+		for expPath, actPath in zip(expPaths, actPaths):
+			expImage, actImage = plt.imread(expPath), plt.imread(actPath)
+			self.assertTrue( np.array_equal(expImage, actImage) )
+
+	def testLinePlotterOptionsResetToDefault(self):
+		plotter = ptrs.LinePlotter(plotData=[ [[1,2],[2,4],[3,3]] ], figSizeOnCreation=(3,2))
+		allIterOfKwargs = [ [{"fontSizeDefault":5}, dict()], [{"tickLabelRotationX":45}, dict()], [{"titleStr":"title"}, {"titleStr":None}] ]
+		for iterOfKwargs in allIterOfKwargs:
+			self._checkImagesMatchCreatePlot(plotter, iterOfKwargs)
+
+	def testImagePlotterColorBarRemoved(self):
+		plotter = ptrs.ImagePlotter(plotDataImage=np.arange(16).reshape(4,4), colorBarShow=True, figSizeOnCreation=(3,2))
+		self._checkImagesMatchCreatePlot(plotter, [dict(), {"colorBarShow":False}, dict()])
+
+
+class TestCreatePlotKwargsNotModified(unittest.TestCase):
+
+	def tearDown(self):
+		plt.close("all")
+
+	def testListKwargUnchanged(self):
+		plotters = [ptrs.LinePlotter() for idx in range(3)]
+		plotter = ptrs.RectMultiPlotter(plotters=plotters, nColsGrid=1, nRowsGrid=3)
+		relGridHeights = [2, None]
+		plotter.createPlot(relGridHeights=relGridHeights)
+		self.assertEqual([2, None], relGridHeights)
+
+
+if __name__ == '__main__':
+	unittest.main()
+
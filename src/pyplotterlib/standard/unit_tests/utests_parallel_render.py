@@ -0,0 +1,52 @@
+
+import os
+import tempfile
+import unittest
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.parallel_render as tCode
+
+
+class TestRenderPlottersInParallel(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.plotters = [ ptrs.LinePlotter(plotData=[ [[1,2,3],[2,4,idx]] ]) for idx in range(3) ]
+		self.outPaths = [ os.path.join(self.tempDir.name, "plot_{}.png".format(idx)) for idx in range(3) ]
+		self.maxWorkers = 2
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+
+	def _runTestFunct(self):
+		return tCode.renderPlottersInParallel(self.plotters, self.outPaths, maxWorkers=self.maxWorkers)
+
+	def testExpectedFilesWritten(self):
+		actResults = self._runTestFunct()
+		for outPath, result in zip(self.outPaths, actResults):
+			self.assertTrue( os.path.exists(outPath) )
+			self.assertTrue( result.success )
+			self.assertEqual( outPath, result.outPath )
+			self.assertGreater( result.renderTime, 0 )
+
+	def testWorksWithJSONInput(self):
+		self.plotters = [x.toJSON() for x in self.plotters]
+		actResults = self._runTestFunct()
+		self.assertTrue( all([x.success for x in actResults]) )
+		self.assertTrue( all([os.path.exists(x) for x in self.outPaths]) )
+
+	def testFailedJobDoesntStopOthers(self):
+		self.outPaths[1] = os.path.join(self.tempDir.name, "fake_dir", "plot_1.png")
+		actResults = self._runTestFunct()
+		self.assertEqual( [True,False,True], [x.success for x in actResults] )
+		self.assertTrue( actResults[1].errorStr is not None )
+
+	def testRaisesIfLengthsDiffer(self):
+		self.outPaths = self.outPaths[:-1]
+		with self.assertRaises(ValueError):
+			self._runTestFunct()
+
+
+if __name__ == '__main__':
+	unittest.main()
+
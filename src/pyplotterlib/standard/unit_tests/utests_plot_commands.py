@@ -2,14 +2,20 @@
 import unittest
 import unittest.mock
 
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.core.plot_command as plotCmdCoreHelp
 import pyplotterlib.standard.annotations as annotationHelp
 import pyplotterlib.standard.plot_commands as tCode
+import pyplotterlib.standard.plotters as ptrs
 
 class TestDrawShadedAnnotationsDirectionVals(unittest.TestCase):
 
 	def setUp(self):
 		self.testComm = tCode.DrawShadedAnnotationsGeneric()
 		self.plotterInstance = unittest.mock.Mock()
+		self.plotterInstance._scratchSpace = {"axHandle":unittest.mock.Mock()}
 		self.direction = "vertical"
 		self.createTestObjs()
 
@@ -36,6 +42,80 @@ class TestDrawShadedAnnotationsDirectionVals(unittest.TestCase):
 			self._runTestFunct()
 
 
+class TestCopyNumpyArrayPlotDataToScratchSpace(unittest.TestCase):
+
+	def setUp(self):
+		self.plotData = np.arange(12, dtype=float).reshape(3,4)
+		self.plotter = ptrs.DiscreteHeatMapPlotter(plotData=self.plotData)
+
+	def _getUsePlotData(self):
+		figHandle = matplotlib.figure.Figure()
+		outDict = self.plotter.createPlot(axHandle=figHandle.add_subplot(111))
+		return outDict["plotter"]._scratchSpace["usePlotData"]
+
+	def testReadOnlyViewWithoutMutatingCommands(self):
+		actData = self._getUsePlotData()
+		self.assertTrue( np.shares_memory(self.plotData, actData) )
+		self.assertFalse( actData.flags.writeable )
+
+	def testCopiedIfLaterCommandMutatesPlotData(self):
+		self.plotter.appendCommandObjs([_SetFirstPlotDataValToNegative()])
+		actData = self._getUsePlotData()
+		self.assertEqual(-1, actData[0,0])
+		self.assertTrue( np.array_equal(np.arange(12).reshape(3,4), self.plotData) )
+
+
+class _SetFirstPlotDataValToNegative(plotCmdCoreHelp.PlotCommand):
+
+	def __init__(self):
+		self._name = "set-first-val-to-negative"
+		self._description = "Modifies plot data in place"
+		self._mutatesPlotData = True
+
+	def execute(self, plotterInstance):
+		plotterInstance._scratchSpace["usePlotData"][0,0] = -1
+
+
+class TestPlotDataAsLinesSeriesData(unittest.TestCase):
+
+	def setUp(self):
+		self.xVals = np.linspace(0, 1, 20)
+		self.columnsY = np.array([self.xVals*2, self.xVals*3, self.xVals*4]).T
+		self.plotter = ptrs.LinePlotter()
+
+	def _getPlottedLines(self, **kwargs):
+		figHandle = matplotlib.figure.Figure()
+		outDict = self.plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+		return outDict["plotter"]._scratchSpace["plotLineHandles"]["value"]
+
+	def testNumpyPlotDataNotCopied(self):
+		plotData = [np.array([self.xVals, self.xVals*2]).T]
+		self.plotter.setOptionVals({"plotData":plotData})
+		actData = tCode.PlotDataAsLines()._getSeriesXYData(self.plotter)
+		self.assertTrue( all([np.shares_memory(plotData[0], vals) for vals in actData[0]]) )
+
+	def testColumnsYNotCopied(self):
+		self.plotter.setOptionVals({"plotDataColumnsY":self.columnsY, "plotDataSharedX":self.xVals})
+		actData = tCode.PlotDataAsLines()._getSeriesXYData(self.plotter)
+		self.assertEqual(3, len(actData))
+		self.assertTrue( all([actX is self.xVals for actX,unused in actData]) )
+		self.assertTrue( all([np.shares_memory(self.columnsY, actY) for unused,actY in actData]) )
+
+	def testColumnsYMatchesEquivalentPlotData(self):
+		plotData = [np.array([self.xVals, col]).T for col in self.columnsY.T]
+		expLines = self._getPlottedLines(plotData=plotData)
+		actLines = self._getPlottedLines(plotDataColumnsY=self.columnsY, plotDataSharedX=self.xVals)
+		self.assertEqual(len(expLines), len(actLines))
+		for expLine, actLine in zip(expLines, actLines):
+			self.assertTrue( np.allclose(expLine.get_xydata(), actLine.get_xydata()) )
+
+	def testColumnsYPlottedAfterPlotData(self):
+		plotData = [ [[5,6],[7,8]] ]
+		actLines = self._getPlottedLines(plotData=plotData, plotDataColumnsY=self.columnsY[:,0])
+		self.assertEqual(2, len(actLines))
+		self.assertTrue( np.allclose([5,7], actLines[0].get_xdata()) )
+		self.assertTrue( np.allclose(np.arange(len(self.xVals)), actLines[1].get_xdata()) )
+
 
 if __name__=='__main__':
 	unittest.main()
@@ -0,0 +1,95 @@
+
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import matplotlib.pyplot as plt
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.render_cache as tCode
+
+
+class TestRenderCache(unittest.TestCase):
+
+	def setUp(self):
+		self.tempDir = tempfile.TemporaryDirectory()
+		self.cacheDir = os.path.join(self.tempDir.name, "cache")
+		self.maxEntries = None
+		self.maxSizeBytes = None
+		self.plotterA = ptrs.LinePlotter(plotData=[ [[1,2],[2,3]] ], figSizeOnCreation=(2,2))
+		self.plotterB = ptrs.LinePlotter(plotData=[ [[1,2],[2,4]] ], figSizeOnCreation=(2,2))
+		self.plotterC = ptrs.LinePlotter(plotData=[ [[1,2],[2,5]] ], figSizeOnCreation=(2,2))
+		self.outPath = os.path.join(self.tempDir.name, "out.png")
+		self.createTestObjs()
+
+	def tearDown(self):
+		self.tempDir.cleanup()
+		plt.close("all")
+
+	def createTestObjs(self):
+		self.testObj = tCode.RenderCache(self.cacheDir, maxSizeBytes=self.maxSizeBytes, maxEntries=self.maxEntries)
+
+	def testMissThenHit(self):
+		self.assertFalse( self.testObj.savePlot(self.plotterA, self.outPath) )
+		self.assertTrue( self.testObj.savePlot(self.plotterA, self.outPath) )
+		self.assertTrue( os.path.exists(self.outPath) )
+		actStats = self.testObj.stats
+		self.assertEqual( (1,1), (actStats.hits, actStats.misses) )
+
+	def testHitDoesntRender(self):
+		self.testObj.savePlot(self.plotterA, self.outPath)
+		with unittest.mock.patch.object(ptrs.LinePlotter, "createPlots") as mockedCreatePlots:
+			self.testObj.savePlot(self.plotterA, self.outPath)
+		mockedCreatePlots.assert_not_called()
+
+	def testHitBytesMatchMiss(self):
+		expBytes = self.testObj.getPlotBytes(self.plotterA)
+		actBytes = self.testObj.getPlotBytes(self.plotterA)
+		self.assertEqual(expBytes, actBytes)
+
+	def testDpiAndFormatAreInKey(self):
+		self.testObj.savePlot(self.plotterA, self.outPath)
+		self.assertFalse( self.testObj.savePlot(self.plotterA, self.outPath, dpi=50) )
+		self.assertFalse( self.testObj.savePlot(self.plotterA, self.outPath, fmt="svg") )
+
+	def testKwargsAreInKey(self):
+		self.testObj.savePlot(self.plotterA, self.outPath)
+		self.assertFalse( self.testObj.savePlot(self.plotterA, self.outPath, titleStr="new title") )
+		self.assertTrue( self.testObj.savePlot(self.plotterA, self.outPath, titleStr="new title") )
+
+	def testEvictsLeastRecentlyUsedOnMaxEntries(self):
+		self.maxEntries = 2
+		self.createTestObjs()
+		self.testObj.savePlot(self.plotterA, self.outPath)
+		self.testObj.savePlot(self.plotterB, self.outPath)
+		self.testObj.savePlot(self.plotterA, self.outPath) #A is now more recently used than B
+		self.testObj.savePlot(self.plotterC, self.outPath)
+
+		self.assertEqual( (2,1), (self.testObj.stats.nEntries, self.testObj.stats.evictions) )
+		self.assertTrue( self.testObj.savePlot(self.plotterA, self.outPath) )
+		self.assertFalse( self.testObj.savePlot(self.plotterB, self.outPath) )
+
+	def testSizeLimitRespected(self):
+		self.testObj.savePlot(self.plotterA, self.outPath)
+		self.maxSizeBytes = int(self.testObj.stats.sizeBytes*1.5)
+		self.createTestObjs()
+		self.testObj.savePlot(self.plotterB, self.outPath)
+		self.assertLessEqual( self.testObj.stats.sizeBytes, self.maxSizeBytes )
+		self.assertEqual( 1, self.testObj.stats.nEntries )
+
+	def testEntriesReusedByNewCacheObject(self):
+		self.testObj.savePlot(self.plotterA, self.outPath)
+		self.createTestObjs()
+		self.assertTrue( self.testObj.savePlot(self.plotterA, self.outPath) )
+
+	def testClear(self):
+		self.testObj.savePlot(self.plotterA, self.outPath)
+		self.testObj.clear()
+		self.assertEqual( (0,0), (self.testObj.stats.nEntries, self.testObj.stats.sizeBytes) )
+		self.assertEqual( list(), os.listdir(self.cacheDir) )
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,76 @@
+
+import concurrent.futures
+import io
+import unittest
+
+import matplotlib.figure
+import matplotlib.pyplot as plt
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+
+
+def _createPlotters():
+	lineData = np.array( [ [x, x**2] for x in range(10) ] )
+	countsA, edges = np.histogram( np.sin(np.arange(100)), bins=5 )
+	sqrMatrix = np.array( [ [1.0, 0.1, -0.7], [0.1, 1.0, 0.5], [-0.7, 0.5, 1.0] ] )
+
+	outPlotters = [
+	ptrs.LinePlotter(plotData=[lineData], dataLabels=["a"], showLegend=True, titleStr="Line", xLabelStr="x", yLimit=[0,50], gridLinesShow=True),
+	ptrs.BarPlotter(plotData1D=[ [1,2,3], [3,2,1] ], groupLabels=["A","B","C"], addBarLabelsByDefault=True, titleStr="Bar"),
+	ptrs.HistogramPlotter(plotDataHisto=[ [countsA, edges] ], plotHozLinePositions=5),
+	ptrs.DiscreteHeatMapPlotter(plotData=sqrMatrix, annotateVals=True, colorBarShow=True, plotUpperTri=False),
+	ptrs.ImagePlotter(plotDataImage=np.arange(16).reshape(4,4), colorBarShow=True)
+	]
+	return outPlotters
+
+
+def _createPngBytes(inpPlotter):
+	figHandle = matplotlib.figure.Figure(figsize=(4,3))
+	inpPlotter.createPlot(axHandle=figHandle.add_subplot(111))
+	outStream = io.BytesIO()
+	figHandle.savefig(outStream, format="png")
+	return outStream.getvalue()
+
+
+class TestRenderWithoutPyplot(unittest.TestCase):
+
+	def setUp(self):
+		self.plotters = _createPlotters()
+		plt.close("all")
+
+	def testNoPyplotFiguresCreated(self):
+		for plotter in self.plotters:
+			_createPngBytes(plotter)
+		self.assertEqual( list(), plt.get_fignums() )
+
+	def testRectMultiPlotterOnFigHandle(self):
+		figHandle = matplotlib.figure.Figure()
+		multiPlotter = ptrs.RectMultiPlotter(plotters=self.plotters, nColsGrid=2)
+		multiPlotter.createPlot(figHandle=figHandle)
+		figHandle.savefig(io.BytesIO(), format="png")
+		self.assertEqual( list(), plt.get_fignums() )
+		self.assertEqual( len(self.plotters), len(figHandle.axes) - 2 ) #2 colorbars
+
+
+class TestConcurrentRenderingStress(unittest.TestCase):
+
+	def setUp(self):
+		self.plotters = _createPlotters()
+		self.nThreads = 8
+		self.nRepeats = 4
+
+	def testImagesIdenticalToSerialRendering(self):
+		expBytes = [ _createPngBytes(plotter) for plotter in self.plotters ]
+
+		jobPlotters = self.plotters*self.nRepeats
+		with concurrent.futures.ThreadPoolExecutor(max_workers=self.nThreads) as executor:
+			actBytes = list( executor.map(_createPngBytes, jobPlotters) )
+
+		for idx, currBytes in enumerate(actBytes):
+			self.assertEqual( expBytes[idx%len(self.plotters)], currBytes )
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,160 @@
+
+import io
+import unittest
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as ptrs
+import pyplotterlib.standard.private.split_axis_plotter as splitAxisPlotterHelp
+
+
+def _createPlotOnNewFigure(plotter, **kwargs):
+	figHandle = matplotlib.figure.Figure(figsize=(4,3))
+	outDict = plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+	return figHandle, outDict
+
+def _getPngBytes(figHandle):
+	outBuffer = io.BytesIO()
+	figHandle.savefig(outBuffer, format="png")
+	return outBuffer.getvalue()
+
+
+class TestUpdatePlotMatchesCreatePlot(unittest.TestCase):
+
+	def setUp(self):
+		xVals = np.linspace(0, 10, 20)
+		self.plotData = [ np.array([xVals, np.sin(xVals)]).T, np.array([xVals, np.cos(xVals)]).T ]
+		self.linePlotter = ptrs.LinePlotter(plotData=self.plotData, titleStr="title", xLabelStr="x", dataLabels=["a","b"],
+		                                    showLegend=True, lineColors=["r","g"], errorBarDataY=[np.ones(20)*0.1, None],
+		                                    errorBarColorsMatchLinesByDefault=True)
+		self.barPlotter = ptrs.BarPlotter(plotData1D=[[1,2,3],[2,3,1]], groupLabels=["a","b","c"], dataLabels=["x","y"],
+		                                  showLegend=True, titleStr="title")
+
+	def _checkUpdateMatchesCreate(self, plotter, changedOpts):
+		figHandle, outDict = _createPlotOnNewFigure(plotter)
+		plotter.updatePlot(outDict, **changedOpts)
+		actBytes = _getPngBytes(figHandle)
+
+		expBytes = _getPngBytes( _createPlotOnNewFigure(plotter, **changedOpts)[0] )
+		self.assertEqual(expBytes, actBytes)
+
+	def testLinePlotterInPlaceUpdates(self):
+		allChangedOpts = [ {"titleStr":"new title"}, {"xLimit":[2,5], "yLimit":[-2,2]}, {"lineColors":["b","k"]},
+		                   {"lineStyles":["--"], "lineThickness":3}, {"fontSizeDefault":15}, {"showLegend":False},
+		                   {"legendLocStr":"upper left"}, {"errorBarColorsMatchLinesByDefault":False} ]
+		for changedOpts in allChangedOpts:
+			self._checkUpdateMatchesCreate(self.linePlotter, changedOpts)
+
+	def testLinePlotterFullRedraws(self):
+		allChangedOpts = [ {"plotData":[self.plotData[1], self.plotData[0]]}, {"titleStr":None}, {"dataLabels":["c","d"]} ]
+		for changedOpts in allChangedOpts:
+			self._checkUpdateMatchesCreate(self.linePlotter, changedOpts)
+
+	def testLinePlotterDataUpdates(self):
+		plotter = ptrs.LinePlotter(plotData=self.plotData, titleStr="title", dataLabels=["a","b"], showLegend=True, lineColors=["r","g"], xLimit=[0,5])
+		xVals = np.linspace(-5, 20, 50)
+		allChangedOpts = [ {"plotData":[self.plotData[1], self.plotData[0]]}, {"plotData":[ np.array([xVals, xVals**2]).T, self.plotData[0] ], "xLimit":[-5,20]},
+		                   {"plotData":[ np.array([xVals, xVals**2]).T, self.plotData[0] ], "lineDecimation":"minMax", "lineDecimationNumbPixels":10} ]
+		for changedOpts in allChangedOpts:
+			self._checkUpdateMatchesCreate(plotter, changedOpts)
+
+	def testBarPlotterUpdates(self):
+		allChangedOpts = [ {"titleStr":"new title"}, {"barColors":["r","b"]}, {"yLimit":[0,5]}, {"widthBars":0.5} ]
+		for changedOpts in allChangedOpts:
+			self._checkUpdateMatchesCreate(self.barPlotter, changedOpts)
+
+	def testDecimatedLinesRedrawnForXLimitChange(self):
+		xVals = np.linspace(0, 10, 100000)
+		plotter = ptrs.LinePlotter(plotData=[np.array([xVals, np.sin(xVals)]).T], lineDecimation="minMax")
+		self._checkUpdateMatchesCreate(plotter, {"xLimit":[2,3]})
+
+	def testImagePlotterWithColorBarRedraw(self):
+		plotter = ptrs.ImagePlotter(plotDataImage=np.arange(16).reshape(4,4), colorBarShow=True)
+		self._checkUpdateMatchesCreate(plotter, {"colorMapStr":"viridis"})
+
+	def testOptionsResetToNoneMatchCreatePlot(self):
+		#Clearing the axis used to keep the tick params and the space taken by the (removed) colorbar
+		imagePlotter = ptrs.ImagePlotter(plotDataImage=np.arange(16).reshape(4,4), colorBarShow=True)
+		self._checkUpdateMatchesCreate(imagePlotter, {"colorBarShow":False})
+		self._checkUpdateMatchesCreate(self.linePlotter.createFactory(fontSizeDefault=5), {"fontSizeDefault":None})
+		self._checkUpdateMatchesCreate(self.linePlotter.createFactory(tickLabelRotationX=45), {"tickLabelRotationX":None})
+
+	def testDoubleAxisPlotterRedraws(self):
+		plotterB = ptrs.LinePlotter(plotData=[self.plotData[1]], lineColors=["g"])
+		plotterC = ptrs.ImagePlotter(plotDataImage=np.arange(16).reshape(4,4), colorBarShow=True)
+		plotter = ptrs.DoubleAxisPlotter(plotters=[ptrs.LinePlotter(plotData=[self.plotData[0]]), plotterB], independentYAxis=True)
+		allChangedOpts = [ {"independentXAxis":True, "independentYAxis":False}, {"plotters":[plotterB, self.barPlotter]} ]
+		for changedOpts in allChangedOpts:
+			self._checkUpdateMatchesCreate(plotter, changedOpts)
+
+		self._checkUpdateMatchesCreate( ptrs.DoubleAxisPlotter(plotters=[plotterC, plotterB], independentYAxis=True), {"independentXAxis":True, "independentYAxis":False} )
+
+	def testSplitAxisPlotterRedraws(self):
+		linePlotters = [ ptrs.LinePlotter(plotData=[self.plotData[0]], xLimit=[0,4]), ptrs.LinePlotter(plotData=[self.plotData[0]], xLimit=[6,10]) ]
+		lineConfig = [splitAxisPlotterHelp.DoubleLinesConfig(draw=True)]
+		plotter = ptrs.SplitAxisPlotter(plotterGrid=[ [linePlotters[0]], [linePlotters[1]] ], splitDrawDoubleLinesX=lineConfig)
+		allChangedOpts = [ {"spacingX":0.2}, {"splitDrawDoubleLinesX":[splitAxisPlotterHelp.DoubleLinesConfig(draw=False)]},
+		                   {"plotterGrid":[ linePlotters ], "fractsY":[0.3,0.7]} ]
+		for changedOpts in allChangedOpts:
+			self._checkUpdateMatchesCreate(plotter, changedOpts)
+
+	def testSplitAxisPlotterCreatorRedraws(self):
+		plotter = ptrs.SplitAxisPlotterCreator(plotter=self.linePlotter, xLimits=[[0,4],[6,10]], splitLinesDraw=True)
+		allChangedOpts = [ {"xLimits":[[0,2],[3,5],[8,10]]}, {"splitLinesDraw":False}, {"yLimits":[[-1,0],[0.5,1]]} ]
+		for changedOpts in allChangedOpts:
+			self._checkUpdateMatchesCreate(plotter, changedOpts)
+
+
+class TestUpdatePlot(unittest.TestCase):
+
+	def setUp(self):
+		self.plotter = ptrs.LinePlotter(plotData=[ [[1,2,3],[2,4,6]] ], titleStr="title")
+		self.figHandle, self.outDict = _createPlotOnNewFigure(self.plotter)
+		self.axHandle = self.outDict["plotter"]._scratchSpace["axHandle"]
+
+	def testDataArtistsKeptForTitleChange(self):
+		expLines = self.axHandle.get_lines()
+		self.plotter.updatePlot(self.outDict, titleStr="new title")
+		self.assertEqual(expLines, self.axHandle.get_lines())
+		self.assertEqual("new title", self.axHandle.get_title())
+
+	def testDataLinesUpdatedInPlaceForDataChange(self):
+		origLines = self.axHandle.get_lines()
+		self.plotter.updatePlot(self.outDict, plotData=[ [[1,3],[2,2],[3,1]] ])
+		self.assertEqual(origLines, self.axHandle.get_lines())
+		self.assertEqual([3,2,1], list(self.axHandle.get_lines()[0].get_ydata()))
+
+	def testDataArtistsReplacedForNumberOfLinesChange(self):
+		origLines = self.axHandle.get_lines()
+		self.plotter.updatePlot(self.outDict, plotData=[ [[1,2,3],[3,2,1]], [[1,2,3],[1,1,1]] ])
+		newAxHandle = self.outDict["axHandle"]
+		self.assertNotEqual(origLines[0], newAxHandle.get_lines()[0])
+		self.assertEqual(2, len(newAxHandle.get_lines()))
+
+	def testAxisReplacedForFullRedraw(self):
+		self.plotter.updatePlot(self.outDict, titleStr=None)
+		newAxHandle = self.outDict["axHandle"]
+		self.assertIsNot(self.axHandle, newAxHandle)
+		self.assertIs(newAxHandle, self.outDict["plotter"]._scratchSpace["axHandle"])
+		self.assertEqual([newAxHandle], self.figHandle.axes)
+		self.assertEqual(self.axHandle.get_subplotspec().get_geometry(), newAxHandle.get_subplotspec().get_geometry())
+
+	def testOptionsOnPlotterUnchanged(self):
+		self.plotter.updatePlot(self.outDict, titleStr="new title")
+		self.assertEqual("title", self.plotter.opts.titleStr.value)
+
+	def testUpdatesAccumulate(self):
+		self.plotter.updatePlot(self.outDict, titleStr="new title")
+		self.plotter.updatePlot(self.outDict, xLimit=[0,10])
+		self.assertEqual("new title", self.axHandle.get_title())
+		self.assertEqual((0,10), self.axHandle.get_xlim())
+
+	def testRaisesWithoutPlotterInOutput(self):
+		with self.assertRaises(ValueError):
+			self.plotter.updatePlot(dict(), titleStr="new title")
+
+
+if __name__ == '__main__':
+	unittest.main()
+
@@ -0,0 +1,39 @@
+import io
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_SERIES = 2
+N_BARS_PER_SERIES = 50000
+
+#Compares drawing one Rectangle patch per bar with drawing each series as a single artist
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	rng = np.random.default_rng(0)
+	barData = [rng.uniform(1, 10, N_BARS_PER_SERIES) for x in range(N_SERIES)]
+	histoData = [list(np.histogram(rng.normal(idx, 1, 10**6), bins=N_BARS_PER_SERIES)) for idx in range(N_SERIES)]
+
+	#Pointing groupLabelTickPosKey at a missing key means no group ticks are set; otherwise creating one tick per group dominates
+	allPlotters = [("BarPlotter", plotters.BarPlotter(plotData1D=barData, stackBars=True, groupLabelTickPosKey="noTicks")),
+	               ("HistogramPlotter", plotters.HistogramPlotter(plotDataHisto=histoData, barOpacities=[0.5])),
+	               ("HistogramPlotter (spaced)", plotters.HistogramPlotter(plotDataHisto=histoData, interBarFractSpace=0.2))]
+
+	for label, plotter in allPlotters:
+		for drawAsCollection in [False, True]:
+			def _runSavePlot():
+				figHandle = matplotlib.figure.Figure(figsize=(8,4), dpi=100)
+				plotter.createPlot(axHandle=figHandle.add_subplot(111), barDrawAsCollection=drawAsCollection)
+				figHandle.savefig(io.BytesIO(), format="png")
+
+			runTime = helpers.getBestTimeForFunct(_runSavePlot, nRepeats=cmdLineArgs.nRepeats)
+			currLabel = "{} barDrawAsCollection={}".format(label, drawAsCollection)
+			helpers.printThroughput(currLabel, N_SERIES*N_BARS_PER_SERIES, runTime, unitStr="bars")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,42 @@
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.standard.private.bar_plotter as barPlotterHelp
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+#(nSeries, nGroups) for each run
+DATA_SHAPES = [(5,2000), (20,5000), (50,20000)]
+LAYOUT_COMMAND_TYPES = [barPlotterHelp.CalculateBottomVals, barPlotterHelp.CalculateCentreVals,
+                        barPlotterHelp.CalculateGroupEdgesFromCentreVals]
+
+#Times the commands that calculate bar positions (centres/bottoms/group edges) for increasing numbers of bars
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	for nSeries, nGroups in DATA_SHAPES:
+		plotter = plotters.BarPlotter(plotData1D=_getPlotData(nSeries, nGroups), stackBars=[True,False])
+		layoutCommands = [comm for comm in plotter._commands if isinstance(comm, tuple(LAYOUT_COMMAND_TYPES))]
+
+		def _runLayout():
+			for comm in layoutCommands:
+				comm.execute(plotter)
+
+		label = "layout {}x{}".format(nSeries, nGroups)
+		runTime = helpers.getBestTimeForFunct(_runLayout, nRepeats=cmdLineArgs.nRepeats)
+		helpers.printThroughput(label, nSeries*nGroups, runTime, unitStr="bars")
+
+
+#Lists with some None values; the (slowest) format accepted. With stackBars=[True,False], odd-indexed series have nothing stacked on them
+#so can contain None values
+def _getPlotData(nSeries, nGroups):
+	rng = np.random.default_rng(0)
+	outData = list()
+	for idx in range(nSeries):
+		currVals = rng.uniform(0, 10, nGroups).tolist()
+		if idx%2 == 1:
+			currVals[::97] = [None for x in currVals[::97]]
+		outData.append(currVals)
+	return outData
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import tracemalloc
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+MATRIX_SIZE = 6000
+
+#Compares drawing a memory-mapped matrix in full with block-downsampling it to the axis size first (createPlot + rendering the figure)
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	with tempfile.TemporaryDirectory() as tempDir:
+		filePath = os.path.join(tempDir, "matrix.npy")
+		np.save(filePath, np.random.default_rng(0).normal(size=(MATRIX_SIZE,MATRIX_SIZE)))
+		plotData = np.load(filePath, mmap_mode="r")
+
+		allRuns = [("image, full array", plotters.ImagePlotter(plotDataImage=plotData)),
+		           ("image, blockDownsampling=mean", plotters.ImagePlotter(plotDataImage=plotData, blockDownsampling="mean")),
+		           ("disc heat, full array", plotters.DiscreteHeatMapPlotter(plotData=plotData, plotUpperTri=False)),
+		           ("disc heat, blockDownsampling=nanmean", plotters.DiscreteHeatMapPlotter(plotData=plotData, plotUpperTri=False, blockDownsampling="nanmean"))]
+
+		for label, plotter in allRuns:
+			funct = lambda: _createAndDrawPlot(plotter)
+			runTime = helpers.getBestTimeForFunct(funct, nRepeats=cmdLineArgs.nRepeats)
+			helpers.printThroughput(label, MATRIX_SIZE**2, runTime, unitStr="values")
+
+			#Only counts memory allocated through numpy/python in this process (i.e. not the memory-mapped file)
+			tracemalloc.start()
+			funct()
+			peakMem = tracemalloc.get_traced_memory()[1]
+			tracemalloc.stop()
+			print("{} peak memory: {:.1f} MB".format(label, peakMem/1e6))
+
+
+#Drawing a tick on every row/column would dominate the full-array disc heat timings; so theyre removed before rendering
+def _createAndDrawPlot(plotter):
+	figHandle = matplotlib.figure.Figure()
+	axHandle = figHandle.add_subplot(111)
+	plotter.createPlot(axHandle=axHandle)
+	if plotter.opts.blockDownsampling.value is None and hasattr(plotter.opts, "plotLowerTri"):
+		axHandle.set_xticks([])
+		axHandle.set_yticks([])
+	figHandle.canvas.draw()
+
+
+if __name__ == '__main__':
+	main()
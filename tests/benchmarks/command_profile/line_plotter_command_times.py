@@ -0,0 +1,32 @@
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.core.instrumentation as instrumentHelp
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_LINES = 10
+N_POINTS = 10000
+N_SHOW = 8
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	xVals = np.linspace(0, 10, N_POINTS)
+	plotData = [ np.array( [xVals, np.sin(xVals + idx)] ).T for idx in range(N_LINES) ]
+	plotter = plotters.LinePlotter(plotData=plotData, xLabelStr="x-label", yLabelStr="y-label", titleStr="title",
+	                               showLegend=True, dataLabels=["data {}".format(idx) for idx in range(N_LINES)])
+
+	profiler = instrumentHelp.CommandProfiler()
+	with profiler:
+		for unused in range(cmdLineArgs.nRepeats):
+			plotter.createPlot(axHandle=matplotlib.figure.Figure().add_subplot(111))
+
+	print("{:40} {:>8} {:>10} {:>10} {:>8}".format("command", "nCalls", "wall(ms)", "cpu(ms)", "artists"))
+	for commandClass, totals in list(profiler.getTotals().items())[:N_SHOW]:
+		print("{:40} {:>8} {:>10.2f} {:>10.2f} {:>8}".format(commandClass, totals.nCalls, 1e3*totals.wallTime, 1e3*totals.cpuTime, totals.nArtistsAdded))
+
+
+if __name__ == '__main__':
+	main()
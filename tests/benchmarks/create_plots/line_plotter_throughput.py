@@ -0,0 +1,52 @@
+
+import os
+import tempfile
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_PLOTS = 50
+N_POINTS = 1000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	plotter = plotters.LinePlotter(xLabelStr="x-label", yLabelStr="y-label", showLegend=True, dataLabels=["data"])
+	iterOfKwargs = _getIterOfKwargs()
+
+	with tempfile.TemporaryDirectory() as tempDir:
+		outPaths = [ os.path.join(tempDir, "plot_{}.png".format(idx)) for idx in range(N_PLOTS) ]
+
+		def _runCreatePlotLoop():
+			for kwargs, outPath in zip(iterOfKwargs, outPaths):
+				plotter.createPlot(**kwargs)
+				plt.gcf().savefig(outPath, format="png")
+				plt.close(plt.gcf())
+
+		def _runCreatePlots():
+			plotter.createPlots(iterOfKwargs, outPaths, fmt="png")
+
+		loopTime = helpers.getBestTimeForFunct(_runCreatePlotLoop, nRepeats=cmdLineArgs.nRepeats)
+		batchTime = helpers.getBestTimeForFunct(_runCreatePlots, nRepeats=cmdLineArgs.nRepeats)
+
+	helpers.printThroughput("createPlot + savefig loop", N_PLOTS, loopTime)
+	helpers.printThroughput("createPlots", N_PLOTS, batchTime)
+	helpers.printSpeedup("createPlots speedup", loopTime, batchTime)
+
+
+def _getIterOfKwargs():
+	xVals = np.linspace(0, 10, N_POINTS)
+	outKwargs = list()
+	for idx in range(N_PLOTS):
+		currData = np.array( [xVals, np.sin(xVals + idx)] ).T
+		outKwargs.append( {"plotData":[currData], "titleStr":"Plot {}".format(idx), "xLimit":[0, 10-(idx%5)]} )
+	return outKwargs
+
+
+if __name__ == '__main__':
+	main()
+
@@ -0,0 +1,53 @@
+import io
+import tracemalloc
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_SERIES = 20
+N_POINTS_PER_SERIES = 500000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	plotter = plotters.LinePlotter(plotData=_getPlotData(), xLabelStr="time", yLabelStr="signal")
+
+	for rasterMethod in [None, "lines", "points"]:
+		outBuffer = io.BytesIO()
+		kwargs = {"lineDensityRaster":rasterMethod, "colorBarShow":rasterMethod is not None}
+
+		def _runSavePlot():
+			figHandle = matplotlib.figure.Figure(figsize=(8,4), dpi=100)
+			plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+			outBuffer.seek(0)
+			outBuffer.truncate()
+			figHandle.savefig(outBuffer, format="png")
+
+		runTime = helpers.getBestTimeForFunct(_runSavePlot, nRepeats=cmdLineArgs.nRepeats)
+		label = "lineDensityRaster={}".format(rasterMethod)
+		helpers.printThroughput(label, N_SERIES*N_POINTS_PER_SERIES, runTime, unitStr="points")
+
+		tracemalloc.start()
+		_runSavePlot()
+		peakMem = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+		print("{} peak memory: {:.1f} MB".format(label, peakMem/1e6))
+
+
+#Noisy, overlapping oscillations; far more points than pixels
+def _getPlotData():
+	rng = np.random.default_rng(0)
+	xVals = np.linspace(0, 100, N_POINTS_PER_SERIES)
+	outData = list()
+	for idx in range(N_SERIES):
+		yVals = np.sin(xVals/(5+idx)) + rng.normal(0, 0.05, N_POINTS_PER_SERIES)
+		outData.append( np.array([xVals, yVals]).T )
+	return outData
+
+
+if __name__ == '__main__':
+	main()
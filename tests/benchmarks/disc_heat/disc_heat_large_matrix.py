@@ -0,0 +1,41 @@
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.standard.private.disc_heat_plotter as discHeatHelp
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+MATRIX_SIZES = [200, 1000, 2000]
+TEXT_COLORS = ["white", "grey", "black"]
+
+#Times the steps that run on every cell of a (correlation-like) matrix before anything is drawn; removing the
+#upper triangle/diagonal and picking an annotation text color for each value
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	for matrixSize in MATRIX_SIZES:
+		plotData = _getPlotData(matrixSize)
+		plotter = plotters.DiscreteHeatMapPlotter(plotData=plotData, plotUpperTri=False, plotDiag=False,
+		                                          annotateValsTextColor=TEXT_COLORS)
+		removeCommand, annotateCommand = discHeatHelp.RemoveUnwantedPlotData(), discHeatHelp.AddDataAnnotations()
+
+		def _runRemoveData():
+			plotter._scratchSpace["usePlotData"] = plotData
+			removeCommand.execute(plotter)
+
+		def _runGetColors():
+			annotateCommand._getColorArray(plotter, plotData)
+
+		label = "{}x{}".format(matrixSize, matrixSize)
+		removeTime = helpers.getBestTimeForFunct(_runRemoveData, nRepeats=cmdLineArgs.nRepeats)
+		helpers.printThroughput("remove tri/diag " + label, matrixSize**2, removeTime, unitStr="cells")
+		colorTime = helpers.getBestTimeForFunct(_runGetColors, nRepeats=cmdLineArgs.nRepeats)
+		helpers.printThroughput("annotation colors " + label, matrixSize**2, colorTime, unitStr="cells")
+
+
+def _getPlotData(matrixSize):
+	rng = np.random.default_rng(0)
+	randVals = rng.normal(size=(matrixSize, 2*matrixSize))
+	return np.corrcoef(randVals)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_FILES = 8
+N_VALS_PER_FILE = 5*10**6
+N_BINS = 1000
+
+#Compares loading all data then calling np.histogram with building the histogram from memory-mapped .npy files
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	with tempfile.TemporaryDirectory() as tempDir:
+		filePaths = _writeDataFiles(tempDir)
+
+		def _runLoadAll():
+			return np.histogram( np.concatenate([np.load(path) for path in filePaths]), bins=N_BINS )
+
+		allRuns = [("load all + np.histogram", _runLoadAll),
+		           ("chunks, rangePass=True", lambda: plotters.getHistoDataFromChunks(filePaths, bins=N_BINS, rangePass=True)),
+		           ("chunks, auto-range (single pass)", lambda: plotters.getHistoDataFromChunks(filePaths, bins=N_BINS)),
+		           ("chunks, rangePass=True, nWorkers=2", lambda: plotters.getHistoDataFromChunks(filePaths, bins=N_BINS, rangePass=True, nWorkers=2))]
+
+		for label, funct in allRuns:
+			runTime = helpers.getBestTimeForFunct(funct, nRepeats=cmdLineArgs.nRepeats)
+			helpers.printThroughput(label, N_FILES*N_VALS_PER_FILE, runTime, unitStr="values")
+
+			#Only counts memory in this process
+			tracemalloc.start()
+			funct()
+			peakMem = tracemalloc.get_traced_memory()[1]
+			tracemalloc.stop()
+			print("{} peak memory: {:.1f} MB".format(label, peakMem/1e6))
+
+
+def _writeDataFiles(outDir):
+	rng = np.random.default_rng(0)
+	outPaths = list()
+	for idx in range(N_FILES):
+		outPaths.append( os.path.join(outDir, "chunk_{}.npy".format(idx)) )
+		np.save(outPaths[-1], rng.normal(idx, 1, N_VALS_PER_FILE))
+	return outPaths
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,46 @@
+import os
+import tempfile
+import time
+
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+IMAGE_SIZE = 8000
+ZOOM_LIMITS = [ (None, None), ([0,4000], [4000,0]), ([1000,1500], [1500,1000]), ([2000,2050], [2050,2000]) ]
+
+#Compares rendering regions of a huge on-disk image by block-downsampling the file directly vs reading tiles from an image pyramid
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	with tempfile.TemporaryDirectory() as tempDir:
+		filePath = os.path.join(tempDir, "image.npy")
+		np.save(filePath, np.random.default_rng(0).random((IMAGE_SIZE,IMAGE_SIZE), dtype=np.float32))
+		plotData = plotters.LazyArrayRef.fromNpyFile(filePath)
+
+		pyramidDir = os.path.join(tempDir, "pyramids")
+		pyramidPlotter = plotters.ImagePlotter(plotDataImage=plotData, blockDownsampling="mean", imagePyramidDir=pyramidDir)
+		startTime = time.perf_counter()
+		_createAndDrawPlot(pyramidPlotter, None, None)
+		print("Building pyramid (and first render) took {:.2f} s".format(time.perf_counter()-startTime))
+
+		allRuns = [("blockDownsampling only", plotters.ImagePlotter(plotDataImage=plotData, blockDownsampling="mean")),
+		           ("image pyramid", pyramidPlotter)]
+
+		for label, plotter in allRuns:
+			for xLimit, yLimit in ZOOM_LIMITS:
+				funct = lambda: _createAndDrawPlot(plotter, xLimit, yLimit)
+				runTime = helpers.getBestTimeForFunct(funct, nRepeats=cmdLineArgs.nRepeats)
+				zoomStr = "full image" if xLimit is None else "{}x{} region".format(xLimit[1]-xLimit[0], yLimit[0]-yLimit[1])
+				helpers.printThroughput("{}, {}".format(label, zoomStr), 1, runTime, unitStr="renders")
+
+
+def _createAndDrawPlot(plotter, xLimit, yLimit):
+	figHandle = matplotlib.figure.Figure()
+	plotter.createPlot(axHandle=figHandle.add_subplot(111), xLimit=xLimit, yLimit=yLimit)
+	figHandle.canvas.draw()
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,48 @@
+import io
+import tracemalloc
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_SERIES = 5000
+N_POINTS_PER_SERIES = 100
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	plotter = plotters.LinePlotter(plotData=_getPlotData(), lineColors=["r","g","b"], lineThickness=[0.5,1],
+	                               lineAlpha=0.3, lineStyles=["-"])
+
+	for drawAsCollection in [False, True]:
+		outBuffer = io.BytesIO()
+
+		def _runSavePlot():
+			figHandle = matplotlib.figure.Figure(figsize=(8,4), dpi=100)
+			plotter.createPlot(axHandle=figHandle.add_subplot(111), lineDrawAsCollection=drawAsCollection)
+			outBuffer.seek(0)
+			outBuffer.truncate()
+			figHandle.savefig(outBuffer, format="png")
+
+		runTime = helpers.getBestTimeForFunct(_runSavePlot, nRepeats=cmdLineArgs.nRepeats)
+		label = "lineDrawAsCollection={}".format(drawAsCollection)
+		helpers.printThroughput(label, N_SERIES, runTime, unitStr="series")
+
+		tracemalloc.start()
+		_runSavePlot()
+		peakMem = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+		print("{} peak memory: {:.1f} MB".format(label, peakMem/1e6))
+
+
+def _getPlotData():
+	rng = np.random.default_rng(0)
+	xVals = np.arange(N_POINTS_PER_SERIES)
+	return [np.array([xVals, rng.normal(0, 1, N_POINTS_PER_SERIES).cumsum()]).T for x in range(N_SERIES)]
+
+
+if __name__ == '__main__':
+	main()
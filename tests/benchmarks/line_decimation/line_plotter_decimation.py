@@ -0,0 +1,45 @@
+import io
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_POINTS = 10000000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	plotter = plotters.LinePlotter(plotData=[_getPlotData()], xLabelStr="time", yLabelStr="signal")
+
+	for decimation in [None, "minMax", "lttb"]:
+		for fmt in ["png", "svg"]:
+			outBuffer = io.BytesIO()
+
+			def _runSavePlot():
+				figHandle = matplotlib.figure.Figure(figsize=(8,4), dpi=100)
+				plotter.createPlot(axHandle=figHandle.add_subplot(111), lineDecimation=decimation)
+				outBuffer.seek(0)
+				outBuffer.truncate()
+				figHandle.savefig(outBuffer, format=fmt)
+
+			runTime = helpers.getBestTimeForFunct(_runSavePlot, nRepeats=cmdLineArgs.nRepeats)
+			label = "{} ({})".format(decimation, fmt)
+			helpers.printThroughput(label, N_POINTS, runTime, unitStr="points")
+			print("{} file size: {:.2f} MB".format(label, len(outBuffer.getvalue())/1e6))
+
+
+#Noisy signal with occasional narrow spikes; similar to a sensor trace
+def _getPlotData():
+	rng = np.random.default_rng(0)
+	xVals = np.linspace(0, 1000, N_POINTS)
+	yVals = np.sin(xVals/20) + rng.normal(0, 0.2, N_POINTS)
+	spikeIdxs = rng.integers(0, N_POINTS, 20)
+	yVals[spikeIdxs] += rng.choice([-5,5], len(spikeIdxs))
+	return np.array([xVals, yVals]).T
+
+
+if __name__ == '__main__':
+	main()
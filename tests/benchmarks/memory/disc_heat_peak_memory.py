@@ -0,0 +1,39 @@
+import tracemalloc
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+MATRIX_SIZE = 4000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	plotData = np.random.default_rng(0).normal(size=(MATRIX_SIZE,MATRIX_SIZE))
+	allKwargs = {"all cells": dict(),
+	             "upper tri/diag removed": {"plotUpperTri":False, "plotDiag":False}}
+
+	for label, kwargs in allKwargs.items():
+		plotter = plotters.DiscreteHeatMapPlotter(plotData=plotData, **kwargs)
+
+		#Most of the time is spent adding a tick for every row/column; this benchmark is mainly for the memory use
+		def _runCreatePlot():
+			figHandle = matplotlib.figure.Figure(figsize=(8,8), dpi=100)
+			plotter.createPlot(axHandle=figHandle.add_subplot(111))
+
+		runTime = helpers.getBestTimeForFunct(_runCreatePlot, nRepeats=cmdLineArgs.nRepeats)
+		helpers.printThroughput(label, MATRIX_SIZE**2, runTime, unitStr="cells")
+
+		#Includes matplotlibs own (masked) copy of the data made by imshow; pyplotterlib should add as little as possible on top of that
+		tracemalloc.start()
+		_runCreatePlot()
+		peakMem = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+		print("{} peak memory: {:.1f} MB (input data: {:.1f} MB)".format(label, peakMem/1e6, plotData.nbytes/1e6))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,46 @@
+import tracemalloc
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_SERIES = 10
+N_POINTS_PER_SERIES = 500000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	xVals, columnsY = _getColumnarData()
+	allKwargs = {"plotData (nx2 arrays)": {"plotData":[np.array([xVals,col]).T for col in columnsY.T]},
+	             "plotDataColumnsY": {"plotDataColumnsY":columnsY, "plotDataSharedX":xVals}}
+
+	for label, kwargs in allKwargs.items():
+		plotter = plotters.LinePlotter(**kwargs)
+
+		def _runCreatePlot():
+			figHandle = matplotlib.figure.Figure(figsize=(8,4), dpi=100)
+			plotter.createPlot(axHandle=figHandle.add_subplot(111))
+
+		runTime = helpers.getBestTimeForFunct(_runCreatePlot, nRepeats=cmdLineArgs.nRepeats)
+		helpers.printThroughput(label, N_SERIES*N_POINTS_PER_SERIES, runTime, unitStr="points")
+
+		#Most of the peak is matplotlibs own copies of each line; pyplotterlib should add nothing on top of those
+		tracemalloc.start()
+		_runCreatePlot()
+		peakMem = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+		print("{} peak memory: {:.1f} MB (input data: {:.1f} MB)".format(label, peakMem/1e6, columnsY.nbytes/1e6))
+
+
+def _getColumnarData():
+	rng = np.random.default_rng(0)
+	xVals = np.linspace(0, 100, N_POINTS_PER_SERIES)
+	columnsY = rng.normal(0, 1, (N_POINTS_PER_SERIES, N_SERIES)).cumsum(axis=0)
+	return xVals, columnsY
+
+
+if __name__ == '__main__':
+	main()
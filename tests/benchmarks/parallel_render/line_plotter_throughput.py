@@ -0,0 +1,49 @@
+
+import os
+import tempfile
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.standard.parallel_render as parallelRender
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_PLOTS = 100
+N_POINTS = 1000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	inpPlotters = _getPlotters()
+
+	with tempfile.TemporaryDirectory() as tempDir:
+		outPaths = [ os.path.join(tempDir, "plot_{}.png".format(idx)) for idx in range(N_PLOTS) ]
+
+		def _runSerial():
+			for plotter, outPath in zip(inpPlotters, outPaths):
+				plotter.createPlots([dict()], [outPath], fmt="png")
+
+		def _runParallel():
+			parallelRender.renderPlottersInParallel(inpPlotters, outPaths, fmt="png")
+
+		serialTime = helpers.getBestTimeForFunct(_runSerial, nRepeats=cmdLineArgs.nRepeats)
+		parallelTime = helpers.getBestTimeForFunct(_runParallel, nRepeats=cmdLineArgs.nRepeats)
+
+	helpers.printThroughput("serial", N_PLOTS, serialTime)
+	helpers.printThroughput("renderPlottersInParallel ({} cpus)".format(os.cpu_count()), N_PLOTS, parallelTime)
+
+
+def _getPlotters():
+	xVals = np.linspace(0, 10, N_POINTS)
+	basePlotter = plotters.LinePlotter(xLabelStr="x-label", yLabelStr="y-label")
+	outPlotters = list()
+	for idx in range(N_PLOTS):
+		currData = np.array( [xVals, np.sin(xVals + idx)] ).T
+		outPlotters.append( basePlotter.createFactory(plotData=[currData], titleStr="Plot {}".format(idx)) )
+	return outPlotters
+
+
+if __name__ == '__main__':
+	main()
+
@@ -0,0 +1,49 @@
+
+import os
+import tempfile
+
+import matplotlib
+matplotlib.use("Agg")
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.standard.render_cache as renderCache
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_PLOTS = 20
+N_POINTS = 100000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	xVals = np.linspace(0, 10, N_POINTS)
+	plotter = plotters.LinePlotter(plotData=[ np.array([xVals, np.sin(xVals)]).T ])
+
+	#Fingerprint vs the JSON round-trip it replaces
+	jsonTime = helpers.getBestTimeForFunct(lambda: [plotter.toJSON() for x in range(N_PLOTS)], nRepeats=cmdLineArgs.nRepeats)
+	fingerprintTime = helpers.getBestTimeForFunct(lambda: [plotter.getFingerprint() for x in range(N_PLOTS)], nRepeats=cmdLineArgs.nRepeats)
+	helpers.printThroughput("toJSON ({} points)".format(N_POINTS), N_PLOTS, jsonTime, unitStr="plotters")
+	helpers.printThroughput("getFingerprint ({} points)".format(N_POINTS), N_PLOTS, fingerprintTime, unitStr="plotters")
+
+	#Rendering vs cache hits
+	with tempfile.TemporaryDirectory() as tempDir:
+		cache = renderCache.RenderCache(os.path.join(tempDir, "cache"))
+		outPath = os.path.join(tempDir, "out.png")
+
+		def _renderNoCache():
+			plotter.createPlots([dict() for x in range(N_PLOTS)], [outPath for x in range(N_PLOTS)], fmt="png")
+
+		def _renderWithCache():
+			for idx in range(N_PLOTS):
+				cache.savePlot(plotter, outPath)
+
+		renderTime = helpers.getBestTimeForFunct(_renderNoCache, nRepeats=cmdLineArgs.nRepeats)
+		cache.savePlot(plotter, outPath) #Make sure everything after is a hit
+		cacheTime = helpers.getBestTimeForFunct(_renderWithCache, nRepeats=cmdLineArgs.nRepeats)
+
+	helpers.printThroughput("createPlots (no cache)", N_PLOTS, renderTime)
+	helpers.printThroughput("RenderCache.savePlot (hits)", N_PLOTS, cacheTime)
+
+
+if __name__ == '__main__':
+	main()
+
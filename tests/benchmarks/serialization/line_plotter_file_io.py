@@ -0,0 +1,46 @@
+import os
+import tempfile
+
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_LINES = 10
+N_POINTS = 100000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	plotter = plotters.LinePlotter(plotData=_getPlotData(), titleStr="title")
+	nPoints = N_LINES*N_POINTS
+
+	with tempfile.TemporaryDirectory() as tempDir:
+		for ext in [".json", ".npz"]:
+			outPath = os.path.join(tempDir, "plotter" + ext)
+
+			def _runWrite():
+				plotters.writePlotterToFile(plotter, outPath)
+
+			def _runRead():
+				plotters.readPlotterFromFile(outPath)
+
+			def _runReadMemoryMapped():
+				plotters.readPlotterFromFile(outPath, memoryMap=True)
+
+			writeTime = helpers.getBestTimeForFunct(_runWrite, nRepeats=cmdLineArgs.nRepeats)
+			readTime = helpers.getBestTimeForFunct(_runRead, nRepeats=cmdLineArgs.nRepeats)
+			helpers.printThroughput("write {}".format(ext), nPoints, writeTime, unitStr="points")
+			helpers.printThroughput("read {}".format(ext), nPoints, readTime, unitStr="points")
+			if ext == ".npz":
+				mmapTime = helpers.getBestTimeForFunct(_runReadMemoryMapped, nRepeats=cmdLineArgs.nRepeats)
+				helpers.printThroughput("read {} memory-mapped".format(ext), nPoints, mmapTime, unitStr="points")
+			print("file size {}: {:.1f} MB".format(ext, os.path.getsize(outPath)/1e6))
+
+
+def _getPlotData():
+	xVals = np.linspace(0, 10, N_POINTS)
+	return [ np.array( [xVals, np.sin(xVals + idx)] ).T for idx in range(N_LINES) ]
+
+
+if __name__ == '__main__':
+	main()
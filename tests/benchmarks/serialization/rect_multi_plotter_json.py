@@ -0,0 +1,42 @@
+import numpy as np
+
+import pyplotterlib.core.serialization.json_io as jsonIO
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_CONVERSIONS = 20
+N_PLOTTERS = 16
+N_POINTS = 100
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	multiPlotter = _getMultiPlotter()
+	outJSON = multiPlotter.toJSON()
+
+	def _runToJSON():
+		for idx in range(N_CONVERSIONS):
+			multiPlotter.toJSON()
+
+	def _runFromJSON():
+		for idx in range(N_CONVERSIONS):
+			jsonIO.createInstanceFromJSON(outJSON)
+
+	toTime = helpers.getBestTimeForFunct(_runToJSON, nRepeats=cmdLineArgs.nRepeats)
+	fromTime = helpers.getBestTimeForFunct(_runFromJSON, nRepeats=cmdLineArgs.nRepeats)
+
+	helpers.printThroughput("toJSON", N_CONVERSIONS, toTime, unitStr="plotters")
+	helpers.printThroughput("createInstanceFromJSON", N_CONVERSIONS, fromTime, unitStr="plotters")
+	print("JSON size: {:.1f} kB".format(len(outJSON)/1e3))
+
+
+#Nested RectMultiPlotters; the worst case for embedding JSON strings within JSON strings
+def _getMultiPlotter():
+	xVals = np.linspace(0, 10, N_POINTS)
+	linePlotters = [ plotters.LinePlotter(plotData=[np.array([xVals, np.sin(xVals+idx)]).T], titleStr="Plot {}".format(idx))
+	                 for idx in range(N_PLOTTERS) ]
+	innerPlotters = [ plotters.RectMultiPlotter(plotters=linePlotters[idx:idx+4]) for idx in range(0, N_PLOTTERS, 4) ]
+	return plotters.RectMultiPlotter(plotters=innerPlotters)
+
+
+if __name__ == '__main__':
+	main()
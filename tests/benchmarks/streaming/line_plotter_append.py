@@ -0,0 +1,58 @@
+import io
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_SERIES = 4
+N_POINTS_START = 500000
+N_POINTS_PER_UPDATE = 1000
+
+#Compares the cost of one refresh of a live plot (N_POINTS_PER_UPDATE new points per series) done by re-creating the plot
+#vs. by appending to the existing lines
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	startData = _getPlotData()
+	plotter = plotters.LinePlotter(plotData=startData, dataLabels=["series {}".format(idx) for idx in range(N_SERIES)],
+	                               showLegend=True)
+	newData = [_getNewPoints(N_POINTS_START) for idx in range(N_SERIES)]
+	fullData = [np.concatenate([old,new]) for old,new in zip(startData, newData)]
+	figHandle = matplotlib.figure.Figure(figsize=(8,4), dpi=100)
+	outDict = plotter.createPlot(axHandle=figHandle.add_subplot(111))
+	nAppended = 0
+
+	def _runCreatePlot():
+		currFig = matplotlib.figure.Figure(figsize=(8,4), dpi=100)
+		plotter.createPlot(axHandle=currFig.add_subplot(111), plotData=fullData)
+		return currFig
+
+	def _runAppendData():
+		nonlocal nAppended
+		nAppended += N_POINTS_PER_UPDATE
+		for seriesIdx in range(N_SERIES):
+			plotter.appendData(outDict, seriesIdx, _getNewPoints(N_POINTS_START+nAppended), maxWindow=N_POINTS_START)
+		return figHandle
+
+	for label, funct in [("createPlot", _runCreatePlot), ("appendData", _runAppendData)]:
+		runTime = helpers.getBestTimeForFunct(funct, nRepeats=cmdLineArgs.nRepeats)
+		helpers.printThroughput(label, 1, runTime, unitStr="refreshes")
+		drawTime = helpers.getBestTimeForFunct(lambda: funct().savefig(io.BytesIO(), format="png"), nRepeats=cmdLineArgs.nRepeats)
+		helpers.printThroughput(label+" + savefig", 1, drawTime, unitStr="refreshes")
+
+
+def _getPlotData():
+	rng = np.random.default_rng(0)
+	xVals = np.arange(N_POINTS_START, dtype=float)
+	return [np.array([xVals, rng.normal(0,1,N_POINTS_START).cumsum()]).T for idx in range(N_SERIES)]
+
+def _getNewPoints(startX):
+	xVals = np.arange(startX, startX+N_POINTS_PER_UPDATE, dtype=float)
+	return np.array([xVals, np.sin(xVals/100)]).T
+
+
+if __name__ == '__main__':
+	main()
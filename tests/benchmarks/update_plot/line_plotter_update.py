@@ -0,0 +1,45 @@
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.figure
+import numpy as np
+
+import pyplotterlib.standard.plotters as plotters
+import pyplotterlib.reg_testing.benchmarks.helpers as helpers
+
+N_UPDATES = 50
+N_LINES = 10
+N_POINTS = 10000
+
+def main():
+	cmdLineArgs = helpers.parseStdCommandLineArgs()
+	plotter = plotters.LinePlotter(plotData=_getPlotData(), xLabelStr="x-label", yLabelStr="y-label", titleStr="title",
+	                               showLegend=True, dataLabels=["data {}".format(idx) for idx in range(N_LINES)])
+	iterOfKwargs = [ {"titleStr":"Title {}".format(idx), "xLimit":[0, 10-(idx%5)]} for idx in range(N_UPDATES) ]
+
+	def _runCreatePlotLoop():
+		for kwargs in iterOfKwargs:
+			figHandle = matplotlib.figure.Figure()
+			plotter.createPlot(axHandle=figHandle.add_subplot(111), **kwargs)
+			figHandle.canvas.draw()
+
+	def _runUpdatePlotLoop():
+		figHandle = matplotlib.figure.Figure()
+		outDict = plotter.createPlot(axHandle=figHandle.add_subplot(111))
+		for kwargs in iterOfKwargs:
+			plotter.updatePlot(outDict, **kwargs)
+			figHandle.canvas.draw()
+
+	createTime = helpers.getBestTimeForFunct(_runCreatePlotLoop, nRepeats=cmdLineArgs.nRepeats)
+	updateTime = helpers.getBestTimeForFunct(_runUpdatePlotLoop, nRepeats=cmdLineArgs.nRepeats)
+
+	helpers.printThroughput("createPlot + draw", N_UPDATES, createTime)
+	helpers.printThroughput("updatePlot + draw", N_UPDATES, updateTime)
+
+
+def _getPlotData():
+	xVals = np.linspace(0, 10, N_POINTS)
+	return [ np.array( [xVals, np.sin(xVals + idx)] ).T for idx in range(N_LINES) ]
+
+
+if __name__ == '__main__':
+	main()